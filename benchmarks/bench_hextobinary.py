@@ -0,0 +1,59 @@
+"""
+bench_hextobinary.py
+
+16進数テキスト→バイナリ変換の処理速度を比較するベンチマーク。
+hexdump 風の16進数テキスト（BOM・空白・改行を含む）を生成し、
+HexToBinaryChunkedStrategy と HexToBinaryFastStrategy の処理時間を計測する。
+両者の出力がバイト単位で同一であることも確認する。
+
+使用例:
+    python -m benchmarks.bench_hextobinary --size-mb 64
+"""
+import argparse
+import filecmp
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from binary_file_tool.convert_file.hextobinary_chunked_strategy import HexToBinaryChunkedStrategy
+from binary_file_tool.convert_file.hextobinary_fast_strategy import HexToBinaryFastStrategy
+
+
+def make_hex_fixture(path: Path, size: int) -> None:
+    """
+    バイナリ換算で size バイト分の16進数テキストファイルを生成する（1行16バイト）。
+    """
+    block = os.urandom(16 * 4096)
+    lines = "\n".join(block[i:i + 16].hex(' ') for i in range(0, len(block), 16)) + "\n"
+    data = lines.encode('ascii')
+    with open(path, 'wb') as f:
+        f.write(b'\xef\xbb\xbf')
+        for _ in range(max(1, size // len(block))):
+            f.write(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="hextobinary benchmark")
+    parser.add_argument('--size-mb', type=int, default=16, help='変換後のバイナリサイズ（MB）')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = Path(tmp) / "fixture.txt"
+        make_hex_fixture(src, args.size_mb * 1024 * 1024)
+        text_size = src.stat().st_size
+
+        outputs = {}
+        for name, strategy in (('chunked', HexToBinaryChunkedStrategy(output_dir=f"{tmp}/chunked")),
+                               ('fast',    HexToBinaryFastStrategy(output_dir=f"{tmp}/fast"))):
+            start = time.perf_counter()
+            outputs[name] = strategy.execute(str(src))[0]
+            elapsed = time.perf_counter() - start
+            print(f"{name:<8}: {elapsed:8.3f} s  {text_size / elapsed / 1e6:8.1f} MB/s (入力テキスト換算)")
+
+        identical = filecmp.cmp(outputs['chunked'], outputs['fast'], shallow=False)
+        print(f"出力一致: {identical}")
+
+
+if __name__ == '__main__':
+    main()
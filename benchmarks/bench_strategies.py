@@ -0,0 +1,224 @@
+"""
+bench_strategies.py
+
+binary_file_tool の主要な戦略の処理速度を計測するベンチマーク（ネットワーク接続不要）。
+指定サイズのフィクスチャ（ランダムなバイナリ、16進数テキスト）を生成し、各戦略を計測する。
+
+計測項目（ケースごとに新しいプロセスで実行し、他のケースの影響を受けないようにする）:
+- seconds / mb_per_s: repeat 回のうち最短の処理時間と、そのときの処理速度
+- peak_rss_mb: 最大常駐メモリ（resource モジュールが使えない環境では null）
+- read_syscalls / write_syscalls: read / write 系システムコールの回数（/proc/self/io がない環境では null）
+
+結果は JSON に保存でき、保存済みのベースラインと比較して処理速度の低下を検出できる。
+
+使用例:
+    python -m benchmarks.bench_strategies --size-mb 64 --save-baseline benchmarks/baseline.json
+    python -m benchmarks.bench_strategies --size-mb 64 --baseline benchmarks/baseline.json --output result.json
+    python -m benchmarks.bench_strategies --only split extract
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from benchmarks.bench_hextobinary import make_hex_fixture
+from binary_file_tool.file_operation.file_operation import FileOperation
+from binary_file_tool.file_operation.split_strategy import SplitStrategy
+from binary_file_tool.file_operation.extract_strategy import ExtractStrategy
+from binary_file_tool.file_operation.hexdump_strategy import HexDumpStrategy
+from binary_file_tool.convert_file.convert_file import ConvertFile
+from binary_file_tool.convert_file.hextobinary_chunked_strategy import HexToBinaryChunkedStrategy
+from binary_file_tool.generate_file.generate_file import GenerateFile
+from binary_file_tool.generate_file.incremental_strategy import IncrementalDataStrategy
+from binary_file_tool.generate_file.random_strategy import SecureRandomStrategy
+
+# 処理速度がこの割合（%）以上低下した場合に低下と判定する
+DEFAULT_THRESHOLD = 10.0
+
+
+# ケース名 → 入力ファイルの種類（binary: ランダムなバイナリ、hex: 16進数テキスト、output: 生成先のパス）
+CASE_INPUTS = {
+    'split':               'binary',
+    'extract':             'binary',
+    'hexdump':             'binary',
+    'hextobinary_chunked': 'hex',
+    'incremental':         'output',
+    'secure_random':       'output',
+}
+CASES = tuple(CASE_INPUTS)
+
+
+def _create_operation(name: str, size: int, out_dir: str):
+    """
+    ケースの実行クラスと、処理するバイト数（MB/s の計算用）を返す。
+    """
+    if name == 'split':
+        return FileOperation(SplitStrategy(max(size // 8, 1), ignore_tail=False, output_dir=out_dir)), size
+    if name == 'extract':
+        return FileOperation(ExtractStrategy(size // 4, size // 2, output_dir=out_dir)), size // 2
+    if name == 'hexdump':
+        return FileOperation(HexDumpStrategy(0, size // 4, output=os.path.join(out_dir, 'dump.txt'))), size // 4
+    if name == 'hextobinary_chunked':
+        return ConvertFile(HexToBinaryChunkedStrategy(output_dir=out_dir)), size
+    if name == 'incremental':
+        return GenerateFile(IncrementalDataStrategy(size)), size
+    if name == 'secure_random':
+        return GenerateFile(SecureRandomStrategy(size)), size
+    raise ValueError(f"未対応のケースです: {name}")
+
+
+def _io_counters() -> Optional[dict[str, int]]:
+    """
+    /proc/self/io の read / write システムコール回数（Linux のみ）。
+    """
+    try:
+        with open('/proc/self/io', encoding='ascii') as f:
+            values = dict(line.split(': ') for line in f.read().splitlines())
+        return {'read': int(values['syscr']), 'write': int(values['syscw'])}
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux は KiB、macOS はバイト単位
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_case(name: str, size: int, input_path: str, work_dir: str, repeat: int) -> dict:
+    """
+    1ケースを repeat 回実行し、計測結果を返す（子プロセスで実行する）。
+    """
+    best = None
+    syscalls = None
+    for i in range(repeat):
+        out_dir = os.path.join(work_dir, f"{name}_{i}")
+        os.makedirs(out_dir, exist_ok=True)
+        operation, nbytes = _create_operation(name, size, out_dir)
+        target = os.path.join(out_dir, 'generated.bin') if CASE_INPUTS[name] == 'output' else input_path
+
+        before = _io_counters()
+        start = time.perf_counter()
+        # 戦略が表示する処理速度などは計測結果に含めない
+        with contextlib.redirect_stdout(io.StringIO()):
+            operation.execute(target)
+        elapsed = time.perf_counter() - start
+        after = _io_counters()
+
+        if best is None or elapsed < best:
+            best = elapsed
+            if before is not None and after is not None:
+                syscalls = {key: after[key] - before[key] for key in before}
+        shutil.rmtree(out_dir, ignore_errors=True)
+
+    return {
+        'bytes': nbytes,
+        'seconds': round(best, 6),
+        'mb_per_s': round(nbytes / best / 1e6, 2) if best > 0 else None,
+        'peak_rss_mb': round(rss, 1) if (rss := _peak_rss_mb()) is not None else None,
+        'read_syscalls': syscalls['read'] if syscalls else None,
+        'write_syscalls': syscalls['write'] if syscalls else None,
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    ベースラインと比較し、処理速度が threshold % 以上低下したケース名を返す。
+    """
+    regressions = []
+    print(f"\n{'case':<20}{'baseline MB/s':>15}{'current MB/s':>15}{'change':>10}")
+    for name, result in results.items():
+        base = baseline.get('results', {}).get(name)
+        if not base or not base.get('mb_per_s') or not result.get('mb_per_s'):
+            print(f"{name:<20}{'-':>15}{result.get('mb_per_s') or '-':>15}{'-':>10}")
+            continue
+        change = (result['mb_per_s'] - base['mb_per_s']) / base['mb_per_s'] * 100
+        mark = '  低下' if change <= -threshold else ''
+        print(f"{name:<20}{base['mb_per_s']:>15.1f}{result['mb_per_s']:>15.1f}{change:>+9.1f}%{mark}")
+        if mark:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="binary_file_tool strategies benchmark")
+    parser.add_argument('--size-mb',       type=int,   default=16,                help='フィクスチャのサイズ（MB）。hextobinary はバイナリ換算のサイズ')
+    parser.add_argument('--repeat',        type=int,   default=3,                 help='ケースごとの実行回数（最短の時間を採用）')
+    parser.add_argument('--only',          nargs='+',  choices=CASES,             help='実行するケース（未指定の場合はすべて）')
+    parser.add_argument('--output',        type=str,                              help='結果を保存する JSON ファイル')
+    parser.add_argument('--baseline',      type=str,                              help='比較するベースラインの JSON ファイル')
+    parser.add_argument('--save-baseline', type=str,                              help='結果をベースラインとして保存する JSON ファイル')
+    parser.add_argument('--threshold',     type=float, default=DEFAULT_THRESHOLD, help='処理速度の低下と判定する割合（%%）')
+    parser.add_argument('--workdir',       type=str,                              help='フィクスチャ・出力の作業ディレクトリ。未指定の場合は一時ディレクトリ')
+    args = parser.parse_args()
+
+    size = args.size_mb * 1024 * 1024
+    names = args.only or CASES
+    with tempfile.TemporaryDirectory(dir=args.workdir) as tmp:
+        inputs = {'binary': os.path.join(tmp, 'fixture.bin'), 'hex': os.path.join(tmp, 'fixture.txt'), 'output': ''}
+        if any(CASE_INPUTS[name] == 'binary' for name in names):
+            with open(inputs['binary'], 'wb') as f:
+                for offset in range(0, size, 1024 * 1024):
+                    f.write(os.urandom(min(1024 * 1024, size - offset)))
+        if any(CASE_INPUTS[name] == 'hex' for name in names):
+            make_hex_fixture(Path(inputs['hex']), size)
+
+        print(f"{'case':<20}{'seconds':>10}{'MB/s':>10}{'peak RSS MB':>13}{'read':>10}{'write':>10}")
+        results = {}
+        for name in names:
+            # ケースごとに新しいプロセスで実行する（最大常駐メモリ・システムコール回数を分離するため）
+            with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as pool:
+                result = pool.submit(run_case, name, size, inputs[CASE_INPUTS[name]], tmp, args.repeat).result()
+            results[name] = result
+            print(f"{name:<20}{result['seconds']:>10.3f}{result['mb_per_s'] or 0:>10.1f}"
+                  f"{result['peak_rss_mb'] if result['peak_rss_mb'] is not None else '-':>13}"
+                  f"{result['read_syscalls'] if result['read_syscalls'] is not None else '-':>10}"
+                  f"{result['write_syscalls'] if result['write_syscalls'] is not None else '-':>10}")
+
+    report = {
+        'meta': {
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'size_mb': args.size_mb,
+            'repeat': args.repeat,
+        },
+        'results': results,
+    }
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+        print(f"出力ファイル：{path}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('meta', {}).get('size_mb') != args.size_mb:
+            print(f"[警告] ベースラインのサイズ（{baseline.get('meta', {}).get('size_mb')} MB）と異なるサイズで計測しています")
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"処理速度が {args.threshold}% 以上低下したケース: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
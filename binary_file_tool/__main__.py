@@ -1,21 +1,42 @@
 import argparse
 import glob
+import os
+import shutil
+import sys
+import tempfile
 from pathlib import Path
 from typing import List
 
-from util.resolve_files.resolve_files import resolve_files
+from util.resolve_files.resolve_files import count_files, iter_files
 
 
 from binary_file_tool.file_operation.file_operation import FileOperation
 from binary_file_tool.file_operation.split_strategy import SplitStrategy
+from binary_file_tool.file_operation.cdc_split_strategy import CDCSplitStrategy
+from binary_file_tool.file_operation.join_strategy import JoinStrategy
+from binary_file_tool.file_operation.copy_engine import COPY_ENGINES
 from binary_file_tool.file_operation.extract_strategy import ExtractStrategy
+from binary_file_tool.file_operation.extract_ranges_strategy import ExtractRangesStrategy
 from binary_file_tool.file_operation.hexdump_strategy import HexDumpStrategy
+from binary_file_tool.file_operation.search_strategy import SearchStrategy, load_patterns
+from binary_file_tool.file_operation.diff_strategy import BLOCK_SIZE as DIFF_BLOCK_SIZE, DiffStrategy
+from binary_file_tool.file_operation.patch_strategy import PatchStrategy, load_edits, parse_edit
+from binary_file_tool.file_operation.checksum import CHECKSUM_ALGORITHMS
+from binary_file_tool.file_operation.checksum_strategy import ChecksumStrategy
+from binary_file_tool.file_operation.analyze_strategy import OUTPUT_FORMATS as ANALYZE_FORMATS, WINDOW_SIZE, AnalyzeStrategy
 
 from binary_file_tool.generate_file.generate_file import GenerateFile
 from binary_file_tool.generate_file.incremental_strategy import IncrementalDataStrategy
 from binary_file_tool.generate_file.random_strategy import SecureRandomStrategy
+from binary_file_tool.generate_file.fast_random_strategy import FastRandomStrategy
 from binary_file_tool.convert_file.convert_file import ConvertFile
 from binary_file_tool.convert_file.hextobinary_chunked_strategy import HexToBinaryChunkedStrategy
+from binary_file_tool.convert_file.hextobinary_fast_strategy import HexToBinaryFastStrategy
+from binary_file_tool.convert_file.binarytohex_strategy import BinaryToHexStrategy
+from binary_file_tool.convert_file.intelhex_strategy import BinaryToIntelHexStrategy, IntelHexToBinaryStrategy
+from binary_file_tool.convert_file.srecord_strategy import BinaryToSRecordStrategy, SRecordToBinaryStrategy
+from binary_file_tool.convert_file.decode_records_strategy import OUTPUT_FORMATS, DecodeRecordsStrategy, load_layout
+from binary_file_tool.batch.batch_executor import BatchExecutor
 
 
 def non_negative_int(value):
@@ -33,6 +54,24 @@ def non_negative_int(value):
         raise argparse.ArgumentTypeError(f"{value} は0以上の整数ではありません")
     return ivalue
 
+def address_int(value):
+    """
+    文字列（10進数、または 0x 付き16進数）を0以上の整数に変換し、妥当性を検証する。
+
+    argparse の type 引数として使用することを想定。
+
+    :param value: コマンドライン引数として渡される文字列
+    :return: 変換後の整数値（0以上）
+    :raises argparse.ArgumentTypeError: 数値として解釈できない場合、または0未満の値が指定された場合
+    """
+    try:
+        ivalue = int(value, 0)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value} は整数（10進数または0x付き16進数）ではありません")
+    if ivalue < 0:
+        raise argparse.ArgumentTypeError(f"{value} は0以上の整数ではありません")
+    return ivalue
+
 # メイン関数：コマンドライン引数の解析と処理実行
 def main():
     """
@@ -46,20 +85,44 @@ def main():
     #  ファイル操作コマンド群 
     # ==================================================================
     # file_operation共通オプション用の親パーサー（help を False にして二重表示を防ぐ）
-    file_operation_parser = argparse.ArgumentParser(add_help=False)
-    file_operation_parser.add_argument('--force', action='store_true',  help='大量ファイル処理の確認をスキップする')
-    file_operation_parser.add_argument('--input', required=True,        help='入力ファイルパス（ワイルドカード可）')
+    # 入力ファイル指定用の親パーサー
+    input_parser = argparse.ArgumentParser(add_help=False)
+    input_parser.add_argument('--input',     required=True, nargs='+',         help='入力ファイルパス（ワイルドカード可。複数指定可。"**" は任意の階層のディレクトリ）')
+    input_parser.add_argument('--exclude',   nargs='+', default=[],            help='除外するパターン（複数指定可。例: "*.bak" ".git" "data/tmp/**"）')
+    input_parser.add_argument('--scan_jobs', type=non_negative_int, default=1, help='ディレクトリ走査のスレッド数。0の場合はCPU数（ネットワークドライブなど、走査が遅い場合に指定）')
+    input_parser.add_argument('--force',     action='store_true',              help='大量ファイル処理の確認をスキップする')
+
+    file_operation_parser = argparse.ArgumentParser(add_help=False, parents=[input_parser])
+
+    # 複数ファイルの並列実行オプション用の親パーサー
+    jobs_parser = argparse.ArgumentParser(add_help=False)
+    jobs_parser.add_argument('--jobs', type=non_negative_int, default=1, help='並列実行数。0の場合はCPU数。I/Oバウンドな処理はスレッド、CPUバウンドな処理はプロセスで実行（split で入力が1ファイルの場合はパーツ単位、generate random --fast で出力が1ファイルの場合はブロック単位で並列実行）')
     
     # 分割コマンド
-    parser_split = subparsers.add_parser('split', parents=[file_operation_parser],      help='バイナリファイルを指定サイズで分割する')
-    parser_split.add_argument('--size',         type=non_negative_int,  required=True,  help='分割サイズ（バイト）')
+    parser_split = subparsers.add_parser('split', parents=[file_operation_parser, jobs_parser],      help='バイナリファイルを指定サイズで分割する')
+    parser_split.add_argument('--mode',         choices=['fixed', 'cdc'], default='fixed', help='分割方式。fixed: 固定サイズ、cdc: 内容に基づく分割（チャンクをハッシュ名でストアに保存し、マニフェストを出力）')
+    parser_split.add_argument('--size',         type=non_negative_int,                  help='分割サイズ（バイト）。--mode fixed の場合は必須')
     parser_split.add_argument('--ignore-tail',  action='store_true',                    help='端数チャンクを無視する')
     parser_split.add_argument('--output_dir',   type=str,                               help='出力ディレクトリ。未指定の場合は、入力ファイルと同じ')
+    parser_split.add_argument('--engine',       choices=COPY_ENGINES,                   help='--mode fixed のコピーエンジン。auto: カーネルコピー優先（失敗時はread/write。既定値）、kernel: カーネルコピーのみ、buffered: read/write')
+    parser_split.add_argument('--min_size',     type=non_negative_int,  default=2048,   help='--mode cdc の最小チャンクサイズ（バイト）')
+    parser_split.add_argument('--avg_size',     type=non_negative_int,  default=8192,   help='--mode cdc の平均チャンクサイズの目安（バイト）')
+    parser_split.add_argument('--max_size',     type=non_negative_int,  default=65536,  help='--mode cdc の最大チャンクサイズ（バイト）')
+    parser_split.add_argument('--store',        type=str,                               help='--mode cdc のチャンク保存先（共有ストア）。未指定の場合は <出力ディレクトリ>/chunks')
+    parser_split.add_argument('--manifest',     action='store_true',                    help='--mode fixed でマニフェスト（各パーツのサイズ・ハッシュ値）を出力する。join --verify で使用')
+
+    # 連結コマンド
+    parser_join = subparsers.add_parser('join', parents=[file_operation_parser, jobs_parser],        help='分割したパーツを連結して元のファイルを復元する')
+    parser_join.add_argument('--output_dir',    type=str,                               help='出力ディレクトリ。未指定の場合は、パーツ（マニフェスト）と同じ')
+    parser_join.add_argument('--verify',        action='store_true',                    help='連結前に各パーツのサイズ・ハッシュ値をマニフェストと照合する（並列実行）')
+    parser_join.add_argument('--overwrite',     action='store_true',                    help='出力ファイルが既に存在する場合に上書きする')
+    parser_join.add_argument('--engine',        choices=COPY_ENGINES,   default='auto', help='コピーエンジン。auto: カーネルコピー優先（失敗時はread/write）、kernel: カーネルコピーのみ、buffered: read/write')
 
     # 抽出コマンド
-    parser_extract = subparsers.add_parser('extract', parents=[file_operation_parser],  help='任意範囲のデータを抽出')
-    parser_extract.add_argument('--offset',     type=non_negative_int,  default=0,      help='開始位置（バイト）。初期値は０')
-    parser_extract.add_argument('--size',       type=non_negative_int,  required=True,  help='抽出サイズ（バイト）')
+    parser_extract = subparsers.add_parser('extract', parents=[file_operation_parser, jobs_parser],  help='任意範囲のデータを抽出')
+    parser_extract.add_argument('--offset',     type=non_negative_int,                  help='開始位置（バイト）。初期値は０')
+    parser_extract.add_argument('--size',       type=non_negative_int,                  help='抽出サイズ（バイト）。--ranges 未指定の場合は必須')
+    parser_extract.add_argument('--ranges',     type=str,                               help='範囲定義ファイル（offset,size,name の CSV または TOML）。指定時は全範囲をまとめて抽出（--offset / --size / --suffix とは併用不可）')
     parser_extract.add_argument('--suffix',     type=str,                               help='出力ファイル名の末尾。未指定の場合"_extrace"')
     parser_extract.add_argument('--file_ext',   type=str,                               help='出力ファイル拡張子。未指定の場合は入力ファイルと同じ')
     parser_extract.add_argument('--output_dir', type=str,                               help='出力ディレクトリ。未指定の場合は、入力ファイルと同じ')
@@ -68,6 +131,44 @@ def main():
     parser_hexdump = subparsers.add_parser('hexdump', parents=[file_operation_parser],  help='ファイル内容をhexdump表示')
     parser_hexdump.add_argument('--offset', type=non_negative_int, default=0,           help='開始位置（バイト）')
     parser_hexdump.add_argument('--size',   type=non_negative_int, default=None,        help='表示サイズ（バイト）')
+    parser_hexdump.add_argument('--output', type=str,              default=None,        help='出力ファイルパス。未指定の場合は標準出力')
+    parser_hexdump.add_argument('-s', '--squeeze', action='store_true',                 help='直前と同じ行を"*"に省略する（hexdump -C 相当）')
+
+    # 検索コマンド
+    parser_search = subparsers.add_parser('search', parents=[file_operation_parser, jobs_parser], help='複数のバイトパターンの出現位置を検索し、"パス,オフセット,パターン" を出力する')
+    parser_search.add_argument('--pattern',      nargs='+', default=[],                help='16進数のパターン（複数指定可。例: 7F454C46 0xAA55）')
+    parser_search.add_argument('--pattern_file', type=str,              default=None, help='パターンファイル（1行に1パターン。"#" で始まる行は無視）')
+    parser_search.add_argument('--max_count',    type=non_negative_int, default=None, help='1ファイルあたりの最大出力件数')
+    parser_search.add_argument('--output',       type=str,              default=None, help='出力ファイルパス（CSV）。未指定の場合は標準出力')
+
+    # チェックサムコマンド
+    parser_checksum = subparsers.add_parser('checksum', parents=[file_operation_parser, jobs_parser], help='チェックサム（CRC / SHA / BLAKE2）を計算し、"パス,オフセット,サイズ,値" を出力する')
+    parser_checksum.add_argument('--algorithm',  choices=CHECKSUM_ALGORITHMS, default='crc32', help='アルゴリズム')
+    parser_checksum.add_argument('--chunk_size', type=non_negative_int,       default=None,    help='このサイズ（バイト）ごとに計算する。未指定の場合はファイル全体。入力が分割のマニフェストの場合は各パーツ')
+    parser_checksum.add_argument('--output',     type=str,                    default=None,    help='出力ファイルパス（CSV）。未指定の場合は標準出力')
+
+    # 解析コマンド
+    parser_analyze = subparsers.add_parser('analyze', parents=[file_operation_parser, jobs_parser], help='ウィンドウごとのバイトのエントロピー・ヒストグラムを計算する（圧縮・暗号化領域やパディングの特定）')
+    parser_analyze.add_argument('--window_size',      type=non_negative_int, default=WINDOW_SIZE, help='ウィンドウサイズ（バイト）')
+    parser_analyze.add_argument('--format',           choices=ANALYZE_FORMATS, default='csv',    help='ウィンドウごとの結果の出力形式。sparkline: エントロピーを1ウィンドウ1文字のテキストで出力')
+    parser_analyze.add_argument('--window_histogram', action='store_true',                        help='CSV にウィンドウごとのヒストグラム（00～FF の出現数）を出力する')
+    parser_analyze.add_argument('--output_dir',       type=str,                                   help='出力ディレクトリ。未指定の場合は、入力ファイルと同じ')
+
+    # 差分コマンド
+    parser_diff = subparsers.add_parser('diff', parents=[file_operation_parser, jobs_parser], help='比較元ファイルとの差分範囲を求め、extract --ranges 形式の CSV に出力する')
+    parser_diff.add_argument('--reference',  type=str,              required=True,           help='比較元のファイルパス')
+    parser_diff.add_argument('--block_size', type=non_negative_int, default=DIFF_BLOCK_SIZE, help='ハッシュ値を比較するブロックのサイズ（バイト）')
+    parser_diff.add_argument('--merge_gap',  type=non_negative_int, default=0,               help='この値以下の間隔の差分範囲を1つにまとめる（バイト）')
+    parser_diff.add_argument('--output_dir', type=str,                                       help='出力ディレクトリ。未指定の場合は、入力ファイルと同じ')
+
+    # パッチコマンド
+    parser_patch = subparsers.add_parser('patch', parents=[file_operation_parser, jobs_parser], help='ファイルの指定位置のバイト列をその場で書き換える')
+    parser_patch.add_argument('--edit',        nargs='+', default=[],                 help='編集（オフセット=16進数。例: 0x10=DEADBEEF。複数指定可）')
+    parser_patch.add_argument('--patch',       type=str,              default=None,   help='パッチファイル（offset,data の CSV / TOML、または diff が出力した offset,size,name の CSV）')
+    parser_patch.add_argument('--source',      type=str,              default=None,   help='offset,size,name 形式のパッチで、データを読み込むファイル（diff の入力ファイル）')
+    parser_patch.add_argument('--journal',     action='store_true',                   help='書き込み前の内容を取り消し用のパッチ（<ファイル名>.undo.csv）に保存する')
+    parser_patch.add_argument('--journal_dir', type=str,              default=None,   help='取り消し用のパッチの出力ディレクトリ。未指定の場合は、入力ファイルと同じ')
+    parser_patch.add_argument('--fsync_batch', type=non_negative_int, default=None,   help='この回数の書き込みごと（および最後）に fsync する')
 
     # ==================================================================
     #  ファイル生成コマンド群
@@ -76,8 +177,8 @@ def main():
     generate_subparsers = parser_generate.add_subparsers(dest='generate_type')
 
     # file_operation共通オプション用の親パーサー（help を False にして二重表示を防ぐ）
-    generate_file_parser = argparse.ArgumentParser(add_help=False)
-    generate_file_parser.add_argument('--output', required=True, help='出力ファイルパス')
+    generate_file_parser = argparse.ArgumentParser(add_help=False, parents=[jobs_parser])
+    generate_file_parser.add_argument('--output', required=True, nargs='+', help='出力ファイルパス（複数指定可）')
     
     # incremental サブコマンド
     parser_increment = generate_subparsers.add_parser('incremental', parents=[generate_file_parser], help='インクリメントデータで構成されたバイナリファイルを生成')
@@ -89,6 +190,9 @@ def main():
     # random サブコマンド
     parser_random = generate_subparsers.add_parser('random', parents=[generate_file_parser], help='暗号論的に安全な乱数で構成されたバイナリファイルを生成')
     parser_random.add_argument('--size', type=non_negative_int, required=True, help='生成サイズ（バイト）')
+    parser_random.add_argument('--offset', type=non_negative_int, default=None,  help='既存ファイルのこの位置から --size バイトを上書きする（ファイルサイズは変更しない）')
+    parser_random.add_argument('--fast',   action='store_true',                  help='シード指定で再現可能な高速乱数を使用する（暗号論的に安全ではない。負荷試験用。出力が1ファイルの場合は --jobs でブロック単位に並列生成）')
+    parser_random.add_argument('--seed',   type=int,              default=None,  help='--fast のシード（0 以上。未指定の場合は 0。--output の各ファイルには異なるデータを生成）')
 
     # ==================================================================
     #  ファイル変換コマンド群
@@ -97,14 +201,45 @@ def main():
     convert_subparsers = parser_convert.add_subparsers(dest='convert_type')
     
     # convert_file共通オプション用の親パーサー（help を False にして二重表示を防ぐ）
-    convert_file_parser = argparse.ArgumentParser(add_help=False)
+    convert_file_parser = argparse.ArgumentParser(add_help=False, parents=[jobs_parser, input_parser])
     convert_file_parser.add_argument('--output_dir', type=str, help='出力ディレクトリ。未指定の場合は、入力ファイルと同じ')
-    convert_file_parser.add_argument('--input', required=True,        help='入力ファイルパス（ワイルドカード可）')
-    convert_file_parser.add_argument('--force', action='store_true',  help='大量ファイル処理の確認をスキップする')
     
     # hextobinary サブコマンド
     parser_hextobinary = convert_subparsers.add_parser('hextobinary', parents=[convert_file_parser], help='16進数テキストファイルをバイナリファイルに変換する')
-    parser_hextobinary.add_argument('--chunk_size', type=non_negative_int, default=8192,    help='チャンクサイズ（バイト）処理単位で、メモリ使用量を抑える')
+    parser_hextobinary.add_argument('--chunk_size', type=non_negative_int, default=None,    help='チャンクサイズ（バイト）処理単位で、メモリ使用量を抑える。未指定の場合は chunked: 8192、fast: 1MiB')
+    parser_hextobinary.add_argument('--engine', choices=['chunked', 'fast'], default='chunked', help='変換エンジン。fast: バイナリ読み込みと一括削除・一括デコードによる高速版（出力は同一）')
+
+    # binarytohex サブコマンド
+    parser_binarytohex = convert_subparsers.add_parser('binarytohex', parents=[convert_file_parser], help='バイナリファイルを16進数テキストファイルに変換する')
+    parser_binarytohex.add_argument('--line_width', type=non_negative_int, default=16,  help='1行あたりのバイト数')
+    parser_binarytohex.add_argument('--group_size', type=non_negative_int, default=1,   help='空白で区切るバイト数。0の場合は区切らない')
+    parser_binarytohex.add_argument('--uppercase',  action='store_true',                help='大文字で出力する')
+
+    # Intel HEX 変換サブコマンド
+    parser_binarytoihex = convert_subparsers.add_parser('binarytoihex', parents=[convert_file_parser], help='バイナリファイルを Intel HEX ファイルに変換する')
+    parser_binarytoihex.add_argument('--start_address', type=address_int,      default=0,  help='先頭バイトのアドレス（0x付き16進数可）')
+    parser_binarytoihex.add_argument('--record_size',   type=non_negative_int, default=16, help='1レコードあたりのデータバイト数（1～255）')
+    parser_ihextobinary = convert_subparsers.add_parser('ihextobinary', parents=[convert_file_parser], help='Intel HEX ファイルをバイナリファイルに変換する')
+    parser_ihextobinary.add_argument('--fill', type=address_int, default=0xFF, help='空き領域を埋めるバイト値（0x付き16進数可）')
+
+    # Motorola S-record 変換サブコマンド
+    parser_binarytosrec = convert_subparsers.add_parser('binarytosrec', parents=[convert_file_parser], help='バイナリファイルを Motorola S-record ファイルに変換する')
+    parser_binarytosrec.add_argument('--start_address', type=address_int,      default=0,    help='先頭バイトのアドレス（0x付き16進数可）')
+    parser_binarytosrec.add_argument('--record_size',   type=non_negative_int, default=16,   help='1レコードあたりのデータバイト数（1～250）')
+    parser_binarytosrec.add_argument('--address_size',  type=int, choices=[2, 3, 4], default=None, help='アドレス長（バイト）。未指定の場合は終端アドレスから自動選択')
+    parser_binarytosrec.add_argument('--header',        type=str,              default=None, help='S0レコードの内容。未指定の場合は入力ファイル名')
+    parser_srectobinary = convert_subparsers.add_parser('srectobinary', parents=[convert_file_parser], help='Motorola S-record ファイルをバイナリファイルに変換する')
+    parser_srectobinary.add_argument('--fill', type=address_int, default=0xFF, help='空き領域を埋めるバイト値（0x付き16進数可）')
+
+    # 固定長レコードのデコードコマンド
+    parser_decode = subparsers.add_parser('decode', parents=[convert_file_parser], help='固定長レコードのバイナリファイルをデコードして CSV / Parquet に出力する')
+    parser_decode.add_argument('--layout',        type=str,              required=True,    help='レコードのレイアウト。struct の書式文字列（例: ">i8si64s"）または TOML のフィールド定義ファイル（.toml）')
+    parser_decode.add_argument('--names',         type=str,              default=None,     help='書式文字列の場合の列名（カンマ区切り）。未指定の場合は field0, field1, ...')
+    parser_decode.add_argument('--format',        choices=OUTPUT_FORMATS, default='csv',   help='出力形式。parquet は pyarrow が必要')
+    parser_decode.add_argument('--offset',        type=address_int,      default=0,        help='先頭レコードの位置（バイト、0x付き16進数可）。ヘッダを読み飛ばす場合に指定')
+    parser_decode.add_argument('--count',         type=non_negative_int, default=None,     help='デコードする最大レコード数。未指定の場合はファイル末尾まで')
+    parser_decode.add_argument('--batch_records', type=non_negative_int, default=65536,    help='1回にデコードするレコード数（メモリ使用量の目安）')
+    parser_decode.add_argument('--encoding',      type=str,              default='utf-8',  help='文字列（s / c）の列のエンコーディング')
 
 
 
@@ -115,13 +250,76 @@ def main():
     # 各サブコマンドごとの戦略生成
     # ファイル操作群
     if args.command == 'split':
-        strategy = SplitStrategy(args.size, args.ignore_tail,output_dir=args.output_dir)
+        if args.mode == 'cdc':
+            # 固定サイズ分割のオプションは使用しないため、指定された場合はエラーにする
+            fixed_options = {'--size': args.size is not None, '--ignore-tail': args.ignore_tail,
+                             '--engine': args.engine is not None, '--manifest': args.manifest}
+            ignored = [name for name, given in fixed_options.items() if given]
+            if ignored:
+                parser_split.error(f"{', '.join(ignored)} は --mode cdc では指定できません")
+            strategy = CDCSplitStrategy(args.store, args.min_size, args.avg_size, args.max_size, output_dir=args.output_dir)
+        elif args.size is not None:
+            strategy = SplitStrategy(args.size, args.ignore_tail,output_dir=args.output_dir,engine=args.engine or 'auto',manifest=args.manifest)
+        else:
+            parser_split.error("--mode fixed の場合は --size を指定してください")
+        operation = FileOperation(strategy)
+    elif args.command == 'join':
+        strategy = JoinStrategy(args.output_dir, verify=args.verify, overwrite=args.overwrite, engine=args.engine)
         operation = FileOperation(strategy)
     elif args.command == 'extract':
-        strategy = ExtractStrategy(args.offset, args.size,suffix=args.suffix,file_ext=args.file_ext,output_dir=args.output_dir)
+        if args.ranges:
+            # 範囲は範囲定義ファイルで指定するため、単一範囲のオプションはエラーにする
+            single_options = {'--offset': args.offset, '--size': args.size, '--suffix': args.suffix}
+            conflicts = [name for name, value in single_options.items() if value is not None]
+            if conflicts:
+                parser_extract.error(f"{', '.join(conflicts)} は --ranges と併せて指定できません")
+            try:
+                strategy = ExtractRangesStrategy(args.ranges,file_ext=args.file_ext,output_dir=args.output_dir)
+            except (OSError, ValueError) as e:
+                parser_extract.error(str(e))
+        elif args.size is not None:
+            strategy = ExtractStrategy(args.offset or 0, args.size,suffix=args.suffix,file_ext=args.file_ext,output_dir=args.output_dir)
+        else:
+            parser_extract.error("--size または --ranges を指定してください")
+        operation = FileOperation(strategy)
+    elif args.command == 'diff':
+        try:
+            strategy = DiffStrategy(args.reference, args.block_size, merge_gap=args.merge_gap, output_dir=args.output_dir)
+        except (OSError, ValueError) as e:
+            parser_diff.error(str(e))
+        operation = FileOperation(strategy)
+    elif args.command == 'patch':
+        try:
+            edits = [parse_edit(edit) for edit in args.edit]
+            if args.patch:
+                edits += load_edits(args.patch, args.source)
+            if not edits:
+                parser_patch.error("--edit または --patch を指定してください")
+            strategy = PatchStrategy(edits, journal=args.journal, fsync_batch=args.fsync_batch or None, journal_dir=args.journal_dir)
+        except (OSError, ValueError) as e:
+            parser_patch.error(str(e))
         operation = FileOperation(strategy)
     elif args.command == 'hexdump':
-        strategy = HexDumpStrategy(args.offset, args.size)
+        strategy = HexDumpStrategy(args.offset, args.size, output=args.output, squeeze=args.squeeze)
+        operation = FileOperation(strategy)
+    elif args.command == 'search':
+        try:
+            patterns = args.pattern + (load_patterns(args.pattern_file) if args.pattern_file else [])
+            strategy = SearchStrategy(patterns, max_count=args.max_count or None)
+        except (OSError, ValueError) as e:
+            parser_search.error(str(e))
+        operation = FileOperation(strategy)
+    elif args.command == 'analyze':
+        try:
+            strategy = AnalyzeStrategy(args.window_size, args.format, window_histogram=args.window_histogram, output_dir=args.output_dir)
+        except ValueError as e:
+            parser_analyze.error(str(e))
+        operation = FileOperation(strategy)
+    elif args.command == 'checksum':
+        try:
+            strategy = ChecksumStrategy(args.algorithm, chunk_size=args.chunk_size or None)
+        except ValueError as e:
+            parser_checksum.error(str(e))
         operation = FileOperation(strategy)
     # ファイル生成群
     elif args.command == 'generate':
@@ -129,7 +327,15 @@ def main():
             strategy = IncrementalDataStrategy(args.size, args.unit_size, args.start_value, args.endian)
             operation = GenerateFile(strategy)
         elif args.generate_type == 'random':
-            strategy = SecureRandomStrategy(args.size)
+            if args.fast:
+                try:
+                    strategy = FastRandomStrategy(args.size, args.seed or 0, offset=args.offset, outputs=args.output)
+                except ValueError as e:
+                    parser_random.error(str(e))
+            elif args.seed is not None:
+                parser_random.error("--seed は --fast と併せて指定してください")
+            else:
+                strategy = SecureRandomStrategy(args.size, offset=args.offset)
             operation = GenerateFile(strategy)
         else:
             parser_generate.print_help()
@@ -137,11 +343,39 @@ def main():
     # ファイル変換群
     elif args.command == 'convert':
         if args.convert_type == 'hextobinary':
-            strategy = HexToBinaryChunkedStrategy(encoding='utf-8-sig', chunk_size=args.chunk_size, output_dir=args.output_dir)
+            chunk_size = {'chunk_size': args.chunk_size} if args.chunk_size is not None else {}
+            if args.engine == 'fast':
+                strategy = HexToBinaryFastStrategy(output_dir=args.output_dir, **chunk_size)
+            else:
+                strategy = HexToBinaryChunkedStrategy(encoding='utf-8-sig', output_dir=args.output_dir, **chunk_size)
+            operation = ConvertFile(strategy)
+        elif args.convert_type == 'binarytohex':
+            strategy = BinaryToHexStrategy(args.line_width, args.group_size, uppercase=args.uppercase, output_dir=args.output_dir)
+            operation = ConvertFile(strategy)
+        elif args.convert_type == 'binarytoihex':
+            strategy = BinaryToIntelHexStrategy(args.start_address, args.record_size, output_dir=args.output_dir)
+            operation = ConvertFile(strategy)
+        elif args.convert_type == 'ihextobinary':
+            strategy = IntelHexToBinaryStrategy(args.fill, output_dir=args.output_dir)
+            operation = ConvertFile(strategy)
+        elif args.convert_type == 'binarytosrec':
+            strategy = BinaryToSRecordStrategy(args.start_address, args.record_size,
+                                               address_size=args.address_size, header=args.header, output_dir=args.output_dir)
+            operation = ConvertFile(strategy)
+        elif args.convert_type == 'srectobinary':
+            strategy = SRecordToBinaryStrategy(args.fill, output_dir=args.output_dir)
             operation = ConvertFile(strategy)
         else:
             parser_convert.print_help()
             return
+    elif args.command == 'decode':
+        names = args.names.split(',') if args.names else None
+        try:
+            strategy = DecodeRecordsStrategy(load_layout(args.layout, names), args.format, offset=args.offset, count=args.count,
+                                             batch_records=args.batch_records, encoding=args.encoding, output_dir=args.output_dir)
+        except (OSError, ValueError) as e:
+            parser_decode.error(str(e))
+        operation = ConvertFile(strategy)
     else:
         parser.print_help()
         return
@@ -149,13 +383,19 @@ def main():
     # ==================================================================
     # 入出力ファイルの解決と処理実行
     # ==================================================================
-    if args.command in ('split', 'extract', 'hexdump', 'convert'):
-        paths = resolve_files(args.input)
-        if not paths:
+    # 30件以上のファイルが対象の場合、確認を行う
+    MAX_FILES_BEFORE_WARNING = 30
+    force = getattr(args, 'force', False)
+    if args.command in ('split', 'join', 'extract', 'diff', 'patch', 'hexdump', 'search', 'checksum', 'analyze', 'convert', 'decode'):
+        # 件数は確認に必要な分だけ数え、ファイルは走査しながら順次処理する（全件の解決を待たない）
+        count = count_files(args.input, args.exclude, limit=2 if force else MAX_FILES_BEFORE_WARNING)
+        if not count:
             print(f"[警告] 入力パターンにマッチするファイルが見つかりません: {args.input}")
             return
+        paths = iter_files(args.input, args.exclude, jobs=args.scan_jobs)
     elif args.command in ('generate'):
-        paths = [args.output]
+        paths = args.output
+        count = len(paths)
     else:
         parser.print_help()
         return
@@ -164,24 +404,55 @@ def main():
     # 対象ファイルの解決
     # ==================================================================
     # 対象ファイルが多い場合の確認
-    # 30件以上のファイルが対象の場合、確認を行う
-    MAX_FILES_BEFORE_WARNING = 30
-    if len(paths) >= MAX_FILES_BEFORE_WARNING and not args.force:
-        print(f"[警告] 対象ファイルが {len(paths)} 件あります。処理を続行しますか？ (y/N): ", end="")
+    if count >= MAX_FILES_BEFORE_WARNING and not force:
+        print(f"[警告] 対象ファイルが {count} 件以上あります。処理を続行しますか？ (y/N): ", end="")
         confirm = input().strip().lower()
         if confirm != 'y':
             print("処理を中止しました。")
             return
     
-    # 各ファイルに対して処理を実行
-    for path in paths:
+    # 各ファイルに対して処理を実行（結果は入力順に出力）
+    jobs = getattr(args, 'jobs', 1)
+    if isinstance(strategy, (SplitStrategy, DiffStrategy, FastRandomStrategy)) and count == 1:
+        # 1ファイルの固定サイズ分割・差分・高速乱数の生成は、ファイル内のパーツ・ブロックを並列に処理する
+        strategy.jobs, jobs = jobs, 1
+    if isinstance(strategy, (SearchStrategy, ChecksumStrategy)):
+        # 検索・チェックサムの結果はファイルごとに順次書き出す（エラーは標準エラー出力）
+        # 検索の一致はファイルごとの一時ファイルに書き出し、入力順に連結する（一致数によらずメモリ一定）
+        spool = tempfile.TemporaryDirectory(prefix='search_') if isinstance(strategy, SearchStrategy) else None
+        if spool is not None:
+            strategy.spool_dir = spool.name
+        executor = BatchExecutor(operation, jobs=jobs)
+        out = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
         try:
-            outpath = operation.execute(path)
-            
-            for path in outpath:
-                print(f"出力ファイル：{path}")
-        except Exception as e:
-            print(f"予期しないエラーが発生しました: {path} - {e}")
+            out.write(f"{strategy.header}\n")
+            for result in executor.run(paths):
+                if result.error is not None:
+                    print(f"予期しないエラーが発生しました: {result.path} - {result.error}", file=sys.stderr)
+                    continue
+                if spool is None:
+                    out.writelines(f"{line}\n" for line in result.outputs)
+                else:
+                    for part in result.outputs:
+                        with open(part, encoding='utf-8', newline='') as f:
+                            shutil.copyfileobj(f, out)
+                        os.remove(part)
+                out.flush()
+        finally:
+            if out is not sys.stdout:
+                out.close()
+            if spool is not None:
+                spool.cleanup()
+        if args.output:
+            print(f"出力ファイル：{args.output}")
+        return
+    executor = BatchExecutor(operation, jobs=jobs)
+    for result in executor.run(paths):
+        if result.error is not None:
+            print(f"予期しないエラーが発生しました: {result.path} - {result.error}")
+            continue
+        for outpath in result.outputs:
+            print(f"出力ファイル：{outpath}")
 
 # エントリーポイント
 if __name__ == '__main__':
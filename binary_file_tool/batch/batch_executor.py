@@ -0,0 +1,107 @@
+"""
+batch_executor.py
+
+このモジュールは、複数ファイルに対する処理を並列実行する BatchExecutor クラスを提供します。
+
+BatchExecutor は FileOperation / ConvertFile などの実行クラスを受け取り、
+resolve_files で解決したファイルごとに execute を呼び出します。
+戦略が CPU バウンド（cpu_bound = True）の場合はプロセスプール、
+I/O バウンドの場合はスレッドプールを使用します。
+
+主な特徴:
+- 入力順（決定的な順序）で結果を返す
+- ファイルごとの例外を BatchResult に格納し、他のファイルの処理を継続する
+- jobs=1 の場合はプールを生成せず逐次実行する
+
+使用例:
+    executor = BatchExecutor(FileOperation(ExtractStrategy(0, 16)), jobs=8)
+    for result in executor.run(paths):
+        print(result.path, result.outputs, result.error)
+"""
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional, Union
+
+from binary_file_tool.file_operation.file_operation import FileOperation
+from binary_file_tool.convert_file.convert_file import ConvertFile
+from binary_file_tool.generate_file.generate_file import GenerateFile
+
+# execute(filepath) -> list[str] を持つ実行クラス
+Operation = Union[FileOperation, ConvertFile, GenerateFile]
+
+# 並列数あたりの先行投入数（入力をすべて読み込まずに処理を開始するため、投入数を制限する）
+PREFETCH_PER_JOB = 4
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """
+    1ファイル分の処理結果を表すデータクラス
+    """
+    path: str
+    outputs: list[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def _execute_one(operation: Operation, path: str) -> BatchResult:
+    """
+    1ファイル分の処理を実行する（プロセスプールから呼び出すためモジュールレベルに定義）。
+    """
+    try:
+        return BatchResult(path, operation.execute(path))
+    except Exception as e:
+        return BatchResult(path, error=str(e))
+
+
+class BatchExecutor:
+    """
+    複数ファイルに対して実行クラスの execute を並列に呼び出すクラス。
+    """
+    def __init__(self, operation: Operation, jobs: int = 1) -> None:
+        """
+        Args:
+            operation (Operation): 実行クラス（FileOperation, ConvertFile など）
+            jobs (int, optional): 並列数。0 の場合は CPU 数. Defaults to 1.
+
+        Raises:
+            ValueError: jobs が負の値の場合
+        """
+        if jobs < 0:
+            raise ValueError(f"jobs は0以上の整数である必要があります。指定値: {jobs}")
+
+        self.operation = operation
+        self.jobs      = jobs or os.cpu_count() or 1
+        # 戦略が CPU バウンドであればプロセスプールを使用する
+        self.use_process = getattr(operation.strategy, 'cpu_bound', False)
+
+    def run(self, paths: Iterable[str]) -> Iterator[BatchResult]:
+        """
+        各ファイルに対して処理を実行し、入力順に結果を返す。
+
+        Args:
+            paths (Iterable[str]): 対象ファイルパス（ジェネレータの場合は、読み込みながら順次処理する）
+
+        Returns:
+            Iterator[BatchResult]: 入力順の処理結果
+        """
+        if self.jobs == 1:
+            for path in paths:
+                yield _execute_one(self.operation, path)
+            return
+
+        with self._create_pool() as pool:
+            # Executor.map は入力を最初にすべて読み込むため、投入数を制限して入力順に結果を返す
+            pending: deque = deque()
+            for path in paths:
+                pending.append(pool.submit(_execute_one, self.operation, path))
+                if len(pending) >= self.jobs * PREFETCH_PER_JOB:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def _create_pool(self) -> Executor:
+        if self.use_process:
+            return ProcessPoolExecutor(max_workers=self.jobs)
+        return ThreadPoolExecutor(max_workers=self.jobs)
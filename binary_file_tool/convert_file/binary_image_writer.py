@@ -0,0 +1,105 @@
+"""
+binary_image_writer.py
+
+アドレス付きレコード（Intel HEX / Motorola S-record）からバイナリイメージを書き出す
+BinaryImageWriter クラスを提供します。
+
+- 先頭の（最初に現れた）データレコードのアドレスを出力ファイルの先頭とする
+- レコード間の空き領域は fill バイトで埋める（チャンク単位で書き込み、メモリを消費しない）
+- アドレスが前後するレコードは seek して上書きする
+- 連続するアドレスのデータはまとめてから書き込む（flush() で確定する）
+
+使用例:
+    with open("out.bin", "wb") as f:
+        writer = BinaryImageWriter(f, fill=0xFF)
+        writer.write(0x08000000, b"\\x00\\x01")
+        writer.flush()
+"""
+from typing import BinaryIO, Optional
+
+# 空き領域を埋める際の書き込み単位、および連続データをまとめる最大サイズ
+_FILL_CHUNK_SIZE = 1024 * 1024
+_PENDING_LIMIT   = 1024 * 1024
+
+
+class BinaryImageWriter:
+    """
+    絶対アドレス指定のデータを、出力ファイル上の相対位置へ書き込むクラス。
+    """
+    def __init__(self, fout: BinaryIO, fill: int = 0xFF) -> None:
+        """
+        Args:
+            fout (BinaryIO): 出力ファイル（'wb' で開いたもの）
+            fill (int, optional): 空き領域を埋めるバイト値. Defaults to 0xFF.
+
+        Raises:
+            ValueError: fill が 0～255 の範囲外の場合
+        """
+        if not 0 <= fill <= 0xFF:
+            raise ValueError(f"fill は 0～255 の範囲である必要があります。指定値: {fill}")
+
+        self.fout = fout
+        self.fill = fill
+        # 出力ファイル先頭に対応するアドレス（最初のデータレコードで決定）
+        self.base_address: Optional[int] = None
+        # 出力済みの末尾（相対位置）と現在のファイル位置
+        self._end      = 0
+        self._position = 0
+        # 未書き込みの連続データ（先頭アドレスとデータ）
+        self._pending_address = 0
+        self._pending         = bytearray()
+
+    def write(self, address: int, data: bytes) -> None:
+        """
+        絶対アドレス address に data を書き込む。
+        直前のデータに連続する場合はまとめて、flush() または不連続なデータの書き込み時に出力する。
+
+        Args:
+            address (int): 書き込み先の絶対アドレス
+            data (bytes): 書き込むデータ
+
+        Raises:
+            ValueError: 先頭レコードより前のアドレスが指定された場合
+        """
+        if self.base_address is None:
+            self.base_address = address
+            self._pending_address = address
+        if address < self.base_address:
+            raise ValueError(f"アドレス(0x{address:X})が先頭レコードのアドレス(0x{self.base_address:X})より前です。")
+
+        if address != self._pending_address + len(self._pending) or len(self._pending) >= _PENDING_LIMIT:
+            self.flush()
+            self._pending_address = address
+        self._pending += data
+
+    def flush(self) -> None:
+        """
+        まとめていたデータを出力ファイルに書き込む。
+        """
+        if not self._pending:
+            return
+        offset = self._pending_address - self.base_address
+        data   = self._pending
+
+        if offset > self._end:
+            # 空き領域を fill で埋める
+            self._seek(self._end)
+            gap = offset - self._end
+            fill_chunk = bytes([self.fill]) * min(gap, _FILL_CHUNK_SIZE)
+            while gap > 0:
+                n = min(gap, len(fill_chunk))
+                self.fout.write(fill_chunk[:n] if n < len(fill_chunk) else fill_chunk)
+                gap -= n
+            self._position = offset
+        else:
+            self._seek(offset)
+
+        self.fout.write(data)
+        self._position += len(data)
+        self._end = max(self._end, self._position)
+        self._pending = bytearray()
+
+    def _seek(self, offset: int) -> None:
+        if self._position != offset:
+            self.fout.seek(offset)
+            self._position = offset
@@ -0,0 +1,93 @@
+"""
+binarytohex_strategy.py
+
+バイナリファイルを16進数テキストファイルへ変換する戦略クラス。
+HexToBinaryChunkedStrategy / HexToBinaryFastStrategy の逆変換に相当し、
+出力したテキストは hextobinary で元のバイナリに戻すことができる。
+
+- 1行あたりのバイト数（line_width）と、区切り文字を入れるバイト数（group_size）を指定可能
+- チャンク単位で読み込み、bytes.hex(sep, bytes_per_sep) により行単位で一括変換する
+
+使用例:
+    strategy = BinaryToHexStrategy(line_width=16, group_size=4)
+    strategy.execute("firmware.bin")  # → ["firmware.txt"]
+"""
+from pathlib import Path
+from typing import Optional
+
+from binary_file_tool.convert_file.strategy_base import ConvertFileStrategy
+from binary_file_tool.file_error.exceptions import check_file_not_empty
+
+# 1回の読み込みで処理する行数
+_LINES_PER_CHUNK = 4096
+
+
+class BinaryToHexStrategy(ConvertFileStrategy):
+    """
+    バイナリファイルから16進数テキストファイルに変換する戦略。
+    """
+    def __init__(self, line_width: int = 16, group_size: int = 1,
+                 uppercase: bool = False,
+                 output_dir: Optional[str] = None) -> None:
+        """
+        Args:
+            line_width (int, optional): 1行あたりのバイト数. Defaults to 16.
+            group_size (int, optional): 空白で区切るバイト数。0 の場合は区切らない. Defaults to 1.
+            uppercase (bool, optional): 大文字で出力するかどうか. Defaults to False.
+            output_dir (Optional[str], optional): 出力ディレクトリ. Defaults to None.
+
+        Raises:
+            ValueError: line_width が正の整数でない場合、group_size が負の場合
+        """
+        if line_width <= 0:
+            raise ValueError(f"line_width は正の整数である必要があります。指定値: {line_width}")
+        if group_size < 0:
+            raise ValueError(f"group_size は0以上の整数である必要があります。指定値: {group_size}")
+
+        self.line_width = line_width
+        self.group_size = group_size
+        self.uppercase  = uppercase
+        self.output_dir = Path(output_dir) if output_dir else None
+
+    def execute(self, filepath: str) -> list[str]:
+        """
+        バイナリファイルから16進数テキストファイルに変換する
+
+        Args:
+            filepath (str): 変換元のファイルパス（絶対または相対パス）
+
+        Raises:
+            EmptyFileError: ファイルが空の場合
+
+        Returns:
+            list[str]: 出力されたテキストファイルのパス（1要素）
+        """
+        file = Path(filepath)
+
+        # 空ファイルの検出と例外処理
+        check_file_not_empty(file)
+
+        # 出力ディレクトリ
+        out_dir = self.output_dir or file.parent
+        out_dir.mkdir(parents=True, exist_ok=True)
+        out_path = out_dir / file.with_suffix('.txt').name
+
+        width      = self.line_width
+        chunk_size = width * _LINES_PER_CHUNK
+        with open(filepath, 'rb') as fin, \
+            open(out_path, 'w', encoding='ascii', newline='\n') as fout:
+
+            while True:
+                chunk = fin.read(chunk_size)
+                if not chunk:
+                    break
+                text = '\n'.join(self._format_line(chunk[i:i + width]) for i in range(0, len(chunk), width)) + '\n'
+                fout.write(text.upper() if self.uppercase else text)
+
+        return [str(out_path)]
+
+    def _format_line(self, line: bytes) -> str:
+        if self.group_size == 0:
+            return line.hex()
+        # 負の bytes_per_sep で先頭から group_size バイトごとに区切る
+        return line.hex(' ', -self.group_size)
@@ -0,0 +1,257 @@
+"""
+bulk_record.py
+
+固定長レコード（Intel HEX / Motorola S-record の行）をまとめて生成・解析するための関数群。
+
+k 個の固定長レコードを「stride バイトごとに並んだバイト列」として扱い、
+列単位の拡張スライス（records[c::stride]）で組み立て・分解することで、
+レコードごとの Python ループを使わずに処理する。
+
+- record_sums: 各レコードの総和（下位8ビット）を一括計算する。
+  各列を16ビット（または32ビット）のレーンに広げた多倍長整数とし、
+  列ごとの加算で全レコード分を同時に計算するため、1バイトずつのループが不要
+- interleave / gather_columns: 列の組み立て・取り出し（可能な場合は2/4/8バイト単位でコピー）
+- sequential_values: 連続する値（アドレスなど）をビッグエンディアンで並べる
+- format_lines / decode_lines: レコードと「マーク + 16進数 + 改行」形式の行との相互変換。
+  マークと改行の文字数の合計が偶数の場合、レコード末尾の予備列（padding）をその位置に割り当て、
+  16進数変換を1回で行う
+
+各関数の結果は、1レコードずつ処理する参照実装（reference_*）と一致する（tests/binary_file_tool/test_bulk_record.py で比較）。
+"""
+import binascii
+import math
+import struct
+from typing import Optional
+
+# チェックサム計算用の変換テーブル（2の補数 / 1の補数）
+NEGATE_TABLE = bytes(-i & 0xFF for i in range(256))
+INVERT_TABLE = bytes(0xFF - i for i in range(256))
+
+# コピー単位（バイト）ごとの memoryview.cast の形式
+_CAST_FORMATS = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+
+
+def line_padding(mark: bytes) -> int:
+    """
+    format_lines で1回の16進数変換を行うために、レコード末尾に確保する予備列の数を返す。
+    マークと改行（'\\n'）の文字数の合計が奇数の場合は 0（予備列を使用しない）。
+    """
+    extra = len(mark) + 1
+    return extra // 2 if extra % 2 == 0 else 0
+
+
+def record_sums(records: bytes, stride: int) -> bytes:
+    """
+    各レコード（stride バイト）の総和の下位8ビットを一括計算する。
+
+    Args:
+        records (bytes): stride バイトごとに並んだレコード列
+        stride (int): 1レコードのバイト数
+
+    Returns:
+        bytes: レコードごとの総和の下位8ビット（レコード数と同じ長さ）
+    """
+    # レーン幅：stride バイト分の総和が桁あふれしない幅
+    lane_bytes = 2 if stride * 0xFF <= 0xFFFF else 4
+    lanes = bytearray((len(records) // stride) * lane_bytes)
+    # 列ごとにレーンへ広げた多倍長整数を加算する（レコード数分を1回の加算で処理）
+    total = 0
+    for c in range(stride):
+        lanes[0::lane_bytes] = records[c::stride]
+        total += int.from_bytes(lanes, 'little')
+
+    return total.to_bytes(len(lanes), 'little')[0::lane_bytes]
+
+
+def _cast(buffer, unit: int) -> memoryview:
+    return memoryview(buffer).cast('B').cast(_CAST_FORMATS[unit])
+
+
+def interleave(parts: list[tuple[bytes, int]], k: int, extra: int = 0) -> tuple[bytearray, int]:
+    """
+    列データを並べて k 個の固定長レコードを組み立てる。
+
+    Args:
+        parts (list[tuple[bytes, int]]): (データ, 幅) のリスト。データは k * 幅 バイト
+        k (int): レコード数
+        extra (int, optional): 末尾に確保する列数（0で初期化。チェックサム・予備列用）. Defaults to 0.
+
+    Returns:
+        tuple[bytearray, int]: レコード列, 1レコードのバイト数
+    """
+    stride  = sum(width for _, width in parts) + extra
+    records = bytearray(k * stride)
+    # すべての幅・位置を割り切る単位でまとめてコピーする
+    unit = math.gcd(stride, *(width for _, width in parts))
+    unit = max(u for u in _CAST_FORMATS if unit % u == 0)
+    with _cast(records, unit) as dst:
+        col = 0
+        for data, width in parts:
+            with _cast(data, unit) as src:
+                for j in range(width // unit):
+                    dst[col // unit + j::stride // unit] = src[j::width // unit]
+            col += width
+    return records, stride
+
+
+def gather_columns(records: bytes, stride: int, start: int, stop: int) -> bytearray:
+    """
+    各レコードの [start, stop) 列を取り出し、連続したバイト列として返す。
+    """
+    width = stop - start
+    out   = bytearray((len(records) // stride) * width)
+    unit  = math.gcd(stride, start, width)
+    unit  = max(u for u in _CAST_FORMATS if unit % u == 0)
+    with _cast(out, unit) as dst, _cast(records, unit) as src:
+        for j in range(width // unit):
+            dst[j::width // unit] = src[start // unit + j::stride // unit]
+    return out
+
+
+def sequential_values(start: int, step: int, k: int, width: int) -> bytes:
+    """
+    start から step ずつ増加する k 個の値を、width バイトのビッグエンディアンで並べる。
+    """
+    if width in (2, 4, 8):
+        return struct.pack(f'>{k}{_CAST_FORMATS[width]}', *range(start, start + step * k, step))
+    packed = struct.pack(f'>{k}Q', *range(start, start + step * k, step))
+    out = bytearray(k * width)
+    for j in range(width):
+        out[j::width] = packed[8 - width + j::8]
+    return bytes(out)
+
+
+def format_lines(mark: bytes, records: bytes, stride: int, padding: int = 0) -> bytes:
+    """
+    各レコードを「mark + 16進数（大文字） + 改行」の行に変換し、連結して返す。
+
+    Args:
+        mark (bytes): 行頭のマーク（b':' / b'S3' など）
+        records (bytes): stride バイトごとに並んだレコード列
+        stride (int): 1レコードのバイト数（予備列を含む）
+        padding (int, optional): レコード末尾の予備列の数（line_padding(mark) または 0）. Defaults to 0.
+
+    Returns:
+        bytes: 連結した行
+    """
+    k       = len(records) // stride
+    hex_len = 2 * (stride - padding)
+    text    = bytearray(binascii.hexlify(records).upper())
+
+    if padding and padding == line_padding(mark):
+        # 予備列の位置に「改行 + 次の行のマーク」を書き込み、全体を1文字列として扱う
+        length = 2 * stride
+        for j, c in enumerate(b'\n' + mark):
+            text[hex_len + j::length] = bytes([c]) * k
+        return mark + text[:len(text) - len(mark)]
+
+    length = len(mark) + hex_len + 1
+    out = bytearray(k * length)
+    for j, c in enumerate(mark):
+        out[j::length] = bytes([c]) * k
+    for c in range(hex_len):
+        out[len(mark) + c::length] = text[c::2 * stride]
+    out[length - 1::length] = b'\n' * k
+    return out
+
+
+def decode_lines(lines: list[bytes], mark_len: int) -> Optional[tuple[bytes, int, int]]:
+    """
+    同じ長さの行（先頭 mark_len 文字が共通のマーク、続いて16進数、末尾に改行）を一括でデコードする。
+    形式が揃っていない場合は None を返す（呼び出し側で1行ずつ処理する）。
+
+    Args:
+        lines (list[bytes]): 同じ長さの行のリスト（改行を含む）
+        mark_len (int): 行頭のマークの文字数
+
+    Returns:
+        Optional[tuple[bytes, int, int]]: レコード列, 1レコードのバイト数, 末尾の予備列（値は0）の数
+    """
+    k       = len(lines)
+    first   = lines[0]
+    length  = len(first)
+    eol     = 2 if first.endswith(b'\r\n') else 1 if first.endswith(b'\n') else 0
+    hex_len = length - mark_len - eol
+    if eol == 0 or hex_len <= 0 or hex_len % 2:
+        return None
+
+    joined = b''.join(lines)
+    if len(joined) != k * length:
+        return None
+    # マーク・改行の列がすべて一致すること
+    for j in list(range(mark_len)) + list(range(length - eol, length)):
+        if joined[j::length] != bytes([first[j]]) * k:
+            return None
+
+    extra = mark_len + eol
+    if extra % 2 == 0:
+        # 「改行 + 次の行のマーク」の位置を '0' に置き換え、全体を1回でデコードする
+        text = bytearray(joined[mark_len:]) + b'0' * mark_len
+        for j in range(extra):
+            text[hex_len + j::length] = b'0' * k
+        padding = extra // 2
+    else:
+        text = bytearray(k * hex_len)
+        for c in range(hex_len):
+            text[c::hex_len] = joined[mark_len + c::length]
+        padding = 0
+
+    try:
+        return binascii.unhexlify(text), len(text) // (2 * k), padding
+    except binascii.Error:
+        return None
+
+
+# ----------------------------------------------------------------------
+# 参照実装（1レコードずつ処理する。上の一括処理の関数と同じ結果を返す）
+# ----------------------------------------------------------------------
+def reference_record_sums(records: bytes, stride: int) -> bytes:
+    """record_sums の参照実装"""
+    return bytes(sum(records[i:i + stride]) & 0xFF for i in range(0, len(records) - stride + 1, stride))
+
+
+def reference_interleave(parts: list[tuple[bytes, int]], k: int, extra: int = 0) -> tuple[bytearray, int]:
+    """interleave の参照実装"""
+    records = bytearray()
+    for i in range(k):
+        for data, width in parts:
+            records += data[i * width:(i + 1) * width]
+        records += bytes(extra)
+    return records, sum(width for _, width in parts) + extra
+
+
+def reference_gather_columns(records: bytes, stride: int, start: int, stop: int) -> bytearray:
+    """gather_columns の参照実装"""
+    out = bytearray()
+    for i in range(0, len(records) - stride + 1, stride):
+        out += records[i + start:i + stop]
+    return out
+
+
+def reference_format_lines(mark: bytes, records: bytes, stride: int, padding: int = 0) -> bytes:
+    """format_lines の参照実装"""
+    lines = []
+    for i in range(0, len(records) - stride + 1, stride):
+        lines.append(mark + binascii.hexlify(records[i:i + stride - padding]).upper() + b'\n')
+    return b''.join(lines)
+
+
+def reference_decode_lines(lines: list[bytes], mark_len: int) -> Optional[tuple[bytes, int, int]]:
+    """decode_lines の参照実装"""
+    first   = lines[0]
+    eol     = 2 if first.endswith(b'\r\n') else 1 if first.endswith(b'\n') else 0
+    hex_len = len(first) - mark_len - eol
+    if eol == 0 or hex_len <= 0 or hex_len % 2:
+        return None
+
+    padding = (mark_len + eol) // 2 if (mark_len + eol) % 2 == 0 else 0
+    records = bytearray()
+    for line in lines:
+        if len(line) != len(first) or line[:mark_len] != first[:mark_len] or line[-eol:] != first[-eol:]:
+            return None
+        try:
+            records += binascii.unhexlify(line[mark_len:mark_len + hex_len])
+        except binascii.Error:
+            return None
+        records += bytes(padding)
+    return bytes(records), hex_len // 2 + padding, padding
@@ -0,0 +1,422 @@
+"""
+decode_records_strategy.py
+
+固定長レコードで構成されたバイナリファイル（キャプチャファイルなど）を、
+レコードのレイアウトに従ってデコードし、CSV（または Parquet）に出力する戦略クラスを提供します。
+
+クラス:
+    RecordLayout: レコードのレイアウト（struct の書式・列名）
+    DecodeRecordsStrategy: バイナリファイル → CSV（.csv）/ Parquet（.parquet）
+
+- レイアウトは struct の書式文字列（例: ">i8si64s"）または TOML のフィールド定義で指定する
+- ファイルを mmap で開き、バッチ（既定 65536 レコード）ごとに一括デコードする
+  - NumPy がある場合は、レイアウトと同じ配置（バイトオーダー・アラインメント・パディング）の構造化型
+    （numpy_dtype）で np.frombuffer により読み込み、列ごとの配列を CSV / Parquet に渡す
+  - NumPy がない場合は struct.iter_unpack でデコードし、列ごとの値に組み替える
+  （いずれもレコードごとの struct.unpack 呼び出しやインデックス計算を行わない）
+- 文字列（s / c）の列は末尾の NUL を除去し、列単位でまとめてデコードする
+- CSV はバッチ単位で csv.writer.writerows により書き込む（一定メモリ）
+- Parquet 出力には pyarrow が必要（未インストールの場合はエラー）
+
+TOML のフィールド定義:
+    byteorder = "big"        # big / little / native（省略時は native。アラインメントなし）
+
+    [[field]]
+    name = "id"
+    type = "i"               # struct の書式文字（個数付き可。"8s" は8バイトの文字列、"3H" は3列）
+
+    [[field]]
+    type = "4x"              # パディング（name 不要）
+
+使用例:
+    layout = load_layout(">i8si64s", names=["id", "name", "value", "payload"])
+    DecodeRecordsStrategy(layout).execute("capture.dat")  # → ["capture.csv"]
+"""
+import csv
+import mmap
+import re
+import struct
+import time
+import tomllib
+from dataclasses import dataclass
+from itertools import repeat
+from pathlib import Path
+from typing import Iterator, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from binary_file_tool.convert_file.strategy_base import ConvertFileStrategy
+from binary_file_tool.file_operation.copy_engine import format_throughput
+from binary_file_tool.file_error.exceptions import check_file_not_empty, check_offset_in_range
+from binary_file_tool.file_error.file_info import FileInfo
+
+# TOML の byteorder と struct のバイトオーダー文字の対応
+BYTE_ORDERS = {'big': '>', 'little': '<', 'native': '='}
+
+# 出力形式
+OUTPUT_FORMATS = ('csv', 'parquet')
+
+# 1回にデコードするレコード数の既定値
+DEFAULT_BATCH_RECORDS = 64 * 1024
+
+# 書式文字列の1要素（個数 + 書式文字）。n / N / p / P はファイル上のレイアウトとして扱わない
+_TOKEN = re.compile(r'\s*(\d*)([xcbB?hHiIlLqQefds])\s*')
+# 文字列として扱う書式文字
+_TEXT_CODES = ('s', 'c')
+# 書式文字に対応する NumPy の型の種類（サイズはバイトオーダーに応じて struct.calcsize で求める）
+_NUMPY_KINDS = {
+    'b': 'i', 'h': 'i', 'i': 'i', 'l': 'i', 'q': 'i',
+    'B': 'u', 'H': 'u', 'I': 'u', 'L': 'u', 'Q': 'u',
+    '?': 'b', 'e': 'f', 'f': 'f', 'd': 'f', 's': 'S', 'c': 'S',
+}
+# struct のバイトオーダー文字と NumPy のバイトオーダー
+_NUMPY_ORDERS = {'': '=', '@': '=', '=': '=', '<': '<', '>': '>', '!': '>'}
+
+
+@dataclass(frozen=True)
+class RecordLayout:
+    """
+    レコードのレイアウト。
+
+    Attributes:
+        format (str): バイトオーダーを含む struct の書式文字列
+        names (tuple[str, ...]): 列名（デコード後の値の数と同じ）
+        text_columns (tuple[int, ...]): 文字列（s / c）の列の位置
+    """
+    format: str
+    names: tuple[str, ...]
+    text_columns: tuple[int, ...]
+
+    @property
+    def record_size(self) -> int:
+        """1レコードのバイト数"""
+        return struct.calcsize(self.format)
+
+
+def _tokens(body: str, source: str) -> Iterator[tuple[int, str]]:
+    """
+    書式文字列（バイトオーダー文字を除く）を (個数, 書式文字) に分解する。
+    """
+    pos = 0
+    while pos < len(body):
+        match = _TOKEN.match(body, pos)
+        if not match:
+            raise ValueError(f"レコードの書式が不正です（使用できる書式文字: x c b B ? h H i I l L q Q e f d s）: '{source}'")
+        count, code = match.groups()
+        yield (int(count) if count else 1), code
+        pos = match.end()
+
+
+def _build_layout(byte_order: str, fields: list[tuple[str, Optional[str]]], source: str) -> RecordLayout:
+    """
+    (書式, 列名) のリストからレイアウトを作成する。列名が None の場合は field<番号> とする。
+    """
+    names: list[str] = []
+    text_columns: list[int] = []
+    for fmt, name in fields:
+        for count, code in _tokens(fmt, source):
+            if code == 'x':
+                continue
+            # s は個数をバイト数として1列、それ以外は個数分の列
+            width = 1 if code == 's' else count
+            for j in range(width):
+                if code in _TEXT_CODES:
+                    text_columns.append(len(names))
+                if name is None:
+                    names.append(f"field{len(names)}")
+                else:
+                    names.append(name if width == 1 else f"{name}_{j}")
+
+    if not names:
+        raise ValueError(f"デコードする列がありません: '{source}'")
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"列名が重複しています（{', '.join(duplicates)}）: '{source}'")
+
+    layout = RecordLayout(byte_order + ''.join(fmt for fmt, _ in fields), tuple(names), tuple(text_columns))
+    if layout.record_size == 0:
+        raise ValueError(f"レコードサイズが0です: '{source}'")
+    return layout
+
+
+def parse_format(fmt: str, names: Optional[list[str]] = None) -> RecordLayout:
+    """
+    struct の書式文字列からレイアウトを作成する。
+
+    Args:
+        fmt (str): 書式文字列（例: ">i8si64s"）。先頭のバイトオーダー文字の扱いは struct と同じ
+        names (Optional[list[str]], optional): 列名。None の場合は field0, field1, ... . Defaults to None.
+
+    Raises:
+        ValueError: 書式が不正な場合、列名の数が列の数と一致しない場合
+
+    Returns:
+        RecordLayout: レイアウト
+    """
+    fmt = fmt.strip()
+    byte_order, body = (fmt[0], fmt[1:]) if fmt[:1] in '@=<>!' and fmt else ('', fmt)
+    layout = _build_layout(byte_order, [(body, None)], fmt)
+    if names is not None:
+        if len(names) != len(layout.names):
+            raise ValueError(f"列名の数({len(names)})が列の数({len(layout.names)})と一致しません: '{fmt}'")
+        if len(set(names)) != len(names):
+            raise ValueError(f"列名が重複しています: '{fmt}'")
+        layout = RecordLayout(layout.format, tuple(names), layout.text_columns)
+    return layout
+
+
+def load_layout_toml(path: str) -> RecordLayout:
+    """
+    TOML のフィールド定義からレイアウトを作成する。
+
+    Args:
+        path (str): TOML ファイルのパス
+
+    Raises:
+        ValueError: byteorder / フィールドの定義が不正な場合
+
+    Returns:
+        RecordLayout: レイアウト
+    """
+    with open(path, 'rb') as f:
+        data = tomllib.load(f)
+
+    byte_order = data.get('byteorder', 'native')
+    if byte_order not in BYTE_ORDERS:
+        raise ValueError(f"byteorder は {tuple(BYTE_ORDERS)} のいずれかである必要があります。指定値: {byte_order}（{path}）")
+
+    fields = []
+    for i, field in enumerate(data.get('field', [])):
+        fmt = field.get('type')
+        if not isinstance(fmt, str) or not fmt.strip():
+            raise ValueError(f"field[{i}] に type がありません: '{path}'")
+        name = field.get('name')
+        if name is None and fmt.strip()[-1:] != 'x':
+            raise ValueError(f"field[{i}] に name がありません: '{path}'")
+        fields.append((fmt.strip(), name))
+    if not fields:
+        raise ValueError(f"[[field]] が定義されていません: '{path}'")
+    return _build_layout(BYTE_ORDERS[byte_order], fields, path)
+
+
+def numpy_dtype(layout: RecordLayout) -> 'np.dtype':
+    """
+    レイアウトと同じ配置の NumPy の構造化型を作成する（NumPy がある場合に使用）。
+    各列の位置は、struct の "0<書式文字>"（値を読まずにアラインメントのみ行う）を付けた書式の calcsize で求めるため、
+    ネイティブのアラインメント（@）も struct と同じになる。
+
+    Args:
+        layout (RecordLayout): レコードのレイアウト
+
+    Returns:
+        np.dtype: 列ごとのフィールド（f0, f1, ...）を持つ構造化型。itemsize はレコードサイズ
+    """
+    fmt = layout.format
+    byte_order, body = (fmt[0], fmt[1:]) if fmt[:1] in '@=<>!' else ('', fmt)
+    formats: list[str] = []
+    offsets: list[int] = []
+    prefix = byte_order
+    for count, code in _tokens(body, fmt):
+        if code == 's':
+            formats.append(f"S{count}")
+            offsets.append(struct.calcsize(f"{prefix}0s"))
+        elif code != 'x':
+            size  = struct.calcsize(f"{byte_order}{code}")
+            start = struct.calcsize(f"{prefix}0{code}")
+            kind  = _NUMPY_KINDS[code]
+            for j in range(count):
+                formats.append(f"S{size}" if kind == 'S' else f"{_NUMPY_ORDERS[byte_order]}{kind}{size}")
+                offsets.append(start + j * size)
+        prefix += f"{count}{code}"
+    return np.dtype({'names': [f"f{i}" for i in range(len(formats))], 'formats': formats,
+                     'offsets': offsets, 'itemsize': layout.record_size})
+
+
+def load_layout(spec: str, names: Optional[list[str]] = None) -> RecordLayout:
+    """
+    レイアウトの指定（struct の書式文字列、または TOML ファイルのパス）からレイアウトを作成する。
+
+    Args:
+        spec (str): 書式文字列、または拡張子 .toml のファイルパス
+        names (Optional[list[str]], optional): 書式文字列の場合の列名. Defaults to None.
+
+    Raises:
+        ValueError: レイアウトが不正な場合、TOML と列名を同時に指定した場合
+
+    Returns:
+        RecordLayout: レイアウト
+    """
+    if Path(spec).suffix.lower() == '.toml':
+        if names is not None:
+            raise ValueError("TOML のレイアウトでは列名を TOML の name で指定してください")
+        return load_layout_toml(spec)
+    return parse_format(spec, names)
+
+
+class DecodeRecordsStrategy(ConvertFileStrategy):
+    """
+    固定長レコードのバイナリファイルをデコードし、CSV / Parquet に出力する戦略。
+    """
+    cpu_bound = True
+
+    def __init__(self, layout: RecordLayout, output_format: str = 'csv', offset: int = 0,
+                 count: Optional[int] = None, batch_records: int = DEFAULT_BATCH_RECORDS,
+                 encoding: str = 'utf-8', output_dir: Optional[str] = None) -> None:
+        """
+        Args:
+            layout (RecordLayout): レコードのレイアウト
+            output_format (str, optional): 出力形式（csv / parquet）. Defaults to 'csv'.
+            offset (int, optional): 先頭レコードの位置（ヘッダを読み飛ばす場合に指定）. Defaults to 0.
+            count (Optional[int], optional): デコードする最大レコード数。None の場合はファイル末尾まで. Defaults to None.
+            batch_records (int, optional): 1回にデコードするレコード数. Defaults to 65536.
+            encoding (str, optional): 文字列の列のエンコーディング. Defaults to 'utf-8'.
+            output_dir (Optional[str], optional): 出力ディレクトリ. Defaults to None.
+
+        Raises:
+            ValueError: 引数が範囲外の場合
+        """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"output_format は {OUTPUT_FORMATS} のいずれかである必要があります。指定値: {output_format}")
+        if offset < 0:
+            raise ValueError(f"offset は0以上である必要があります。指定値: {offset}")
+        if count is not None and count <= 0:
+            raise ValueError(f"count は1以上である必要があります。指定値: {count}")
+        if batch_records <= 0:
+            raise ValueError(f"batch_records は1以上である必要があります。指定値: {batch_records}")
+
+        self.layout        = layout
+        self.output_format = output_format
+        self.offset        = offset
+        self.count         = count
+        self.batch_records = batch_records
+        self.encoding      = encoding
+        self.output_dir    = Path(output_dir) if output_dir else None
+        self._dtype        = numpy_dtype(layout) if np is not None else None
+
+    def execute(self, filepath: str) -> list[str]:
+        """
+        バイナリファイルをデコードして出力する
+
+        Args:
+            filepath (str): 変換元のファイルパス（絶対または相対パス）
+
+        Raises:
+            EmptyFileError: ファイルが空の場合
+            OffsetOutOfRangeError: offset がファイルサイズ以上の場合
+            ValueError: offset 以降が1レコードに満たない場合
+            ImportError: parquet 出力で pyarrow がインストールされていない場合
+
+        Returns:
+            list[str]: 出力ファイルのパス（1要素）
+        """
+        file = Path(filepath)
+
+        # 空ファイル・オフセットの検出と例外処理
+        info = FileInfo.from_path(file)
+        check_file_not_empty(info)
+        check_offset_in_range(info, self.offset)
+        record_size = self.layout.record_size
+        available   = info.size - self.offset
+        records     = available // record_size
+        if records == 0:
+            raise ValueError(f"データ({available}バイト)がレコードサイズ({record_size}バイト)に満たないため、デコードできません: '{file}'")
+        if self.count is not None:
+            records = min(records, self.count)
+        elif available % record_size:
+            print(f"[警告] 末尾の {available % record_size} バイトはレコードサイズ({record_size}バイト)に満たないため無視します: {filepath}")
+
+        # 出力ディレクトリ
+        out_dir = self.output_dir or file.parent
+        out_dir.mkdir(parents=True, exist_ok=True)
+        out_path = out_dir / file.with_suffix(f'.{self.output_format}').name
+
+        start = time.perf_counter()
+        with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            chunks = self._chunks(mm, records)
+            try:
+                if self.output_format == 'parquet':
+                    self._write_parquet(chunks, out_path)
+                else:
+                    self._write_csv(chunks, out_path)
+            except BaseException:
+                # 書きかけの出力ファイルは残さない
+                out_path.unlink(missing_ok=True)
+                raise
+
+        elapsed = time.perf_counter() - start
+        print(f"レコード数：{records} 処理速度：{format_throughput(records * record_size, elapsed)} {filepath}")
+        return [str(out_path)]
+
+    def _chunks(self, mm: mmap.mmap, records: int) -> Iterator[bytes]:
+        """
+        batch_records レコードずつのバイト列を返す。
+        """
+        record_size = self.layout.record_size
+        for first in range(0, records, self.batch_records):
+            last = min(first + self.batch_records, records)
+            yield mm[self.offset + first * record_size:self.offset + last * record_size]
+
+    def _columns(self, chunk: bytes) -> list:
+        """
+        バッチ全体を一括でデコードし、列ごとの値を返す（文字列の列はデコードする）。
+        NumPy がある場合、数値の列は NumPy の配列（ネイティブのバイトオーダー）、文字列の列はリストとする。
+        """
+        if self._dtype is None:
+            columns = list(zip(*struct.iter_unpack(self.layout.format, chunk)))
+            for i in self.layout.text_columns:
+                stripped   = map(bytes.rstrip, columns[i], repeat(b'\x00'))
+                columns[i] = tuple(map(bytes.decode, stripped, repeat(self.encoding), repeat('replace')))
+            return columns
+
+        records = np.frombuffer(chunk, dtype=self._dtype)
+        columns = []
+        for i, name in enumerate(self._dtype.names):
+            column = records[name]
+            if i in self.layout.text_columns:
+                # S 型の値は末尾の NUL が除去される
+                column = [value.decode(self.encoding, 'replace') for value in column.tolist()]
+            elif column.dtype.kind == 'b':
+                # struct の ? と同じく、0 以外の値を True とする
+                column = column.view(np.uint8) != 0
+            elif column.dtype.kind == 'f' and column.dtype.itemsize == 2:
+                # 半精度（e）は struct と同じく倍精度とする（Parquet は半精度に対応しないため）
+                column = column.astype(np.float64)
+            else:
+                column = column.astype(column.dtype.newbyteorder('='))
+            columns.append(column)
+        return columns
+
+    def _write_csv(self, chunks: Iterator[bytes], out_path: Path) -> None:
+        with open(out_path, 'w', newline='', encoding='utf-8') as out:
+            writer = csv.writer(out)
+            writer.writerow(self.layout.names)
+            for chunk in chunks:
+                if self._dtype is not None:
+                    writer.writerows(zip(*(column if isinstance(column, list) else column.tolist()
+                                           for column in self._columns(chunk))))
+                elif self.layout.text_columns:
+                    writer.writerows(zip(*self._columns(chunk)))
+                else:
+                    # 数値のみの場合は列に組み替えずにそのまま書き込む
+                    writer.writerows(struct.iter_unpack(self.layout.format, chunk))
+
+    def _write_parquet(self, chunks: Iterator[bytes], out_path: Path) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("parquet 形式の出力には pyarrow が必要です（pip install pyarrow）") from e
+
+        writer = None
+        try:
+            for chunk in chunks:
+                table = pa.table(dict(zip(self.layout.names, self._columns(chunk))))
+                if writer is None:
+                    writer = pq.ParquetWriter(out_path, table.schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
@@ -25,6 +25,8 @@ class HexToBinaryChunkedStrategy(ConvertFileStrategy):
     chunk_sizeで指定したサイズごとに読み込み、変換を行います。
     
     """
+    cpu_bound = True
+
     def __init__(self, 
                  encoding: str = 'utf-8-sig', chunk_size: int = 8192,
                  output_dir: Optional[str] = None) -> None:
@@ -0,0 +1,108 @@
+"""
+hextobinary_fast_strategy.py
+
+大容量の16進数テキストファイルを高速にバイナリファイルへ変換する戦略クラス。
+HexToBinaryChunkedStrategy と同一の出力を、以下の方法で高速に生成する。
+
+- テキストとしてデコードせず、バイナリモードで大きなバッファ単位に読み込む（readinto で再利用）
+- 16進数以外のバイトを bytes.translate(None, 削除テーブル) で一括削除（正規表現を使用しない）
+- binascii.unhexlify で一括デコード。奇数桁の端数（最大1文字）のみ次回に持ち越す
+
+備考:
+    UTF-8（BOM付きを含む）のテキストを前提とする。マルチバイト文字や BOM は
+    すべて 0x80 以上のバイトで構成されるため、16進数以外の文字として削除される。
+
+使用例:
+    strategy = HexToBinaryFastStrategy()
+    strategy.execute("hexdata.txt")  # → ["hexdata.bin"]
+"""
+import binascii
+from pathlib import Path
+from typing import Optional
+
+from binary_file_tool.convert_file.strategy_base import ConvertFileStrategy
+from binary_file_tool.file_error.exceptions import check_file_not_empty
+
+# 16進数として有効な文字以外を削除するためのテーブル
+_HEX_DIGITS   = b'0123456789abcdefABCDEF'
+_DELETE_TABLE = bytes(b for b in range(256) if b not in _HEX_DIGITS)
+
+# 既定の読み込みチャンクサイズ
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class HexToBinaryFastStrategy(ConvertFileStrategy):
+    """
+    16進数テキストファイルからバイナリファイルに変換する戦略(高速版)。
+    出力は HexToBinaryChunkedStrategy とバイト単位で同一。
+    """
+    cpu_bound = True
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 output_dir: Optional[str] = None) -> None:
+        """
+        Args:
+            chunk_size (int): 読み込みチャンクサイズ（バイト）. Defaults to 1MiB.
+            output_dir (Optional[str]): 出力ディレクトリ. Defaults to None.
+
+        Raises:
+            ValueError: chunk_size が正の整数でない場合
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"チャンクサイズは正の整数である必要があります。指定値: {chunk_size}")
+
+        self.chunk_size = chunk_size
+        self.output_dir = Path(output_dir) if output_dir else None
+
+    def execute(self, filepath: str) -> list[str]:
+        """
+        16進数テキストファイルからバイナリファイルに変換する
+
+        Args:
+            filepath (str): 変換元のファイルパス（絶対または相対パス）
+
+        Raises:
+            EmptyFileError: ファイルが空の場合
+            ValueError: 16進数の文字数が奇数の場合
+
+        Returns:
+            list[str]: 出力されたバイナリファイルのパス（1要素）
+        """
+        file = Path(filepath)
+
+        # 空ファイルの検出と例外処理
+        check_file_not_empty(file)
+
+        # 出力ディレクトリ
+        out_dir = self.output_dir or file.parent
+        # 出力ディレクトリが存在しない場合は作成
+        out_dir.mkdir(parents=True, exist_ok=True)
+        out_path = out_dir / file.with_suffix('.bin').name
+
+        # 読み込みバッファは再利用する
+        buffer = bytearray(self.chunk_size)
+        carry  = b""
+        with open(filepath, 'rb', buffering=0) as fin, \
+            open(out_path, 'wb') as fout:
+
+            while True:
+                n = fin.readinto(buffer)
+                if not n:
+                    break
+
+                # 16進数文字以外（空白・改行・BOMなど）を一括削除
+                chunk   = buffer if n == len(buffer) else buffer[:n]
+                cleaned = chunk.translate(None, _DELETE_TABLE)
+                if carry:
+                    cleaned[0:0] = carry
+
+                # 偶数文字数まで処理、残り（最大1文字）は次回に持ち越し
+                process_len = len(cleaned) & ~1
+                with memoryview(cleaned) as view:
+                    fout.write(binascii.unhexlify(view[:process_len]))
+                carry = bytes(cleaned[process_len:])
+
+            if carry:
+                raise ValueError(f"変換できない1文字が残りました（不正な16進数？）: '{carry.decode('ascii')}'")
+
+        return [str(out_path)]
@@ -0,0 +1,304 @@
+"""
+intelhex_strategy.py
+
+Intel HEX 形式とバイナリファイルを相互に変換する戦略クラスを提供します。
+
+クラス:
+    BinaryToIntelHexStrategy: バイナリファイル → Intel HEX（.hex）
+    IntelHexToBinaryStrategy: Intel HEX → バイナリファイル（.bin）
+
+- チャンク単位で読み込み、レコード単位の行をまとめて書き込む（ストリーミング処理）
+- 固定長のデータレコードは bulk_record により列単位で一括生成・一括解析し、
+  チェックサムも全レコード分をまとめて計算する（レコードごとのループなし）
+- 64KiB 境界で拡張リニアアドレスレコード（タイプ04）を出力する
+- 端数のレコードは 64KiB 境界の直前とファイルの末尾にのみ出力する（読み込みの区切りでは分割しない）
+- 変換時はタイプ02（拡張セグメントアドレス）/ タイプ04 に対応。タイプ03 / 05（開始アドレス）は無視する
+
+使用例:
+    BinaryToIntelHexStrategy(start_address=0x08000000).execute("firmware.bin")  # → ["firmware.hex"]
+    IntelHexToBinaryStrategy(fill=0xFF).execute("firmware.hex")                  # → ["firmware.bin"]
+"""
+import binascii
+import itertools
+import os
+from pathlib import Path
+from typing import Optional
+
+from binary_file_tool.convert_file.strategy_base import ConvertFileStrategy
+from binary_file_tool.convert_file import bulk_record
+from binary_file_tool.convert_file.binary_image_writer import BinaryImageWriter
+from binary_file_tool.file_error.exceptions import check_file_not_empty
+from binary_file_tool.file_error.file_info import FileInfo
+
+# レコードタイプ
+_DATA                     = 0x00
+_END_OF_FILE              = 0x01
+_EXTENDED_SEGMENT_ADDRESS = 0x02
+_START_SEGMENT_ADDRESS    = 0x03
+_EXTENDED_LINEAR_ADDRESS  = 0x04
+_START_LINEAR_ADDRESS     = 0x05
+
+# 1回に読み込むレコード数
+_RECORDS_PER_CHUNK = 4096
+
+# 変換時に1回で読み込む行のサイズの目安（バイト）
+_LINES_HINT = 1024 * 1024
+
+
+def _format_record(address: int, record_type: int, data: bytes) -> bytes:
+    """
+    1レコード分の行（':' + 16進数 + 改行）を作成する。
+    """
+    record = bytearray((len(data), (address >> 8) & 0xFF, address & 0xFF, record_type))
+    record += data
+    # チェックサム：レコードの総和の2の補数
+    record.append(-sum(record) & 0xFF)
+    return b':' + binascii.hexlify(record).upper() + b'\n'
+
+
+def _format_data_records(address: int, data: bytes, record_size: int) -> bytes:
+    """
+    同一の64KiB領域内にある、record_size バイトのデータレコードをまとめて作成する。
+    """
+    k       = len(data) // record_size
+    padding = bulk_record.line_padding(b':')
+    # レコード長・アドレス・レコードタイプ(00)の4バイトを32ビット値としてまとめて生成
+    header  = bulk_record.sequential_values((record_size << 24) | ((address & 0xFFFF) << 8), record_size << 8, k, 4)
+    records, stride = bulk_record.interleave([(header, 4), (data, record_size)], k, extra=1 + padding)
+    # チェックサム：全レコード分をまとめて計算
+    checksum_col = stride - padding - 1
+    records[checksum_col::stride] = bulk_record.record_sums(records, stride).translate(bulk_record.NEGATE_TABLE)
+    return bulk_record.format_lines(b':', records, stride, padding)
+
+
+class BinaryToIntelHexStrategy(ConvertFileStrategy):
+    """
+    バイナリファイルから Intel HEX ファイルに変換する戦略。
+    """
+    cpu_bound = True
+
+    def __init__(self, start_address: int = 0, record_size: int = 16,
+                 output_dir: Optional[str] = None) -> None:
+        """
+        Args:
+            start_address (int, optional): 先頭バイトのアドレス. Defaults to 0.
+            record_size (int, optional): 1レコードあたりのデータバイト数（1～255）. Defaults to 16.
+            output_dir (Optional[str], optional): 出力ディレクトリ. Defaults to None.
+
+        Raises:
+            ValueError: start_address が負の場合、record_size が範囲外の場合
+        """
+        if start_address < 0:
+            raise ValueError(f"start_address は0以上である必要があります。指定値: {start_address}")
+        if not 1 <= record_size <= 0xFF:
+            raise ValueError(f"record_size は 1～255 の範囲である必要があります。指定値: {record_size}")
+
+        self.start_address = start_address
+        self.record_size   = record_size
+        self.output_dir    = Path(output_dir) if output_dir else None
+
+    def execute(self, filepath: str) -> list[str]:
+        """
+        バイナリファイルから Intel HEX ファイルに変換する
+
+        Args:
+            filepath (str): 変換元のファイルパス（絶対または相対パス）
+
+        Raises:
+            EmptyFileError: ファイルが空の場合
+            ValueError: アドレスが32ビットの範囲を超える場合
+
+        Returns:
+            list[str]: 出力された Intel HEX ファイルのパス（1要素）
+        """
+        file = Path(filepath)
+
+        # 空ファイルの検出と例外処理
+        info = FileInfo.from_path(file)
+        check_file_not_empty(info)
+        end_address = self.start_address + info.size
+        if end_address > 0x100000000:
+            raise ValueError(f"アドレス(0x{end_address:X})が Intel HEX の範囲（32ビット）を超えています。ファイル: '{file}'")
+
+        # 出力ディレクトリ
+        out_dir = self.output_dir or file.parent
+        out_dir.mkdir(parents=True, exist_ok=True)
+        out_path = out_dir / file.with_suffix('.hex').name
+
+        address = self.start_address
+        upper   = None
+        size    = self.record_size
+        pending = b""
+        with open(filepath, 'rb') as fin, open(out_path, 'wb') as fout:
+
+            while True:
+                chunk = fin.read(size * _RECORDS_PER_CHUNK)
+                if not chunk:
+                    break
+                if pending:
+                    chunk   = pending + chunk
+                    pending = b""
+
+                view = memoryview(chunk)
+                i = 0
+                while i < len(chunk):
+                    # 上位16ビットが変わる場合は拡張リニアアドレスレコードを出力
+                    if address >> 16 != upper:
+                        upper = address >> 16
+                        fout.write(_format_record(0, _EXTENDED_LINEAR_ADDRESS, upper.to_bytes(2, 'big')))
+                    # 64KiB 境界をまたがない範囲を、固定長レコードと端数レコードに分けて出力
+                    boundary = 0x10000 - (address & 0xFFFF)
+                    run_len  = min(len(chunk) - i, boundary)
+                    full     = run_len - run_len % size
+                    if full:
+                        fout.write(_format_data_records(address, view[i:i + full], size))
+                    if full < run_len and run_len < boundary:
+                        # 読み込みの区切りで余った端数は、次に読み込んだデータと合わせてレコードにする
+                        pending  = chunk[i + full:]
+                        address += full
+                        break
+                    if full < run_len:
+                        fout.write(_format_record((address + full) & 0xFFFF, _DATA, view[i + full:i + run_len]))
+                    i       += run_len
+                    address += run_len
+
+            # ファイル末尾の端数レコード
+            if pending:
+                fout.write(_format_record(address & 0xFFFF, _DATA, pending))
+            fout.write(_format_record(0, _END_OF_FILE, b""))
+
+        return [str(out_path)]
+
+
+class IntelHexToBinaryStrategy(ConvertFileStrategy):
+    """
+    Intel HEX ファイルからバイナリファイルに変換する戦略。
+    先頭のデータレコードのアドレスを出力ファイルの先頭とし、空き領域は fill で埋める。
+    """
+    cpu_bound = True
+
+    def __init__(self, fill: int = 0xFF, output_dir: Optional[str] = None) -> None:
+        """
+        Args:
+            fill (int, optional): 空き領域を埋めるバイト値. Defaults to 0xFF.
+            output_dir (Optional[str], optional): 出力ディレクトリ. Defaults to None.
+
+        Raises:
+            ValueError: fill が 0～255 の範囲外の場合
+        """
+        if not 0 <= fill <= 0xFF:
+            raise ValueError(f"fill は 0～255 の範囲である必要があります。指定値: {fill}")
+
+        self.fill       = fill
+        self.output_dir = Path(output_dir) if output_dir else None
+
+    def execute(self, filepath: str) -> list[str]:
+        """
+        Intel HEX ファイルからバイナリファイルに変換する
+
+        Args:
+            filepath (str): 変換元のファイルパス（絶対または相対パス）
+
+        Raises:
+            EmptyFileError: ファイルが空の場合
+            ValueError: レコードの形式・チェックサムが不正な場合、EOFレコードがない場合
+
+        Returns:
+            list[str]: 出力されたバイナリファイルのパス（1要素）
+        """
+        file = Path(filepath)
+
+        # 空ファイルの検出と例外処理
+        check_file_not_empty(file)
+
+        # 出力ディレクトリ
+        out_dir = self.output_dir or file.parent
+        out_dir.mkdir(parents=True, exist_ok=True)
+        out_path = out_dir / file.with_suffix('.bin').name
+
+        try:
+            with open(filepath, 'rb') as fin, open(out_path, 'wb') as fout:
+                writer = BinaryImageWriter(fout, self.fill)
+                self._convert(fin, writer, file)
+                writer.flush()
+        except ValueError:
+            if out_path.exists():
+                os.remove(out_path)
+            raise
+
+        return [str(out_path)]
+
+    def _convert(self, fin, writer: BinaryImageWriter, file: Path) -> None:
+        """
+        同じ長さの行が続く部分は一括で、それ以外は1行ずつ解析し、データレコードを writer に書き込む。
+        """
+        upper  = 0
+        lineno = 0
+        for block in iter(lambda: fin.readlines(_LINES_HINT), []):
+            for _, group in itertools.groupby(block, key=len):
+                lines = list(group)
+                if len(lines) > 1 and self._write_data_lines(lines, upper, writer):
+                    lineno += len(lines)
+                    continue
+
+                for line in lines:
+                    lineno += 1
+                    line = line.strip()
+                    if not line:
+                        continue
+                    if line[:1] != b':':
+                        raise ValueError(f"Intel HEX のレコードではありません。ファイル: '{file}', 行: {lineno}")
+                    try:
+                        record = binascii.unhexlify(line[1:])
+                    except binascii.Error as e:
+                        raise ValueError(f"16進数変換エラー: {e}。ファイル: '{file}', 行: {lineno}") from e
+                    if len(record) < 5 or record[0] != len(record) - 5:
+                        raise ValueError(f"レコード長が不正です。ファイル: '{file}', 行: {lineno}")
+                    if sum(record) & 0xFF:
+                        raise ValueError(f"チェックサムが一致しません。ファイル: '{file}', 行: {lineno}")
+
+                    record_type = record[3]
+                    data        = record[4:-1]
+                    if record_type == _DATA:
+                        writer.write(upper + ((record[1] << 8) | record[2]), data)
+                    elif record_type == _END_OF_FILE:
+                        return
+                    elif record_type == _EXTENDED_SEGMENT_ADDRESS:
+                        upper = int.from_bytes(data, 'big') << 4
+                    elif record_type == _EXTENDED_LINEAR_ADDRESS:
+                        upper = int.from_bytes(data, 'big') << 16
+                    elif record_type in (_START_SEGMENT_ADDRESS, _START_LINEAR_ADDRESS):
+                        continue
+                    else:
+                        raise ValueError(f"未対応のレコードタイプ({record_type:02X})です。ファイル: '{file}', 行: {lineno}")
+
+        raise ValueError(f"EOFレコードがありません。ファイル: '{file}'")
+
+    @staticmethod
+    def _write_data_lines(lines: list[bytes], upper: int, writer: BinaryImageWriter) -> bool:
+        """
+        同じ長さの行が、アドレスが連続する正しいデータレコードのみで構成されている場合に、
+        まとめてデコードして writer に書き込む。
+
+        Returns:
+            bool: 一括処理した場合 True。条件を満たさない場合は何もせず False
+        """
+        decoded = bulk_record.decode_lines(lines, 1)
+        if decoded is None:
+            return False
+        records, stride, padding = decoded
+        k          = len(lines)
+        record_len = stride - padding
+        size       = record_len - 5
+        if size <= 0 or records[0::stride] != bytes([size]) * k or records[3::stride] != bytes(k):
+            return False
+        if bulk_record.record_sums(records, stride) != bytes(k):
+            return False
+        address = (records[1] << 8) | records[2]
+        if address + size * k > 0x10000:
+            return False
+        if bulk_record.gather_columns(records, stride, 1, 3) != bulk_record.sequential_values(address, size, k, 2):
+            return False
+
+        writer.write(upper + address, bulk_record.gather_columns(records, stride, 4, record_len - 1))
+        return True
@@ -0,0 +1,304 @@
+"""
+srecord_strategy.py
+
+Motorola S-record 形式とバイナリファイルを相互に変換する戦略クラスを提供します。
+
+クラス:
+    BinaryToSRecordStrategy: バイナリファイル → S-record（.srec）
+    SRecordToBinaryStrategy: S-record → バイナリファイル（.bin）
+
+- チャンク単位で読み込み、レコード単位の行をまとめて書き込む（ストリーミング処理）
+- 固定長のデータレコードは bulk_record により列単位で一括生成・一括解析し、
+  チェックサムも全レコード分をまとめて計算する（レコードごとのループなし）
+- アドレス長は 2 / 3 / 4 バイト（S1 / S2 / S3）。未指定の場合は終端アドレスから自動選択
+- 出力時は S0（ヘッダ）、S5 / S6（レコード数）、S9 / S8 / S7（終端）を付与する
+
+使用例:
+    BinaryToSRecordStrategy(start_address=0x08000000).execute("firmware.bin")  # → ["firmware.srec"]
+    SRecordToBinaryStrategy(fill=0xFF).execute("firmware.srec")                 # → ["firmware.bin"]
+"""
+import binascii
+import itertools
+import os
+from pathlib import Path
+from typing import Optional
+
+from binary_file_tool.convert_file.strategy_base import ConvertFileStrategy
+from binary_file_tool.convert_file import bulk_record
+from binary_file_tool.convert_file.binary_image_writer import BinaryImageWriter
+from binary_file_tool.file_error.exceptions import check_file_not_empty
+from binary_file_tool.file_error.file_info import FileInfo
+
+# アドレス長（バイト）ごとのデータレコード／終端レコードのタイプ
+_DATA_TYPES        = {2: '1', 3: '2', 4: '3'}
+_TERMINATION_TYPES = {2: '9', 3: '8', 4: '7'}
+
+# 読み込み時のレコードタイプごとのアドレス長（バイト）
+_ADDRESS_SIZES = {'0': 2, '1': 2, '2': 3, '3': 4, '5': 2, '6': 3, '7': 4, '8': 3, '9': 2}
+
+# 1回に読み込むレコード数
+_RECORDS_PER_CHUNK = 4096
+
+# 変換時に1回で読み込む行のサイズの目安（バイト）
+_LINES_HINT = 1024 * 1024
+
+
+def _format_record(record_type: str, address: int, address_size: int, data: bytes) -> bytes:
+    """
+    1レコード分の行（'S' + タイプ + 16進数 + 改行）を作成する。
+    """
+    record = bytearray((address_size + len(data) + 1,))
+    record += address.to_bytes(address_size, 'big')
+    record += data
+    # チェックサム：レコード長～データの総和の1の補数
+    record.append(~sum(record) & 0xFF)
+    return b'S' + record_type.encode('ascii') + binascii.hexlify(record).upper() + b'\n'
+
+
+def _format_data_records(record_type: str, address: int, address_size: int,
+                         data: bytes, record_size: int) -> bytes:
+    """
+    record_size バイトのデータレコードをまとめて作成する。
+    """
+    k    = len(data) // record_size
+    mark = b'S' + record_type.encode('ascii')
+    # レコード長・アドレスをまとめて生成
+    header = bulk_record.sequential_values(((address_size + record_size + 1) << (8 * address_size)) | address,
+                                           record_size, k, address_size + 1)
+    records, stride = bulk_record.interleave([(header, address_size + 1), (data, record_size)], k, extra=1)
+    # チェックサム：全レコード分をまとめて計算
+    records[stride - 1::stride] = bulk_record.record_sums(records, stride).translate(bulk_record.INVERT_TABLE)
+    return bulk_record.format_lines(mark, records, stride)
+
+
+class BinaryToSRecordStrategy(ConvertFileStrategy):
+    """
+    バイナリファイルから Motorola S-record ファイルに変換する戦略。
+    """
+    cpu_bound = True
+
+    def __init__(self, start_address: int = 0, record_size: int = 16,
+                 address_size: Optional[int] = None, header: Optional[str] = None,
+                 output_dir: Optional[str] = None) -> None:
+        """
+        Args:
+            start_address (int, optional): 先頭バイトのアドレス. Defaults to 0.
+            record_size (int, optional): 1レコードあたりのデータバイト数（1～250）. Defaults to 16.
+            address_size (Optional[int], optional): アドレス長（2 / 3 / 4）。None の場合は自動. Defaults to None.
+            header (Optional[str], optional): S0 レコードの内容。None の場合は入力ファイル名. Defaults to None.
+            output_dir (Optional[str], optional): 出力ディレクトリ. Defaults to None.
+
+        Raises:
+            ValueError: 引数が範囲外の場合
+        """
+        if start_address < 0:
+            raise ValueError(f"start_address は0以上である必要があります。指定値: {start_address}")
+        if not 1 <= record_size <= 250:
+            raise ValueError(f"record_size は 1～250 の範囲である必要があります。指定値: {record_size}")
+        if address_size is not None and address_size not in _DATA_TYPES:
+            raise ValueError(f"address_size は 2 / 3 / 4 のいずれかである必要があります。指定値: {address_size}")
+
+        self.start_address = start_address
+        self.record_size   = record_size
+        self.address_size  = address_size
+        self.header        = header
+        self.output_dir    = Path(output_dir) if output_dir else None
+
+    def execute(self, filepath: str) -> list[str]:
+        """
+        バイナリファイルから S-record ファイルに変換する
+
+        Args:
+            filepath (str): 変換元のファイルパス（絶対または相対パス）
+
+        Raises:
+            EmptyFileError: ファイルが空の場合
+            ValueError: アドレスが指定したアドレス長の範囲を超える場合
+
+        Returns:
+            list[str]: 出力された S-record ファイルのパス（1要素）
+        """
+        file = Path(filepath)
+
+        # 空ファイルの検出と例外処理
+        info = FileInfo.from_path(file)
+        check_file_not_empty(info)
+        last_address = self.start_address + info.size - 1
+        address_size = self.address_size or self._auto_address_size(last_address)
+        if last_address >= 1 << (8 * address_size):
+            raise ValueError(f"アドレス(0x{last_address:X})がアドレス長({address_size}バイト)の範囲を超えています。ファイル: '{file}'")
+
+        # 出力ディレクトリ
+        out_dir = self.output_dir or file.parent
+        out_dir.mkdir(parents=True, exist_ok=True)
+        out_path = out_dir / file.with_suffix('.srec').name
+
+        data_type = _DATA_TYPES[address_size]
+        header    = (self.header if self.header is not None else file.name).encode('utf-8')[:250]
+        address   = self.start_address
+        count     = 0
+        size      = self.record_size
+        with open(filepath, 'rb') as fin, open(out_path, 'wb') as fout:
+
+            fout.write(_format_record('0', 0, 2, header))
+            while True:
+                chunk = fin.read(size * _RECORDS_PER_CHUNK)
+                if not chunk:
+                    break
+
+                # 固定長レコードと端数レコードに分けて出力
+                full = len(chunk) - len(chunk) % size
+                if full:
+                    fout.write(_format_data_records(data_type, address, address_size, chunk[:full], size))
+                if full < len(chunk):
+                    fout.write(_format_record(data_type, address + full, address_size, chunk[full:]))
+                address += len(chunk)
+                count   += -(-len(chunk) // size)
+
+            # レコード数（16 / 24ビットに収まる場合のみ）
+            if count <= 0xFFFF:
+                fout.write(_format_record('5', count, 2, b""))
+            elif count <= 0xFFFFFF:
+                fout.write(_format_record('6', count, 3, b""))
+            fout.write(_format_record(_TERMINATION_TYPES[address_size], self.start_address, address_size, b""))
+
+        return [str(out_path)]
+
+    @staticmethod
+    def _auto_address_size(last_address: int) -> int:
+        if last_address <= 0xFFFF:
+            return 2
+        if last_address <= 0xFFFFFF:
+            return 3
+        return 4
+
+
+class SRecordToBinaryStrategy(ConvertFileStrategy):
+    """
+    Motorola S-record ファイルからバイナリファイルに変換する戦略。
+    先頭のデータレコードのアドレスを出力ファイルの先頭とし、空き領域は fill で埋める。
+    """
+    cpu_bound = True
+
+    def __init__(self, fill: int = 0xFF, output_dir: Optional[str] = None) -> None:
+        """
+        Args:
+            fill (int, optional): 空き領域を埋めるバイト値. Defaults to 0xFF.
+            output_dir (Optional[str], optional): 出力ディレクトリ. Defaults to None.
+
+        Raises:
+            ValueError: fill が 0～255 の範囲外の場合
+        """
+        if not 0 <= fill <= 0xFF:
+            raise ValueError(f"fill は 0～255 の範囲である必要があります。指定値: {fill}")
+
+        self.fill       = fill
+        self.output_dir = Path(output_dir) if output_dir else None
+
+    def execute(self, filepath: str) -> list[str]:
+        """
+        S-record ファイルからバイナリファイルに変換する
+
+        Args:
+            filepath (str): 変換元のファイルパス（絶対または相対パス）
+
+        Raises:
+            EmptyFileError: ファイルが空の場合
+            ValueError: レコードの形式・チェックサムが不正な場合、終端レコードがない場合
+
+        Returns:
+            list[str]: 出力されたバイナリファイルのパス（1要素）
+        """
+        file = Path(filepath)
+
+        # 空ファイルの検出と例外処理
+        check_file_not_empty(file)
+
+        # 出力ディレクトリ
+        out_dir = self.output_dir or file.parent
+        out_dir.mkdir(parents=True, exist_ok=True)
+        out_path = out_dir / file.with_suffix('.bin').name
+
+        try:
+            with open(filepath, 'rb') as fin, open(out_path, 'wb') as fout:
+                writer = BinaryImageWriter(fout, self.fill)
+                self._convert(fin, writer, file)
+                writer.flush()
+        except ValueError:
+            if out_path.exists():
+                os.remove(out_path)
+            raise
+
+        return [str(out_path)]
+
+    def _convert(self, fin, writer: BinaryImageWriter, file: Path) -> None:
+        """
+        同じ長さの行が続く部分は一括で、それ以外は1行ずつ解析し、
+        データレコード（S1 / S2 / S3）を writer に書き込む。
+        """
+        lineno = 0
+        for block in iter(lambda: fin.readlines(_LINES_HINT), []):
+            for _, group in itertools.groupby(block, key=len):
+                lines = list(group)
+                if len(lines) > 1 and self._write_data_lines(lines, writer):
+                    lineno += len(lines)
+                    continue
+
+                for line in lines:
+                    lineno += 1
+                    line = line.strip()
+                    if not line:
+                        continue
+                    record_type = chr(line[1]) if len(line) > 1 else ''
+                    if line[:1] != b'S' or record_type not in _ADDRESS_SIZES:
+                        raise ValueError(f"S-record のレコードではありません。ファイル: '{file}', 行: {lineno}")
+                    try:
+                        record = binascii.unhexlify(line[2:])
+                    except binascii.Error as e:
+                        raise ValueError(f"16進数変換エラー: {e}。ファイル: '{file}', 行: {lineno}") from e
+
+                    address_size = _ADDRESS_SIZES[record_type]
+                    if len(record) < address_size + 2 or record[0] != len(record) - 1:
+                        raise ValueError(f"レコード長が不正です。ファイル: '{file}', 行: {lineno}")
+                    if sum(record) & 0xFF != 0xFF:
+                        raise ValueError(f"チェックサムが一致しません。ファイル: '{file}', 行: {lineno}")
+
+                    if record_type in '123':
+                        address = int.from_bytes(record[1:1 + address_size], 'big')
+                        writer.write(address, record[1 + address_size:-1])
+                    elif record_type in '789':
+                        return
+
+        raise ValueError(f"終端レコード（S7 / S8 / S9）がありません。ファイル: '{file}'")
+
+    @staticmethod
+    def _write_data_lines(lines: list[bytes], writer: BinaryImageWriter) -> bool:
+        """
+        同じ長さの行が、アドレスが連続する正しいデータレコード（S1 / S2 / S3）のみで構成されている場合に、
+        まとめてデコードして writer に書き込む。
+
+        Returns:
+            bool: 一括処理した場合 True。条件を満たさない場合は何もせず False
+        """
+        record_type = chr(lines[0][1]) if len(lines[0]) > 1 else ''
+        if record_type not in ('1', '2', '3'):
+            return False
+        decoded = bulk_record.decode_lines(lines, 2)
+        if decoded is None:
+            return False
+        records, stride, padding = decoded
+        k            = len(lines)
+        record_len   = stride - padding
+        address_size = _ADDRESS_SIZES[record_type]
+        size         = record_len - address_size - 2
+        if size <= 0 or records[0::stride] != bytes([record_len - 1]) * k:
+            return False
+        if bulk_record.record_sums(records, stride) != b'\xff' * k:
+            return False
+        address  = int.from_bytes(records[1:1 + address_size], 'big')
+        expected = bulk_record.sequential_values(address, size, k, address_size)
+        if bulk_record.gather_columns(records, stride, 1, 1 + address_size) != expected:
+            return False
+
+        writer.write(address, bulk_record.gather_columns(records, stride, 1 + address_size, record_len - 1))
+        return True
@@ -8,16 +8,28 @@ exceptions.py
 - EmptyFileError: ファイルが空の場合に発生する例外
 - OffsetOutOfRangeError: 指定オフセットがファイルサイズ範囲外の場合に発生する例外
 - SizeExceedsError: 指定サイズが利用可能サイズを超えた場合に発生する例外
+- CopyEngineError: 指定したコピーエンジンが利用できない場合に発生する例外
 
 - check_file_not_empty: ファイルが空でないことを検証する関数
 - check_offset_in_range: オフセットがファイルサイズ内か検証する関数
 - check_size_available: 指定範囲の読み込みが可能か検証する関数
+- check_range_in_file: 取得済みのファイルサイズに対して範囲を検証する関数（stat を行わない）
+
+各チェック関数は、パス（Path）の代わりに FileInfo（file_info.py）を受け取ることができる。
+FileInfo を渡した場合は stat を行わないため、開いたファイルの fstat の結果を
+複数のチェックで共有することで、ファイルあたりのメタデータ取得を1回にできる。
 
 このモジュールを用いることで、複数のストラテジークラス間で例外処理や
 ファイル状態チェックの一貫性を保つことができる。
 """
 
 from pathlib import Path
+from typing import Union
+
+from binary_file_tool.file_error.file_info import FileInfo
+
+# チェック対象（パスの場合は stat してサイズを取得する）
+FileTarget = Union[Path, FileInfo]
 
 class FileError(Exception):
     """ファイル操作全般の共通例外基底クラス"""
@@ -35,41 +47,54 @@ class SizeExceedsError(FileError):
     """指定されたサイズが利用可能なサイズを超えた場合の例外"""
     pass
 
-def check_file_not_empty(filepath: Path) -> None:
+class CopyEngineError(FileError):
+    """指定されたコピーエンジンが利用できない場合の例外"""
+    pass
+
+def _file_info(target: FileTarget) -> FileInfo:
+    """
+    チェック対象を FileInfo に変換する（パスの場合のみ stat する）。
+    """
+    if isinstance(target, FileInfo):
+        return target
+    return FileInfo.from_path(target)
+
+def check_file_not_empty(filepath: FileTarget) -> None:
     """
     ファイルが空でないかをチェックする。
     
     Args:
-        filepath (Path): チェック対象のファイルパス
+        filepath (FileTarget): チェック対象のファイルパス、または FileInfo
     
     Raises:
         EmptyFileError: ファイルサイズが0の場合に発生
     """
-    size = filepath.stat().st_size
-    if size == 0:
-        raise EmptyFileError(f"ファイル'{filepath}'は空です。")
+    info = _file_info(filepath)
+    if info.size == 0:
+        raise EmptyFileError(f"ファイル'{info.path}'は空です。")
     
-def check_offset_in_range(filepath: Path, offset: int) -> None:
+def check_offset_in_range(filepath: FileTarget, offset: int) -> None:
     """
     指定したオフセットがファイルサイズの範囲内かチェックする。
     
     Args:
-        filepath (Path): 対象ファイルのパス
+        filepath (FileTarget): 対象ファイルのパス、または FileInfo
         offset (int): チェックするオフセット値（バイト単位）
     
     Raises:
         OffsetOutOfRangeError: オフセットがファイルサイズを超える場合に発生
     """
-    size = filepath.stat().st_size
+    info = _file_info(filepath)
+    size, filepath = info.size, info.path
     if offset >= size:
         raise OffsetOutOfRangeError(f"オフセット({offset})がファイルサイズ({size})を超えています。ファイル: '{filepath}'")
 
-def check_size_available(filepath: Path, offset: int, requested_size: int) -> None:
+def check_size_available(filepath: FileTarget, offset: int, requested_size: int) -> None:
     """
     指定したオフセットから要求されたサイズが読み込み可能かをチェックする。
     
     Args:
-        filepath (Path): 対象ファイルのパス
+        filepath (FileTarget): 対象ファイルのパス、または FileInfo
         offset (int): 読み込み開始オフセット
         requested_size (int): 読み込みを要求するサイズ（バイト）
     
@@ -77,7 +102,8 @@ def check_size_available(filepath: Path, offset: int, requested_size: int) -> No
         SizeExceedsError: 要求サイズが利用可能サイズを超える場合に発生
     
     """
-    size = filepath.stat().st_size
+    info = _file_info(filepath)
+    size, filepath = info.size, info.path
     available = size - offset
     if offset < 0:
         raise ValueError(f"オフセット({offset})は負の値です。")
@@ -88,12 +114,50 @@ def check_size_available(filepath: Path, offset: int, requested_size: int) -> No
             f"ファイル: '{filepath}', オフセット: {offset}"
         )
 
-def check_chunk_size(filepath: Path, chunk_size : int) -> None:
-    
-    check_file_not_empty(filepath)
+def check_range_in_file(filepath: Path, file_size: int, offset: int, requested_size: int) -> None:
+    """
+    取得済みのファイルサイズに対して、指定範囲が読み込み可能かをチェックする。
+    複数範囲をまとめて検証する場合に、範囲ごとの stat を省略するために使用する。
+
+    Args:
+        filepath (Path): 対象ファイルのパス（エラーメッセージ用）
+        file_size (int): ファイルサイズ（バイト）
+        offset (int): 読み込み開始オフセット
+        requested_size (int): 読み込みを要求するサイズ（バイト）
+
+    Raises:
+        ValueError: オフセットが負の値の場合
+        OffsetOutOfRangeError: オフセットがファイルサイズを超える場合
+        SizeExceedsError: 要求サイズが利用可能サイズを超える場合
+    """
+    if offset < 0:
+        raise ValueError(f"オフセット({offset})は負の値です。")
+    if offset >= file_size:
+        raise OffsetOutOfRangeError(f"オフセット({offset})がファイルサイズ({file_size})を超えています。ファイル: '{filepath}'")
+    available = file_size - offset
+    if requested_size > available:
+        raise SizeExceedsError(
+            f"要求サイズ({requested_size}バイト)は利用可能サイズ({available}バイト)を超えています。"
+            f"ファイル: '{filepath}', オフセット: {offset}"
+        )
+
+def check_chunk_size(filepath: FileTarget, chunk_size : int) -> None:
+    """
+    分割サイズが1以上、かつファイルサイズ以下かをチェックする。
+
+    Args:
+        filepath (FileTarget): 対象ファイルのパス、または FileInfo
+        chunk_size (int): 分割サイズ（バイト）
+
+    Raises:
+        EmptyFileError: ファイルサイズが0の場合
+        ValueError: 分割サイズが範囲外の場合
+    """
+    info = _file_info(filepath)
+    check_file_not_empty(info)
     if chunk_size <= 0:
         raise ValueError(f"チャンクサイズは正の整数である必要があります。指定値: {chunk_size}")
-    if chunk_size > filepath.stat().st_size:
-        raise ValueError(f"チャンクサイズ({chunk_size})はファイルのサイズ({chunk_size})を超えています。")
+    if chunk_size > info.size:
+        raise ValueError(f"チャンクサイズ({chunk_size})はファイルのサイズ({info.size})を超えています。")
     
     
\ No newline at end of file
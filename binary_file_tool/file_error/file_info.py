@@ -0,0 +1,58 @@
+"""
+file_info.py
+
+ファイルのメタデータ（サイズ・更新日時など）を1回の stat / fstat で取得し、
+検証関数（exceptions.py）と各戦略で共有するためのクラスを提供するモジュール。
+
+- FileInfo: 1回の os.stat / os.fstat の結果のスナップショット
+
+ネットワークドライブ上のファイルでは stat のたびに通信が発生するため、
+検証のたびに stat するのではなく、開いたファイルの fstat の結果を使い回す。
+
+使用例:
+    with open(filepath, 'rb') as f:
+        info = FileInfo.from_fd(filepath, f.fileno())
+        check_file_not_empty(info)
+        check_size_available(info, offset, size)
+"""
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Union
+
+
+@dataclass(frozen=True)
+class FileInfo:
+    """
+    ファイルのメタデータのスナップショット
+    """
+    path: Path
+    size: int
+    mtime_ns: int
+    dev: int
+    ino: int
+
+    @classmethod
+    def from_stat(cls, path: Union[str, Path], st: os.stat_result) -> 'FileInfo':
+        """
+        stat の結果から FileInfo を作成する。
+        """
+        return cls(Path(path), st.st_size, st.st_mtime_ns, st.st_dev, st.st_ino)
+
+    @classmethod
+    def from_fd(cls, path: Union[str, Path], fd: int) -> 'FileInfo':
+        """
+        開いたファイルの fstat（1回）から FileInfo を作成する。
+        """
+        return cls.from_stat(path, os.fstat(fd))
+
+    @classmethod
+    def from_path(cls, path: Union[str, Path]) -> 'FileInfo':
+        """
+        パスの stat（1回）から FileInfo を作成する。
+
+        Raises:
+            FileNotFoundError: ファイルが存在しない場合
+        """
+        return cls.from_stat(path, os.stat(path))
+
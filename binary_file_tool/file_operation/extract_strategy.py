@@ -22,6 +22,7 @@ from typing import Optional
 
 from binary_file_tool.file_operation.strategy_base import FileOperationStrategy
 from binary_file_tool.file_error.exceptions import check_file_not_empty,check_offset_in_range,check_size_available
+from binary_file_tool.file_error.file_info import FileInfo
 
 # 任意範囲のデータ抽出戦略
 class ExtractStrategy(FileOperationStrategy):
@@ -64,20 +65,18 @@ class ExtractStrategy(FileOperationStrategy):
 
         file = Path(filepath)
         
-        # 範囲外アクセスの対処
-        # 空ファイル
-        check_file_not_empty(file)
-        
-        # オフセットが範囲外
-        check_offset_in_range(file, self.offset)
-        
         read_size = self.size
-        # 指定サイズを得られない
-        check_size_available(file, self.offset, self.size)
-    
-    
-        # 読み込み
         with open(filepath, 'rb') as f:
+            # 範囲外アクセスの対処（fstat 1回の結果で検証する）
+            info = FileInfo.from_fd(file, f.fileno())
+            # 空ファイル
+            check_file_not_empty(info)
+            # オフセットが範囲外
+            check_offset_in_range(info, self.offset)
+            # 指定サイズを得られない
+            check_size_available(info, self.offset, self.size)
+
+            # 読み込み
             f.seek(self.offset)
             data = f.read(read_size)
         
@@ -1,30 +1,135 @@
+"""
+hexdump_strategy.py
+
+このモジュールは、HexDumpStrategy クラスを提供します。
+HexDumpStrategy は、バイナリファイルを hexdump 形式（オフセット・16進数・ASCII）で出力する戦略です。
+
+Features:
+- 固定サイズのウィンドウ単位で読み込み、ファイルサイズに依らず一定のメモリで動作
+- ウィンドウ単位で bytes.hex(' ') と ASCII 変換テーブル（bytes.translate）により一括整形
+- 標準出力、または出力ファイル（output）へのバッファ付き書き込み
+- 同一行の繰り返しを '*' に省略する squeeze オプション（hexdump -C 相当）
+
+使用例:
+    strategy = HexDumpStrategy(offset=0, size=None, output="dump.txt", squeeze=True)
+    strategy.execute("firmware.bin")
+"""
+import sys
+from pathlib import Path
+from typing import Optional, TextIO
+
 from binary_file_tool.file_operation.strategy_base import FileOperationStrategy
 
+# 1行あたりのバイト数
+ROW_SIZE = 16
+
+# 1回に読み込むウィンドウサイズ（ROW_SIZE の倍数）
+WINDOW_SIZE = 64 * 1024
+
+# 表示可能なASCII文字以外を '.' に置き換える変換テーブル
+_ASCII_TABLE = bytes(b if 32 <= b < 127 else ord('.') for b in range(256))
+
 
 # バイナリファイルをhexdump出力する戦略
 class HexDumpStrategy(FileOperationStrategy):
     """
-    バイナリファイルをhexdump形式で標準出力に表示する戦略。
+    バイナリファイルをhexdump形式で標準出力またはファイルに出力する戦略。
     """
-    def __init__(self, offset=0, size=None):
+    def __init__(self, offset: int = 0, size: Optional[int] = None,
+                 output: Optional[str] = None, squeeze: bool = False) -> None:
+        """
+        Args:
+            offset (int, optional): 表示開始位置（バイト）. Defaults to 0.
+            size (Optional[int], optional): 表示サイズ（バイト）。Noneの場合は末尾まで. Defaults to None.
+            output (Optional[str], optional): 出力ファイルパス。Noneの場合は標準出力.
+                                              複数ファイルを処理する場合は同じファイルに追記する. Defaults to None.
+            squeeze (bool, optional): 直前と同じ行を '*' に省略するかどうか. Defaults to False.
         """
-        :param offset: 表示開始位置（バイト）
-        :param size: 表示サイズ（バイト）。Noneの場合は末尾まで。
+        self.offset  = offset
+        self.size    = size
+        self.output  = Path(output) if output else None
+        self.squeeze = squeeze
+        # 出力ファイルを初回のみ新規作成するためのフラグ
+        self._output_created = False
+
+    def execute(self, filepath: str) -> list[str]:
+        """
+        指定範囲のバイナリを16バイトごとに整形し出力する。
+
+        Args:
+            filepath (str): 対象ファイルパス
+
+        Returns:
+            list[str]: 出力ファイルのパス。標準出力の場合は空リスト
         """
-        self.offset = offset
-        self.size = size
+        if self.output is None:
+            self._dump(filepath, sys.stdout)
+            return []
+
+        self.output.parent.mkdir(parents=True, exist_ok=True)
+        mode = 'a' if self._output_created else 'w'
+        with open(self.output, mode, encoding='utf-8') as out:
+            self._dump(filepath, out)
+        self._output_created = True
+        return [str(self.output)]
 
-    def execute(self, filepath):
+    def _dump(self, filepath: str, out: TextIO) -> None:
         """
-        指定範囲のバイナリを16バイトごとに整形し表示する。
+        ウィンドウ単位で読み込み、整形結果を out に書き込む。
         """
-        print(f"Path : {filepath}")
+        out.write(f"Path : {filepath}\n")
+
+        remaining = self.size
+        offset    = self.offset
+        # squeeze 用の状態（直前の行、省略中かどうか）
+        prev_row  = None
+        squeezing = False
         with open(filepath, 'rb') as f:
             f.seek(self.offset)
-            data = f.read() if self.size is None else f.read(self.size)
-            for i in range(0, len(data), 16):
-                chunk = data[i:i+16]
-                hex_chunk = ' '.join(f"{b:02x}" for b in chunk)
-                ascii_chunk = ''.join((chr(b) if 32 <= b < 127 else '.') for b in chunk)
-                print(f"{self.offset + i:08x}  {hex_chunk:<48}  |{ascii_chunk}|")
-                
+            while remaining is None or remaining > 0:
+                read_size = WINDOW_SIZE if remaining is None else min(WINDOW_SIZE, remaining)
+                data = f.read(read_size)
+                if not data:
+                    break
+                if remaining is not None:
+                    remaining -= len(data)
+
+                lines, prev_row, squeezing = self._format_block(data, offset, prev_row, squeezing)
+                out.write(lines)
+                offset += len(data)
+
+        # squeeze 時は hexdump -C と同様に終端オフセットを出力する
+        if self.squeeze:
+            out.write(f"{offset:08x}\n")
+
+    def _format_block(self, data: bytes, base: int,
+                      prev_row: Optional[bytes], squeezing: bool) -> tuple[str, Optional[bytes], bool]:
+        """
+        ウィンドウ1つ分を一括で整形する。
+
+        Args:
+            data (bytes): ウィンドウのデータ
+            base (int): ウィンドウ先頭のオフセット
+            prev_row (Optional[bytes]): 直前に出力した行（squeeze 用）
+            squeezing (bool): 直前の行が省略中かどうか（squeeze 用）
+
+        Returns:
+            tuple[str, Optional[bytes], bool]: 整形結果, 直前に出力した行, 省略中かどうか
+        """
+        # 16進数文字列（1バイト3文字）とASCII文字列をウィンドウ単位で一括変換
+        hex_str = data.hex(' ')
+        text    = data.translate(_ASCII_TABLE).decode('ascii')
+
+        lines = []
+        for i in range(0, len(data), ROW_SIZE):
+            if self.squeeze:
+                row = data[i:i + ROW_SIZE]
+                if row == prev_row:
+                    if not squeezing:
+                        lines.append("*\n")
+                        squeezing = True
+                    continue
+                prev_row  = row
+                squeezing = False
+            lines.append(f"{base + i:08x}  {hex_str[i * 3:i * 3 + 47]:<48}  |{text[i:i + ROW_SIZE]}|\n")
+        return ''.join(lines), prev_row, squeezing
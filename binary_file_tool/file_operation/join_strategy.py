@@ -0,0 +1,162 @@
+"""
+join_strategy.py
+
+このモジュールは、JoinStrategy クラスを提供します。
+JoinStrategy は、SplitStrategy / CDCSplitStrategy で分割したパーツを連結し、
+元のファイルを復元するファイル操作戦略です。
+
+Features:
+- 入力には先頭パーツ（<名前>_part0<拡張子>）またはマニフェスト（<名前>.manifest.json）を指定する
+  - 先頭パーツを指定した場合は、同じディレクトリの _part<番号> を番号の数値順（part2 < part10）に連結する
+  - マニフェストを指定した場合は、マニフェストに記録された順に連結する（CDC のチャンクストアにも対応）
+- 連結は RangeCopier によるカーネル内コピー（os.copy_file_range / os.sendfile）
+- 検証（verify）。連結前に、各パーツのサイズ・ハッシュ値をマニフェストと照合する（スレッドプールで並列実行）
+- 出力ファイルが既に存在する場合は、overwrite を指定しない限りエラー
+
+使用例:
+    strategy = JoinStrategy(output_dir="restored", verify=True)
+    output_files = strategy.execute("out/firmware_part0.bin")  # → ["restored/firmware.bin"]
+"""
+import glob
+import os
+import re
+import time
+from pathlib import Path
+from typing import Optional
+
+from binary_file_tool.file_operation.strategy_base import FileOperationStrategy
+from binary_file_tool.file_operation.copy_engine import COPY_ENGINES, RangeCopier, format_throughput
+from binary_file_tool.file_operation.split_manifest import MANIFEST_SUFFIX, SplitManifest, manifest_path_for
+
+# パーツのファイル名（拡張子を除く）：<元の名前>_part<番号>
+_PART_PATTERN = re.compile(r'^(?P<stem>.*)_part(?P<index>\d+)$')
+
+
+def find_parts(first_part: Path) -> tuple[str, list[Path]]:
+    """
+    先頭パーツと同じディレクトリにある同じ名前のパーツを、番号の数値順に返す。
+
+    Args:
+        first_part (Path): 先頭パーツ（<名前>_part0<拡張子>）のパス
+
+    Raises:
+        FileNotFoundError: 先頭パーツが存在しない場合
+        ValueError: 先頭パーツでない場合、番号が連続していない場合
+
+    Returns:
+        tuple[str, list[Path]]: 元のファイル名, パーツのパス（番号順）
+    """
+    match = _PART_PATTERN.match(first_part.stem)
+    if not match or int(match['index']) != 0:
+        raise ValueError(f"先頭パーツ（_part0）またはマニフェストを指定してください: '{first_part}'")
+    if not first_part.is_file():
+        raise FileNotFoundError(f"先頭パーツが見つかりません: '{first_part}'")
+
+    stem, suffix = match['stem'], first_part.suffix
+    parts = {}
+    for path in first_part.parent.glob(f"{glob.escape(stem)}_part*{glob.escape(suffix)}"):
+        m = _PART_PATTERN.match(path.stem)
+        if m and m['stem'] == stem and path.suffix == suffix:
+            parts[int(m['index'])] = path
+
+    missing = sorted(set(range(max(parts) + 1)) - parts.keys())
+    if missing:
+        raise ValueError(f"パーツが不足しています（番号: {', '.join(map(str, missing))}）: '{first_part}'")
+    return f"{stem}{suffix}", [parts[index] for index in sorted(parts)]
+
+
+class JoinStrategy(FileOperationStrategy):
+    """
+    JoinStrategy は、分割されたパーツを連結して元のファイルを復元する戦略クラスです。
+    """
+    def __init__(self, output_dir: Optional[str] = None, verify: bool = False,
+                 overwrite: bool = False, engine: str = 'auto', verify_jobs: int = 0) -> None:
+        """
+        Args:
+            output_dir (Optional[str], optional): 出力ディレクトリ。None の場合はパーツ（マニフェスト）と同じ. Defaults to None.
+            verify (bool, optional): 連結前にマニフェストと照合するかどうか. Defaults to False.
+            overwrite (bool, optional): 出力ファイルが存在する場合に上書きするかどうか. Defaults to False.
+            engine (str, optional): コピーエンジン（auto / kernel / buffered）. Defaults to 'auto'.
+            verify_jobs (int, optional): 検証の並列数。0 の場合は CPU 数. Defaults to 0.
+
+        Raises:
+            ValueError: engine がサポート外の値の場合
+        """
+        if engine not in COPY_ENGINES:
+            raise ValueError(f"engine は {COPY_ENGINES} のいずれかである必要があります。指定値: {engine}")
+
+        self.output_dir  = Path(output_dir) if output_dir else None
+        self.verify      = verify
+        self.overwrite   = overwrite
+        self.engine      = engine
+        self.verify_jobs = verify_jobs
+
+    def execute(self, filepath: str) -> list[str]:
+        """
+        パーツを連結して元のファイルを出力する。
+
+        Args:
+            filepath (str): 先頭パーツまたはマニフェストのパス
+
+        Raises:
+            ValueError: パーツが不足している場合、検証に失敗した場合、マニフェストの元ファイル名にディレクトリが含まれる場合
+            FileNotFoundError: verify=True でマニフェストが見つからない場合
+            FileExistsError: 出力ファイルが既に存在する場合（overwrite=False）
+
+        Returns:
+            list[str]: 出力ファイルのパス（1要素）
+        """
+        file = Path(filepath)
+        manifest: Optional[SplitManifest] = None
+        if file.name.endswith(MANIFEST_SUFFIX):
+            manifest = SplitManifest.load(filepath)
+            # 元ファイル名は出力ディレクトリ直下のファイル名としてのみ使用する（ディレクトリ・'..' を含むものは拒否）
+            name  = Path(manifest.source).name
+            if name != manifest.source or name in ('', '.', '..') or '\\' in name:
+                raise ValueError(f"マニフェストの元ファイル名が不正です: '{manifest.source}' ({filepath})")
+            parts = [manifest.resolve(part) for part in manifest.parts]
+        else:
+            name, parts = find_parts(file)
+            manifest_path = manifest_path_for(file.parent, Path(name))
+            if self.verify:
+                if not manifest_path.is_file():
+                    raise FileNotFoundError(f"検証に必要なマニフェストが見つかりません: '{manifest_path}'")
+                manifest = SplitManifest.load(str(manifest_path))
+                if [manifest.resolve(part).resolve() for part in manifest.parts] != [p.resolve() for p in parts]:
+                    raise ValueError(f"パーツの構成がマニフェストと一致しません: '{manifest_path}'")
+
+        # 連結前の検証（各パーツのハッシュ値を並列に計算）
+        if self.verify:
+            errors = manifest.verify(self.verify_jobs)
+            if errors:
+                raise ValueError("検証に失敗しました。\n" + "\n".join(errors))
+
+        # 出力ディレクトリ（存在しない場合はディレクトリ作成）
+        out_dir = self.output_dir or file.parent
+        out_dir.mkdir(parents=True, exist_ok=True)
+        out_path = out_dir / name
+        if out_path.exists() and not self.overwrite:
+            raise FileExistsError(f"出力ファイルが既に存在します（上書きする場合は overwrite を指定）: '{out_path}'")
+        if any(out_path.resolve() == part.resolve() for part in parts):
+            raise ValueError(f"出力ファイルがパーツと同じです: '{out_path}'")
+
+        copier = RangeCopier(self.engine)
+        total = 0
+        start = time.perf_counter()
+        try:
+            with open(out_path, 'wb', buffering=0) as out_file:
+                for part in parts:
+                    with open(part, 'rb') as f:
+                        total += copier.copy(f, out_file, 0, os.fstat(f.fileno()).st_size)
+        except BaseException:
+            # 書きかけの出力ファイルは残さない
+            out_path.unlink(missing_ok=True)
+            raise
+
+        if manifest is not None and total != manifest.size:
+            out_path.unlink(missing_ok=True)
+            raise ValueError(f"連結後のサイズ({total})がマニフェストのサイズ({manifest.size})と一致しません: '{filepath}'")
+
+        elapsed = time.perf_counter() - start
+        print(f"処理速度：{format_throughput(total, elapsed)} [engine: {', '.join(copier.used_engines) or '-'}] {filepath}")
+        return [str(out_path)]
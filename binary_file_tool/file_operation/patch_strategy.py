@@ -0,0 +1,258 @@
+"""
+patch_strategy.py
+
+このモジュールは、PatchStrategy クラスを提供します。
+PatchStrategy は、ファイルの指定位置のバイト列をその場で書き換える（ファイル全体をコピーしない）
+ファイル操作戦略です。
+
+Features:
+- 編集（オフセット, バイト列）をオフセット順に並べ、隣接する編集を1回の書き込みにまとめる
+- 'r+b' で開いたファイルに os.pwrite で書き込む（使えない環境では seek + write）
+- fsync_batch を指定すると、その回数の書き込みごと、および最後に os.fsync する
+- journal を指定すると、書き込み前に元のバイト列を取り消し用のパッチ（<ファイル名>.undo.csv）に保存する
+  - 取り消しパッチは fsync してから書き込みを開始する（書き込み途中で失敗しても元に戻せる）
+  - 取り消しパッチは同じ形式のため、そのまま PatchStrategy で適用できる
+- ファイルサイズは変更しない（ファイル末尾を超える編集はエラー）
+
+パッチファイルの形式:
+    CSV（offset,data。data は16進数。offset は 0x 付きの16進数も可）
+        offset,data
+        0x10,DEADBEEF
+        512,55 AA
+
+    CSV（offset,size,name。diff の出力。データは source ファイルの同じ範囲から読み込む）
+
+    TOML
+        [[edit]]
+        offset = 0x10
+        data   = "DEADBEEF"
+
+使用例:
+    edits = load_edits("firmware_v2.diff.csv", source="firmware_v2.bin")
+    output_files = PatchStrategy(edits, journal=True).execute("firmware_v1.bin")
+"""
+import csv
+import os
+import time
+import tomllib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from binary_file_tool.file_operation.strategy_base import FileOperationStrategy
+from binary_file_tool.file_operation.extract_ranges_strategy import load_ranges, parse_int
+from binary_file_tool.file_error.exceptions import check_range_in_file
+
+# 取り消し用パッチのファイル名の末尾
+UNDO_SUFFIX = '.undo.csv'
+
+
+@dataclass(frozen=True)
+class PatchEdit:
+    """
+    1件の編集（offset の位置から data を書き込む）を表すデータクラス
+    """
+    offset: int
+    data: bytes
+
+
+def _read_at(f, offset: int, size: int) -> bytes:
+    if hasattr(os, 'pread'):
+        return os.pread(f.fileno(), size, offset)
+    f.seek(offset)
+    return f.read(size)
+
+
+def _write_at(f, offset: int, data: bytes) -> None:
+    if hasattr(os, 'pwrite'):
+        view = memoryview(data)
+        while view:
+            written = os.pwrite(f.fileno(), view, offset)
+            view    = view[written:]
+            offset += written
+    else:
+        f.seek(offset)
+        f.write(data)
+
+
+def parse_edit(text: str) -> PatchEdit:
+    """
+    "オフセット=16進数" 形式（例: "0x10=DEADBEEF"）の文字列を編集に変換する。
+
+    Raises:
+        ValueError: 形式が不正な場合
+    """
+    offset, sep, data = text.partition('=')
+    try:
+        if not sep:
+            raise ValueError("'=' がありません")
+        return PatchEdit(parse_int(offset), bytes.fromhex(data))
+    except ValueError as e:
+        raise ValueError(f"編集の指定が不正です（オフセット=16進数 の形式で指定してください）: '{text}' - {e}") from e
+
+
+def load_edits(path: str, source: Optional[str] = None) -> list[PatchEdit]:
+    """
+    パッチファイル（.csv / .toml）を読み込む。
+
+    Args:
+        path (str): パッチファイルのパス
+        source (Optional[str], optional): offset,size 形式の場合に、データを読み込むファイル. Defaults to None.
+
+    Raises:
+        ValueError: 形式が不正な場合、offset,size 形式で source が未指定の場合
+
+    Returns:
+        list[PatchEdit]: 編集のリスト（ファイル記載順）
+    """
+    file = Path(path)
+    if file.suffix.lower() == '.toml':
+        with open(file, 'rb') as f:
+            rows = tomllib.load(f).get('edit', [])
+    elif file.suffix.lower() == '.csv':
+        with open(file, newline='', encoding='utf-8-sig') as f:
+            reader = csv.DictReader(f)
+            rows = list(reader)
+            fields = reader.fieldnames or []
+        if 'data' not in fields and 'size' in fields:
+            return _load_range_edits(path, source)
+    else:
+        raise ValueError(f"パッチファイルは .csv または .toml である必要があります: '{file}'")
+
+    edits = []
+    for index, row in enumerate(rows):
+        try:
+            edits.append(PatchEdit(parse_int(row['offset']), bytes.fromhex(str(row['data']))))
+        except (KeyError, ValueError) as e:
+            raise ValueError(f"パッチ({index + 1}件目)が不正です: {row} - {e}") from e
+    return edits
+
+
+def _load_range_edits(path: str, source: Optional[str]) -> list[PatchEdit]:
+    """
+    範囲定義（offset,size,name）の各範囲について、source ファイルの同じ範囲のデータを編集とする。
+    """
+    if source is None:
+        raise ValueError(f"範囲定義（offset,size）のパッチには、データを読み込むファイル（source）を指定してください: '{path}'")
+    ranges = load_ranges(path)
+    with open(source, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        for r in ranges:
+            check_range_in_file(Path(source), size, r.offset, r.size)
+        return [PatchEdit(r.offset, _read_at(f, r.offset, r.size)) for r in ranges]
+
+
+def coalesce_edits(edits: list[PatchEdit]) -> list[PatchEdit]:
+    """
+    編集をオフセット順に並べ、隣接する編集を1つにまとめる。
+
+    Args:
+        edits (list[PatchEdit]): 編集のリスト
+
+    Raises:
+        ValueError: 範囲が重なる編集がある場合
+
+    Returns:
+        list[PatchEdit]: まとめた編集のリスト（オフセット順。空のデータは除く）
+    """
+    merged: list[PatchEdit] = []
+    pending: list[bytes] = []
+    start = end = 0
+    for edit in sorted((e for e in edits if e.data), key=lambda e: e.offset):
+        if pending and edit.offset < end:
+            raise ValueError(f"パッチの範囲が重なっています: オフセット {edit.offset}（直前の編集の終端: {end}）")
+        if pending and edit.offset == end:
+            pending.append(edit.data)
+        else:
+            if pending:
+                merged.append(PatchEdit(start, b''.join(pending)))
+            start, pending = edit.offset, [edit.data]
+        end = edit.offset + len(edit.data)
+    if pending:
+        merged.append(PatchEdit(start, b''.join(pending)))
+    return merged
+
+
+def save_edits(path: Path, edits: list[PatchEdit]) -> None:
+    """
+    編集をパッチファイル（CSV: offset,data）に保存し、fsync する。
+    """
+    with open(path, 'w', newline='', encoding='utf-8') as out:
+        writer = csv.writer(out)
+        writer.writerow(['offset', 'data'])
+        writer.writerows((f"0x{edit.offset:X}", edit.data.hex().upper()) for edit in edits)
+        out.flush()
+        os.fsync(out.fileno())
+
+
+class PatchStrategy(FileOperationStrategy):
+    """
+    PatchStrategy は、ファイルの指定位置をその場で書き換える戦略クラスです。
+    """
+    def __init__(self, edits: list[PatchEdit], journal: bool = False,
+                 fsync_batch: Optional[int] = None, journal_dir: Optional[str] = None) -> None:
+        """
+        Args:
+            edits (list[PatchEdit]): 編集のリスト
+            journal (bool, optional): 元のバイト列を取り消し用のパッチに保存するかどうか. Defaults to False.
+            fsync_batch (Optional[int], optional): この回数の書き込みごと（および最後）に fsync する。None の場合は fsync しない. Defaults to None.
+            journal_dir (Optional[str], optional): 取り消し用のパッチの出力ディレクトリ。None の場合は対象ファイルと同じ. Defaults to None.
+
+        Raises:
+            ValueError: 編集の範囲が重なる場合、fsync_batch が範囲外の場合
+        """
+        if fsync_batch is not None and fsync_batch <= 0:
+            raise ValueError(f"fsync_batch は1以上である必要があります。指定値: {fsync_batch}")
+
+        self.edits       = coalesce_edits(edits)
+        self.edit_count  = len(edits)
+        self.journal     = journal
+        self.fsync_batch = fsync_batch
+        self.journal_dir = Path(journal_dir) if journal_dir else None
+
+    def execute(self, filepath: str) -> list[str]:
+        """
+        ファイルに編集を適用する。
+
+        Args:
+            filepath (str): 対象のファイルパス
+
+        Raises:
+            OffsetOutOfRangeError: 編集のオフセットがファイルサイズの範囲外の場合
+            SizeExceedsError: 編集がファイル末尾を超える場合
+            FileExistsError: 取り消し用のパッチが既に存在する場合
+
+        Returns:
+            list[str]: 対象ファイルのパス（journal の場合は取り消し用のパッチのパスを含む）
+        """
+        file = Path(filepath)
+        outputs = [str(file)]
+        start = time.perf_counter()
+        with open(filepath, 'r+b') as f:
+            # 書き込み前にすべての範囲を検証する
+            size = os.fstat(f.fileno()).st_size
+            for edit in self.edits:
+                check_range_in_file(file, size, edit.offset, len(edit.data))
+
+            if self.journal:
+                journal_dir = self.journal_dir or file.parent
+                journal_dir.mkdir(parents=True, exist_ok=True)
+                undo_path = journal_dir / f"{file.name}{UNDO_SUFFIX}"
+                if undo_path.exists():
+                    raise FileExistsError(f"取り消し用のパッチが既に存在します（適用または削除してください）: '{undo_path}'")
+                save_edits(undo_path, [PatchEdit(e.offset, _read_at(f, e.offset, len(e.data))) for e in self.edits])
+                outputs.append(str(undo_path))
+
+            for count, edit in enumerate(self.edits, 1):
+                _write_at(f, edit.offset, edit.data)
+                if self.fsync_batch and count % self.fsync_batch == 0:
+                    f.flush()
+                    os.fsync(f.fileno())
+            if self.fsync_batch:
+                f.flush()
+                os.fsync(f.fileno())
+
+        elapsed = time.perf_counter() - start
+        total = sum(len(edit.data) for edit in self.edits)
+        print(f"パッチ：{self.edit_count} 件（書き込み {len(self.edits)} 回、{total:,} バイト） 処理時間：{elapsed:.3f} s {filepath}")
+        return outputs
@@ -0,0 +1,255 @@
+"""
+search_strategy.py
+
+このモジュールは、SearchStrategy クラスを提供します。
+SearchStrategy は、ファイル内の複数のバイトパターン（マジックナンバー、同期ワードなど）の
+出現位置をすべて検索するファイル操作戦略です。
+
+Features:
+- パターンは16進数文字列で指定する（例: "7F454C46", "0xAA55", "de ad be ef"）
+- ファイルを mmap で開き、ブロック単位で検索する
+  - ブロックの境界をまたぐ一致は、次のブロックの先頭を (最長パターン長 - 1) バイト重ねて読むことで検出する
+  - 重なり部分から始まる一致は次のブロックで検出するため、重複して出力しない
+- パターン数が少ない場合は、パターンごとの bytes.find（C 実装の高速検索）
+- パターン数が多い場合は、バケット分割したビット並列のフィルタ（PatternMatcher を参照）で候補位置を絞り込み、
+  先頭バイト列の辞書で照合する（パターン数によらず1回の走査）
+- 結果は「パス,オフセット,パターン」の CSV 行（オフセット順）
+  - spool_dir を指定した場合は、一致を順次一時ファイルに書き込み、そのパスを返す（一致数によらずメモリ一定）
+
+使用例:
+    strategy = SearchStrategy(["7F454C46", "AA55"])
+    for line in strategy.execute("dump.bin"):
+        print(line)  # → "dump.bin,510,aa55"
+"""
+import csv
+import io
+import mmap
+import os
+import tempfile
+from typing import Iterator, Optional
+
+from binary_file_tool.file_operation.strategy_base import FileOperationStrategy
+
+# 1回に検索するブロックのサイズ（バイト）
+BLOCK_SIZE = 4 * 1024 * 1024
+
+# このパターン数以下の場合は、パターンごとに bytes.find で検索する
+FIND_THRESHOLD = 4
+
+# フィルタのバケット数（1バイトのビット数）と、判定に使う先頭バイト数の上限
+_BUCKETS      = 8
+_PREFIX_BYTES = 4
+
+# 0 以外のバイトを 1 に変換するテーブル（候補位置を bytes.find で探すため）
+_NONZERO_TABLE = bytes([0]) + bytes([1]) * 255
+
+
+def parse_pattern(text: str) -> bytes:
+    """
+    16進数文字列のパターンをバイト列に変換する。
+
+    Args:
+        text (str): 16進数文字列。先頭の 0x、空白・':'・'-' の区切りは無視する
+
+    Raises:
+        ValueError: 16進数として不正な場合、空の場合
+
+    Returns:
+        bytes: パターン
+    """
+    value = text.strip()
+    if value[:2].lower() == '0x':
+        value = value[2:]
+    for sep in (' ', ':', '-', '_'):
+        value = value.replace(sep, '')
+    try:
+        pattern = bytes.fromhex(value)
+    except ValueError as e:
+        raise ValueError(f"パターンが16進数として不正です: '{text}'") from e
+    if not pattern:
+        raise ValueError(f"パターンが空です: '{text}'")
+    return pattern
+
+
+def load_patterns(path: str) -> list[str]:
+    """
+    パターンファイル（1行に1パターン。空行と '#' で始まる行は無視）を読み込む。
+    """
+    with open(path, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+
+
+class PatternMatcher:
+    """
+    複数のバイトパターンの出現位置を検索するクラス。
+
+    パターン数が多い場合は、Hyperscan の FDR と同様のバケット分割ビット並列フィルタを使用する。
+    各パターンの先頭 q バイト（q = min(4, 最短パターン長)）を 8 つのバケットに振り分け、
+    先頭から j バイト目の値ごとに「そのバイトを j バイト目に持つパターンがあるバケット」のビットを立てたテーブルを作る。
+    データを各テーブルで translate し、j バイトずらして多倍長整数の AND を取ると、
+    0 以外のバイトの位置が「いずれかのバケットで先頭 q バイトが一致し得る」候補位置となる。
+    候補位置のみ、先頭 q バイトの辞書でパターンを照合する。
+    """
+    def __init__(self, patterns: list[bytes]) -> None:
+        """
+        Args:
+            patterns (list[bytes]): パターンのリスト（重複は除く）
+
+        Raises:
+            ValueError: パターンが空の場合
+        """
+        if not patterns or not all(patterns):
+            raise ValueError("パターンを1つ以上指定してください（空のパターンは指定できません）")
+
+        self.patterns = list(dict.fromkeys(patterns))
+        self.max_len  = max(map(len, self.patterns))
+        self.use_find = len(self.patterns) <= FIND_THRESHOLD
+        if self.use_find:
+            return
+
+        # 先頭 q バイトごとのパターン（入力順）
+        self.prefix_len = min(_PREFIX_BYTES, min(map(len, self.patterns)))
+        self.by_prefix: dict[bytes, list[bytes]] = {}
+        for pattern in self.patterns:
+            self.by_prefix.setdefault(pattern[:self.prefix_len], []).append(pattern)
+
+        # 先頭 q バイトをバケットに振り分け、j バイト目のテーブルを作成する
+        tables = [bytearray(256) for _ in range(self.prefix_len)]
+        for i, prefix in enumerate(self.by_prefix):
+            bit = 1 << (i % _BUCKETS)
+            for j, value in enumerate(prefix):
+                tables[j][value] |= bit
+        self.tables = [bytes(table) for table in tables]
+
+    def search(self, data: bytes, end: int) -> list[tuple[int, bytes]]:
+        """
+        data 内で、開始位置が end 未満の一致をすべて返す。
+
+        Args:
+            data (bytes): 検索対象（ブロック + 次のブロックとの重なり部分）
+            end (int): 一致の開始位置の上限（この位置以降から始まる一致は返さない）
+
+        Returns:
+            list[tuple[int, bytes]]: (位置, パターン) のリスト（位置順。同じ位置はパターンの入力順）
+        """
+        if self.use_find:
+            return self._search_find(data, end)
+        return self._search_filter(data, end)
+
+    def _search_find(self, data: bytes, end: int) -> list[tuple[int, bytes]]:
+        matches = []
+        for index, pattern in enumerate(self.patterns):
+            i = data.find(pattern)
+            while 0 <= i < end:
+                matches.append((i, index, pattern))
+                i = data.find(pattern, i + 1)
+        matches.sort()
+        return [(i, pattern) for i, _, pattern in matches]
+
+    def _search_filter(self, data: bytes, end: int) -> list[tuple[int, bytes]]:
+        q = self.prefix_len
+        n = min(len(data) - q + 1, end)
+        if n <= 0:
+            return []
+
+        # j バイトずらして translate した値の AND（0 以外のバイトが候補位置）
+        candidates = -1
+        for j, table in enumerate(self.tables):
+            candidates &= int.from_bytes(data[j:j + n].translate(table), 'little')
+        if not candidates:
+            return []
+        marks = candidates.to_bytes(n, 'little').translate(_NONZERO_TABLE)
+
+        matches = []
+        i = marks.find(1)
+        while i >= 0:
+            for pattern in self.by_prefix.get(data[i:i + q], ()):
+                if data.startswith(pattern, i):
+                    matches.append((i, pattern))
+            i = marks.find(1, i + 1)
+        return matches
+
+
+class SearchStrategy(FileOperationStrategy):
+    """
+    SearchStrategy は、ファイル内の複数のバイトパターンの出現位置を検索する戦略クラスです。
+    """
+    cpu_bound = True
+    # 出力する CSV のヘッダー
+    header = 'path,offset,pattern'
+
+    def __init__(self, patterns: list[str], max_count: Optional[int] = None,
+                 block_size: int = BLOCK_SIZE, spool_dir: Optional[str] = None) -> None:
+        """
+        Args:
+            patterns (list[str]): 16進数文字列のパターンのリスト
+            max_count (Optional[int], optional): 1ファイルあたりの最大出力件数。None の場合は無制限. Defaults to None.
+            block_size (int, optional): 1回に検索するブロックのサイズ（バイト）. Defaults to 4MiB.
+            spool_dir (Optional[str], optional): 結果の一時ファイルを作成するディレクトリ。
+                None の場合は結果を CSV 行のリストで返す. Defaults to None.
+
+        Raises:
+            ValueError: パターンが不正な場合、max_count / block_size が範囲外の場合
+        """
+        if max_count is not None and max_count <= 0:
+            raise ValueError(f"max_count は1以上である必要があります。指定値: {max_count}")
+        if block_size <= 0:
+            raise ValueError(f"block_size は1以上である必要があります。指定値: {block_size}")
+
+        self.matcher    = PatternMatcher([parse_pattern(p) for p in patterns])
+        self.max_count  = max_count
+        self.block_size = block_size
+        self.spool_dir  = spool_dir
+
+    def iter_matches(self, filepath: str) -> Iterator[tuple[int, bytes]]:
+        """
+        ファイル内の一致を位置順に返す。
+
+        Args:
+            filepath (str): 検索対象のファイルパス
+
+        Returns:
+            Iterator[tuple[int, bytes]]: (オフセット, パターン)
+        """
+        overlap = self.matcher.max_len - 1
+        count   = 0
+        with open(filepath, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for start in range(0, size, self.block_size):
+                    end  = min(start + self.block_size, size)
+                    data = mm[start:min(end + overlap, size)]
+                    for i, pattern in self.matcher.search(data, end - start):
+                        yield start + i, pattern
+                        count += 1
+                        if count == self.max_count:
+                            return
+
+    def execute(self, filepath: str) -> list[str]:
+        """
+        ファイル内の一致を検索する。
+
+        Args:
+            filepath (str): 検索対象のファイルパス
+
+        Returns:
+            list[str]: 一致ごとの CSV 行（パス,オフセット,パターン）。
+                spool_dir を指定した場合は、CSV 行を書き込んだ一時ファイルのパス（1要素。呼び出し側で削除する）
+        """
+        rows = ((filepath, offset, pattern.hex()) for offset, pattern in self.iter_matches(filepath))
+        if self.spool_dir is None:
+            out = io.StringIO()
+            csv.writer(out, lineterminator='\n').writerows(rows)
+            return out.getvalue().splitlines()
+
+        # 一致をすべてメモリに保持せず、一時ファイルに順次書き込む
+        fd, path = tempfile.mkstemp(prefix='search_', suffix='.csv', dir=self.spool_dir)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8', newline='') as out:
+                csv.writer(out, lineterminator='\n').writerows(rows)
+        except BaseException:
+            os.remove(path)
+            raise
+        return [path]
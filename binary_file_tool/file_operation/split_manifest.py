@@ -0,0 +1,194 @@
+"""
+split_manifest.py
+
+このモジュールは、分割結果を記録するマニフェスト（JSON）を扱う SplitManifest クラスを提供します。
+マニフェストには元ファイルのサイズ・ハッシュと、各パーツのパス・位置・サイズ・ハッシュを記録し、
+後から元ファイルを復元（join）・検証するために使用します。
+
+形式:
+    {
+      "version": 1,
+      "mode": "cdc",                 # fixed / cdc
+      "source": "firmware.bin",
+      "size": 1048576,
+      "algorithm": "sha256",
+      "digest": "...",               # 元ファイル全体のハッシュ
+      "parts": [
+        {"path": "chunks/3f2a...", "offset": 0, "size": 8192, "digest": "3f2a..."},
+        ...
+      ]
+    }
+
+    path はマニフェストのあるディレクトリからの相対パス（相対パスで表せない場合は絶対パス）。
+
+    digest はスレッドプールで並列に計算・検証する（hashlib は大きなデータの計算中に GIL を解放する）。
+
+Typical usage:
+    manifest = SplitManifest.load("firmware.bin.manifest.json")
+    for part in manifest.parts:
+        print(manifest.resolve(part), part.size)
+    errors = manifest.verify()  # 各パーツのサイズ・ハッシュを並列に検証
+"""
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from binary_file_tool.file_error.file_info import FileInfo
+
+# マニフェストファイル名の末尾
+MANIFEST_SUFFIX = '.manifest.json'
+# マニフェストの形式のバージョン
+MANIFEST_VERSION = 1
+# ハッシュ計算時の読み込み単位（バイト）
+_HASH_BUFFER_SIZE = 1024 * 1024
+
+
+def manifest_path_for(out_dir: Path, file: Path) -> Path:
+    """
+    入力ファイル file の分割結果を記録するマニフェストのパスを返す。
+    """
+    return out_dir / f"{file.name}{MANIFEST_SUFFIX}"
+
+
+def hash_file(path: Path, algorithm: str = 'sha256', offset: int = 0, size: Optional[int] = None) -> str:
+    """
+    ファイルの [offset, offset + size) のハッシュ値（16進数）を計算する。size が None の場合は末尾まで。
+    """
+    digest = hashlib.new(algorithm)
+    buffer = bytearray(_HASH_BUFFER_SIZE)
+    view   = memoryview(buffer)
+    with open(path, 'rb', buffering=0) as f:
+        f.seek(offset)
+        remaining = size
+        while remaining is None or remaining > 0:
+            n = f.readinto(view if remaining is None or remaining >= len(buffer) else view[:remaining])
+            if not n:
+                break
+            digest.update(view[:n])
+            if remaining is not None:
+                remaining -= n
+    return digest.hexdigest()
+
+
+def hash_files(paths: list[Path], algorithm: str = 'sha256', jobs: int = 0) -> list[str]:
+    """
+    複数ファイルのハッシュ値をスレッドプールで並列に計算する。
+
+    Args:
+        paths (list[Path]): 対象ファイルのパス
+        algorithm (str, optional): ハッシュアルゴリズム（hashlib の名前）. Defaults to 'sha256'.
+        jobs (int, optional): 並列数。0 の場合は CPU 数. Defaults to 0.
+
+    Returns:
+        list[str]: paths と同じ順序のハッシュ値
+    """
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        return list(pool.map(lambda path: hash_file(path, algorithm), paths))
+
+
+@dataclass(frozen=True)
+class ManifestPart:
+    """
+    マニフェストに記録する1パーツ分の情報
+    """
+    path: str
+    offset: int
+    size: int
+    digest: str
+
+
+@dataclass
+class SplitManifest:
+    """
+    分割結果（元ファイルの情報とパーツの一覧）を表すデータクラス
+    """
+    mode: str
+    source: str
+    size: int
+    algorithm: str
+    digest: str
+    parts: list[ManifestPart] = field(default_factory=list)
+    # マニフェストファイルのパス（load / save 時に設定。相対パスの基準）
+    location: Path = field(default=Path('.'), compare=False)
+
+    def relative(self, path: Path) -> str:
+        """
+        パーツのパスを、マニフェストからの相対パス（記録用の文字列）に変換する。
+        """
+        try:
+            return Path(os.path.relpath(path, self.location.parent)).as_posix()
+        except ValueError:
+            # 別ドライブなど、相対パスで表せない場合
+            return str(Path(path).resolve())
+
+    def resolve(self, part: ManifestPart) -> Path:
+        """
+        パーツの実際のパスを返す。
+        """
+        return self.location.parent / part.path
+
+    def verify(self, jobs: int = 0) -> list[str]:
+        """
+        各パーツが存在し、サイズ・ハッシュ値がマニフェストと一致するかを並列に検証する。
+
+        Args:
+            jobs (int, optional): 並列数。0 の場合は CPU 数. Defaults to 0.
+
+        Returns:
+            list[str]: 不一致の内容（問題がなければ空のリスト）
+        """
+        errors = []
+        # 同じパーツ（重複排除されたチャンク）は1回だけ検証する
+        unique = list({part.path: part for part in self.parts}.values())
+        targets = []
+        for part in unique:
+            path = self.resolve(part)
+            # 存在・サイズの確認はパーツごとに1回の stat で行う
+            try:
+                info = FileInfo.from_path(path)
+            except (FileNotFoundError, NotADirectoryError):
+                errors.append(f"パーツが見つかりません: '{path}'")
+                continue
+            if info.size != part.size:
+                errors.append(f"パーツのサイズが一致しません: '{path}'（期待値: {part.size}、実際: {info.size}）")
+            else:
+                targets.append(part)
+
+        digests = hash_files([self.resolve(part) for part in targets], self.algorithm, jobs)
+        for part, digest in zip(targets, digests):
+            if digest != part.digest:
+                errors.append(f"パーツのハッシュ値が一致しません: '{self.resolve(part)}'")
+        return errors
+
+    def save(self, path: Path) -> None:
+        """
+        マニフェストを JSON ファイルとして保存する。
+        """
+        self.location = Path(path)
+        data = {'version': MANIFEST_VERSION, **asdict(self)}
+        del data['location']
+        with open(path, 'w', encoding='utf-8', newline='\n') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+
+    @classmethod
+    def load(cls, path: str) -> 'SplitManifest':
+        """
+        JSON ファイルからマニフェストを読み込む。
+
+        Raises:
+            ValueError: 形式が不正な場合、またはバージョンが未対応の場合
+        """
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        try:
+            if data.pop('version') != MANIFEST_VERSION:
+                raise ValueError(f"未対応のマニフェストのバージョンです: '{path}'")
+            parts = [ManifestPart(**part) for part in data.pop('parts')]
+            return cls(**data, parts=parts, location=Path(path))
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"マニフェストの形式が不正です: '{path}' - {e}") from e
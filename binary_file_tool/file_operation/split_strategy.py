@@ -10,17 +10,30 @@ Features:
 - 分割後の出力ファイルを自動生成（_part0, _part1,... 形式）
 - 出力ディレクトリの指定が可能（省略時は入力ファイルと同じ場所に保存）
 - 端数チャンクの無視オプション（ignore_tail）
+- コピーエンジンの選択（engine）。auto / kernel の場合は os.copy_file_range /
+  os.sendfile によりカーネル内でコピーし、ユーザー空間へのデータ転送を省略する
+- パーツ単位の並列処理（jobs）。各ワーカーが担当するパーツ番号（重複なし）を受け持ち、
+  共有した入力ファイルから位置指定（os.copy_file_range / os.pread）で読み込み、
+  os.posix_fallocate で領域を確保した出力ファイルへ書き込む。出力ファイル名・ignore_tail の動作は逐次処理と同一
+- マニフェストの出力（manifest）。各パーツのサイズとハッシュ値（スレッドプールで並列計算）を記録し、
+  JoinStrategy での復元・検証に使用する
 
 使用例:
-    strategy = SplitStrategy(chunk_size=1024, ignore_tail=False)
+    strategy = SplitStrategy(chunk_size=1024, ignore_tail=False, engine="auto")
     output_files = strategy.execute("sample.bin")
 """
-
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 from binary_file_tool.file_operation.strategy_base import FileOperationStrategy
+from binary_file_tool.file_operation.copy_engine import COPY_ENGINES, RangeCopier, format_throughput, preallocate
+from binary_file_tool.file_operation.split_manifest import (
+    ManifestPart, SplitManifest, hash_file, hash_files, manifest_path_for)
 from binary_file_tool.file_error.exceptions import check_chunk_size
+from binary_file_tool.file_error.file_info import FileInfo
 
 
 # バイナリファイルを指定サイズで分割する戦略
@@ -30,60 +43,124 @@ class SplitStrategy(FileOperationStrategy):
     ファイル単位で保存する戦略クラスです。
     """
     def __init__(self, chunk_size: int, ignore_tail: bool,
-                 output_dir: Optional[str] = None) -> None:
+                 output_dir: Optional[str] = None,
+                 engine: str = 'auto',
+                 manifest: bool = False,
+                 jobs: int = 1) -> None:
         """
 
         Args:
             chunk_size (int): 分割サイズ（バイト）
             ignore_tail (bool): 最後の端数チャンクを無視するかどうか
+            output_dir (Optional[str], optional): 出力ディレクトリ. Defaults to None.
+            engine (str, optional): コピーエンジン（auto / kernel / buffered）. Defaults to 'auto'.
+            manifest (bool, optional): マニフェスト（<入力ファイル名>.manifest.json）を出力するかどうか. Defaults to False.
+            jobs (int, optional): パーツを並列に書き込むワーカー数。0 の場合は CPU 数. Defaults to 1.
+
+        Raises:
+            ValueError: engine がサポート外の値の場合、jobs が負の値の場合
         """
 
         self.chunk_size = chunk_size
         self.ignore_tail = ignore_tail
         self.output_dir = Path(output_dir) if output_dir else None
+        if engine not in COPY_ENGINES:
+            raise ValueError(f"engine は {COPY_ENGINES} のいずれかである必要があります。指定値: {engine}")
+        self.engine = engine
+        self.manifest = manifest
+        if jobs < 0:
+            raise ValueError(f"jobs は0以上の整数である必要があります。指定値: {jobs}")
+        self.jobs = jobs
 
     def execute(self, filepath: str) -> list[str]:
         """
-        ファイルを読み込み、指定サイズで分割して別ファイルに保存する。
+        ファイルを指定サイズで分割して別ファイルに保存し、処理速度を表示する。
 
         Args:
             filepath (str): 抽出元のファイルパス（絶対または相対パス）
 
+        Raises:
+            CopyEngineError: engine='kernel' でカーネルコピーが利用できない場合
+
         Returns:
-            list[str]: 出力ファイルパスのリスト
+            list[str]: 出力ファイルパスのリスト（manifest=True の場合は末尾にマニフェストのパス）
         """
         file = Path(filepath)
         
-        # チャンクサイズをチェック
-        check_chunk_size(file,self.chunk_size)
-        
-        # 出力ディレクトリ
-        out_dir = self.output_dir or file.parent
-        # 存在しない場合はディレクトリ作成
-        out_dir.mkdir(parents=True, exist_ok=True)
-        
-        output_paths = []
+        start = time.perf_counter()
         with open(filepath, 'rb') as f:
-            index = 0
-            while True:
-                # chunk_size読み込み
-                chunk = f.read(self.chunk_size)
-                # 空であれば終了
-                if not chunk:
-                    break
-                # 端数がある場合、指定があれば破棄する
-                if len(chunk) < self.chunk_size and self.ignore_tail:
-                    break
-                # 出力ファイル名
-                base_name = file.stem
-                ext = file.suffix
-                out_path = out_dir / f"{base_name}_part{index}{ext}"
-                
-                # 書き込み
-                with open(out_path, 'wb') as out_file:
-                    out_file.write(chunk)
-                output_paths.append(str(out_path))
-                index += 1
+            # チャンクサイズをチェック（fstat 1回の結果で検証する）
+            info = FileInfo.from_fd(file, f.fileno())
+            check_chunk_size(info, self.chunk_size)
+            file_size = info.size
+
+            # 出力ディレクトリ
+            out_dir = self.output_dir or file.parent
+            # 存在しない場合はディレクトリ作成
+            out_dir.mkdir(parents=True, exist_ok=True)
+
+            # 出力するチャンク数（端数がある場合、指定があれば破棄する）
+            count = file_size // self.chunk_size
+            if file_size % self.chunk_size and not self.ignore_tail:
+                count += 1
+
+            # 各パーツの出力ファイル名・オフセット・サイズ
+            parts = []
+            for index in range(count):
+                offset = index * self.chunk_size
+                size = min(self.chunk_size, file_size - offset)
+                parts.append((out_dir / f"{file.stem}_part{index}{file.suffix}", offset, size))
+
+            # 入力ファイルを共有して並列に読み込むには、位置指定の読み込み（os.pread）が必要
+            jobs = min(self.jobs or os.cpu_count() or 1, count) if hasattr(os, 'pread') else 1
+            if jobs > 1:
+                # ワーカー w はパーツ番号 w, w + jobs, w + 2 * jobs, ... を担当する
+                with ThreadPoolExecutor(max_workers=jobs) as pool:
+                    results = list(pool.map(lambda w: self._copy_parts(f, parts[w::jobs]), range(jobs)))
+            else:
+                results = [self._copy_parts(f, parts)]
+
+        total = sum(copied for copied, _ in results)
+        used_engines = list(dict.fromkeys(engine for _, engines in results for engine in engines))
+        output_paths = [str(path) for path, _, _ in parts]
 
+        elapsed = time.perf_counter() - start
+        print(f"処理速度：{format_throughput(total, elapsed)} [engine: {', '.join(used_engines) or '-'}] {filepath}")
+
+        if self.manifest:
+            output_paths.append(str(self._write_manifest(file, out_dir, parts, total)))
         return output_paths
-    
\ No newline at end of file
+
+    def _copy_parts(self, src, parts: list[tuple[Path, int, int]]) -> tuple[int, list[str]]:
+        """
+        担当するパーツを順に書き込む（ワーカーごとに RangeCopier を使用する）。
+
+        Returns:
+            tuple[int, list[str]]: 書き込んだバイト数, 使用したコピーエンジン
+        """
+        copier = RangeCopier(self.engine)
+        total = 0
+        for out_path, offset, size in parts:
+            with open(out_path, 'wb', buffering=0) as out_file:
+                # 出力ファイルの領域をあらかじめ確保する
+                preallocate(out_file.fileno(), size)
+                total += copier.copy(src, out_file, offset, size)
+        return total, copier.used_engines
+
+    @staticmethod
+    def _write_manifest(file: Path, out_dir: Path, parts: list[tuple[Path, int, int]], total: int) -> Path:
+        """
+        各パーツと元ファイル（出力した範囲）のハッシュ値を並列に計算し、マニフェストを出力する。
+        """
+        manifest_path = manifest_path_for(out_dir, file)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            # 元ファイルのハッシュ（1ファイルの逐次計算）は、パーツのハッシュ計算と並行して行う
+            source_digest = pool.submit(hash_file, file, 'sha256', 0, total)
+            part_digests  = hash_files([path for path, _, _ in parts])
+
+        manifest = SplitManifest('fixed', file.name, total, 'sha256', source_digest.result(), location=manifest_path)
+        # パーツのサイズは書き込んだ範囲のサイズ（stat しない）
+        for (path, offset, size), digest in zip(parts, part_digests):
+            manifest.parts.append(ManifestPart(manifest.relative(path), offset, size, digest))
+        manifest.save(manifest_path)
+        return manifest_path
@@ -0,0 +1,146 @@
+"""
+fast_random_strategy.py
+
+シード指定で再現可能な、高速な（暗号論的に安全ではない）乱数データを生成する戦略クラス。
+負荷試験用のテストデータ（フィクスチャ）の生成を想定しています。
+
+生成方法:
+    - 出力ファイル o のブロック i（BLOCK_SIZE バイトごと）のデータは、
+      NumPy の PCG64(SeedSequence(シード, spawn_key=(o, i))) の出力の先頭 block_size バイト
+      （NumPy がない場合は、"シード:o:i" を入力とした SHAKE128 の出力）
+    - o は outputs（CLI の --output の並び）における出力ファイルの位置。複数のファイルを出力する場合も
+      ファイルごとに異なるデータとなる（outputs を指定しない場合は 0）
+    - 各ブロックはシード・出力ファイルの位置・ブロック番号のみから独立に生成するため、
+      新規作成・既存ファイルへの上書き・並列実行に依らず同一のデータとなる（サイズが異なる場合も、先頭部分は共通）
+    - jobs を指定した場合は、ブロックをプロセスプールで並列に生成し、ブロック順に書き込む
+
+性能:
+    生成速度は 1 コアあたり、PCG64 で約 0.75 GB/s、SHAKE128 で約 0.25 GB/s（Python 3.11 で計測）。
+    数 GB/s が必要な場合は jobs（CLI の --jobs）でコア数に応じて並列化する。
+    （以前の、1つの乱数テーブルの一部を置換表で変換する方式は 0.5～0.65 GB/s だったが、
+    データが自己相似になるため廃止した）
+
+備考:
+    NumPy の有無で生成されるデータは異なる（同じ環境であれば再現可能）。
+    暗号用途には SecureRandomStrategy を使用すること。
+
+使用例:
+    FastRandomStrategy(size=1024 ** 3, seed=42, jobs=8).execute("fixture.bin")
+"""
+import hashlib
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from binary_file_tool.generate_file.strategy_base import GenerateFileStrategy
+from binary_file_tool.generate_file.output_region import open_output
+
+# 1回に生成・書き込みするサイズ（バイト）
+BLOCK_SIZE = 4 * 1024 * 1024
+
+# 並列数あたりの先行投入ブロック数（生成済みで未書き込みのブロックを制限する）
+PREFETCH_PER_JOB = 2
+
+
+def generate_block(seed: int, output: int, index: int, n: int) -> bytes:
+    """
+    出力ファイル output のブロック index の先頭 n バイトを生成する（プロセスプールから呼び出すためモジュールレベルに定義）。
+    PCG64 / SHAKE128 とも出力長を変えても先頭部分が共通のため、末尾の端数ブロックも同じブロックの先頭部分と一致する。
+    """
+    if np is None:
+        return hashlib.shake_128(f"{seed}:{output}:{index}".encode()).digest(n)
+    generator = np.random.PCG64(np.random.SeedSequence(seed, spawn_key=(output, index)))
+    return generator.random_raw((n + 7) // 8).astype('<u8', copy=False).tobytes()[:n]
+
+
+class FastRandomStrategy(GenerateFileStrategy):
+    """
+    シード指定で再現可能な乱数データのファイルを高速に生成する戦略。
+    """
+    cpu_bound = True
+
+    def __init__(self, size: int, seed: int = 0, offset: Optional[int] = None, jobs: int = 1,
+                 outputs: Optional[Sequence[str]] = None):
+        """
+        Args:
+            size (int): 出力するサイズ（バイト数）
+            seed (int, optional): 乱数のシード. Defaults to 0.
+            offset (Optional[int], optional): 既存ファイルの一部を上書きする場合の開始位置。None の場合は新規作成. Defaults to None.
+            jobs (int, optional): ブロックを並列に生成するプロセス数。0 の場合は CPU 数. Defaults to 1.
+            outputs (Optional[Sequence[str]], optional): 出力ファイルのパスの並び。位置ごとに異なるデータを生成する. Defaults to None.
+
+        Raises:
+            ValueError: size が正の整数でない場合、seed / offset / jobs が負の場合
+        """
+        if size <= 0:
+            raise ValueError(f"size({size}) は正の整数である必要があります")
+        if seed < 0:
+            raise ValueError(f"seed({seed}) は 0 以上である必要があります")
+        if offset is not None and offset < 0:
+            raise ValueError(f"offset({offset}) は 0 以上である必要があります")
+        if jobs < 0:
+            raise ValueError(f"jobs は0以上の整数である必要があります。指定値: {jobs}")
+
+        self.size   = size
+        self.seed   = seed
+        self.offset = offset
+        self.jobs   = jobs
+        # 同じファイルが複数回指定された場合は、最初の位置とする
+        self.output_indexes = {}
+        for i, path in enumerate(outputs or ()):
+            self.output_indexes.setdefault(os.path.abspath(path), i)
+
+    def execute(self, filepath: str) -> list[str]:
+        """
+        乱数データを生成し、ファイルに書き込む
+
+        Args:
+            filepath (str): 出力ファイルパス
+
+        Raises:
+            ValueError: outputs を指定し、filepath が含まれない場合
+            FileNotFoundError: offset を指定し、ファイルが存在しない場合
+            SizeExceedsError: offset から size バイトがファイルの範囲を超える場合
+
+        Returns:
+            list[str]: 出力ファイルのパス（1要素）
+        """
+        file   = Path(filepath)
+        output = self._output_index(filepath)
+        blocks = [(index, min(BLOCK_SIZE, self.size - start))
+                  for index, start in enumerate(range(0, self.size, BLOCK_SIZE))]
+        jobs   = min(self.jobs or os.cpu_count() or 1, len(blocks))
+
+        with open_output(filepath, self.size, self.offset) as f:
+            if jobs <= 1:
+                for index, n in blocks:
+                    f.write(generate_block(self.seed, output, index, n))
+                return [str(file)]
+
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                pending: deque = deque()
+                for index, n in blocks:
+                    pending.append(pool.submit(generate_block, self.seed, output, index, n))
+                    if len(pending) >= jobs * PREFETCH_PER_JOB:
+                        f.write(pending.popleft().result())
+                while pending:
+                    f.write(pending.popleft().result())
+        return [str(file)]
+
+    def _output_index(self, filepath: str) -> int:
+        """
+        outputs における出力ファイルの位置を返す（outputs を指定しない場合は 0）。
+        """
+        if not self.output_indexes:
+            return 0
+        path = os.path.abspath(filepath)
+        if path not in self.output_indexes:
+            raise ValueError(f"出力ファイル {filepath} が outputs に含まれていません")
+        return self.output_indexes[path]
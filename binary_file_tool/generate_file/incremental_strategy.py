@@ -1,8 +1,13 @@
-from typing import Literal
+from typing import Iterator, Literal
 from pathlib import Path
 
 from binary_file_tool.generate_file.strategy_base import GenerateFileStrategy
 
+# 下位ビット（最大16ビット）のパターンをまとめて生成する単位（ビット数）
+_LOW_BITS = 16
+# 周期の短いデータ（unit_size <= 2）を書き込む際の1回の書き込みサイズの目安（バイト）
+_WRITE_SIZE = 4 * 1024 * 1024
+
 class IncrementalDataStrategy(GenerateFileStrategy):
     """
     インクリメント値で構成されたバイナリファイルを生成する戦略。
@@ -26,6 +31,8 @@ class IncrementalDataStrategy(GenerateFileStrategy):
 
         if endian not in ('little', 'big'):
             raise ValueError("endian は 'little' または 'big' のいずれかである必要があります")
+        if unit_size <= 0:
+            raise ValueError(f"unit_size({unit_size}) は正の整数である必要があります")
         if size % unit_size != 0:
             raise ValueError(f"size({size}) は unit_size({unit_size}) の倍数である必要があります")
         if start_value < 0:
@@ -46,15 +53,60 @@ class IncrementalDataStrategy(GenerateFileStrategy):
         
         
         with open(filepath, "wb") as f:
-            # 書き込むデータ数（unit単位）と最大値（ラップアラウンド用）
-            count = self.size // self.unit_size
-            current = self.start_value
-            max_value = 2 ** (self.unit_size * 8)
-            # 指定サイズ分のインクリメントデータを順次書き込み
-            for _ in range(count):
-                value = current % max_value  # 指定bit幅を超えたら0に戻る
-                f.write(value.to_bytes(self.unit_size, byteorder=self.endian, signed=False))
-                current += 1
+            # 値をブロック単位でまとめて生成し、順次書き込み
+            for block in self._blocks():
+                f.write(block)
         return [filepath]
 
+    def _blocks(self) -> Iterator[bytes]:
+        """
+        出力データを先頭から順にブロック単位で返す。
+
+        値を「下位 low_bits ビット」と「上位ビット」に分け、下位ビットが 0 から 1 周する間は
+        上位ビットが一定であることを利用する。下位ビットのパターン（0, 1, 2, ...）を一度だけ生成し、
+        ブロックごとに上位バイトの列だけを書き換えることで、1値ごとの変換を行わない。
+        """
+        unit_size   = self.unit_size
+        count       = self.size // self.unit_size
+        max_value   = 2 ** (unit_size * 8)
+        low_bits    = min(_LOW_BITS, unit_size * 8)
+        low_size    = low_bits // 8
+        block_units = 1 << low_bits
+
+        # 下位ビットのパターン：0 ～ block_units-1 を low_size バイトで並べたもの
+        low_pattern = b"".join(v.to_bytes(low_size, self.endian) for v in range(block_units))
+        # 各値のうち下位バイト・上位バイトが置かれる位置（先頭からのオフセット）
+        if self.endian == 'little':
+            low_offset, high_offsets = 0, range(low_size, unit_size)
+        else:
+            low_offset, high_offsets = unit_size - low_size, range(unit_size - low_size)
+
+        block = bytearray(block_units * unit_size)
+        for j in range(low_size):
+            block[low_offset + j::unit_size] = low_pattern[j::low_size]
+
+        value = self.start_value % max_value   # 指定bit幅を超えたら0に戻る
+        if not high_offsets:
+            # 上位ビットがない（unit_size <= 2）場合はブロック全体が1周期。開始値に合わせて回転し、繰り返し書き込む
+            start  = value * unit_size
+            period = bytes(block[start:] + block[:start])
+            chunk  = period * max(1, _WRITE_SIZE // len(period))
+            total  = count * unit_size
+            for _ in range(total // len(chunk)):
+                yield chunk
+            if total % len(chunk):
+                yield chunk[:total % len(chunk)]
+            return
+
+        view = memoryview(block)
+        while count > 0:
+            low  = value & (block_units - 1)
+            high = (value >> low_bits).to_bytes(unit_size - low_size, self.endian)
+            # 上位バイトの列をブロック内の全値について一括で書き換える
+            for offset, b in zip(high_offsets, high):
+                block[offset::unit_size] = bytes((b,)) * block_units
 
+            n = min(block_units - low, count)
+            yield view[low * unit_size:(low + n) * unit_size]
+            value  = (value + n) % max_value
+            count -= n
@@ -0,0 +1,47 @@
+"""
+output_region.py
+
+ファイル生成戦略の出力先を開く関数を提供します。
+
+- offset を指定しない場合は、ファイルを新規作成（既存の場合は上書き）する
+- offset を指定した場合は、既存ファイルの [offset, offset + size) の範囲をその場で上書きする
+  （ファイルサイズは変更しない）
+
+使用例:
+    with open_output("out.bin", size=1024) as f:               # 新規作成
+        f.write(data)
+    with open_output("disk.img", size=1024, offset=4096) as f:  # 既存ファイルの一部を上書き
+        f.write(data)
+"""
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from binary_file_tool.file_error.exceptions import check_size_available
+
+
+def open_output(filepath: str, size: int, offset: Optional[int] = None) -> BinaryIO:
+    """
+    生成データの書き込み先を開き、書き込み開始位置に移動したファイルオブジェクトを返す。
+
+    Args:
+        filepath (str): 出力ファイルパス
+        size (int): 書き込むバイト数
+        offset (Optional[int], optional): 既存ファイル上の書き込み開始位置。None の場合は新規作成. Defaults to None.
+
+    Raises:
+        FileNotFoundError: offset を指定し、ファイルが存在しない場合
+        SizeExceedsError: offset から size バイトがファイルの範囲を超える場合
+
+    Returns:
+        BinaryIO: 書き込み用のファイルオブジェクト
+    """
+    file = Path(filepath)
+    if offset is None:
+        # 存在しない場合はディレクトリ作成
+        file.parent.mkdir(parents=True, exist_ok=True)
+        return open(file, "wb")
+
+    check_size_available(file, offset, size)
+    f = open(file, "r+b")
+    f.seek(offset)
+    return f
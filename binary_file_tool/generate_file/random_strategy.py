@@ -1,36 +1,51 @@
 import secrets
 from pathlib import Path
+from typing import Optional
+
 from binary_file_tool.generate_file.strategy_base import GenerateFileStrategy
+from binary_file_tool.generate_file.output_region import open_output
+
+# 1回に生成・書き込みするサイズ（バイト）
+BLOCK_SIZE = 1024 * 1024
+
+
 class SecureRandomStrategy(GenerateFileStrategy):
     """
     暗号論的に安全な乱数で構成されたバイナリファイルを生成する戦略。
     例: secrets.token_bytes() を用いて、指定サイズのランダムデータを出力する。
     """
 
-    def __init__(self, size: int):
+    def __init__(self, size: int, offset: Optional[int] = None, block_size: int = BLOCK_SIZE):
         """        
 
         Args:
             size (int): 出力するファイルサイズ（バイト数）。セキュアなランダムバイト列を生成します。
+            offset (Optional[int], optional): 既存ファイルの一部を上書きする場合の開始位置。None の場合は新規作成. Defaults to None.
+            block_size (int, optional): 1回に生成・書き込みするサイズ（バイト）. Defaults to BLOCK_SIZE.
         
         Raises:
-            ValueError: size が正の整数でない場合
+            ValueError: size / block_size が正の整数でない場合、offset が負の場合
         """
         if size <= 0:
             raise ValueError(f"size({size}) は正の整数である必要があります")
+        if block_size <= 0:
+            raise ValueError(f"block_size({block_size}) は正の整数である必要があります")
+        if offset is not None and offset < 0:
+            raise ValueError(f"offset({offset}) は 0 以上である必要があります")
 
-        self.size = size
+        self.size       = size
+        self.offset     = offset
+        self.block_size = block_size
 
     def execute(self, filepath: str) -> list[str]:
         
         file = Path(filepath)
         
-        # 出力ディレクトリ
-        out_dir = file.parent
-        # 存在しない場合はディレクトリ作成
-        out_dir.mkdir(parents=True, exist_ok=True)
-        
-        # ファイルにセキュアなランダムバイトを書き込む        
-        with open(filepath, "wb") as f:
-            f.write(secrets.token_bytes(self.size))
+        # ファイルにセキュアなランダムバイトをブロック単位で書き込む（メモリ使用量は block_size 程度）
+        with open_output(filepath, self.size, self.offset) as f:
+            remaining = self.size
+            while remaining > 0:
+                n = min(self.block_size, remaining)
+                f.write(secrets.token_bytes(n))
+                remaining -= n
         return [str(file)]
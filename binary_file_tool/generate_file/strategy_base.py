@@ -24,6 +24,9 @@ class GenerateFileStrategy(ABC):
     ファイル生成の戦略インタフェース。
     execute(filepath) メソッドを実装して、特定のファイル生成を実行する。
     """
+    # CPU バウンドな戦略の場合 True（並列実行時にプロセスプールを使用する）
+    cpu_bound: bool = False
+
     @abstractmethod
     def execute(self, filepath: str) -> list[str]:
         """
@@ -1,8 +1,10 @@
 
 import argparse
 
-from csv_file_tool.concat.csv_concat_executor import CSVConcatExecutor
+from csv_file_tool.concat.csv_concat_executor import CSVConcatExecutor, DEFAULT_CHUNKSIZE, CSV_PARSERS, load_dtypes
 from csv_file_tool.concat.by_index import ConcatByIndexStrategy
+from csv_file_tool.concat.by_row import ConcatByRowStrategy
+from csv_file_tool.concat.by_key import ConcatByKeyStrategy, JOIN_TYPES, JOIN_ENGINES, RUN_SIZE
 
 from util.resolve_files.resolve_files import resolve_files
 
@@ -22,14 +24,32 @@ def main():
     # concat_operation共通オプション用の親パーサー（help を False にして二重表示を防ぐ）
     concat_common_parser = argparse.ArgumentParser(add_help=False)
     concat_common_parser.add_argument('--force', action='store_true',   help='大量ファイル処理の確認をスキップする')
-    concat_common_parser.add_argument('--input', required=True,         help='入力ファイルパス（ワイルドカード可）')
-    concat_common_parser.add_argument('--output', required=True,        help='出力ファイルパス')
+    concat_common_parser.add_argument('--input', required=True,         help='入力ファイルパス（ワイルドカード可。.gz / .zst / .parquet / .feather 以外の拡張子は非圧縮のCSVとして読み込む）')
+    concat_common_parser.add_argument('--output', required=True,        help='出力ファイルパス（拡張子で形式を判定: .csv / .csv.gz / .csv.zst / .parquet / .feather）')
     concat_common_parser.add_argument('--columns', nargs='*',           help="Columns to select from each CSV file")
     concat_common_parser.add_argument('--index-name', type=str,         help='Index name for the concatenated DataFrame. If not specified, index will not be included.')
+    concat_common_parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE,
+                                      help='各ファイルから1回に読み込む行数（行位置で結合する戦略はブロックごとに出力する。0 の場合は全件を読み込んでから結合）')
+    concat_common_parser.add_argument('--dtypes', type=str,             help='カラムの型のスキーマファイル（JSON: {"カラム名": "型名"}）。指定したカラムは型の推定を行わない')
+    concat_common_parser.add_argument('--jobs', type=int, default=0,    help='ファイルを並列に読み込むスレッド数。0の場合はCPU数')
+    concat_common_parser.add_argument('--compression-level', type=int, help='出力の圧縮レベル（.csv.gz / .csv.zst / .parquet / .feather）。未指定の場合は形式ごとの既定値')
+    concat_common_parser.add_argument('--parser', choices=CSV_PARSERS, default='auto',
+                                      help='CSVパーサー（auto: pyarrow がインストールされていれば pyarrow。ブロック単位の読み込みは pyarrow.csv.open_csv で、型の合わない値があれば c に切り替え）')
     
 
     # Index方向ファイル結合コマンド
     concat_operation_subparsers.add_parser('by-index', parents=[concat_common_parser], help="Concatenate CSV files")
+
+    # Row方向ファイル結合コマンド（同じカラムのCSVファイルを縦に連結する）
+    concat_operation_subparsers.add_parser('by-row', parents=[concat_common_parser], help="Stack CSV files with the same columns")
+
+    # キーによるファイル結合コマンド（pandas.merge 相当）
+    concat_by_key_parser = concat_operation_subparsers.add_parser('by-key', parents=[concat_common_parser], help="Join CSV files on key columns")
+    concat_by_key_parser.add_argument('--on', nargs='+', required=True,                         help='キーのカラム（1つ以上）')
+    concat_by_key_parser.add_argument('--how', choices=JOIN_TYPES, default='inner',             help='結合の種類')
+    concat_by_key_parser.add_argument('--engine', choices=JOIN_ENGINES, default='hash',         help='結合エンジン（hash: 小さい方のファイルをメモリに読み込む / merge: 一時ファイルを使う外部ソート）')
+    concat_by_key_parser.add_argument('--run-size', type=int, default=RUN_SIZE,                 help='merge エンジンで1回にソートする行数')
+    concat_by_key_parser.add_argument('--temp-dir', type=str,                                   help='merge エンジンの一時ファイルのディレクトリ')
     
     
     args = parser.parse_args()
@@ -38,11 +58,24 @@ def main():
         # 結合戦略と実行者を初期化
         if args.generate_type == 'by-index':
             strategy = ConcatByIndexStrategy()
+        elif args.generate_type == 'by-row':
+            strategy = ConcatByRowStrategy()
+        elif args.generate_type == 'by-key':
+            strategy = ConcatByKeyStrategy(args.on, how=args.how, engine=args.engine,
+                                           run_size=args.run_size, temp_dir=args.temp_dir)
+        else:
+            concat_operation_generate.print_help()
+            return
         
         executor = CSVConcatExecutor(strategy, 
                                     output_path = args.output, 
                                     columns     = args.columns, 
-                                    index_name  = args.index_name)  
+                                    index_name  = args.index_name,
+                                    chunksize   = args.chunksize or None,
+                                    dtypes      = load_dtypes(args.dtypes) if args.dtypes else None,
+                                    jobs        = args.jobs,
+                                    parser      = args.parser,
+                                    compression_level = args.compression_level)  
     else:
         parser.print_help()
         return
@@ -1,10 +1,27 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
 import pandas as pd
 
 class ConcatStrategy(ABC):
+    # 行位置がそろったブロック単位で concat を呼び出せるかどうか
+    # （True の場合、CSVConcatExecutor は全ファイルを読み込まずにブロックごとに結合・出力する）
+    streamable: bool = False
+
+    # ファイル順に行を連結する戦略かどうか
+    # （True の場合、CSVConcatExecutor はファイルごとに順次読み込み・出力する）
+    sequential: bool = False
+
+    # CSVファイルを直接読み込んで結合する戦略かどうか（True の場合は concat_files を実装する）
+    file_based: bool = False
+
     @abstractmethod
     def concat(self, dfs: List[pd.DataFrame]) -> pd.DataFrame:
         """複数のDataFrameを結合する戦略"""
         pass
+
+    def concat_files(self, file_paths: List[str], output_path: str,
+                     columns: Optional[List[str]] = None, index_name: Optional[str] = None,
+                     compression_level: Optional[int] = None) -> None:
+        """CSVファイルを直接結合し、出力ファイルに書き込む（file_based な戦略のみ）"""
+        raise NotImplementedError(f"{type(self).__name__} does not support concat_files.")
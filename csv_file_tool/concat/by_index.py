@@ -2,13 +2,37 @@ import pandas as pd
 from typing import List
 from csv_file_tool.concat.base import ConcatStrategy
 
+# 欠損値を保持できる型（整数・真偽値の列は、行数の違いで NaN を補うと float / object になるため）
+NULLABLE_DTYPES = {
+    'int8': 'Int8', 'int16': 'Int16', 'int32': 'Int32', 'int64': 'Int64',
+    'uint8': 'UInt8', 'uint16': 'UInt16', 'uint32': 'UInt32', 'uint64': 'UInt64',
+    'bool': 'boolean',
+}
+
+
+def to_nullable(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    整数・真偽値の列を、欠損値を保持できる型（Int64 など）に変換する。
+    """
+    casts = {column: NULLABLE_DTYPES[dtype.name] for column, dtype in df.dtypes.items() if dtype.name in NULLABLE_DTYPES}
+    return df.astype(casts) if casts else df
+
+
 class ConcatByIndexStrategy(ConcatStrategy):
     """
     DataFrameをインデックスに基づいて横方向（列方向）に結合する戦略。
     同じインデックスに対して列を追加する形で統合。
+
+    行数が異なるファイルは、短いファイルの列を欠損値で補う。整数・真偽値の列は Int64 などの型に変換してから
+    結合するため、補った行の有無で列の型（出力の 6 / 6.0）が変わらない。
+    各ファイルの同じ行範囲のブロック単位で結合する場合（CSVConcatExecutor の chunksize）も、
+    ファイル全体を結合した場合と同じ出力になる。空欄を含む整数の列はパーサーが float と推定するが、
+    CSV の出力では小数の列の整数値を整数として書き込むため（table_io.TableWriter）、
+    ブロックの区切り位置に依らず 5 と出力される（以前はファイル全体を読み込むと 5.0 と出力されていた）。
     """
+    streamable = True
 
     def concat(self, dfs: List[pd.DataFrame]) -> pd.DataFrame:
-        df = pd.concat(dfs, axis=1)
+        df = pd.concat([to_nullable(df) for df in dfs], axis=1)
         df.dropna(how='all', inplace=True)  # 全ての値がNaNの行を削除
         return df
\ No newline at end of file
@@ -0,0 +1,351 @@
+import csv
+import heapq
+import os
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import ExitStack
+from functools import reduce
+from itertools import groupby
+from typing import Callable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from csv_file_tool.concat.base import ConcatStrategy
+from csv_file_tool.concat.table_io import TEXT_FORMATS, atomic_output, detect_format, detect_input_format, open_text
+
+# 結合の種類
+JOIN_TYPES = ('inner', 'left', 'outer')
+
+# 結合エンジン
+JOIN_ENGINES = ('hash', 'merge')
+
+# merge エンジンで1回にソートする行数（超えた分はソート済みの一時ファイルに書き出す）
+RUN_SIZE = 1_000_000
+
+# 1回にマージするソート済み一時ファイル数の上限（超える場合は段階的にマージする）
+MERGE_FAN_IN = 64
+
+# キー以外で同じ名前のカラムに付ける接尾辞（pandas.merge と同じ）
+SUFFIXES = ('_x', '_y')
+
+
+class _CSVTable:
+    """
+    結合の入力となるCSVファイル（ヘッダーと、指定カラムに絞った行）。
+    """
+    def __init__(self, path: str, on: List[str], columns: Optional[List[str]] = None):
+        if detect_input_format(path) not in TEXT_FORMATS:
+            raise ValueError(f"by-key は CSV 形式（{', '.join(TEXT_FORMATS)}）のファイルのみ結合できます: {path}")
+        self.path = path
+        with open_text(path) as f:
+            names = next(csv.reader(f), [])
+
+        missing = [name for name in on if name not in names]
+        if missing:
+            raise ValueError(f"ファイル '{path}' にキーのカラム {missing} が存在しません。")
+
+        # キーと指定カラムのみを残す（columns が None の場合は全カラム）
+        keep = [i for i, name in enumerate(names) if columns is None or name in on or name in columns]
+        self.header    = [names[i] for i in keep]
+        self.key_index = [self.header.index(name) for name in on]
+        self._width    = len(names)
+        self._keep     = None if len(keep) == len(names) else keep
+
+    def key(self, row: List[str]) -> Tuple[str, ...]:
+        return tuple(row[i] for i in self.key_index)
+
+    def rows(self) -> Iterator[List[str]]:
+        """
+        ヘッダー以降の行を順に返す（空行は読み飛ばし、列が足りない行は空文字で補う）。
+        """
+        with open_text(self.path) as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            for row in reader:
+                if not row:
+                    continue
+                if len(row) < self._width:
+                    row += [''] * (self._width - len(row))
+                yield row if self._keep is None else [row[i] for i in self._keep]
+
+
+class _JoinLayout:
+    """
+    結合結果のカラム構成（左のカラム + 右のキー以外のカラム）と、行の組み立て。
+    """
+    def __init__(self, left: _CSVTable, right: _CSVTable):
+        self.left_width     = len(left.header)
+        self.left_key_index = left.key_index
+        self.right_key_index = right.key_index
+        self.right_rest     = [i for i in range(len(right.header)) if i not in right.key_index]
+
+        left_names  = {name for i, name in enumerate(left.header) if i not in left.key_index}
+        right_names = {right.header[i] for i in self.right_rest}
+        overlap = left_names & right_names
+        self.header = (
+            [name + SUFFIXES[0] if name in overlap else name for name in left.header] +
+            [right.header[i] + SUFFIXES[1] if right.header[i] in overlap else right.header[i] for i in self.right_rest]
+        )
+
+    def both(self, left_row: List[str], right_row: List[str]) -> List[str]:
+        return left_row + [right_row[i] for i in self.right_rest]
+
+    def left_only(self, left_row: List[str]) -> List[str]:
+        return left_row + [''] * len(self.right_rest)
+
+    def right_only(self, right_row: List[str]) -> List[str]:
+        row = [''] * self.left_width
+        for left_i, right_i in zip(self.left_key_index, self.right_key_index):
+            row[left_i] = right_row[right_i]
+        return row + [right_row[i] for i in self.right_rest]
+
+
+class ConcatByKeyStrategy(ConcatStrategy):
+    """
+    DataFrameをキーのカラムの値で結合する戦略（pandas.merge 相当）。
+    3ファイル以上の場合は、先頭から順に2ファイルずつ結合する。
+
+    CSVConcatExecutor からは file_based な戦略として扱われ、CSVファイルを直接読み込んで結合する。
+    - hash : 小さい方のファイルの行をキーごとのハッシュ表に読み込み、もう一方のファイルを1行ずつ照合する
+             （メモリ使用量は小さい方のファイル程度）
+    - merge: 両方のファイルを RUN_SIZE 行ずつソートして一時ファイルに書き出し、キー順にマージしながら照合する
+             （メモリ使用量は RUN_SIZE 行程度で、メモリより大きいファイルも結合できる）
+
+    キーは文字列として比較する。行の順序は、merge エンジンはキー順、hash エンジンは照合する側のファイル順
+    （一致しなかった行は最後）で、pandas.merge と同じ順序にはならない。
+    """
+    file_based = True
+
+    def __init__(self, on: List[str], how: str = 'inner', engine: str = 'hash',
+                 run_size: int = RUN_SIZE, temp_dir: Optional[str] = None):
+        """
+        Args:
+            on (List[str]): キーのカラム（1つ以上）
+            how (str, optional): 結合の種類（inner / left / outer）. Defaults to 'inner'.
+            engine (str, optional): 結合エンジン（hash / merge）. Defaults to 'hash'.
+            run_size (int, optional): merge エンジンで1回にソートする行数. Defaults to RUN_SIZE.
+            temp_dir (Optional[str], optional): 一時ファイルのディレクトリ。None の場合はシステムの既定. Defaults to None.
+
+        Raises:
+            ValueError: 引数が範囲外の場合
+        """
+        if not on:
+            raise ValueError("on must contain at least one key column.")
+        if how not in JOIN_TYPES:
+            raise ValueError(f"how は {JOIN_TYPES} のいずれかである必要があります。指定値: {how}")
+        if engine not in JOIN_ENGINES:
+            raise ValueError(f"engine は {JOIN_ENGINES} のいずれかである必要があります。指定値: {engine}")
+        if run_size <= 0:
+            raise ValueError(f"run_size は1以上である必要があります。指定値: {run_size}")
+
+        self.on       = list(on)
+        self.how      = how
+        self.engine   = engine
+        self.run_size = run_size
+        self.temp_dir = temp_dir
+
+    def concat(self, dfs: List[pd.DataFrame]) -> pd.DataFrame:
+        return reduce(lambda left, right: pd.merge(left, right, on=self.on, how=self.how, suffixes=SUFFIXES), dfs)
+
+    def concat_files(self, file_paths: List[str], output_path: str,
+                     columns: Optional[List[str]] = None, index_name: Optional[str] = None,
+                     compression_level: Optional[int] = None) -> None:
+        """
+        CSVファイルをキーで結合し、結果を出力ファイルに書き込む。
+        入出力は .csv / .csv.gz / .csv.zst に対応する。
+
+        Args:
+            file_paths (List[str]): 結合するCSVファイルのパスのリスト。
+            output_path (str): 出力ファイルのパス。
+            columns (Optional[List[str]], optional): 各ファイルから選択するカラム（キーは常に含む）. Defaults to None.
+            index_name (Optional[str], optional): 行番号のカラム名。None の場合は出力しない. Defaults to None.
+            compression_level (Optional[int], optional): 出力の圧縮レベル. Defaults to None.
+
+        Raises:
+            ValueError: キーのカラムが存在しないファイルがある場合、またはCSV以外の形式の場合。
+        """
+        if detect_format(output_path) not in TEXT_FORMATS:
+            raise ValueError(f"by-key は CSV 形式（{', '.join(TEXT_FORMATS)}）でのみ出力できます: {output_path}")
+        start = time.perf_counter()
+        tables = [_CSVTable(path, self.on, columns) for path in file_paths]
+        join = self._hash_join if self.engine == 'hash' else self._merge_join
+
+        with tempfile.TemporaryDirectory(dir=self.temp_dir) as tmp_dir:
+            left = tables[0]
+            header, rows = left.header, left.rows()
+            for i, right in enumerate(tables[1:], 1):
+                layout = _JoinLayout(left, right)
+                header, rows = layout.header, join(left, right, layout, tmp_dir)
+                if i < len(tables) - 1:
+                    # 途中の結合結果は一時ファイルに書き出し、次のファイルとの結合の左側にする
+                    path = os.path.join(tmp_dir, f"joined_{i}.csv")
+                    self._write(path, header, rows)
+                    left = _CSVTable(path, self.on)
+            # 結合結果は入力ファイルから順次作成するため、出力ファイルは最後に置き換える
+            with atomic_output(output_path) as tmp_path:
+                count = self._write(tmp_path, header, rows, index_name, compression_level)
+
+        elapsed = time.perf_counter() - start
+        print(f"結合：{len(tables)} ファイル {count:,} 行 エンジン：{self.engine} ({self.how}) 経過時間：{elapsed:.3f} s")
+
+    @staticmethod
+    def _write(path: str, header: List[str], rows: Iterator[List[str]], index_name: Optional[str] = None,
+               compression_level: Optional[int] = None) -> int:
+        """
+        ヘッダーと行をCSVファイルに書き込み、行数を返す。
+        """
+        count = 0
+        with open_text(path, 'w', compression_level) as out:
+            writer = csv.writer(out)
+            if index_name:
+                writer.writerow([index_name] + header)
+                for count, row in enumerate(rows, 1):
+                    writer.writerow([count - 1] + row)
+            else:
+                writer.writerow(header)
+                for count, row in enumerate(rows, 1):
+                    writer.writerow(row)
+        return count
+
+    # ------------------------------------------------------------------
+    # hash エンジン
+    # ------------------------------------------------------------------
+    def _hash_join(self, left: _CSVTable, right: _CSVTable, layout: _JoinLayout, tmp_dir: str) -> Iterator[List[str]]:
+        """
+        小さい方のファイルからハッシュ表を作成し、もう一方のファイルを1行ずつ照合する。
+        """
+        how = self.how
+        matched = set()
+        if os.path.getsize(right.path) <= os.path.getsize(left.path):
+            table = defaultdict(list)
+            for row in right.rows():
+                table[right.key(row)].append(row)
+
+            for row in left.rows():
+                key = left.key(row)
+                matches = table.get(key)
+                if matches:
+                    matched.add(key)
+                    for right_row in matches:
+                        yield layout.both(row, right_row)
+                elif how != 'inner':
+                    yield layout.left_only(row)
+
+            if how == 'outer':
+                for key, right_rows in table.items():
+                    if key not in matched:
+                        for right_row in right_rows:
+                            yield layout.right_only(right_row)
+        else:
+            table = defaultdict(list)
+            for row in left.rows():
+                table[left.key(row)].append(row)
+
+            for row in right.rows():
+                key = right.key(row)
+                matches = table.get(key)
+                if matches:
+                    matched.add(key)
+                    for left_row in matches:
+                        yield layout.both(left_row, row)
+                elif how == 'outer':
+                    yield layout.right_only(row)
+
+            if how != 'inner':
+                for key, left_rows in table.items():
+                    if key not in matched:
+                        for left_row in left_rows:
+                            yield layout.left_only(left_row)
+
+    # ------------------------------------------------------------------
+    # merge エンジン
+    # ------------------------------------------------------------------
+    def _merge_join(self, left: _CSVTable, right: _CSVTable, layout: _JoinLayout, tmp_dir: str) -> Iterator[List[str]]:
+        """
+        両方のファイルをキー順に並べ、同じキーの行のグループ単位で照合する。
+        """
+        how = self.how
+
+        def groups(table: _CSVTable) -> Iterator[Tuple[Tuple[str, ...], List[List[str]]]]:
+            for key, group in groupby(self._sorted_rows(table, tmp_dir), key=table.key):
+                yield key, list(group)
+
+        left_groups, right_groups = groups(left), groups(right)
+        l, r = next(left_groups, None), next(right_groups, None)
+        while l is not None or r is not None:
+            if r is None or (l is not None and l[0] < r[0]):
+                if how == 'inner' and r is None:
+                    break
+                if how != 'inner':
+                    for left_row in l[1]:
+                        yield layout.left_only(left_row)
+                l = next(left_groups, None)
+            elif l is None or r[0] < l[0]:
+                if how != 'outer' and l is None:
+                    break
+                if how == 'outer':
+                    for right_row in r[1]:
+                        yield layout.right_only(right_row)
+                r = next(right_groups, None)
+            else:
+                for left_row in l[1]:
+                    for right_row in r[1]:
+                        yield layout.both(left_row, right_row)
+                l, r = next(left_groups, None), next(right_groups, None)
+
+    def _sorted_rows(self, table: _CSVTable, tmp_dir: str) -> Iterator[List[str]]:
+        """
+        ファイルの行をキー順に返す（同じキーの行はファイル順）。
+        run_size 行を超える場合は、ソート済みの一時ファイルに分けて書き出してからマージする。
+        """
+        runs = []
+        buffer = []
+        for row in table.rows():
+            buffer.append(row)
+            if len(buffer) >= self.run_size:
+                runs.append(self._spill(buffer, table.key, tmp_dir))
+                buffer = []
+
+        if not runs:
+            buffer.sort(key=table.key)
+            yield from buffer
+            return
+        if buffer:
+            runs.append(self._spill(buffer, table.key, tmp_dir))
+        del buffer
+
+        # 一度に開くファイル数を MERGE_FAN_IN 以下にする
+        while len(runs) > MERGE_FAN_IN:
+            merged = []
+            for i in range(0, len(runs), MERGE_FAN_IN):
+                group = runs[i:i + MERGE_FAN_IN]
+                with ExitStack() as stack:
+                    merged.append(self._write_run(self._merge_runs(group, table.key, stack), tmp_dir))
+                for path in group:
+                    os.remove(path)
+            runs = merged
+
+        with ExitStack() as stack:
+            yield from self._merge_runs(runs, table.key, stack)
+        for path in runs:
+            os.remove(path)
+
+    def _spill(self, rows: List[List[str]], key: Callable, tmp_dir: str) -> str:
+        """
+        行をソートして一時ファイルに書き出し、そのパスを返す。
+        """
+        rows.sort(key=key)
+        return self._write_run(rows, tmp_dir)
+
+    @staticmethod
+    def _write_run(rows, tmp_dir: str) -> str:
+        fd, path = tempfile.mkstemp(suffix='.csv', dir=tmp_dir)
+        with open(fd, 'w', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows(rows)
+        return path
+
+    @staticmethod
+    def _merge_runs(paths: List[str], key: Callable, stack: ExitStack) -> Iterator[List[str]]:
+        readers = [csv.reader(stack.enter_context(open(path, newline='', encoding='utf-8'))) for path in paths]
+        return heapq.merge(*readers, key=key)
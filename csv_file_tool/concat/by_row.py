@@ -0,0 +1,141 @@
+import csv
+import io
+import os
+import time
+import pandas as pd
+from typing import BinaryIO, Callable, List, Optional
+
+from binary_file_tool.file_operation.copy_engine import RangeCopier, format_throughput
+from csv_file_tool.concat.base import ConcatStrategy
+from csv_file_tool.concat.table_io import atomic_output
+
+# UTF-8 の BOM（出力は BOM なしの UTF-8 にそろえる）
+_BOM = b'\xef\xbb\xbf'
+
+
+def read_header(f: BinaryIO) -> bytes:
+    """
+    ファイルの先頭からヘッダー行を読み込む（改行を含む）。
+    引用符で囲まれた列名に改行が含まれる場合は、引用符が閉じるまでの行をまとめて返す。
+
+    Args:
+        f (BinaryIO): 'rb' で開いたCSVファイル（ファイル位置は先頭であること）
+
+    Returns:
+        bytes: ヘッダー行。空のファイルの場合は b''
+    """
+    header = f.readline()
+    while header.count(b'"') % 2 and (line := f.readline()):
+        header += line
+    return header
+
+
+def parse_header(header: bytes) -> List[str]:
+    """
+    ヘッダー行をカラム名のリストに変換する。
+    """
+    return next(csv.reader(io.StringIO(header.decode('utf-8-sig'))), [])
+
+
+class ConcatByRowStrategy(ConcatStrategy):
+    """
+    DataFrameを縦方向（行方向）に結合する戦略。
+    同じカラムを持つCSVファイルの行を、ファイル順に連結する。
+
+    CSVConcatExecutor からは sequential な戦略として扱われ、全ファイルを読み込まずに処理する。
+    - カラムの選択・インデックス列の追加がない場合は、各ファイルのヘッダー行を除いた本文を
+      そのままコピーする（copy_file_range / sendfile。使えない場合は read/write ループ）
+    - それ以外の場合は、ファイルごとに chunksize 行ずつ読み込んで順次出力する
+    """
+    sequential = True
+
+    def concat(self, dfs: List[pd.DataFrame]) -> pd.DataFrame:
+        return pd.concat(dfs, axis=0, ignore_index=True)
+
+    def check_headers(self, file_paths: List[str], columns: Optional[List[str]] = None,
+                      read_names: Optional[Callable[[str], List[str]]] = None) -> List[str]:
+        """
+        全ファイルのヘッダー行を1回ずつ読み込み、結合できるかを確認する。
+
+        Args:
+            file_paths (List[str]): 結合するCSVファイルのパスのリスト。
+            columns (Optional[List[str]], optional): 選択するカラム。None の場合は全カラム. Defaults to None.
+            read_names (Optional[Callable[[str], List[str]]], optional): ファイルのカラム名を返す関数。
+                None の場合はCSVのヘッダー行を直接読み込む（圧縮・列指向の形式では指定する）. Defaults to None.
+
+        Raises:
+            ValueError: ヘッダーがないファイルがある場合、カラムが先頭のファイルと一致しない場合、
+                        または指定したカラムが存在しない場合。
+
+        Returns:
+            List[str]: 出力するカラム（先頭のファイルの順序）。
+        """
+        first = None
+        for path in file_paths:
+            if read_names is not None:
+                names = read_names(path)
+            else:
+                with open(path, 'rb') as f:
+                    names = parse_header(read_header(f))
+            if not names:
+                raise ValueError(f"ファイル '{path}' にヘッダー行がありません。")
+
+            if columns:
+                missing = [name for name in columns if name not in names]
+                if missing:
+                    raise ValueError(f"ファイル '{path}' に指定されたカラム {missing} が存在しません。")
+            elif first is not None and names != first:
+                raise ValueError(f"ファイル '{path}' のカラムが '{file_paths[0]}' と一致しません。"
+                                 f"期待値: {first} 実際: {names}")
+            if first is None:
+                first = names
+
+        if columns:
+            return [name for name in first if name in columns]
+        return first
+
+    def copy_bodies(self, file_paths: List[str], output_path: str) -> int:
+        """
+        先頭のファイルのヘッダー行と、全ファイルの本文（ヘッダー行以降）を出力ファイルにコピーする。
+        パースを行わないため、入力ファイルは同じ文字コードであること（check_headers で確認済みであること）。
+        一時ファイルに書き込んでから置き換えるため、出力ファイルが入力ファイルの1つであってもよい。
+
+        Args:
+            file_paths (List[str]): 結合するCSVファイルのパスのリスト。
+            output_path (str): 出力ファイルのパス。
+
+        Returns:
+            int: 出力したバイト数。
+        """
+        copier = RangeCopier(engine='auto')
+        start = time.perf_counter()
+        written = 0
+        with atomic_output(output_path) as tmp_path, open(tmp_path, 'wb') as dst:
+            newline = b'\n'
+            for index, path in enumerate(file_paths):
+                with open(path, 'rb') as src:
+                    header = read_header(src)
+                    if index == 0:
+                        header = header[len(_BOM):] if header.startswith(_BOM) else header
+                        newline = b'\r\n' if header.endswith(b'\r\n') else b'\n'
+                        if not header.endswith(b'\n'):
+                            header += newline
+                        dst.write(header)
+                        written += len(header)
+
+                    offset = src.tell()
+                    size = os.fstat(src.fileno()).st_size - offset
+                    if size <= 0:
+                        continue
+                    written += copier.copy(src, dst, offset, size)
+
+                    # 末尾に改行がないファイルの後に、次のファイルの行が続かないようにする
+                    src.seek(-1, os.SEEK_END)
+                    if src.read(1) != b'\n':
+                        dst.write(newline)
+                        written += len(newline)
+
+        elapsed = time.perf_counter() - start
+        print(f"結合：{len(file_paths)} ファイル 処理速度：{format_throughput(written, elapsed)} "
+              f"エンジン：{', '.join(copier.used_engines) or '-'}")
+        return written
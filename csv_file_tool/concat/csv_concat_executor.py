@@ -1,32 +1,118 @@
-from typing import List
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import Iterator, List
 from typing import Optional
 import pandas as pd
 from pathlib import Path
 
-from csv_file_tool.concat.by_index import ConcatByIndexStrategy
+from csv_file_tool.concat.by_index import ConcatByIndexStrategy, NULLABLE_DTYPES
 from csv_file_tool.concat.base import ConcatStrategy
+from csv_file_tool.concat.table_io import (TableWriter, atomic_output, detect_format, detect_input_format,
+                                           open_blocks, read_table, require_dependencies)
+
+# ストリーミング結合で1ファイルから1回に読み込む行数の初期値
+DEFAULT_CHUNKSIZE = 100_000
+
+# CSVパーサー（auto: pyarrow がインストールされていれば pyarrow、なければ c）
+# pyarrow のブロック単位の読み込みは pyarrow.csv.open_csv で行い、先頭のブロックで決まった型に合わない値があれば
+# c に切り替える（table_io.open_blocks）
+CSV_PARSERS = ('auto', 'c', 'pyarrow')
+
+
+def _has_pyarrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def load_dtypes(path: str) -> dict[str, str]:
+    """
+    カラムの型のスキーマファイル（JSON）を読み込む。
+    pd.read_csv の dtype にそのまま渡すため、型の推定が省略される。
+
+    例）{"Name": "string", "Group": "category", "Point": "int64"}
+
+    Args:
+        path (str): スキーマファイルのパス。
+
+    Raises:
+        ValueError: カラム名から型名（文字列）へのオブジェクトでない場合。
+
+    Returns:
+        dict[str, str]: カラム名 → 型名
+    """
+    with open(path, encoding='utf-8') as f:
+        dtypes = json.load(f)
+    if not isinstance(dtypes, dict) or not all(isinstance(k, str) and isinstance(v, str) for k, v in dtypes.items()):
+        raise ValueError(f"dtypes file must be a JSON object of column name to dtype name: {path}")
+    return dtypes
+
 
 class CSVConcatExecutor:
     def __init__(self, strategy: ConcatStrategy, 
                  output_path: str, 
                  columns: Optional[list[str]] = None,
-                 index_name: Optional[str] = None):
+                 index_name: Optional[str] = None,
+                 chunksize: Optional[int] = DEFAULT_CHUNKSIZE,
+                 dtypes: Optional[dict[str, str]] = None,
+                 jobs: int = 0,
+                 parser: str = 'auto',
+                 compression_level: Optional[int] = None):
         
         self.strategy       = strategy
         self.output_path    = output_path
         self.columns        = columns
         self.index_name     = index_name
+        # None の場合は、戦略が streamable でも全ファイルを読み込んでから結合する
+        self.chunksize      = chunksize
+        # カラムの型（指定したカラムは型の推定を行わない）
+        self.dtypes         = dtypes
+        # ファイルを並列に読み込むスレッド数（0 の場合は CPU 数）
+        self.jobs           = jobs or os.cpu_count() or 1
+        # 出力の圧縮レベル（.csv.gz / .csv.zst / .parquet / .feather。None の場合は既定値）
+        self.compression_level = compression_level
+        if self.chunksize is not None and self.chunksize <= 0:
+            raise ValueError(f"chunksize must be a positive integer. got: {self.chunksize}")
+        if self.jobs < 0:
+            raise ValueError(f"jobs must be a non-negative integer. got: {jobs}")
+        if parser not in CSV_PARSERS:
+            raise ValueError(f"parser must be one of {CSV_PARSERS}. got: {parser}")
+        if parser == 'pyarrow' and not _has_pyarrow():
+            raise ImportError("parser 'pyarrow' には pyarrow が必要です（pip install pyarrow）")
+        self.engine         = 'pyarrow' if parser == 'pyarrow' or (parser == 'auto' and _has_pyarrow()) else 'c'
         if self.columns:
             if not isinstance(self.columns, list):
                 raise ValueError("columns must be a list of column names to select from each CSV file.")
-        if not self.output_path.endswith('.csv'):
-            raise ValueError("output_path must end with '.csv' to save the concatenated result as a CSV file.")
+        # 出力形式は拡張子で判定する（.csv / .csv.gz / .csv.zst / .parquet / .feather）
+        self.output_format  = detect_format(self.output_path)
+        require_dependencies(self.output_format)
 
     def run(self, file_paths: List[str]) -> Optional[List[str]]:
         try:
             if not file_paths:
                 raise ValueError("ファイルパスのリストが空です。少なくとも1つのCSVファイルを指定してください。")
             
+            # 行位置で結合できる戦略は、ブロックごとに読み込み・結合・出力する
+            if self.strategy.streamable and self.chunksize:
+                return self._run_streaming(file_paths)
+
+            # CSVファイルを直接結合する戦略は、読み込み・出力も戦略に任せる
+            if self.strategy.file_based:
+                paths = [path for path in file_paths if isinstance(path, str)]
+                if not paths:
+                    raise ValueError("No valid DataFrames to concatenate.")
+                Path(self.output_path).parent.mkdir(parents=True, exist_ok=True)
+                self.strategy.concat_files(paths, self.output_path, self.columns, self.index_name,
+                                           compression_level=self.compression_level)
+                return [str(self.output_path)]
+
+            # ファイル順に行を連結する戦略は、ファイルごとに順次出力する
+            if self.strategy.sequential:
+                return self._run_sequential(file_paths)
 
             # ファイルパスからDataFrameを読み込む
             dfs = self._load_csv_files(file_paths)
@@ -41,15 +127,14 @@ class CSVConcatExecutor:
             # インデックスをリセットしてNo.列を追加
             # インデックス名が指定されている場合はその名前に変更
             # インデックス名が指定されていない場合はindexは無し
-            if self.index_name:
-                result_df.reset_index(drop=False, inplace=True)
-                result_df.rename(columns={'index': self.index_name}, inplace=True)
+            result_df = self._finalize(result_df)
 
 
             # 結果をCSVファイルに保存
             output_dir = Path(self.output_path).parent
             output_dir.mkdir(parents=True, exist_ok=True)
-            result_df.to_csv(self.output_path, index=False, encoding='utf-8')
+            with atomic_output(self.output_path) as tmp_path, TableWriter(tmp_path, self.compression_level) as writer:
+                writer.write(result_df)
             
             return [str(self.output_path)]  
             
@@ -57,6 +142,189 @@ class CSVConcatExecutor:
             print(f"An error occurred during concatenation: {e}")
             return None
 
+    def _finalize(self, result_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        結合結果にインデックス列を追加する（index_name が指定されている場合）。
+        """
+        if self.index_name:
+            result_df.reset_index(drop=False, inplace=True)
+            result_df.rename(columns={'index': self.index_name}, inplace=True)
+        return result_df
+
+    def _run_streaming(self, file_paths: List[str]) -> List[str]:
+        """
+        全ファイルを同時に開き、同じ行範囲のブロックを結合して順次出力する。
+        メモリ使用量は「1ブロック × ファイル数」程度で、入力の総サイズには依存しない。
+
+        Args:
+            file_paths (List[str]): 読み込むCSVファイルのパスのリスト。
+
+        Returns:
+            List[str]: 出力ファイルのパス。
+        """
+        output_dir = Path(self.output_path).parent
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        # 入力ファイルを読み終えるまで出力ファイルを変更しない（出力ファイルが入力に含まれる場合のため）
+        with atomic_output(self.output_path) as tmp_path, TableWriter(tmp_path, self.compression_level) as writer:
+            for blocks in self._iter_blocks(file_paths):
+                writer.write(self._finalize(self.strategy.concat(blocks)))
+
+        return [str(self.output_path)]
+
+    def _run_sequential(self, file_paths: List[str]) -> List[str]:
+        """
+        ファイル順に行を連結して出力する。ヘッダーの互換性は最初に1回だけ確認する。
+        カラムの選択・インデックス列の追加がない場合は、パースせずに本文をそのままコピーする。
+
+        Args:
+            file_paths (List[str]): 読み込むCSVファイルのパスのリスト。
+
+        Raises:
+            ValueError: ヘッダーが一致しない場合、または指定したカラムが見つからない場合。
+
+        Returns:
+            List[str]: 出力ファイルのパス。
+        """
+        paths = [path for path in file_paths if isinstance(path, str)]
+        if not paths:
+            raise ValueError("No valid DataFrames to concatenate.")
+        # 入出力がすべて非圧縮のCSVの場合のみ、ヘッダー行をそのまま読み込み、本文をコピーできる
+        plain_csv = self.output_format == 'csv' and all(detect_input_format(path) == 'csv' for path in paths)
+        read_names = None if plain_csv else (lambda path: list(self._read_table(path, nrows=0).columns))
+        columns = self.strategy.check_headers(paths, self.columns, read_names)
+
+        output_dir = Path(self.output_path).parent
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        # 型の変換が不要な場合は、パースせずに本文をコピーする
+        if plain_csv and not self.columns and not self.index_name and not self.dtypes:
+            self.strategy.copy_bodies(paths, self.output_path)
+            return [str(self.output_path)]
+
+        with atomic_output(self.output_path) as tmp_path, TableWriter(tmp_path, self.compression_level) as writer:
+            offset = 0
+            for path in paths:
+                for block in self._read_blocks(path):
+                    # 列の順序をそろえ、インデックスを全ファイルを通した行番号にする
+                    block = block[columns]
+                    block.index = pd.RangeIndex(offset, offset + len(block))
+                    offset += len(block)
+                    writer.write(self._finalize(block))
+
+            # 全ファイルがヘッダーのみの場合も、ヘッダーを出力する
+            if offset == 0:
+                writer.write(self._finalize(self._read_table(paths[0], nrows=0)[columns]))
+
+        return [str(self.output_path)]
+
+    def _read_blocks(self, path: str) -> Iterator[pd.DataFrame]:
+        """
+        CSVファイルを chunksize 行ずつ読み込む（chunksize が None の場合はファイル全体を1ブロックとする）。
+
+        Raises:
+            ValueError: CSVファイルが読み込めない場合、または指定したカラムが見つからない場合。
+        """
+        if self.chunksize is None:
+            yield self._read_table(path)
+            return
+        with self._open_blocks(path) as reader:
+            yield from reader
+
+    def _read_table(self, path: str, nrows: Optional[int] = None) -> pd.DataFrame:
+        """
+        カラムの選択（usecols）と型（dtype）をパーサーに渡してファイルを読み込む（形式は拡張子で判定）。
+        CSV は nrows を指定しない場合、self.engine のパーサーを使用する。
+
+        Raises:
+            ValueError: ファイルが読み込めない場合、または指定したカラムが見つからない場合。
+        """
+        engine = 'c' if nrows is not None else self.engine
+        try:
+            return read_table(path, usecols=self.columns, dtype=self.dtypes, engine=engine, nrows=nrows)
+        except ValueError as e:
+            raise self._read_error(path, e)
+
+    def _open_blocks(self, path: str):
+        """
+        ファイルを chunksize 行ずつ読み込むイテレータを返す（with 文で使用する）。
+
+        Raises:
+            ValueError: ファイルが読み込めない場合、または指定したカラムが見つからない場合。
+        """
+        try:
+            return open_blocks(path, self.chunksize, usecols=self.columns, dtype=self.dtypes, engine=self.engine)
+        except ValueError as e:
+            raise self._read_error(path, e)
+
+    def _read_error(self, path: str, e: ValueError) -> ValueError:
+        """
+        読み込みのエラーを、ファイル名を含むメッセージに変換する。
+        カラムの不一致の可能性に触れるのは、カラムを指定した場合のみとする。
+        """
+        if self.columns:
+            return ValueError(f"ファイル '{path}' の読み込みに失敗しました。指定されたカラム {self.columns} が存在しない可能性があります。: {e}")
+        return ValueError(f"ファイル '{path}' の読み込みに失敗しました。: {e}")
+
+    def _iter_blocks(self, file_paths: List[str]) -> Iterator[List[pd.DataFrame]]:
+        """
+        各ファイルから chunksize 行ずつ読み込み、同じ行範囲のブロックのリストを順に返す。
+        各ブロックのインデックスはファイル先頭からの行番号のため、ブロック間でそろう。
+        読み終えたファイルは、列だけの空の DataFrame をブロックとして返す（結合結果の列をそろえるため）。
+        2つ目以降のブロックは、各ファイルの最初のブロックの列の型にそろえる（_align_dtypes）。
+        全ファイルを読み終えた時点で終了する。
+
+        Args:
+            file_paths (List[str]): 読み込むCSVファイルのパスのリスト。
+
+        Raises:
+            ValueError: CSVファイルが読み込めない場合、または指定したカラムが見つからない場合。
+
+        Returns:
+            Iterator[List[pd.DataFrame]]: ファイル順のブロックのリスト。
+        """
+        paths = [path for path in file_paths if isinstance(path, str)]
+        if not paths:
+            raise ValueError("No valid DataFrames to concatenate.")
+
+        with ExitStack() as stack:
+            # ヘッダーのみを先に読み込み、カラムの検証と読み終えたファイルの列の保持に使う
+            empty_blocks = []
+            readers = []
+            for path in paths:
+                empty_blocks.append(self._read_table(path, nrows=0))
+                readers.append(stack.enter_context(self._open_blocks(path)))
+
+            # 各ファイルの次のブロックをスレッドプールで並列に読み込む
+            pool = None
+            if self.jobs > 1 and len(readers) > 1:
+                pool = stack.enter_context(ThreadPoolExecutor(max_workers=min(self.jobs, len(readers))))
+
+            active = [True] * len(readers)
+            first_dtypes = [None] * len(readers)
+            yielded = False
+            while any(active):
+                pending = [reader for reader, alive in zip(readers, active) if alive]
+                fetched = iter(pool.map(_next_block, pending) if pool else map(_next_block, pending))
+                blocks = []
+                for i in range(len(readers)):
+                    block = next(fetched) if active[i] else None
+                    if block is None:
+                        active[i] = False
+                        block = empty_blocks[i]
+                    elif first_dtypes[i] is None:
+                        first_dtypes[i] = block.dtypes
+                    else:
+                        block = _align_dtypes(block, first_dtypes[i])
+                    blocks.append(block)
+                if any(active):
+                    yielded = True
+                    yield blocks
+
+            # 全ファイルがヘッダーのみの場合も、ヘッダーを出力するために空のブロックを返す
+            if not yielded:
+                yield empty_blocks
+
     def _load_csv_files(self, file_paths: List[str]) -> List[pd.DataFrame]:
         """
         複数のCSVファイルをDataFrameとして読み込む。
@@ -74,18 +342,37 @@ class CSVConcatExecutor:
         Returns:
             List[pd.DataFrame]: 読み込まれたCSVファイルのDataFrameリスト。
         """
-        df_list = []
-        for path in file_paths:
-            if not isinstance(path, str):
-                continue
-            try:
-                # 指定されたカラムのみを読み込む
-                df = pd.read_csv(path, usecols=self.columns)
-                df_list.append(df)
-            except ValueError as e:
-                raise ValueError(f"ファイル '{path}' の読み込みに失敗しました。指定されたカラム {self.columns} が存在しない可能性があります。: {e}")
-
-        return df_list
+        paths = [path for path in file_paths if isinstance(path, str)]
+        if self.jobs == 1 or len(paths) <= 1:
+            return [self._read_table(path) for path in paths]
+
+        # パース中は GIL が解放されるため、スレッドで並列に読み込む（結果はファイル順）
+        with ThreadPoolExecutor(max_workers=min(self.jobs, len(paths))) as pool:
+            return list(pool.map(self._read_table, paths))
+
+
+def _align_dtypes(block: pd.DataFrame, dtypes: pd.Series) -> pd.DataFrame:
+    """
+    ブロックの列の型を、同じファイルの最初のブロックの型にそろえる。
+    パーサーはブロックごとに型を推定するため、後のブロックだけに空欄がある整数の列は float になる。
+    そのような列は欠損値を保持できる型（Int64 など）に変換し、出力がブロックの区切り位置に依存しないようにする。
+    変換できない列（整数の列に小数が現れた場合など）はそのままとする。
+    """
+    for column, dtype in dtypes.items():
+        if block[column].dtype == dtype:
+            continue
+        try:
+            block[column] = block[column].astype(NULLABLE_DTYPES.get(dtype.name, dtype))
+        except (TypeError, ValueError):
+            pass
+    return block
+
+
+def _next_block(reader) -> Optional[pd.DataFrame]:
+    """
+    読み込み中のファイルの次のブロックを返す（読み終えた場合は None）。
+    """
+    return next(reader, None)
 
 if __name__ == "__main__":
     # ワイルドカード指定でCSVファイル一覧取得
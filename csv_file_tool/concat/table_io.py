@@ -0,0 +1,490 @@
+"""
+table_io.py
+
+入出力ファイルの形式を拡張子で判定し、DataFrame の読み込み・書き込みを行うモジュール。
+
+対応形式:
+- .csv      : UTF-8 のCSV
+- .csv.gz   : gzip 圧縮したCSV（標準ライブラリの gzip）
+- .csv.zst  : zstd 圧縮したCSV（zstandard が必要）
+- .parquet  : Parquet（pyarrow が必要。ブロックごとに行グループとして書き込む）
+- .feather  : Feather v2 / Arrow IPC ファイル（pyarrow が必要。ブロックごとにレコードバッチとして書き込む）
+
+入力ファイルは .gz / .zst / .parquet / .feather 以外の拡張子（.txt など）を非圧縮のCSVとして読み込む。
+出力ファイルは上記の対応形式の拡張子である必要がある。
+
+Parquet / Feather の入力はテキストのパースを行わないため、同じ入力を繰り返し結合する場合に高速。
+ブロック単位の読み込みでは、Parquet / Feather も CSV と同じく chunksize 行ずつ（最後のブロックを除く）に
+そろえて返すため、複数ファイルの同じ行範囲を結合できる。
+CSV を engine='pyarrow' で読み込む場合は、ブロック単位でも pyarrow.csv.open_csv（マルチスレッドのパーサー）を使用する。
+先頭のブロックで決まった列の型に合わない値があった場合は、それ以降の行を pd.read_csv（c のパーサー）で読み込む。
+
+使用例:
+    with TableWriter("result.parquet", compression_level=3) as writer:
+        for block in blocks:
+            writer.write(block)
+"""
+import contextlib
+import gzip
+import os
+import tempfile
+from typing import Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# 対応する形式（拡張子 → 形式名。長い拡張子から判定する）
+FORMATS = {
+    '.csv.gz':  'csv.gz',
+    '.csv.zst': 'csv.zst',
+    '.csv':     'csv',
+    '.parquet': 'parquet',
+    '.feather': 'feather',
+}
+
+# 入力ファイルで形式を判定する拡張子（これ以外の拡張子の入力ファイルは、非圧縮のCSVとして読み込む）
+INPUT_FORMATS = {
+    '.gz':      'csv.gz',
+    '.zst':     'csv.zst',
+    '.parquet': 'parquet',
+    '.feather': 'feather',
+}
+
+# テキスト（CSV）の形式
+TEXT_FORMATS = ('csv', 'csv.gz', 'csv.zst')
+
+# 列指向（pyarrow）の形式
+COLUMNAR_FORMATS = ('parquet', 'feather')
+
+# 圧縮レベルを指定しない場合の値（gzip コマンド・zstd コマンドの既定値）
+DEFAULT_GZIP_LEVEL = 6
+DEFAULT_ZSTD_LEVEL = 3
+
+
+def detect_format(path: str) -> str:
+    """
+    拡張子からファイル形式を判定する。
+
+    Raises:
+        ValueError: 対応していない拡張子の場合
+    """
+    lower = str(path).lower()
+    for suffix, name in FORMATS.items():
+        if lower.endswith(suffix):
+            return name
+    raise ValueError(f"unsupported file format: {path} (supported: {', '.join(FORMATS)})")
+
+
+def detect_input_format(path: str) -> str:
+    """
+    入力ファイルの形式を拡張子で判定する。
+    .gz / .zst / .parquet / .feather 以外の拡張子（.txt / .tsv など）は、非圧縮のCSVとする。
+    """
+    lower = str(path).lower()
+    for suffix, name in INPUT_FORMATS.items():
+        if lower.endswith(suffix):
+            return name
+    return 'csv'
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("parquet / feather 形式には pyarrow が必要です（pip install pyarrow）") from e
+    return pyarrow
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(".csv.zst 形式には zstandard が必要です（pip install zstandard）") from e
+    return zstandard
+
+
+def require_dependencies(fmt: str) -> None:
+    """
+    形式の読み書きに必要なライブラリがインストールされているかを確認する。
+
+    Raises:
+        ImportError: 必要なライブラリがない場合
+    """
+    if fmt in COLUMNAR_FORMATS:
+        _import_pyarrow()
+    elif fmt == 'csv.zst':
+        _import_zstandard()
+
+
+def open_text(path: str, mode: str = 'r', compression_level: Optional[int] = None):
+    """
+    CSV（.csv / .csv.gz / .csv.zst）をテキストとして開く（読み込みの形式は detect_input_format で判定する）。
+    読み込みは BOM 付きの UTF-8 にも対応し、書き込みは BOM なしの UTF-8 とする。
+
+    Args:
+        path (str): ファイルパス
+        mode (str, optional): 'r' または 'w'. Defaults to 'r'.
+        compression_level (Optional[int], optional): 書き込み時の圧縮レベル。None の場合は既定値. Defaults to None.
+
+    Raises:
+        ValueError: CSV の形式でない場合
+
+    Returns:
+        テキストのファイルオブジェクト
+    """
+    fmt = detect_input_format(path) if mode == 'r' else detect_format(path)
+    encoding = 'utf-8-sig' if mode == 'r' else 'utf-8'
+    if fmt == 'csv':
+        return open(path, mode, newline='', encoding=encoding)
+    if fmt == 'csv.gz':
+        level = DEFAULT_GZIP_LEVEL if compression_level is None else compression_level
+        return gzip.open(path, mode + 't', compresslevel=level, newline='', encoding=encoding)
+    if fmt == 'csv.zst':
+        zstandard = _import_zstandard()
+        level = DEFAULT_ZSTD_LEVEL if compression_level is None else compression_level
+        cctx = zstandard.ZstdCompressor(level=level) if mode == 'w' else None
+        return zstandard.open(path, mode + 't', cctx=cctx, newline='', encoding=encoding)
+    raise ValueError(f"{path} is not a CSV file.")
+
+
+# ----------------------------------------------------------------------
+# 読み込み
+# ----------------------------------------------------------------------
+def _select_columns(names: List[str], usecols: Optional[List[str]], path: str) -> List[str]:
+    """
+    pd.read_csv の usecols と同じく、指定カラムをファイルの順序で返す。
+
+    Raises:
+        ValueError: 指定カラムがファイルに存在しない場合
+    """
+    if not usecols:
+        return list(names)
+    missing = [name for name in usecols if name not in names]
+    if missing:
+        raise ValueError(f"Usecols do not match columns, columns expected but not found: {missing} ({path})")
+    return [name for name in names if name in usecols]
+
+
+def _csv_header(path: str) -> List[str]:
+    """
+    CSV のカラム名（ファイルの順序）を返す。
+    """
+    return list(pd.read_csv(path, nrows=0).columns)
+
+
+def _to_pandas(table, dtype: Optional[dict]) -> pd.DataFrame:
+    df = table.to_pandas()
+    if dtype:
+        df = df.astype({name: value for name, value in dtype.items() if name in df.columns})
+    return df
+
+
+@contextlib.contextmanager
+def _open_arrow(path: str, fmt: str):
+    """
+    Parquet / Feather / CSV ファイルを開き、(スキーマ, レコードバッチを返す関数) を返す。
+    CSV の場合、スキーマは先頭のブロックから推定される（dtype を指定するカラムは文字列として読み込む）。
+    """
+    pa = _import_pyarrow()
+    if fmt in TEXT_FORMATS:
+        yield None, lambda columns, batch_size=None, dtype=None: _iter_csv_batches(path, columns, dtype)
+    elif fmt == 'parquet':
+        import pyarrow.parquet as pq
+        with open(path, 'rb') as f:
+            pf = pq.ParquetFile(f)
+            yield pf.schema_arrow, lambda columns, batch_size=None, dtype=None: pf.iter_batches(
+                batch_size=batch_size or 65536, columns=columns)
+    else:
+        with pa.memory_map(path) as source:
+            reader = pa.ipc.open_file(source)
+            yield reader.schema, lambda columns, batch_size=None, dtype=None: (
+                reader.get_batch(i).select(columns) for i in range(reader.num_record_batches))
+
+
+def _iter_csv_batches(path: str, columns: List[str], dtype: Optional[dict]):
+    """
+    pyarrow.csv.open_csv で CSV をレコードバッチ単位で読み込む（圧縮は拡張子から判定される）。
+    pyarrow は先頭のブロックで列の型を決めるため、以降のブロックに型の合わない値があると pa.ArrowInvalid になる
+    （_iter_csv_blocks で c のパーサーに切り替える）。
+    dtype（--dtypes）を指定したカラムは文字列として読み込み、pandas で変換する。
+    """
+    pa = _import_pyarrow()
+    import pyarrow.csv as pacsv
+    convert_options = pacsv.ConvertOptions(
+        include_columns=columns,
+        column_types={name: pa.string() for name in (dtype or {}) if name in columns},
+        # pd.read_csv と同じく、空欄は文字列の列でも欠損値とする
+        strings_can_be_null=True,
+    )
+    reader = pacsv.open_csv(path, convert_options=convert_options)
+    try:
+        yield from reader
+    finally:
+        reader.close()
+
+
+def read_table(path: str, usecols: Optional[List[str]] = None, dtype: Optional[dict] = None,
+               engine: str = 'c', nrows: Optional[int] = None) -> pd.DataFrame:
+    """
+    ファイル全体（nrows 指定時は先頭の nrows 行）を DataFrame として読み込む。
+
+    Args:
+        path (str): 入力ファイルのパス（形式は detect_input_format で判定）
+        usecols (Optional[List[str]], optional): 読み込むカラム. Defaults to None.
+        dtype (Optional[dict], optional): カラムの型. Defaults to None.
+        engine (str, optional): CSV のパーサー（c / pyarrow）. Defaults to 'c'.
+        nrows (Optional[int], optional): 読み込む行数. Defaults to None.
+
+    Raises:
+        ValueError: 指定カラムがファイルに存在しない場合
+
+    Returns:
+        pd.DataFrame: 読み込んだデータ
+    """
+    fmt = detect_input_format(path)
+    if fmt in TEXT_FORMATS:
+        df = pd.read_csv(path, usecols=usecols, dtype=dtype, engine=engine, nrows=nrows)
+        if engine == 'pyarrow' and usecols:
+            # pyarrow は usecols の順序で返すため、c と同じくファイルの順序にそろえる
+            df = df[_select_columns(_csv_header(path), usecols, path)]
+        return df
+
+    pa = _import_pyarrow()
+    with _open_arrow(path, fmt) as (schema, batches):
+        columns = _select_columns(schema.names, usecols, path)
+        selected = pa.schema([schema.field(name) for name in columns])
+        if nrows == 0:
+            table = selected.empty_table()
+        else:
+            table = pa.Table.from_batches(list(batches(columns)), schema=selected)
+            if nrows is not None:
+                table = table.slice(0, nrows)
+    return _to_pandas(table, dtype)
+
+
+def _rebatch(batches, chunksize: int):
+    """
+    レコードバッチを chunksize 行ずつのテーブルにまとめ直す（最後のテーブルを除く）。
+    """
+    pa = _import_pyarrow()
+    pending = []
+    rows = 0
+    for batch in batches:
+        if batch.num_rows == 0:
+            continue
+        pending.append(batch)
+        rows += batch.num_rows
+        while rows >= chunksize:
+            table = pa.Table.from_batches(pending)
+            yield table.slice(0, chunksize)
+            rest = table.slice(chunksize)
+            pending = rest.to_batches()
+            rows = rest.num_rows
+    if rows:
+        yield pa.Table.from_batches(pending)
+
+
+def _iter_arrow_blocks(path: str, fmt: str, chunksize: int, columns: List[str],
+                       dtype: Optional[dict]) -> Iterator[pd.DataFrame]:
+    offset = 0
+    with _open_arrow(path, fmt) as (_, batches):
+        for table in _rebatch(batches(columns, chunksize, dtype), chunksize):
+            df = _to_pandas(table, dtype)
+            # CSV の chunksize と同じく、インデックスはファイル先頭からの行番号にする
+            df.index = pd.RangeIndex(offset, offset + len(df))
+            offset += len(df)
+            yield df
+
+
+def _iter_csv_blocks(path: str, fmt: str, chunksize: int, columns: List[str], usecols: Optional[List[str]],
+                     dtype: Optional[dict]) -> Iterator[pd.DataFrame]:
+    """
+    CSV を pyarrow.csv.open_csv で chunksize 行ずつ読み込む。
+    型の合わない値で pa.ArrowInvalid になった場合は、ファイルを pd.read_csv の chunksize で開き直し、
+    読み込み済みの行以降を返す（c のパーサーと同じく、ブロックごとに型を推定する）。
+    """
+    pa = _import_pyarrow()
+    offset = 0
+    blocks = _iter_arrow_blocks(path, fmt, chunksize, columns, dtype)
+    try:
+        for df in blocks:
+            yield df
+            offset += len(df)
+        return
+    except pa.ArrowInvalid:
+        pass
+    finally:
+        blocks.close()
+
+    with pd.read_csv(path, usecols=usecols, dtype=dtype, chunksize=chunksize) as reader:
+        for df in reader:
+            # 返したブロックは chunksize 行ずつのため、ブロックの境界は c のパーサーとそろう
+            if df.index[0] >= offset:
+                yield df
+
+
+def open_blocks(path: str, chunksize: int, usecols: Optional[List[str]] = None, dtype: Optional[dict] = None,
+                engine: str = 'c'):
+    """
+    ファイルを chunksize 行ずつの DataFrame として読み込むイテレータを返す（with 文で使用する）。
+    各ブロックのインデックスはファイル先頭からの行番号。
+
+    Args:
+        path (str): 入力ファイルのパス（形式は detect_input_format で判定）
+        chunksize (int): 1ブロックの行数
+        usecols (Optional[List[str]], optional): 読み込むカラム. Defaults to None.
+        dtype (Optional[dict], optional): カラムの型. Defaults to None.
+        engine (str, optional): CSV のパーサー（c: pd.read_csv の chunksize / pyarrow: pyarrow.csv.open_csv。
+            型の合わない値があった場合は c に切り替える）. Defaults to 'c'.
+
+    Raises:
+        ValueError: 指定カラムがファイルに存在しない場合
+    """
+    fmt = detect_input_format(path)
+    if fmt in TEXT_FORMATS:
+        if engine != 'pyarrow':
+            return pd.read_csv(path, usecols=usecols, dtype=dtype, chunksize=chunksize)
+        columns = _select_columns(_csv_header(path), usecols, path)
+        return contextlib.closing(_iter_csv_blocks(path, fmt, chunksize, columns, usecols, dtype))
+
+    # カラムの検証は、読み込みを開始する前に行う
+    with _open_arrow(path, fmt) as (schema, _):
+        columns = _select_columns(schema.names, usecols, path)
+    return contextlib.closing(_iter_arrow_blocks(path, fmt, chunksize, columns, dtype))
+
+
+# ----------------------------------------------------------------------
+# 書き込み
+# ----------------------------------------------------------------------
+@contextlib.contextmanager
+def atomic_output(path: str) -> Iterator[str]:
+    """
+    出力ファイルと同じディレクトリの一時ファイルのパスを返し、正常に終了した場合のみ出力ファイルに置き換える。
+    出力ファイルが入力ファイルの1つである場合も、読み込みが終わるまで入力ファイルは変更されない。
+    例外が発生した場合は一時ファイルを削除し、出力ファイルは変更しない。
+
+    使用例:
+        with atomic_output("result.csv") as tmp_path:
+            with open(tmp_path, 'w') as f:
+                ...
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    # 拡張子で形式を判定できるよう、一時ファイル名の末尾は出力ファイル名とする
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.', suffix=f".{os.path.basename(path)}")
+    os.close(fd)
+    try:
+        # mkstemp は 0600 で作成するため、通常の open と同じパーミッションにする
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        yield tmp_path
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def _format_integral_floats(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    CSV に書き込む前に、小数の列の整数値（5.0 など）を整数として書き込むよう変換する。
+    パーサーは空欄を含む整数の列を float と推定するため、ブロックの区切り位置（chunksize）によって
+    同じ値が 5 / 5.0 のどちらで出力されるかが変わらないようにする。
+    整数値のみの列は Int64 に、小数を含む列は整数値のみ int に置き換えた object 型にする。
+    """
+    result = None
+    for i, dtype in enumerate(df.dtypes):
+        if dtype.kind != 'f':
+            continue
+        values = df.iloc[:, i].to_numpy(dtype='float64', na_value=np.nan)
+        with np.errstate(invalid='ignore'):
+            # 2**53 以上は float で整数を正確に表せないため、そのまま出力する
+            integral = np.isfinite(values) & (values == np.trunc(values)) & (np.abs(values) < 2 ** 53)
+        if not integral.any():
+            continue
+        if (integral | np.isnan(values)).all():
+            column = pd.array(values, dtype='Float64').astype('Int64')
+        else:
+            column = values.astype(object)
+            column[integral] = values[integral].astype(np.int64)
+        if result is None:
+            result = df.copy(deep=False)
+        result.isetitem(i, column)
+    return df if result is None else result
+
+
+class TableWriter:
+    """
+    DataFrame をブロックごとに出力ファイルへ追記するクラス（形式は拡張子で判定）。
+
+    - CSV 系: 最初のブロックのみヘッダーを書き込む。小数の列の整数値（5.0 など）は整数（5）として書き込む
+    - Parquet: ブロックごとに1つの行グループとして書き込む（zstd 圧縮）
+    - Feather: ブロックごとに1つのレコードバッチとして書き込む（zstd 圧縮）
+
+    Parquet / Feather は最初のブロックの型をファイルのスキーマとし、以降のブロックはその型に変換する。
+    """
+    def __init__(self, path: str, compression_level: Optional[int] = None):
+        """
+        Args:
+            path (str): 出力ファイルのパス
+            compression_level (Optional[int], optional): 圧縮レベル。None の場合は既定値. Defaults to None.
+
+        Raises:
+            ValueError: 対応していない拡張子の場合
+            ImportError: 形式に必要なライブラリがない場合
+        """
+        self.path              = path
+        self.format            = detect_format(path)
+        self.compression_level = compression_level
+        self.rows              = 0
+        require_dependencies(self.format)
+        self._out    = None
+        self._header = True
+        self._writer = None
+        self._schema = None
+
+    def __enter__(self) -> 'TableWriter':
+        if self.format in TEXT_FORMATS:
+            self._out = open_text(self.path, 'w', self.compression_level)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        if self._out is not None:
+            self._out.close()
+
+    def write(self, df: pd.DataFrame) -> None:
+        """
+        ブロックを出力ファイルに追記する。
+
+        Raises:
+            ValueError: Parquet / Feather で、ブロックの型を最初のブロックの型に変換できない場合
+        """
+        if self._out is not None:
+            _format_integral_floats(df).to_csv(self._out, index=False, header=self._header)
+            self._header = False
+        else:
+            self._write_arrow(df)
+        self.rows += len(df)
+
+    def _write_arrow(self, df: pd.DataFrame) -> None:
+        pa = _import_pyarrow()
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if self._writer is None:
+            self._schema = table.schema
+            self._writer = self._open_writer(table.schema)
+        elif not table.schema.equals(self._schema):
+            try:
+                table = table.cast(self._schema)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError, ValueError) as e:
+                raise ValueError(f"ブロック間でカラムの型が一致しません。--dtypes で型を指定してください: {e}") from e
+        self._writer.write_table(table)
+
+    def _open_writer(self, schema):
+        pa = _import_pyarrow()
+        if self.format == 'parquet':
+            import pyarrow.parquet as pq
+            return pq.ParquetWriter(self.path, schema, compression='zstd', compression_level=self.compression_level)
+        codec = pa.Codec('zstd', compression_level=self.compression_level)
+        return pa.ipc.new_file(self.path, schema, options=pa.ipc.IpcWriteOptions(compression=codec))
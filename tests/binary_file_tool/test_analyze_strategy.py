@@ -0,0 +1,106 @@
+import csv
+import math
+import random
+from collections import Counter
+
+import pytest
+
+from binary_file_tool.file_operation import analyze_strategy
+from binary_file_tool.file_operation.analyze_strategy import (
+    AnalyzeStrategy, block_window_stats, spark_char, window_stats)
+
+
+def _entropy(data):
+    n = len(data)
+    return -sum(c / n * math.log2(c / n) for c in Counter(data).values())
+
+
+@pytest.fixture
+def dump(tmp_path):
+    rnd = random.Random(5)
+    data = bytes(8192) + rnd.randbytes(8192) + b"\xff" * 4096 + b"ab" * 2048 + b"tail"
+    path = tmp_path / "dump.bin"
+    path.write_bytes(data)
+    return path, data
+
+
+@pytest.mark.parametrize("data", [b"\x00" * 100, b"ab" * 50, bytes(range(256)), random.Random(1).randbytes(4096)])
+def test_window_stats(data):
+    entropy, counts = window_stats(data)
+    assert entropy == pytest.approx(_entropy(data), abs=1e-9)
+    assert counts == Counter(data)
+
+
+def test_block_window_stats_match_window_stats():
+    pytest.importorskip("numpy")
+    data = bytes(100) + random.Random(2).randbytes(900) + b"ab" * 50 + b"z"
+    counts, entropy = block_window_stats(data, 100)
+    assert counts.shape == (12, 256)
+    for i in range(12):
+        expected_entropy, expected_counts = window_stats(data[i * 100:i * 100 + 100])
+        assert entropy[i] == pytest.approx(expected_entropy, abs=1e-9)
+        assert counts[i].tolist() == [expected_counts[b] for b in range(256)]
+
+
+@pytest.mark.parametrize("output_format", ["csv", "sparkline"])
+@pytest.mark.parametrize("window_size", [7, 100, 4096, 5000])
+def test_numpy_output_matches_fallback(dump, tmp_path, monkeypatch, output_format, window_size):
+    pytest.importorskip("numpy")
+    path, _ = dump
+    monkeypatch.setattr(analyze_strategy, "READ_SIZE", 8192)
+    expected = AnalyzeStrategy(window_size, output_format, window_histogram=True,
+                               output_dir=str(tmp_path / "numpy")).execute(str(path))
+    monkeypatch.setattr(analyze_strategy, "np", None)
+    actual = AnalyzeStrategy(window_size, output_format, window_histogram=True,
+                             output_dir=str(tmp_path / "counter")).execute(str(path))
+    for a, b in zip(expected, actual):
+        assert open(a, "rb").read() == open(b, "rb").read()
+
+
+def test_spark_char():
+    assert [spark_char(e) for e in (0.0, 0.5, 1.0, 1.01, 7.99, 8.0)] == [" ", "▁", "▁", "▂", "█", "█"]
+
+
+def test_analyze_csv(dump, tmp_path):
+    path, data = dump
+    window_path, histogram_path = AnalyzeStrategy(4096, window_histogram=True,
+                                                  output_dir=str(tmp_path / "out")).execute(str(path))
+    assert window_path.endswith("dump.bin.entropy.csv")
+
+    with open(window_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [int(r["offset"], 16) for r in rows] == list(range(0, len(data), 4096))
+    assert [int(r["size"]) for r in rows] == [4096] * 6 + [4]
+    for row in rows:
+        offset = int(row["offset"], 16)
+        window = data[offset:offset + 4096]
+        assert float(row["entropy"]) == pytest.approx(_entropy(window), abs=1e-4)
+        assert int(row["unique"]) == len(set(window))
+        assert [int(row[f"{b:02X}"]) for b in range(256)] == [window.count(b) for b in range(256)]
+    assert [r["top_byte"] for r in rows][:2] == ["00", "00"] and rows[4]["top_byte"] == "FF"
+
+    with open(histogram_path, newline="", encoding="utf-8") as f:
+        histogram = {int(r["byte"], 16): int(r["count"]) for r in csv.DictReader(f)}
+    assert histogram == {b: data.count(b) for b in range(256)}
+
+
+def test_analyze_sparkline(dump, tmp_path):
+    path, _ = dump
+    window_path, _ = AnalyzeStrategy(4096, output_format="sparkline").execute(str(path))
+    lines = open(window_path, encoding="utf-8").read().splitlines()
+    assert window_path.endswith("dump.bin.entropy.txt")
+    assert lines[1] == "0000000000 |  ██ ▁▂|"
+
+
+def test_analyze_empty_file(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    window_path, histogram_path = AnalyzeStrategy().execute(str(path))
+    assert open(window_path, encoding="utf-8").read().splitlines() == ["offset,size,entropy,unique,top_byte,top_count"]
+    assert len(open(histogram_path, encoding="utf-8").read().splitlines()) == 257
+
+
+@pytest.mark.parametrize("kwargs", [{"window_size": 0}, {"output_format": "json"}])
+def test_analyze_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        AnalyzeStrategy(**kwargs)
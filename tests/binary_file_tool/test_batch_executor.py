@@ -0,0 +1,61 @@
+import pytest
+
+from binary_file_tool.batch.batch_executor import BatchExecutor
+from binary_file_tool.file_operation.file_operation import FileOperation
+from binary_file_tool.file_operation.extract_strategy import ExtractStrategy
+from binary_file_tool.convert_file.convert_file import ConvertFile
+from binary_file_tool.convert_file.hextobinary_chunked_strategy import HexToBinaryChunkedStrategy
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_extract_results_in_input_order(tmp_path, jobs):
+    """結果が入力順に返り、エラーのファイルも他の処理を妨げないこと"""
+    paths = []
+    for i in range(8):
+        path = tmp_path / f"in{i}.bin"
+        # in3.bin のみ空ファイル
+        path.write_bytes(b"" if i == 3 else bytes([i]) * 16)
+        paths.append(str(path))
+
+    executor = BatchExecutor(FileOperation(ExtractStrategy(0, 4, output_dir=str(tmp_path / "out"))), jobs=jobs)
+    results = list(executor.run(paths))
+
+    assert [r.path for r in results] == paths
+    assert results[3].error is not None
+    for i, result in enumerate(results):
+        if i == 3:
+            continue
+        assert result.error is None
+        assert open(result.outputs[0], "rb").read() == bytes([i]) * 4
+
+
+def test_convert_uses_process_pool(tmp_path):
+    """CPUバウンドな戦略はプロセスプールで実行されること"""
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"hex{i}.txt"
+        path.write_text(f"0{i} ff\n")
+        paths.append(str(path))
+
+    executor = BatchExecutor(ConvertFile(HexToBinaryChunkedStrategy()), jobs=2)
+    assert executor.use_process
+    results = list(executor.run(paths))
+    assert [open(r.outputs[0], "rb").read() for r in results] == [bytes([i, 0xff]) for i in range(3)]
+
+
+def test_run_consumes_input_lazily(tmp_path):
+    """入力のジェネレータを先行投入数の分だけ読み込み、最初の結果を返すこと"""
+    consumed = []
+
+    def paths():
+        for i in range(100):
+            path = tmp_path / f"in{i}.bin"
+            path.write_bytes(bytes([i]) * 8)
+            consumed.append(i)
+            yield str(path)
+
+    executor = BatchExecutor(FileOperation(ExtractStrategy(0, 4, output_dir=str(tmp_path / "out"))), jobs=2)
+    results = executor.run(paths())
+    assert next(results).path == str(tmp_path / "in0.bin")
+    assert len(consumed) < 100
+    assert len(list(results)) == 99
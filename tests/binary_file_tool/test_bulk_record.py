@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from binary_file_tool.convert_file.bulk_record import (
+    decode_lines, format_lines, gather_columns, interleave, line_padding, record_sums, reference_decode_lines,
+    reference_format_lines, reference_gather_columns, reference_interleave, reference_record_sums)
+
+
+@pytest.mark.parametrize("stride", [1, 2, 3, 5, 8, 16, 21, 255, 300])
+def test_record_sums_matches_reference(stride):
+    records = random.Random(stride).randbytes(stride * 37)
+    assert record_sums(records, stride) == reference_record_sums(records, stride)
+    assert record_sums(b"\xff" * stride * 3, stride) == reference_record_sums(b"\xff" * stride * 3, stride)
+
+
+@pytest.mark.parametrize("widths, extra", [([1], 0), ([2, 4], 2), ([4, 4, 8], 0), ([1, 2, 16], 3), ([3, 5], 1)])
+@pytest.mark.parametrize("k", [1, 7])
+def test_interleave_and_gather_match_reference(widths, extra, k):
+    rnd = random.Random(k * 100 + extra)
+    parts = [(rnd.randbytes(k * width), width) for width in widths]
+    records, stride = interleave(parts, k, extra)
+    assert (records, stride) == reference_interleave(parts, k, extra)
+
+    start = 0
+    for data, width in parts:
+        assert gather_columns(records, stride, start, start + width) == data
+        assert reference_gather_columns(records, stride, start, start + width) == data
+        start += width
+
+
+@pytest.mark.parametrize("mark", [b":", b"S1", b"S3", b"ABC"])
+@pytest.mark.parametrize("with_padding", [False, True])
+def test_format_and_decode_lines_match_reference(mark, with_padding):
+    padding = line_padding(mark) if with_padding else 0
+    stride = 12 + padding
+    records = bytearray(random.Random(len(mark)).randbytes(9 * stride))
+    for i in range(padding):
+        records[stride - padding + i::stride] = bytes(9)
+    text = format_lines(mark, bytes(records), stride, padding)
+    assert text == reference_format_lines(mark, bytes(records), stride, padding)
+
+    for eol in (b"\n", b"\r\n"):
+        lines = [line + eol for line in text.split(b"\n")[:-1]]
+        result = decode_lines(lines, len(mark))
+        assert result == reference_decode_lines(lines, len(mark))
+        data, decoded_stride, decoded_padding = result
+        assert [data[i:i + decoded_stride - decoded_padding] for i in range(0, len(data), decoded_stride)] == [
+            bytes(records[i:i + 12]) for i in range(0, len(records), stride)]
+
+
+@pytest.mark.parametrize("lines", [
+    [b":0102\n", b":0304\r\n"],
+    [b":0102\n", b";0304\n"],
+    [b":0102\n", b":03G4\n"],
+    [b":012\n"],
+    [b":0102"],
+    [b":\n"],
+])
+def test_decode_lines_rejects_irregular_lines(lines):
+    assert decode_lines(lines, 1) is None
+    assert reference_decode_lines(lines, 1) is None
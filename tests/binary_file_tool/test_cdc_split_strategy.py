@@ -0,0 +1,75 @@
+import hashlib
+import os
+import random
+
+import pytest
+
+from binary_file_tool.file_operation.cdc_split_strategy import (
+    CDCSplitStrategy, GearChunker, WINDOW_SIZE, _GEAR, gear_hash_array, gear_hashes)
+from binary_file_tool.file_operation import cdc_split_strategy
+from binary_file_tool.file_operation.split_manifest import SplitManifest
+
+
+def test_gear_hashes_match_definition():
+    data = os.urandom(300)
+    lanes = gear_hashes(data)
+    for i in range(len(data)):
+        expected = sum(_GEAR[data[i - j]] << j for j in range(WINDOW_SIZE) if i >= j)
+        assert int.from_bytes(lanes[4 * i:4 * i + 4], "little") == expected
+
+
+def test_numpy_hashes_and_cut_points_match_fallback(monkeypatch):
+    pytest.importorskip("numpy")
+    data = random.Random(4).randbytes(2 * 1024 * 1024 + 77)
+    head = data[:100_000]
+    assert gear_hash_array(head).astype("<u4").tobytes() == gear_hashes(head)
+
+    chunker = GearChunker(512, 2048, 8192)
+    cuts = list(chunker.cut_points(data))
+    monkeypatch.setattr(cdc_split_strategy, "np", None)
+    assert list(chunker.cut_points(data)) == cuts
+
+
+def test_chunk_sizes_within_bounds():
+    data = random.Random(1).randbytes(3 * 1024 * 1024)
+    cuts = list(GearChunker(1024, 4096, 16384).cut_points(data))
+    sizes = [b - a for a, b in zip([0] + cuts, cuts)]
+    assert cuts[-1] == len(data)
+    assert all(1024 <= s <= 16384 for s in sizes[:-1])
+    assert 2048 < sum(sizes) / len(sizes) < 8192
+
+
+def test_boundaries_survive_insertion():
+    data = random.Random(2).randbytes(1024 * 1024)
+    edited = data[:300_000] + b"inserted" + data[300_000:]
+    chunker = GearChunker(1024, 4096, 16384)
+    original = {c for c in chunker.cut_points(data) if c > 320_000}
+    shifted  = {c - 8 for c in chunker.cut_points(edited) if c > 320_008}
+    assert original == shifted
+
+
+def test_split_and_rebuild_with_dedup(tmp_path):
+    data = random.Random(3).randbytes(600_000)
+    (tmp_path / "v1.bin").write_bytes(data)
+    (tmp_path / "v2.bin").write_bytes(data[:100_000] + b"\xff" * 50 + data[100_050:])
+    strategy = CDCSplitStrategy(store_dir=str(tmp_path / "store"), min_size=1024, avg_size=4096,
+                                max_size=16384, output_dir=str(tmp_path / "out"))
+
+    strategy.execute(str(tmp_path / "v1.bin"))
+    stored = len(os.listdir(tmp_path / "store"))
+    manifest_path = strategy.execute(str(tmp_path / "v2.bin"))[0]
+    # 2つ目のファイルで増えるのは変更箇所を含むチャンクのみ
+    assert len(os.listdir(tmp_path / "store")) - stored <= 2
+
+    manifest = SplitManifest.load(manifest_path)
+    rebuilt = b"".join(manifest.resolve(part).read_bytes() for part in manifest.parts)
+    assert rebuilt == (tmp_path / "v2.bin").read_bytes()
+    assert manifest.size == len(rebuilt)
+    assert manifest.digest == hashlib.sha256(rebuilt).hexdigest()
+    assert [p.offset for p in manifest.parts] == [sum(q.size for q in manifest.parts[:i]) for i in range(len(manifest.parts))]
+
+
+@pytest.mark.parametrize("sizes", [(0, 4096, 8192), (4096, 2048, 8192), (16, 32, 64)])
+def test_invalid_sizes(sizes):
+    with pytest.raises(ValueError):
+        GearChunker(*sizes)
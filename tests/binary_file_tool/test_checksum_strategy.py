@@ -0,0 +1,105 @@
+import hashlib
+import random
+import zlib
+
+import pytest
+
+from binary_file_tool.file_operation.checksum import CRC, CRC32, CRC32C, CRC32K, new_checksum
+from binary_file_tool.file_operation.checksum_strategy import ChecksumStrategy
+from binary_file_tool.file_operation.split_strategy import SplitStrategy
+
+
+def _bytewise(polynomial, data):
+    crc = 0xFFFFFFFF
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ polynomial if crc & 1 else crc >> 1
+    return crc ^ 0xFFFFFFFF
+
+
+@pytest.mark.parametrize("cls, check", [(CRC32, 0xCBF43926), (CRC32C, 0xE3069283), (CRC32K, 0x2D3DD0AE)])
+def test_crc_check_values(cls, check):
+    assert cls.calculate(b"123456789") == check
+    assert cls(b"123456789").hexdigest() == f"{check:08x}"
+
+
+@pytest.mark.parametrize("cls", [CRC32C, CRC32K])
+@pytest.mark.parametrize("size", [0, 1, 63, 64, 65, 1000, 4099])
+def test_crc_table_engine_matches_bytewise(cls, size):
+    data = random.Random(size).randbytes(size)
+    assert cls.calculate(data) == _bytewise(cls.polynomial, data)
+
+
+@pytest.mark.parametrize("cls", [CRC32C, CRC32K])
+@pytest.mark.parametrize("size", [511, 512, 513, 5000, 1024 * 1024 + 1536 + 7])
+def test_crc_numpy_engine_matches_fallback(monkeypatch, cls, size):
+    pytest.importorskip("numpy")
+    from binary_file_tool.file_operation import checksum
+
+    data = random.Random(size).randbytes(size)
+    value = cls.calculate(data)
+    monkeypatch.setattr(checksum, "np", None)
+    assert value == cls.calculate(data)
+    if size < 10_000:
+        assert value == _bytewise(cls.polynomial, data)
+
+
+def test_crc_streaming_update():
+    class TableCRC32(CRC):
+        polynomial = 0xEDB88320
+
+    data = random.Random(1).randbytes(100_003)
+    crc = TableCRC32()
+    for i in range(0, len(data), 777):
+        crc.update(memoryview(data)[i:i + 777])
+    assert crc.value == zlib.crc32(data)
+
+    copied = crc.copy()
+    copied.update(b"x")
+    assert crc.value == zlib.crc32(data)
+    assert copied.digest() == zlib.crc32(data + b"x").to_bytes(4, "big")
+
+
+def test_new_checksum():
+    assert isinstance(new_checksum("crc32k"), CRC32K)
+    assert new_checksum("sha256").name == "sha256"
+    with pytest.raises(ValueError):
+        new_checksum("md4")
+
+
+def test_checksum_whole_and_chunked(tmp_path):
+    data = random.Random(2).randbytes(2_500_000)
+    path = tmp_path / "dump.bin"
+    path.write_bytes(data)
+
+    assert ChecksumStrategy().execute(str(path)) == [f"{path},0,{len(data)},{zlib.crc32(data):08x}"]
+
+    lines = ChecksumStrategy("sha256", chunk_size=1_000_000).execute(str(path))
+    assert lines == [f"{path},{i},{len(data[i:i + 1_000_000])},{hashlib.sha256(data[i:i + 1_000_000]).hexdigest()}"
+                     for i in range(0, len(data), 1_000_000)]
+
+
+def test_checksum_empty_file(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    assert ChecksumStrategy("crc32c").execute(str(path)) == [f"{path},0,0,00000000"]
+    assert ChecksumStrategy("crc32c", chunk_size=16).execute(str(path)) == []
+
+
+def test_checksum_split_parts(tmp_path):
+    data = random.Random(3).randbytes(2500)
+    src = tmp_path / "fw.bin"
+    src.write_bytes(data)
+    outputs = SplitStrategy(1000, ignore_tail=False, output_dir=str(tmp_path / "parts"), manifest=True).execute(str(src))
+
+    rows = [line.split(",") for line in ChecksumStrategy("crc32c").execute(outputs[-1])]
+    assert [row[0] for row in rows] == outputs[:-1]
+    assert [(int(row[1]), int(row[2])) for row in rows] == [(0, 1000), (1000, 1000), (2000, 500)]
+    assert [row[3] for row in rows] == [CRC32C(data[i:i + 1000]).hexdigest() for i in range(0, 2500, 1000)]
+
+
+@pytest.mark.parametrize("kwargs", [{"algorithm": "crc16"}, {"chunk_size": 0}])
+def test_checksum_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        ChecksumStrategy(**kwargs)
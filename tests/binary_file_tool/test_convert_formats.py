@@ -0,0 +1,123 @@
+import os
+
+import pytest
+
+from binary_file_tool.convert_file.binarytohex_strategy import BinaryToHexStrategy
+from binary_file_tool.convert_file.hextobinary_fast_strategy import HexToBinaryFastStrategy
+from binary_file_tool.convert_file.intelhex_strategy import BinaryToIntelHexStrategy, IntelHexToBinaryStrategy
+from binary_file_tool.convert_file.srecord_strategy import BinaryToSRecordStrategy, SRecordToBinaryStrategy
+
+
+@pytest.fixture
+def image(tmp_path):
+    src = tmp_path / "fw.bin"
+    src.write_bytes(os.urandom(200_003))
+    return src
+
+
+@pytest.mark.parametrize("line_width, group_size", [(16, 1), (7, 4), (32, 0)])
+def test_binarytohex_roundtrip(tmp_path, image, line_width, group_size):
+    text = BinaryToHexStrategy(line_width, group_size, output_dir=str(tmp_path / "txt")).execute(str(image))[0]
+    out  = HexToBinaryFastStrategy(output_dir=str(tmp_path / "bin")).execute(text)[0]
+    assert open(out, "rb").read() == image.read_bytes()
+
+
+def test_binarytohex_format(tmp_path):
+    src = tmp_path / "a.bin"
+    src.write_bytes(bytes(range(10)))
+    out = BinaryToHexStrategy(line_width=8, group_size=4, uppercase=True).execute(str(src))[0]
+    assert open(out).read() == "00010203 04050607\n0809\n"
+
+
+@pytest.mark.parametrize("start_address", [0, 0x0800FFF3, 0x12345])
+@pytest.mark.parametrize("record_size", [16, 32, 7])
+def test_intelhex_roundtrip(tmp_path, image, start_address, record_size):
+    hex_path = BinaryToIntelHexStrategy(start_address, record_size, output_dir=str(tmp_path / "hex")).execute(str(image))[0]
+    out      = IntelHexToBinaryStrategy(output_dir=str(tmp_path / "bin")).execute(hex_path)[0]
+    assert open(out, "rb").read() == image.read_bytes()
+
+
+def test_intelhex_records(tmp_path):
+    src = tmp_path / "a.bin"
+    src.write_bytes(bytes([0x01, 0x02]))
+    out = BinaryToIntelHexStrategy(start_address=0x08000000).execute(str(src))[0]
+    assert open(out).read().splitlines() == [":020000040800F2", ":020000000102FB", ":00000001FF"]
+
+
+@pytest.mark.parametrize("record_size", [32, 7])
+def test_intelhex_short_records_only_at_boundaries(tmp_path, image, record_size):
+    # 1回の読み込み（record_size * 4096 バイト）を超えるファイルを、整列していないアドレスから変換する
+    start = 0xFFF0
+    out   = BinaryToIntelHexStrategy(start, record_size).execute(str(image))[0]
+    end   = start + image.stat().st_size
+    upper = 0
+    data  = bytearray()
+    for line in open(out).read().splitlines():
+        record = bytes.fromhex(line[1:])
+        if record[3] == 0x04:
+            upper = int.from_bytes(record[4:6], "big") << 16
+        elif record[3] == 0x00:
+            address = upper + int.from_bytes(record[1:3], "big")
+            length  = record[0]
+            assert address == start + len(data)
+            # 端数のレコードは 64KiB 境界の直前とファイルの末尾のみ
+            if length != record_size:
+                assert length < record_size
+                assert (address + length) % 0x10000 == 0 or address + length == end
+            data += record[4:-1]
+    assert bytes(data) == image.read_bytes()
+
+
+@pytest.mark.parametrize("start_address, address_size", [(0, None), (0x0800FFF3, None), (0x100, 3), (0x100, 4)])
+@pytest.mark.parametrize("record_size", [16, 5])
+def test_srecord_roundtrip(tmp_path, image, start_address, address_size, record_size):
+    srec = BinaryToSRecordStrategy(start_address, record_size, address_size,
+                                   output_dir=str(tmp_path / "srec")).execute(str(image))[0]
+    out  = SRecordToBinaryStrategy(output_dir=str(tmp_path / "bin")).execute(srec)[0]
+    assert open(out, "rb").read() == image.read_bytes()
+
+
+def test_srecord_address_overflow(tmp_path, image):
+    with pytest.raises(ValueError, match="アドレス長"):
+        BinaryToSRecordStrategy(start_address=0x100, address_size=2).execute(str(image))
+
+
+def test_srecord_records(tmp_path):
+    src = tmp_path / "a.bin"
+    src.write_bytes(bytes([0x01, 0x02]))
+    out = BinaryToSRecordStrategy(header="").execute(str(src))[0]
+    assert open(out).read().splitlines() == ["S0030000FC", "S10500000102F7", "S5030001FB", "S9030000FC"]
+
+
+def test_gap_fill(tmp_path):
+    src = tmp_path / "gap.hex"
+    # 0x10 番地と 0x14 番地のみデータあり（CRLF 改行）
+    src.write_bytes(b":01001000559A\r\n:010014006685\r\n:00000001FF\r\n")
+    out = IntelHexToBinaryStrategy(fill=0x00).execute(str(src))[0]
+    assert open(out, "rb").read() == b"\x55\x00\x00\x00\x66"
+
+
+@pytest.mark.parametrize("strategies", [
+    (BinaryToIntelHexStrategy, IntelHexToBinaryStrategy),
+    (BinaryToSRecordStrategy, SRecordToBinaryStrategy),
+])
+def test_checksum_error(tmp_path, image, strategies):
+    to_text, to_binary = strategies
+    path  = to_text(output_dir=str(tmp_path / "text")).execute(str(image))[0]
+    lines = open(path, "rb").read().splitlines(keepends=True)
+    # 中ほどの行のデータを1文字書き換える
+    line = bytearray(lines[100])
+    line[10] = ord("0") if line[10] != ord("0") else ord("1")
+    lines[100] = bytes(line)
+    open(path, "wb").write(b"".join(lines))
+
+    with pytest.raises(ValueError, match="チェックサム"):
+        to_binary(output_dir=str(tmp_path / "bin")).execute(path)
+    assert not (tmp_path / "bin" / "fw.bin").exists()
+
+
+def test_missing_eof(tmp_path):
+    src = tmp_path / "a.hex"
+    src.write_bytes(b":020000000102FB\n")
+    with pytest.raises(ValueError, match="EOF"):
+        IntelHexToBinaryStrategy().execute(str(src))
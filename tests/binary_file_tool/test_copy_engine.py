@@ -0,0 +1,22 @@
+import pytest
+
+from binary_file_tool.file_operation.copy_engine import RangeCopier
+
+
+@pytest.mark.parametrize("engine", ["auto", "buffered"])
+def test_copy_range(tmp_path, engine):
+    src = tmp_path / "src.bin"
+    src.write_bytes(bytes(range(256)) * 8)
+    with open(src, "rb") as f, open(tmp_path / "dst.bin", "wb") as out:
+        assert RangeCopier(engine).copy(f, out, 100, 1500) == 1500
+    assert (tmp_path / "dst.bin").read_bytes() == src.read_bytes()[100:1600]
+
+
+@pytest.mark.parametrize("engine", ["auto", "buffered"])
+def test_short_copy_raises(tmp_path, engine):
+    """入力ファイルが要求サイズより短い場合は、途中までのコピーを成功として返さないこと"""
+    src = tmp_path / "src.bin"
+    src.write_bytes(bytes(1000))
+    with open(src, "rb") as f, open(tmp_path / "dst.bin", "wb") as out:
+        with pytest.raises(OSError, match="900/1200"):
+            RangeCopier(engine).copy(f, out, 100, 1200)
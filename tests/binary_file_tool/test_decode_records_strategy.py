@@ -0,0 +1,150 @@
+import csv
+import struct
+
+import pytest
+
+from binary_file_tool.convert_file.decode_records_strategy import DecodeRecordsStrategy, load_layout, parse_format
+from binary_file_tool.file_error.exceptions import OffsetOutOfRangeError
+
+
+def _write_records(path, fmt, rows, header=b""):
+    path.write_bytes(header + b"".join(struct.pack(fmt, *row) for row in rows))
+    return path
+
+
+def _read_csv(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+def test_parse_format():
+    layout = parse_format(">i8si64s", names=["id", "name", "value", "payload"])
+    assert layout.record_size == 80
+    assert layout.names == ("id", "name", "value", "payload")
+    assert layout.text_columns == (1, 3)
+
+    layout = parse_format("<2H 4x c")
+    assert layout.names == ("field0", "field1", "field2")
+    assert layout.text_columns == (2,)
+
+
+@pytest.mark.parametrize("fmt, names", [(">i8sZ", None), (">4x", None), (">ii", ["a"]), (">ii", ["a", "a"]), (">iP", None)])
+def test_parse_format_error(fmt, names):
+    with pytest.raises(ValueError):
+        parse_format(fmt, names)
+
+
+@pytest.mark.parametrize("batch_records", [1, 7, 65536])
+def test_decode_csv(tmp_path, batch_records):
+    fmt  = ">i8si64s"
+    rows = [(i, b"name%d" % i, -i, (f"値{i}" * 3).encode("utf-8")) for i in range(100)]
+    src  = _write_records(tmp_path / "capture.dat", fmt, rows)
+    out  = DecodeRecordsStrategy(parse_format(fmt, ["id", "name", "value", "payload"]),
+                                 batch_records=batch_records, output_dir=str(tmp_path / "out")).execute(str(src))[0]
+
+    assert out == str(tmp_path / "out" / "capture.csv")
+    lines = _read_csv(out)
+    assert lines[0] == ["id", "name", "value", "payload"]
+    assert lines[1:] == [[str(i), f"name{i}", str(-i), f"値{i}" * 3] for i in range(100)]
+
+
+def test_decode_numeric(tmp_path):
+    fmt  = "<hQd?"
+    rows = [(-i, i << 40, i / 4, i % 2 == 0) for i in range(10)]
+    src  = _write_records(tmp_path / "num.bin", fmt, rows)
+    out  = DecodeRecordsStrategy(parse_format(fmt), batch_records=3).execute(str(src))[0]
+    assert _read_csv(out)[1:] == [[str(a), str(b), repr(c), str(d)] for a, b, c, d in rows]
+
+
+def test_decode_toml_layout(tmp_path):
+    layout_path = tmp_path / "layout.toml"
+    layout_path.write_text(
+        'byteorder = "big"\n'
+        '[[field]]\nname = "id"\ntype = "I"\n'
+        '[[field]]\ntype = "2x"\n'
+        '[[field]]\nname = "xy"\ntype = "2h"\n'
+        '[[field]]\nname = "tag"\ntype = "4s"\n',
+        encoding="utf-8")
+    layout = load_layout(str(layout_path))
+    assert layout.format == ">I2x2h4s"
+    assert layout.names == ("id", "xy_0", "xy_1", "tag")
+
+    src = _write_records(tmp_path / "a.dat", ">I2x2h4s", [(1, -2, 3, b"ab"), (4, 5, -6, b"abcd")])
+    out = DecodeRecordsStrategy(layout).execute(str(src))[0]
+    assert _read_csv(out) == [["id", "xy_0", "xy_1", "tag"], ["1", "-2", "3", "ab"], ["4", "5", "-6", "abcd"]]
+
+
+@pytest.mark.parametrize("content", [
+    'byteorder = "middle"\n[[field]]\nname = "a"\ntype = "i"\n',
+    '[[field]]\ntype = "i"\n',
+    '[[field]]\nname = "a"\n',
+    'byteorder = "big"\n',
+])
+def test_decode_toml_layout_error(tmp_path, content):
+    layout_path = tmp_path / "layout.toml"
+    layout_path.write_text(content, encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_layout(str(layout_path))
+
+
+def test_decode_offset_count_and_tail(tmp_path, capsys):
+    src = _write_records(tmp_path / "a.dat", ">H", [(i,) for i in range(10)], header=b"HDR")
+    src.write_bytes(src.read_bytes() + b"\x01")
+
+    out = DecodeRecordsStrategy(parse_format(">H"), offset=3).execute(str(src))[0]
+    assert [row[0] for row in _read_csv(out)[1:]] == [str(i) for i in range(10)]
+    assert "末尾の 1 バイト" in capsys.readouterr().out
+
+    out = DecodeRecordsStrategy(parse_format(">H"), offset=3, count=4).execute(str(src))[0]
+    assert [row[0] for row in _read_csv(out)[1:]] == ["0", "1", "2", "3"]
+
+
+def test_decode_errors(tmp_path):
+    src = tmp_path / "a.dat"
+    src.write_bytes(b"\x00" * 3)
+    with pytest.raises(ValueError):
+        DecodeRecordsStrategy(parse_format(">i")).execute(str(src))
+    with pytest.raises(OffsetOutOfRangeError):
+        DecodeRecordsStrategy(parse_format(">b"), offset=3).execute(str(src))
+    with pytest.raises(ValueError):
+        DecodeRecordsStrategy(parse_format(">b"), output_format="xlsx")
+    with pytest.raises(ValueError):
+        DecodeRecordsStrategy(parse_format(">b"), count=0)
+
+
+@pytest.mark.parametrize("fmt", ["@b i ? e 3H q 5s c", ">i8si64s", "<2H 4x c", "!hQd?", "=bl3xf"])
+def test_numpy_decode_matches_struct(tmp_path, monkeypatch, fmt):
+    np = pytest.importorskip("numpy")
+    from binary_file_tool.convert_file import decode_records_strategy
+
+    layout = parse_format(fmt)
+    assert decode_records_strategy.numpy_dtype(layout).itemsize == layout.record_size
+    # ? の列の 0/1 以外の値・文字列の途中の NUL も含む任意のバイト列
+    data = np.random.default_rng(1).integers(0, 256, 50 * layout.record_size, dtype=np.uint8).tobytes()
+    src = tmp_path / "a.dat"
+    src.write_bytes(data)
+    numpy_out = DecodeRecordsStrategy(layout, batch_records=7, output_dir=str(tmp_path / "numpy")).execute(str(src))[0]
+
+    monkeypatch.setattr(decode_records_strategy, "np", None)
+    struct_out = DecodeRecordsStrategy(layout, batch_records=7, output_dir=str(tmp_path / "struct")).execute(str(src))[0]
+    lines = _read_csv(numpy_out)
+    assert len(lines) == 51
+    assert lines == _read_csv(struct_out)
+
+
+def test_numpy_decode_parquet_matches_struct(tmp_path, monkeypatch):
+    pytest.importorskip("numpy")
+    pq = pytest.importorskip("pyarrow.parquet")
+    from binary_file_tool.convert_file import decode_records_strategy
+
+    fmt  = ">hQd?e4s"
+    rows = [(-i, i << 40, i / 4, i % 2 == 0, i / 2, b"t%d" % i) for i in range(20)]
+    src  = _write_records(tmp_path / "a.dat", fmt, rows)
+    layout = parse_format(fmt)
+    numpy_out = DecodeRecordsStrategy(layout, "parquet", batch_records=6, output_dir=str(tmp_path / "numpy")).execute(str(src))[0]
+    monkeypatch.setattr(decode_records_strategy, "np", None)
+    struct_out = DecodeRecordsStrategy(layout, "parquet", batch_records=6, output_dir=str(tmp_path / "struct")).execute(str(src))[0]
+
+    table = pq.read_table(numpy_out)
+    assert table.to_pylist() == pq.read_table(struct_out).to_pylist()
+    assert table.column("field5").to_pylist() == [f"t{i}" for i in range(20)]
@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+from binary_file_tool.file_operation.diff_strategy import DiffStrategy, diff_runs
+from binary_file_tool.file_operation.extract_ranges_strategy import ExtractRangesStrategy, load_ranges
+
+
+def _brute_force(a, b):
+    runs, i = [], 0
+    n = min(len(a), len(b))
+    while i < n:
+        if a[i] == b[i]:
+            i += 1
+            continue
+        j = i
+        while j < n and a[j] != b[j]:
+            j += 1
+        runs.append((i, j - i))
+        i = j
+    return runs
+
+
+@pytest.fixture
+def images(tmp_path):
+    rnd = random.Random(7)
+    ref = rnd.randbytes(20_000)
+    new = bytearray(ref)
+    for pos, length in [(0, 3), (1000, 1), (4095, 2), (4100, 40), (19_990, 10)]:
+        new[pos:pos + length] = bytes(b ^ 0x5A for b in new[pos:pos + length])
+    (tmp_path / "ref.bin").write_bytes(ref)
+    (tmp_path / "new.bin").write_bytes(new)
+    return tmp_path / "ref.bin", tmp_path / "new.bin", ref, bytes(new)
+
+
+def test_diff_runs():
+    assert list(diff_runs(b"abcdef", b"abcdef")) == []
+    assert list(diff_runs(b"abcdef", b"xbcdyz")) == [(0, 1), (4, 2)]
+
+
+@pytest.mark.parametrize("block_size", [1, 100, 4096, 1 << 20])
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_diff_matches_brute_force(images, block_size, jobs):
+    ref_path, new_path, ref, new = images
+    ranges, size, ref_size = DiffStrategy(str(ref_path), block_size, jobs=jobs).compare(str(new_path))
+    assert ranges == _brute_force(ref, new)
+    assert size == ref_size == len(ref)
+
+
+def test_diff_merge_gap(images):
+    ref_path, new_path, _, _ = images
+    ranges, _, _ = DiffStrategy(str(ref_path), merge_gap=3).compare(str(new_path))
+    assert ranges == [(0, 3), (1000, 1), (4095, 45), (19_990, 10)]
+
+
+def test_diff_size_change(tmp_path, capsys):
+    (tmp_path / "ref.bin").write_bytes(b"\x00" * 100)
+    (tmp_path / "long.bin").write_bytes(b"\x00" * 99 + b"\x01" + b"tail")
+    (tmp_path / "short.bin").write_bytes(b"\x00" * 60)
+
+    strategy = DiffStrategy(str(tmp_path / "ref.bin"))
+    assert strategy.compare(str(tmp_path / "long.bin"))[0] == [(99, 5)]
+    assert strategy.compare(str(tmp_path / "short.bin"))[0] == []
+    strategy.execute(str(tmp_path / "short.bin"))
+    assert "40 バイト短い" in capsys.readouterr().out
+
+
+def test_diff_output_is_extract_ranges(images, tmp_path):
+    ref_path, new_path, _, new = images
+    out = DiffStrategy(str(ref_path), output_dir=str(tmp_path / "out")).execute(str(new_path))[0]
+    assert out == str(tmp_path / "out" / "new.diff.csv")
+
+    ranges = load_ranges(out)
+    assert [(r.offset, r.size, r.name) for r in ranges][:2] == [(0, 3, "diff0"), (1000, 1, "diff1")]
+    extracted = ExtractRangesStrategy(out, output_dir=str(tmp_path / "extract")).execute(str(new_path))
+    assert [open(p, "rb").read() for p in extracted] == [new[r.offset:r.offset + r.size] for r in ranges]
+
+
+def test_diff_identical_and_empty(tmp_path):
+    (tmp_path / "a.bin").write_bytes(b"same")
+    (tmp_path / "b.bin").write_bytes(b"same")
+    (tmp_path / "empty.bin").write_bytes(b"")
+    assert DiffStrategy(str(tmp_path / "a.bin")).compare(str(tmp_path / "b.bin"))[0] == []
+    assert DiffStrategy(str(tmp_path / "empty.bin")).compare(str(tmp_path / "b.bin"))[0] == [(0, 4)]
+
+
+def test_diff_invalid_arguments(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        DiffStrategy(str(tmp_path / "missing.bin"))
+    (tmp_path / "a.bin").write_bytes(b"a")
+    with pytest.raises(ValueError):
+        DiffStrategy(str(tmp_path / "a.bin"), block_size=0)
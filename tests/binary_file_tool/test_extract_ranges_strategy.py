@@ -0,0 +1,61 @@
+import secrets
+import pytest
+
+from binary_file_tool.file_operation.extract_ranges_strategy import ExtractRangesStrategy
+from binary_file_tool.file_error.exceptions import SizeExceedsError
+
+
+@pytest.fixture
+def src_file(tmp_path):
+    path = tmp_path / "image.bin"
+    path.write_bytes(secrets.token_bytes(8192))
+    return path
+
+
+def test_extract_ranges_csv(src_file, tmp_path):
+    """CSVの全範囲が抽出され、大きな範囲はカーネルコピーでも同一内容となること"""
+    ranges = tmp_path / "ranges.csv"
+    ranges.write_text("offset,size,name\n0x10,32,header\n1000,5000,body\n8000,192,\n")
+    strategy = ExtractRangesStrategy(str(ranges), output_dir=str(tmp_path / "out"), copy_threshold=4096)
+
+    paths = strategy.execute(str(src_file))
+
+    data = src_file.read_bytes()
+    assert [p.rsplit("image_", 1)[-1] for p in paths] == ["header.bin", "body.bin", "range2.bin"]
+    assert open(paths[0], "rb").read() == data[0x10:0x30]
+    assert open(paths[1], "rb").read() == data[1000:6000]
+    assert open(paths[2], "rb").read() == data[8000:]
+
+
+def test_extract_ranges_toml(src_file, tmp_path):
+    ranges = tmp_path / "ranges.toml"
+    ranges.write_text('[[range]]\noffset = 4\nsize = 4\nname = "magic"\n')
+    paths = ExtractRangesStrategy(str(ranges), file_ext="dat").execute(str(src_file))
+    assert paths == [str(tmp_path / "image_magic.dat")]
+    assert open(paths[0], "rb").read() == src_file.read_bytes()[4:8]
+
+
+def test_extract_ranges_validated_before_write(src_file, tmp_path):
+    """範囲外の定義が含まれる場合は、何も出力せずにエラーとなること"""
+    ranges = tmp_path / "ranges.csv"
+    ranges.write_text("offset,size,name\n0,16,ok\n8000,193,ng\n")
+    out_dir = tmp_path / "out"
+    with pytest.raises(SizeExceedsError):
+        ExtractRangesStrategy(str(ranges), output_dir=str(out_dir)).execute(str(src_file))
+    assert not out_dir.exists()
+
+
+def test_extract_ranges_duplicate_name(tmp_path):
+    ranges = tmp_path / "ranges.csv"
+    ranges.write_text("offset,size,name\n0,16,a\n16,16,a\n")
+    with pytest.raises(ValueError):
+        ExtractRangesStrategy(str(ranges))
+
+
+@pytest.mark.parametrize("name", ["../escape", "sub/part", "sub\\part", "..", "a..b"])
+def test_extract_ranges_rejects_path_in_name(tmp_path, name):
+    """name にパスの区切り文字・'..' を含む範囲定義は、読み込み時にエラーとなること"""
+    ranges = tmp_path / "ranges.toml"
+    ranges.write_text(f'[[range]]\noffset = 0\nsize = 4\nname = "{name.replace(chr(92), chr(92) * 2)}"\n')
+    with pytest.raises(ValueError, match="区切り文字"):
+        ExtractRangesStrategy(str(ranges))
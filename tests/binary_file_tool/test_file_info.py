@@ -0,0 +1,88 @@
+import os
+
+import pytest
+
+from binary_file_tool.file_error.exceptions import (
+    EmptyFileError, OffsetOutOfRangeError, SizeExceedsError,
+    check_chunk_size, check_file_not_empty, check_offset_in_range, check_size_available)
+from binary_file_tool.file_error.file_info import FileInfo
+from binary_file_tool.file_operation.diff_strategy import DiffStrategy
+from binary_file_tool.file_operation.extract_strategy import ExtractStrategy
+from binary_file_tool.file_operation.split_strategy import SplitStrategy
+
+
+@pytest.fixture
+def stat_calls(monkeypatch):
+    """os.stat / os.fstat の呼び出し回数を数える"""
+    calls = []
+    stat, fstat = os.stat, os.fstat
+
+    def counting_stat(*args, **kwargs):
+        calls.append("stat")
+        return stat(*args, **kwargs)
+
+    def counting_fstat(*args, **kwargs):
+        calls.append("fstat")
+        return fstat(*args, **kwargs)
+
+    monkeypatch.setattr(os, "stat", counting_stat)
+    monkeypatch.setattr(os, "fstat", counting_fstat)
+    return calls
+
+
+@pytest.fixture
+def sample(tmp_path):
+    path = tmp_path / "in.bin"
+    path.write_bytes(bytes(range(100)))
+    return path
+
+
+def test_file_info_snapshot(sample):
+    with open(sample, "rb") as f:
+        info = FileInfo.from_fd(sample, f.fileno())
+    assert info == FileInfo.from_path(sample)
+    assert info.size == 100
+    assert info.mtime_ns == os.stat(sample).st_mtime_ns
+
+
+def test_checks_accept_file_info_without_stat(sample, stat_calls):
+    info = FileInfo.from_path(sample)
+    stat_calls.clear()
+    check_file_not_empty(info)
+    check_offset_in_range(info, 99)
+    check_size_available(info, 10, 90)
+    check_chunk_size(info, 100)
+    assert stat_calls == []
+
+    with pytest.raises(OffsetOutOfRangeError):
+        check_offset_in_range(info, 100)
+    with pytest.raises(SizeExceedsError):
+        check_size_available(info, 10, 91)
+    with pytest.raises(ValueError, match=r"ファイルのサイズ\(100\)"):
+        check_chunk_size(info, 101)
+
+
+def test_checks_accept_path(tmp_path, stat_calls):
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    with pytest.raises(EmptyFileError):
+        check_chunk_size(empty, 1)
+    assert stat_calls == ["stat"]
+
+
+@pytest.mark.parametrize("make_strategy", [lambda out: ExtractStrategy(10, 20, output_dir=out),
+                                           lambda out: SplitStrategy(30, ignore_tail=False, output_dir=out)])
+def test_one_metadata_call_per_file(sample, tmp_path, stat_calls, make_strategy):
+    make_strategy(str(tmp_path / "out")).execute(str(sample))
+    assert len(stat_calls) == 1
+
+
+def test_diff_reads_current_reference_size(sample, tmp_path):
+    """比較元ファイルのサイズは入力ファイルごとに取得し、実行中の変更を反映すること"""
+    target = tmp_path / "target.bin"
+    target.write_bytes(bytes(range(100)) + b"tail")
+    strategy = DiffStrategy(str(sample), output_dir=str(tmp_path / "out"))
+    assert strategy.compare(str(target)) == ([(100, 4)], 104, 100)
+
+    sample.write_bytes(bytes(range(100)) + b"ta")
+    assert strategy.compare(str(target)) == ([(102, 2)], 104, 102)
@@ -0,0 +1,42 @@
+from binary_file_tool.file_operation import hexdump_strategy
+from binary_file_tool.file_operation.hexdump_strategy import HexDumpStrategy
+
+
+def test_hexdump_format(tmp_path):
+    """従来と同じ形式（オフセット・16進数・ASCII）で出力されること"""
+    src = tmp_path / "sample.bin"
+    src.write_bytes(bytes(range(0x30, 0x30 + 20)))
+    out = tmp_path / "dump.txt"
+
+    assert HexDumpStrategy(offset=2, output=str(out)).execute(str(src)) == [str(out)]
+    assert out.read_text().splitlines() == [
+        f"Path : {src}",
+        "00000002  32 33 34 35 36 37 38 39 3a 3b 3c 3d 3e 3f 40 41   |23456789:;<=>?@A|",
+        "00000012  " + "42 43".ljust(48) + "  |BC|",
+    ]
+
+
+def test_hexdump_squeeze_across_windows(tmp_path, monkeypatch):
+    """ウィンドウ境界をまたぐ繰り返し行も1つの '*' に省略されること"""
+    monkeypatch.setattr(hexdump_strategy, "WINDOW_SIZE", 32)
+    src = tmp_path / "sample.bin"
+    src.write_bytes(b"\x00" * 100 + b"\xff")
+    out = tmp_path / "dump.txt"
+
+    HexDumpStrategy(output=str(out), squeeze=True).execute(str(src))
+    assert out.read_text().splitlines()[1:] == [
+        "00000000  00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00   |................|",
+        "*",
+        "00000060  " + "00 00 00 00 ff".ljust(48) + "  |.....|",
+        "00000065",
+    ]
+
+
+def test_hexdump_output_appends_per_file(tmp_path):
+    """同じ出力ファイルに複数ファイル分が追記されること"""
+    out = tmp_path / "dump.txt"
+    strategy = HexDumpStrategy(output=str(out))
+    for name in ("a.bin", "b.bin"):
+        (tmp_path / name).write_bytes(b"x")
+        strategy.execute(str(tmp_path / name))
+    assert out.read_text().count("Path : ") == 2
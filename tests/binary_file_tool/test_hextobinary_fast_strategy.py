@@ -0,0 +1,30 @@
+import pytest
+
+from binary_file_tool.convert_file.hextobinary_chunked_strategy import HexToBinaryChunkedStrategy
+from binary_file_tool.convert_file.hextobinary_fast_strategy import HexToBinaryFastStrategy
+
+TEXTS = [
+    "00 11 22 33\n44 55 66 77\n",
+    "\ufeffDE AD be ef\r\n# コメント：０１\nCA FE\n",
+    "0" + " 1" * 999 + "\n",
+]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_fast_matches_chunked(tmp_path, text, chunk_size):
+    """チャンク境界に依らず、従来の戦略とバイト単位で同一の出力となること"""
+    src = tmp_path / "hex.txt"
+    src.write_text(text, encoding="utf-8")
+
+    expected = HexToBinaryChunkedStrategy(output_dir=str(tmp_path / "chunked")).execute(str(src))[0]
+    actual   = HexToBinaryFastStrategy(chunk_size=chunk_size, output_dir=str(tmp_path / "fast")).execute(str(src))[0]
+
+    assert open(actual, "rb").read() == open(expected, "rb").read()
+
+
+def test_fast_odd_digits(tmp_path):
+    src = tmp_path / "hex.txt"
+    src.write_text("00 11 2\n")
+    with pytest.raises(ValueError):
+        HexToBinaryFastStrategy().execute(str(src))
@@ -0,0 +1,29 @@
+import itertools
+
+import pytest
+
+from binary_file_tool.generate_file.incremental_strategy import IncrementalDataStrategy
+
+
+def reference(size, unit_size, start_value, endian):
+    """1値ずつ変換する従来の実装"""
+    max_value = 2 ** (unit_size * 8)
+    return b"".join(((start_value + i) % max_value).to_bytes(unit_size, endian)
+                    for i in range(size // unit_size))
+
+
+@pytest.mark.parametrize("unit_size, endian, start_value", list(itertools.product(
+    [1, 2, 3, 4, 8], ["little", "big"], [0, 1, 65530, 2**24 - 3, 2**32 - 2])))
+@pytest.mark.parametrize("count", [0, 1, 70000])
+def test_matches_reference(tmp_path, unit_size, endian, start_value, count):
+    out = tmp_path / "inc.bin"
+    size = count * unit_size
+    IncrementalDataStrategy(size, unit_size, start_value, endian).execute(str(out))
+    assert out.read_bytes() == reference(size, unit_size, start_value, endian)
+
+
+def test_invalid_unit_size():
+    with pytest.raises(ValueError):
+        IncrementalDataStrategy(16, 0)
+    with pytest.raises(ValueError):
+        IncrementalDataStrategy(10, 4)
@@ -0,0 +1,108 @@
+import hashlib
+import secrets
+from pathlib import Path
+
+import pytest
+
+from binary_file_tool.file_operation.cdc_split_strategy import CDCSplitStrategy
+from binary_file_tool.file_operation.join_strategy import JoinStrategy, find_parts
+from binary_file_tool.file_operation.split_manifest import SplitManifest
+from binary_file_tool.file_operation.split_strategy import SplitStrategy
+
+
+@pytest.fixture
+def split_parts(tmp_path):
+    """12パーツ（part10, part11 を含む）に分割し、マニフェストを出力する"""
+    src = tmp_path / "fw.bin"
+    src.write_bytes(secrets.token_bytes(11 * 1000 + 123))
+    paths = SplitStrategy(1000, ignore_tail=False, output_dir=str(tmp_path / "parts"), manifest=True).execute(str(src))
+    return src, paths
+
+
+def test_split_manifest(split_parts):
+    src, paths = split_parts
+    assert paths[-1].endswith("fw.bin.manifest.json")
+    manifest = SplitManifest.load(paths[-1])
+    assert manifest.mode == "fixed" and manifest.size == src.stat().st_size
+    assert manifest.digest == hashlib.sha256(src.read_bytes()).hexdigest()
+    assert [str(manifest.resolve(p)) for p in manifest.parts] == [str(Path(p)) for p in paths[:-1]]
+    assert manifest.verify() == []
+
+
+def test_find_parts_numeric_order(split_parts, tmp_path):
+    name, parts = find_parts(tmp_path / "parts" / "fw_part0.bin")
+    assert name == "fw.bin"
+    assert [p.name for p in parts] == [f"fw_part{i}.bin" for i in range(12)]
+
+
+@pytest.mark.parametrize("verify", [False, True])
+@pytest.mark.parametrize("engine", ["auto", "buffered"])
+def test_join_restores_file(split_parts, tmp_path, verify, engine):
+    src, _ = split_parts
+    out = JoinStrategy(str(tmp_path / "restored"), verify=verify, engine=engine).execute(str(tmp_path / "parts" / "fw_part0.bin"))[0]
+    assert open(out, "rb").read() == src.read_bytes()
+
+
+def test_join_from_manifest(split_parts, tmp_path):
+    src, paths = split_parts
+    out = JoinStrategy(str(tmp_path / "restored"), verify=True).execute(paths[-1])[0]
+    assert open(out, "rb").read() == src.read_bytes()
+
+
+def test_join_cdc_manifest(tmp_path):
+    src = tmp_path / "fw.bin"
+    src.write_bytes(secrets.token_bytes(200_000))
+    manifest = CDCSplitStrategy(min_size=1024, avg_size=4096, max_size=16384,
+                                output_dir=str(tmp_path / "cdc")).execute(str(src))[0]
+    out = JoinStrategy(str(tmp_path / "restored"), verify=True).execute(manifest)[0]
+    assert open(out, "rb").read() == src.read_bytes()
+
+
+def test_verify_detects_corruption(split_parts, tmp_path):
+    part = tmp_path / "parts" / "fw_part10.bin"
+    data = bytearray(part.read_bytes())
+    data[0] ^= 0xFF
+    part.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError, match="fw_part10.bin"):
+        JoinStrategy(str(tmp_path / "restored"), verify=True).execute(str(tmp_path / "parts" / "fw_part0.bin"))
+    assert not (tmp_path / "restored" / "fw.bin").exists()
+
+
+def test_missing_part(split_parts, tmp_path):
+    (tmp_path / "parts" / "fw_part3.bin").unlink()
+    with pytest.raises(ValueError, match="3"):
+        JoinStrategy(str(tmp_path / "restored")).execute(str(tmp_path / "parts" / "fw_part0.bin"))
+
+
+def test_verify_requires_manifest(tmp_path):
+    src = tmp_path / "fw.bin"
+    src.write_bytes(secrets.token_bytes(3000))
+    SplitStrategy(1000, ignore_tail=False, output_dir=str(tmp_path / "parts")).execute(str(src))
+    with pytest.raises(FileNotFoundError):
+        JoinStrategy(str(tmp_path / "restored"), verify=True).execute(str(tmp_path / "parts" / "fw_part0.bin"))
+
+
+def test_existing_output(split_parts, tmp_path):
+    src, _ = split_parts
+    first = str(tmp_path / "parts" / "fw_part0.bin")
+    with pytest.raises(FileExistsError):
+        JoinStrategy(str(tmp_path)).execute(first)
+    JoinStrategy(str(tmp_path), overwrite=True).execute(first)
+    assert src.stat().st_size == 11 * 1000 + 123
+
+
+def test_requires_first_part(split_parts, tmp_path):
+    with pytest.raises(ValueError):
+        JoinStrategy().execute(str(tmp_path / "parts" / "fw_part1.bin"))
+
+
+@pytest.mark.parametrize("source", ["../escape.bin", "sub/fw.bin", "/tmp/fw.bin", "..", ""])
+def test_join_rejects_source_with_directory(split_parts, tmp_path, source):
+    _, paths = split_parts
+    manifest = SplitManifest.load(paths[-1])
+    manifest.source = source
+    manifest.save(paths[-1])
+    with pytest.raises(ValueError, match="元ファイル名"):
+        JoinStrategy(str(tmp_path / "restored" / "deep")).execute(paths[-1])
+    assert not (tmp_path / "restored").exists()
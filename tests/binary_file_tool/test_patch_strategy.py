@@ -0,0 +1,99 @@
+import os
+
+import pytest
+
+from binary_file_tool.file_operation.diff_strategy import DiffStrategy
+from binary_file_tool.file_operation.patch_strategy import (
+    UNDO_SUFFIX, PatchEdit, PatchStrategy, coalesce_edits, load_edits, parse_edit)
+from binary_file_tool.file_error.exceptions import OffsetOutOfRangeError, SizeExceedsError
+
+
+@pytest.fixture
+def target(tmp_path):
+    path = tmp_path / "fw.bin"
+    path.write_bytes(bytes(range(256)) * 4)
+    return path
+
+
+def test_coalesce_edits():
+    edits = [PatchEdit(10, b"cd"), PatchEdit(4, b"xy"), PatchEdit(8, b"ab"), PatchEdit(20, b""), PatchEdit(6, b"z")]
+    assert coalesce_edits(edits) == [PatchEdit(4, b"xyz"), PatchEdit(8, b"abcd")]
+
+
+def test_coalesce_edits_overlap():
+    with pytest.raises(ValueError):
+        coalesce_edits([PatchEdit(0, b"abcd"), PatchEdit(2, b"x")])
+
+
+def test_patch_in_place(target):
+    original = target.read_bytes()
+    inode = os.stat(target).st_ino
+    strategy = PatchStrategy([PatchEdit(0x10, b"\xDE\xAD"), PatchEdit(0x12, b"\xBE\xEF"), PatchEdit(1000, b"!")],
+                             fsync_batch=1)
+    assert len(strategy.edits) == 2
+    assert strategy.execute(str(target)) == [str(target)]
+
+    expected = bytearray(original)
+    expected[0x10:0x14] = b"\xDE\xAD\xBE\xEF"
+    expected[1000] = ord("!")
+    assert target.read_bytes() == expected
+    assert os.stat(target).st_ino == inode
+
+
+def test_patch_journal_undo(target, tmp_path):
+    original = target.read_bytes()
+    outputs = PatchStrategy([parse_edit("0x0=FFFF"), parse_edit("512=00 11 22")], journal=True).execute(str(target))
+    undo_path = tmp_path / f"fw.bin{UNDO_SUFFIX}"
+    assert outputs == [str(target), str(undo_path)]
+    assert target.read_bytes() != original
+
+    # 取り消し用のパッチが既にある場合は上書きしない
+    with pytest.raises(FileExistsError):
+        PatchStrategy([parse_edit("1=00")], journal=True).execute(str(target))
+
+    PatchStrategy(load_edits(str(undo_path))).execute(str(target))
+    assert target.read_bytes() == original
+
+
+@pytest.mark.parametrize("edit, error", [(PatchEdit(1024, b"x"), OffsetOutOfRangeError),
+                                         (PatchEdit(1020, b"12345"), SizeExceedsError)])
+def test_patch_out_of_range_writes_nothing(target, edit, error):
+    original = target.read_bytes()
+    with pytest.raises(error):
+        PatchStrategy([PatchEdit(0, b"\x00\x00"), edit]).execute(str(target))
+    assert target.read_bytes() == original
+
+
+def test_load_edits_csv_and_toml(tmp_path):
+    csv_path = tmp_path / "p.csv"
+    csv_path.write_text("offset,data\n0x10,DEADBEEF\n512,55 AA\n", encoding="utf-8")
+    assert load_edits(str(csv_path)) == [PatchEdit(0x10, b"\xDE\xAD\xBE\xEF"), PatchEdit(512, b"\x55\xAA")]
+
+    toml_path = tmp_path / "p.toml"
+    toml_path.write_text('[[edit]]\noffset = 0x10\ndata = "0102"\n', encoding="utf-8")
+    assert load_edits(str(toml_path)) == [PatchEdit(0x10, b"\x01\x02")]
+
+    bad_path = tmp_path / "bad.csv"
+    bad_path.write_text("offset,data\n0x10,XYZ\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_edits(str(bad_path))
+
+
+def test_patch_from_diff(target, tmp_path):
+    new = tmp_path / "new.bin"
+    data = bytearray(target.read_bytes())
+    data[5:9] = b"abcd"
+    data[700] ^= 0xFF
+    new.write_bytes(data)
+
+    diff_path = DiffStrategy(str(target), output_dir=str(tmp_path / "diff")).execute(str(new))[0]
+    with pytest.raises(ValueError):
+        load_edits(diff_path)
+    PatchStrategy(load_edits(diff_path, source=str(new))).execute(str(target))
+    assert target.read_bytes() == data
+
+
+@pytest.mark.parametrize("text", ["0x10", "x=00", "1=0"])
+def test_parse_edit_error(text):
+    with pytest.raises(ValueError):
+        parse_edit(text)
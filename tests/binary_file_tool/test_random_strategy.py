@@ -0,0 +1,104 @@
+import hashlib
+
+import pytest
+
+from binary_file_tool.file_error.exceptions import SizeExceedsError
+from binary_file_tool.generate_file import fast_random_strategy
+from binary_file_tool.generate_file.fast_random_strategy import BLOCK_SIZE, FastRandomStrategy
+from binary_file_tool.generate_file.random_strategy import SecureRandomStrategy
+
+
+def test_secure_streams_in_blocks(tmp_path):
+    out = tmp_path / "sub" / "r.bin"
+    SecureRandomStrategy(10_001, block_size=4096).execute(str(out))
+    assert out.stat().st_size == 10_001
+
+
+def test_fast_reproducible(tmp_path):
+    size = BLOCK_SIZE + 123
+    a = FastRandomStrategy(size, seed=7).execute(str(tmp_path / "a" / "fw.bin"))[0]
+    b = FastRandomStrategy(size, seed=7).execute(str(tmp_path / "b" / "fw.bin"))[0]
+    c = FastRandomStrategy(size, seed=8).execute(str(tmp_path / "c" / "fw.bin"))[0]
+    d = FastRandomStrategy(size, seed=7).execute(str(tmp_path / "a" / "other.bin"))[0]
+
+    data = open(a, "rb").read()
+    assert len(data) == size
+    assert data == open(b, "rb").read()
+    assert data != open(c, "rb").read()
+    # 出力ファイル名に依らず、同じシードは同じデータ
+    assert data == open(d, "rb").read()
+    # 先頭部分はサイズに依らず共通
+    small = FastRandomStrategy(1000, seed=7).execute(str(tmp_path / "s" / "fw.bin"))[0]
+    assert open(small, "rb").read() == data[:1000]
+
+
+@pytest.mark.parametrize("strategy_class", [SecureRandomStrategy, FastRandomStrategy])
+def test_fill_region_in_place(tmp_path, strategy_class):
+    target = tmp_path / "fw.bin"
+    target.write_bytes(bytes(1000))
+    strategy_class(100, offset=200).execute(str(target))
+
+    data = target.read_bytes()
+    assert len(data) == 1000
+    assert data[:200] == bytes(200) and data[300:] == bytes(700)
+    assert data[200:300] != bytes(100)
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_fast_blocks_depend_only_on_seed_output_and_index(tmp_path, monkeypatch, use_numpy):
+    if use_numpy:
+        np = pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(fast_random_strategy, "np", None)
+    size = 2 * BLOCK_SIZE + 10
+    data = open(FastRandomStrategy(size, seed=3).execute(str(tmp_path / "a.bin"))[0], "rb").read()
+    blocks = [data[i:i + BLOCK_SIZE] for i in range(0, size, BLOCK_SIZE)]
+    assert [len(block) for block in blocks] == [BLOCK_SIZE, BLOCK_SIZE, 10]
+    for index, block in enumerate(blocks):
+        if use_numpy:
+            generator = np.random.PCG64(np.random.SeedSequence(3, spawn_key=(0, index)))
+            expected = generator.random_raw((len(block) + 7) // 8).astype("<u8").tobytes()[:len(block)]
+        else:
+            expected = hashlib.shake_128(f"3:0:{index}".encode()).digest(len(block))
+        assert block == expected
+    # ブロック同士で同じ並びを共有しない（1つのテーブルの切り出しではない）
+    assert blocks[1][:4096] not in blocks[0]
+
+    parallel = FastRandomStrategy(size, seed=3, jobs=2).execute(str(tmp_path / "b.bin"))[0]
+    assert open(parallel, "rb").read() == data
+
+
+def test_fast_outputs_get_different_data(tmp_path):
+    outputs = [str(tmp_path / "a.bin"), str(tmp_path / "b.bin")]
+    strategy = FastRandomStrategy(1000, seed=5, outputs=outputs)
+    a, b = (open(strategy.execute(path)[0], "rb").read() for path in outputs)
+    assert a != b
+    # 先頭の出力ファイルは outputs を指定しない場合と同じデータ
+    assert a == open(FastRandomStrategy(1000, seed=5).execute(str(tmp_path / "c.bin"))[0], "rb").read()
+    # 2つ目の出力ファイルは、単独で生成しても同じデータ
+    again = FastRandomStrategy(1000, seed=5, outputs=outputs).execute(outputs[1])[0]
+    assert open(again, "rb").read() == b
+
+    with pytest.raises(ValueError):
+        strategy.execute(str(tmp_path / "other.bin"))
+    with pytest.raises(ValueError):
+        FastRandomStrategy(1000, seed=-1)
+
+
+def test_fast_in_place_matches_new_file(tmp_path):
+    target = tmp_path / "a" / "fw.bin"
+    target.parent.mkdir()
+    target.write_bytes(bytes(50_000))
+    FastRandomStrategy(40_000, seed=1, offset=10_000).execute(str(target))
+    fresh = FastRandomStrategy(40_000, seed=1).execute(str(tmp_path / "b" / "fw.bin"))[0]
+    assert target.read_bytes()[10_000:] == open(fresh, "rb").read()
+
+
+@pytest.mark.parametrize("strategy_class", [SecureRandomStrategy, FastRandomStrategy])
+def test_region_out_of_range(tmp_path, strategy_class):
+    target = tmp_path / "fw.bin"
+    target.write_bytes(bytes(100))
+    with pytest.raises(SizeExceedsError):
+        strategy_class(50, offset=60).execute(str(target))
+    with pytest.raises(FileNotFoundError):
+        strategy_class(50, offset=0).execute(str(tmp_path / "missing.bin"))
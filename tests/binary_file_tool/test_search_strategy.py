@@ -0,0 +1,113 @@
+import os
+import random
+
+import pytest
+
+from binary_file_tool.batch.batch_executor import BatchExecutor
+from binary_file_tool.file_operation.file_operation import FileOperation
+from binary_file_tool.file_operation.search_strategy import (
+    FIND_THRESHOLD, PatternMatcher, SearchStrategy, load_patterns, parse_pattern)
+
+
+def _brute_force(data, patterns):
+    return sorted((i, patterns.index(p), p) for p in patterns for i in range(len(data)) if data.startswith(p, i))
+
+
+@pytest.fixture
+def sample(tmp_path):
+    rnd  = random.Random(13)
+    data = bytes(rnd.choice(b"\x00\x01\xAA\x55") for _ in range(5000))
+    path = tmp_path / "dump.bin"
+    path.write_bytes(data)
+    return path, data
+
+
+@pytest.mark.parametrize("count", [1, FIND_THRESHOLD, 12, 40])
+@pytest.mark.parametrize("block_size", [5, 64, 1 << 20])
+def test_search_matches_brute_force(sample, count, block_size):
+    path, data = sample
+    rnd = random.Random(count)
+    patterns = list(dict.fromkeys(bytes(rnd.choice(b"\x00\x01\xAA\x55") for _ in range(rnd.randint(1, 5)))
+                                  for _ in range(count)))
+    strategy = SearchStrategy([p.hex() for p in patterns], block_size=block_size)
+    assert strategy.matcher.use_find == (len(patterns) <= FIND_THRESHOLD)
+
+    expected = [(i, p) for i, _, p in _brute_force(data, patterns)]
+    assert list(strategy.iter_matches(str(path))) == expected
+
+
+def test_search_overlapping_and_boundary(tmp_path):
+    path = tmp_path / "a.bin"
+    path.write_bytes(b"\xAA\xAA\xAA\x55\xAA\x55")
+    strategy = SearchStrategy(["AAAA", "aa55"], block_size=3)
+    assert strategy.execute(str(path)) == [f"{path},0,aaaa", f"{path},1,aaaa", f"{path},2,aa55", f"{path},4,aa55"]
+
+
+def test_search_max_count_and_empty_file(tmp_path):
+    path = tmp_path / "a.bin"
+    path.write_bytes(b"\x01" * 100)
+    assert len(SearchStrategy(["01"], max_count=3).execute(str(path))) == 3
+
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    assert SearchStrategy(["01"]).execute(str(empty)) == []
+
+
+def test_search_parallel_files(tmp_path):
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"f{i}.bin"
+        path.write_bytes(b"\x00" * (i * 10) + b"\x7FELF" + b"\x00" * 7)
+        paths.append(str(path))
+    patterns = ["7F454C46"] + [f"{i:08x}" for i in range(1, 10)]
+    results = list(BatchExecutor(FileOperation(SearchStrategy(patterns)), jobs=2).run(paths))
+    assert [r.outputs for r in results] == [[f"{p},{i * 10},7f454c46"] for i, p in enumerate(paths)]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_search_spool_dir(tmp_path, sample, jobs):
+    path, data = sample
+    spool = tmp_path / "spool"
+    spool.mkdir()
+    expected = SearchStrategy(["AA55", "0001"]).execute(str(path))
+    strategy = SearchStrategy(["AA55", "0001"], block_size=64, spool_dir=str(spool))
+    results  = list(BatchExecutor(FileOperation(strategy), jobs=jobs).run([str(path), str(path)]))
+    # 一致はファイルごとの一時ファイルに書き出される
+    parts = [part for r in results for part in r.outputs]
+    assert len(set(parts)) == 2 and all(os.path.dirname(part) == str(spool) for part in parts)
+    for part in parts:
+        with open(part, encoding="utf-8", newline="") as f:
+            assert f.read().splitlines() == expected
+    assert len(expected) > 100
+
+
+def test_search_spool_dir_removes_partial_output(tmp_path):
+    spool = tmp_path / "spool"
+    spool.mkdir()
+    with pytest.raises(OSError):
+        SearchStrategy(["01"], spool_dir=str(spool)).execute(str(tmp_path / "missing.bin"))
+    assert list(spool.iterdir()) == []
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("7F454C46", b"\x7FELF"), ("0xAA55", b"\xAA\x55"), ("de ad:be-ef", b"\xDE\xAD\xBE\xEF"),
+])
+def test_parse_pattern(text, expected):
+    assert parse_pattern(text) == expected
+
+
+@pytest.mark.parametrize("text", ["", "0x", "ABC", "zz"])
+def test_parse_pattern_error(text):
+    with pytest.raises(ValueError):
+        parse_pattern(text)
+
+
+def test_load_patterns(tmp_path):
+    path = tmp_path / "patterns.txt"
+    path.write_text("# magic\n7F454C46\n\n  AA55  \n", encoding="utf-8")
+    assert load_patterns(str(path)) == ["7F454C46", "AA55"]
+
+
+def test_matcher_requires_patterns():
+    with pytest.raises(ValueError):
+        PatternMatcher([])
@@ -0,0 +1,128 @@
+import random
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from csv_file_tool.concat.by_index import ConcatByIndexStrategy
+from csv_file_tool.concat.csv_concat_executor import CSVConcatExecutor
+
+
+def _write_csv(path, header, rows):
+    path.write_text("\n".join([",".join(header)] + [",".join(map(str, row)) for row in rows]) + "\n", encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def unequal_files(tmp_path):
+    rnd = random.Random(7)
+    paths = []
+    for i, n in enumerate([7, 12, 3, 0]):
+        rows = [(rnd.randint(0, 9), f"s{j}", rnd.random() < 0.5) for j in range(n)]
+        paths.append(_write_csv(tmp_path / f"f{i}.csv", [f"a{i}", f"s{i}", f"b{i}"], rows))
+    return paths
+
+
+def _run(paths, output, **kwargs):
+    result = CSVConcatExecutor(ConcatByIndexStrategy(), str(output), **kwargs).run(paths)
+    assert result == [str(output)]
+    return output.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("parser", ["c", "auto"])
+@pytest.mark.parametrize("index_name", [None, "No."])
+@pytest.mark.parametrize("chunksize", [1, 2, 5, 100])
+def test_streaming_matches_whole_file(unequal_files, tmp_path, chunksize, index_name, parser):
+    expected = _run(unequal_files, tmp_path / "whole.csv", chunksize=None, index_name=index_name, parser=parser)
+    actual = _run(unequal_files, tmp_path / "stream.csv", chunksize=chunksize, index_name=index_name, parser=parser)
+    assert actual == expected
+
+
+@pytest.mark.parametrize("chunksize", [1, 5, 100])
+def test_pyarrow_block_reads_match_c_parser(unequal_files, tmp_path, monkeypatch, chunksize):
+    pacsv = pytest.importorskip("pyarrow.csv")
+    opened = []
+    open_csv = pacsv.open_csv
+    monkeypatch.setattr(pacsv, "open_csv", lambda path, **kwargs: opened.append(path) or open_csv(path, **kwargs))
+    expected = _run(unequal_files, tmp_path / "c.csv", chunksize=None, parser="c")
+    actual = _run(unequal_files, tmp_path / "arrow.csv", chunksize=chunksize, parser="pyarrow")
+    assert actual == expected
+    # ブロック単位の読み込みでも pyarrow のパーサーを使う
+    assert sorted(opened) == sorted(unequal_files)
+
+
+@pytest.mark.parametrize("parser", ["pyarrow", "auto"])
+def test_pyarrow_type_change_after_first_block_falls_back_to_c(tmp_path, parser):
+    pytest.importorskip("pyarrow")
+    # pyarrow.csv.open_csv は先頭のブロック（1MB）で列の型を決めるため、それ以降の 1.5 は int64 に変換できない
+    rows = [[i, "x" * 100] for i in range(20000)]
+    rows[15001][0] = 1.5
+    paths = [_write_csv(tmp_path / "a.csv", ["n", "pad"], rows),
+             _write_csv(tmp_path / "b.csv", ["m"], [[i] for i in range(5)])]
+    expected = _run(paths, tmp_path / "c.csv", chunksize=1000, parser="c")
+    actual = _run(paths, tmp_path / "arrow.csv", chunksize=1000, parser=parser)
+    assert actual == expected
+    lines = actual.splitlines()
+    assert len(lines) == 1 + 20000
+    assert lines[15002].startswith("1.5,") and lines[20000].startswith("19999,")
+
+
+def test_padded_integer_columns_stay_integer(unequal_files, tmp_path):
+    lines = _run(unequal_files, tmp_path / "out.csv", chunksize=2).splitlines()
+    assert lines[0] == "a0,s0,b0,a1,s1,b1,a2,s2,b2,a3,s3,b3"
+    assert len(lines) == 1 + 12
+    # 3行のファイルの列は、4行目以降が空欄になり、整数は小数にならない
+    a2 = [line.split(",")[6] for line in lines[1:]]
+    assert all(value.isdigit() for value in a2[:3]) and a2[3:] == [""] * 9
+
+
+def test_column_type_change_within_file(tmp_path):
+    # 2つ目のブロックにだけ空欄がある整数の列も、ブロックの区切り位置で 6 / 6.0 が混在しない
+    paths = [_write_csv(tmp_path / "a.csv", ["x"], [[1], [2], [3], [""], [5]])]
+    lines = _run(paths, tmp_path / "out.csv", chunksize=2).splitlines()
+    assert lines == ["x", "1", "2", "3", "5"]
+
+
+@pytest.mark.parametrize("chunksize", [None, 2, 3, 100000])
+def test_integer_column_with_blank_does_not_depend_on_chunksize(tmp_path, chunksize):
+    # 空欄を含む整数の列は float と推定されるが、整数値は chunksize に依らず整数として出力する
+    a = _write_csv(tmp_path / "a.csv", ["A", "C"], [[1, 1], [2, 1], [3, 1], [4, 1], ["", 1], [6, 1]])
+    b = _write_csv(tmp_path / "b.csv", ["B", "D"], [[1, 0.5], [1, 1.0], [1, 2.5]])
+    lines = _run([a, b], tmp_path / "out.csv", chunksize=chunksize).splitlines()
+    assert lines == ["A,C,B,D", "1,1,1,0.5", "2,1,1,1", "3,1,1,2.5", "4,1,,", ",1,,", "6,1,,"]
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_header_only_files(tmp_path, chunksize):
+    paths = [_write_csv(tmp_path / "a.csv", ["x", "y"], []), _write_csv(tmp_path / "b.csv", ["z"], [])]
+    assert _run(paths, tmp_path / "out.csv", chunksize=chunksize).splitlines() == ["x,y,z"]
+    assert _run(paths, tmp_path / "idx.csv", chunksize=chunksize, index_name="No.").splitlines() == ["No.,x,y,z"]
+
+
+@pytest.mark.parametrize("parser", ["c", "pyarrow"])
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_columns_projection(tmp_path, chunksize, parser):
+    if parser == "pyarrow":
+        pytest.importorskip("pyarrow")
+    # usecols と同じく、列はファイルの順序で出力する
+    paths = [_write_csv(tmp_path / f"p{i}.csv", ["k", "v", "w"], [(i, j, j * 2) for j in range(3)]) for i in range(2)]
+    lines = _run(paths, tmp_path / "out.csv", chunksize=chunksize, columns=["w", "k"], parser=parser).splitlines()
+    assert lines == ["k,w,k,w"] + [f"0,{j * 2},1,{j * 2}" for j in range(3)]
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_output_can_be_an_input(tmp_path, chunksize):
+    first = _write_csv(tmp_path / "1.csv", ["a"], [[1], [2], [3]])
+    second = _write_csv(tmp_path / "2.csv", ["b"], [[4]])
+    _run([first, second], tmp_path / "1.csv", chunksize=chunksize)
+    assert (tmp_path / "1.csv").read_text(encoding="utf-8").splitlines() == ["a,b", "1,4", "2,", "3,"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["1.csv", "2.csv"]
+
+
+def test_missing_column_leaves_output_untouched(tmp_path):
+    path = _write_csv(tmp_path / "a.csv", ["x"], [[1]])
+    output = tmp_path / "out.csv"
+    output.write_text("previous\n", encoding="utf-8")
+    assert CSVConcatExecutor(ConcatByIndexStrategy(), str(output), columns=["nope"]).run([path]) is None
+    assert output.read_text(encoding="utf-8") == "previous\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.csv", "out.csv"]
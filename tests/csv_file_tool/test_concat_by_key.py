@@ -0,0 +1,95 @@
+import csv
+import random
+from collections import Counter
+from functools import reduce
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from csv_file_tool.concat.by_key import MERGE_FAN_IN, ConcatByKeyStrategy
+
+
+def _write_csv(path, header, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+    return str(path)
+
+
+def _read_csv(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+def _expected(paths, on, how):
+    dfs = [pd.read_csv(path, dtype=str, keep_default_na=False) for path in paths]
+    merged = reduce(lambda left, right: pd.merge(left, right, on=on, how=how), dfs)
+    return [list(merged.columns)] + merged.fillna("").values.tolist()
+
+
+@pytest.fixture
+def tables(tmp_path):
+    rnd = random.Random(11)
+
+    def rows(n, width):
+        return [[rnd.choice("abcdefgh"), rnd.choice("xy")] + [str(rnd.randint(0, 99)) for _ in range(width)]
+                for _ in range(n)]
+
+    return [
+        _write_csv(tmp_path / "left.csv", ["Name", "Group", "Point"], rows(60, 1)),
+        _write_csv(tmp_path / "right.csv", ["Name", "Group", "Score", "Point"], rows(25, 2)),
+        _write_csv(tmp_path / "third.csv", ["Name", "Group", "Address"], rows(150, 1)),
+    ]
+
+
+@pytest.mark.parametrize("engine", ["hash", "merge"])
+@pytest.mark.parametrize("how", ["inner", "left", "outer"])
+@pytest.mark.parametrize("on", [["Name"], ["Name", "Group"]])
+@pytest.mark.parametrize("order", [(0, 1), (2, 0), (0, 1, 2)])
+def test_join_matches_pandas_merge(tables, tmp_path, engine, how, on, order, capsys):
+    paths = [tables[i] for i in order]
+    output = tmp_path / "out.csv"
+    ConcatByKeyStrategy(on, how=how, engine=engine, run_size=7).concat_files(paths, str(output))
+    actual, expected = _read_csv(output), _expected(paths, on, how)
+    assert actual[0] == expected[0]
+    assert Counter(map(tuple, actual[1:])) == Counter(map(tuple, expected[1:]))
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "outer"])
+def test_merge_engine_with_more_runs_than_fan_in(tables, tmp_path, how, capsys):
+    # 150行を2行ずつソートすると 75 個の一時ファイルになり、段階的なマージが必要になる
+    assert 150 // 2 > MERGE_FAN_IN
+    paths = [tables[2], tables[0]]
+    small = tmp_path / "small_runs.csv"
+    large = tmp_path / "one_run.csv"
+    ConcatByKeyStrategy(["Name"], how=how, engine="merge", run_size=2).concat_files(paths, str(small))
+    ConcatByKeyStrategy(["Name"], how=how, engine="merge").concat_files(paths, str(large))
+    assert small.read_bytes() == large.read_bytes()
+
+    expected = _expected(paths, ["Name"], how)
+    assert Counter(map(tuple, _read_csv(small)[1:])) == Counter(map(tuple, expected[1:]))
+    # merge エンジンはキー順に出力する
+    keys = [row[0] for row in _read_csv(small)[1:]]
+    assert keys == sorted(keys)
+
+
+def test_columns_and_index_name(tables, tmp_path, capsys):
+    output = tmp_path / "out.csv"
+    ConcatByKeyStrategy(["Name"], how="inner").concat_files(tables[:2], str(output), columns=["Score"], index_name="No.")
+    rows = _read_csv(output)
+    assert rows[0] == ["No.", "Name", "Score"]
+    assert [row[0] for row in rows[1:]] == [str(i) for i in range(len(rows) - 1)]
+
+
+def test_missing_key_column(tables):
+    with pytest.raises(ValueError):
+        ConcatByKeyStrategy(["Address"]).concat_files(tables[:2], "unused.csv")
+
+
+@pytest.mark.parametrize("kwargs", [{"on": []}, {"on": ["Name"], "how": "cross"},
+                                    {"on": ["Name"], "engine": "sort"}, {"on": ["Name"], "run_size": 0}])
+def test_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        ConcatByKeyStrategy(**kwargs)
@@ -0,0 +1,81 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from csv_file_tool.concat.by_row import ConcatByRowStrategy, parse_header, read_header
+from csv_file_tool.concat.csv_concat_executor import CSVConcatExecutor
+
+
+def _write(path, data):
+    path.write_bytes(data)
+    return str(path)
+
+
+def _run(paths, output, **kwargs):
+    result = CSVConcatExecutor(ConcatByRowStrategy(), str(output), **kwargs).run(paths)
+    assert result == [str(output)]
+    return output.read_bytes()
+
+
+def test_raw_copy_strips_bom_and_keeps_crlf(tmp_path):
+    paths = [_write(tmp_path / "a.csv", b"\xef\xbb\xbfk,v\r\nx,1\r\n"),
+             _write(tmp_path / "b.csv", b"\xef\xbb\xbfk,v\r\ny,2\r\n")]
+    assert _run(paths, tmp_path / "out.csv") == b"k,v\r\nx,1\r\ny,2\r\n"
+
+
+def test_raw_copy_adds_missing_trailing_newline(tmp_path):
+    paths = [_write(tmp_path / "a.csv", b"k,v\nx,1"), _write(tmp_path / "b.csv", b"k,v\ny,2"),
+             _write(tmp_path / "c.csv", b"k,v\r\nz,3")]
+    assert _run(paths, tmp_path / "out.csv") == b"k,v\nx,1\ny,2\nz,3\n"
+
+
+def test_raw_copy_header_only_inputs(tmp_path):
+    paths = [_write(tmp_path / "a.csv", b"k,v"), _write(tmp_path / "b.csv", b"k,v\n"),
+             _write(tmp_path / "c.csv", b"k,v\nx,1\n")]
+    assert _run(paths, tmp_path / "out.csv") == b"k,v\nx,1\n"
+
+
+def test_raw_copy_quoted_multiline_header(tmp_path):
+    header = b'k,"multi\nline ""v"""\n'
+    paths = [_write(tmp_path / "a.csv", header + b"x,1\n"), _write(tmp_path / "b.csv", header + b'y,"2\n3"\n')]
+    assert _run(paths, tmp_path / "out.csv") == header + b'x,1\ny,"2\n3"\n'
+    with open(paths[0], "rb") as f:
+        assert parse_header(read_header(f)) == ["k", 'multi\nline "v"']
+        assert f.read() == b"x,1\n"
+
+
+def test_raw_copy_output_can_be_an_input(tmp_path):
+    paths = [_write(tmp_path / "a.csv", b"k,v\nx,1\n"), _write(tmp_path / "b.csv", b"k,v\nz,3\n")]
+    assert _run(paths, tmp_path / "a.csv") == b"k,v\nx,1\nz,3\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.csv", "b.csv"]
+
+
+def test_header_mismatch(tmp_path, capsys):
+    paths = [_write(tmp_path / "a.csv", b"k,v\nx,1\n"), _write(tmp_path / "b.csv", b"v,k\n1,x\n")]
+    output = tmp_path / "out.csv"
+    assert CSVConcatExecutor(ConcatByRowStrategy(), str(output)).run(paths) is None
+    assert "b.csv" in capsys.readouterr().out
+    assert not output.exists()
+
+
+def test_missing_header(tmp_path):
+    with pytest.raises(ValueError):
+        ConcatByRowStrategy().check_headers([_write(tmp_path / "a.csv", b"")])
+
+
+@pytest.mark.parametrize("chunksize", [None, 1, 100])
+def test_columns_reordered_across_files(tmp_path, chunksize):
+    paths = [_write(tmp_path / "a.csv", b"k,v,w\nx,1,a\ny,2,b\n"), _write(tmp_path / "b.csv", b"w,k\nc,z\n")]
+    out = _run(paths, tmp_path / "out.csv", columns=["w", "k"], chunksize=chunksize)
+    assert out.decode().splitlines() == ["k,w", "x,a", "y,b", "z,c"]
+
+
+@pytest.mark.parametrize("chunksize", [None, 1, 100])
+def test_parsed_path_matches_raw_copy(tmp_path, chunksize):
+    paths = [_write(tmp_path / f"{i}.csv", b"k,v\n" + b"".join(b"r%d,%d\n" % (i, j) for j in range(i + 2)))
+             for i in range(3)]
+    raw = _run(paths, tmp_path / "raw.csv")
+    indexed = _run(paths, tmp_path / "idx.csv", index_name="No.", chunksize=chunksize).decode().splitlines()
+    assert indexed[0] == "No.,k,v"
+    assert [line.split(",", 1)[1] for line in indexed[1:]] == raw.decode().splitlines()[1:]
+    assert [line.split(",", 1)[0] for line in indexed[1:]] == [str(i) for i in range(len(indexed) - 1)]
@@ -0,0 +1,177 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from csv_file_tool.concat.by_index import ConcatByIndexStrategy
+from csv_file_tool.concat.csv_concat_executor import CSVConcatExecutor
+from csv_file_tool.concat.table_io import TableWriter, open_blocks, open_text, read_table
+
+FORMAT_DEPENDENCIES = {
+    ".csv": None,
+    ".csv.gz": None,
+    ".csv.zst": "zstandard",
+    ".parquet": "pyarrow",
+    ".feather": "pyarrow",
+}
+
+
+def _require(suffix):
+    if FORMAT_DEPENDENCIES[suffix]:
+        pytest.importorskip(FORMAT_DEPENDENCIES[suffix])
+
+
+def _frame(start, n):
+    return pd.DataFrame({
+        "id": range(start, start + n),
+        "name": [f"n{i}" for i in range(start, start + n)],
+        "value": [i * 0.5 for i in range(start, start + n)],
+    })
+
+
+@pytest.mark.parametrize("suffix", list(FORMAT_DEPENDENCIES))
+def test_round_trip(tmp_path, suffix):
+    _require(suffix)
+    path = str(tmp_path / f"t{suffix}")
+    blocks = [_frame(0, 3), _frame(3, 4), _frame(7, 0), _frame(7, 2)]
+    with TableWriter(path, compression_level=1) as writer:
+        for block in blocks:
+            writer.write(block)
+    assert writer.rows == 9
+
+    expected = pd.concat(blocks, ignore_index=True)
+    pd.testing.assert_frame_equal(read_table(path), expected, check_dtype=False)
+    pd.testing.assert_frame_equal(read_table(path, usecols=["value", "id"]), expected[["id", "value"]],
+                                  check_dtype=False)
+
+    with open_blocks(path, 4) as reader:
+        chunks = list(reader)
+    assert [len(chunk) for chunk in chunks] == [4, 4, 1]
+    assert [chunk.index[0] for chunk in chunks] == [0, 4, 8]
+    pd.testing.assert_frame_equal(pd.concat(chunks), expected, check_dtype=False)
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".feather"])
+def test_writer_casts_later_blocks_to_first_schema(tmp_path, suffix):
+    pa = pytest.importorskip("pyarrow")
+    path = str(tmp_path / f"t{suffix}")
+    with TableWriter(path) as writer:
+        writer.write(pd.DataFrame({"x": [1, 2], "y": ["a", "b"]}))
+        # 空欄を含むブロック（float64）も、最初のブロックの int64 に変換される
+        writer.write(pd.DataFrame({"x": [3.0, None], "y": ["c", None]}))
+    if suffix == ".parquet":
+        import pyarrow.parquet as pq
+        table = pq.read_table(path)
+    else:
+        table = pa.ipc.open_file(path).read_all()
+    assert table.schema.field("x").type == pa.int64()
+    assert table.column("x").to_pylist() == [1, 2, 3, None]
+    assert table.column("y").to_pylist() == ["a", "b", "c", None]
+
+    with pytest.raises(ValueError, match="--dtypes"):
+        with TableWriter(str(tmp_path / f"bad{suffix}")) as writer:
+            writer.write(pd.DataFrame({"x": [1, 2]}))
+            writer.write(pd.DataFrame({"x": [1.5]}))
+
+
+def test_rebatch_aligns_uneven_batches():
+    pa = pytest.importorskip("pyarrow")
+    from csv_file_tool.concat.table_io import _rebatch
+
+    batches = [pa.record_batch([pa.array(range(start, start + n))], names=["x"])
+               for start, n in [(0, 3), (3, 0), (3, 4), (7, 2)]]
+    tables = list(_rebatch(iter(batches), 2))
+    assert [table.num_rows for table in tables] == [2, 2, 2, 2, 1]
+    assert [v for table in tables for v in table.column("x").to_pylist()] == list(range(9))
+
+
+def _write_columnar(path, df, batch_rows):
+    pa = pytest.importorskip("pyarrow")
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+        pq.write_table(table, path, row_group_size=batch_rows)
+    else:
+        import pyarrow.feather as feather
+        feather.write_feather(table, path, chunksize=batch_rows)
+    return path
+
+
+@pytest.mark.parametrize("parser", ["c", "pyarrow"])
+@pytest.mark.parametrize("chunksize", [1, 2, 5, 100])
+def test_by_index_mixes_columnar_and_csv(tmp_path, chunksize, parser):
+    pytest.importorskip("pyarrow")
+    # 行グループ・レコードバッチの大きさが chunksize とそろっていなくても、同じ行範囲を結合する
+    parquet = _write_columnar(str(tmp_path / "a.parquet"), pd.DataFrame({"p": range(11)}), 3)
+    feather = _write_columnar(str(tmp_path / "b.feather"), pd.DataFrame({"f": [f"v{i}" for i in range(6)]}), 4)
+    csv = str(tmp_path / "c.csv")
+    (tmp_path / "c.csv").write_text("c\n" + "".join(f"{i * 10}\n" for i in range(8)), encoding="utf-8")
+
+    def run(name, size):
+        output = tmp_path / name
+        result = CSVConcatExecutor(ConcatByIndexStrategy(), str(output), chunksize=size, parser=parser, index_name="No.").run(
+            [parquet, csv, feather])
+        assert result == [str(output)]
+        return output.read_text(encoding="utf-8").splitlines()
+
+    lines = run("stream.csv", chunksize)
+    assert lines == run("whole.csv", None)
+    assert lines[0] == "No.,p,c,f"
+    assert lines[1:] == [
+        f"{i},{i},{i * 10 if i < 8 else ''},{f'v{i}' if i < 6 else ''}" for i in range(11)
+    ]
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".csv.gz"])
+def test_csv_writes_integral_floats_as_integers(tmp_path, suffix):
+    path = str(tmp_path / f"t{suffix}")
+    df = pd.DataFrame([[1.0, 1.5, 2.0 ** 53, "a"], [None, 2.0, float("inf"), "b"], [-3.0, None, None, "c"]],
+                      columns=["x", "y", "x", "s"])
+    with TableWriter(path) as writer:
+        writer.write(df)
+    with open_text(path, "r") as f:
+        assert f.read().splitlines() == ["x,y,x,s", "1,1.5,9007199254740992.0,a", ",2,inf,b", "-3,,,c"]
+
+
+def _concat(strategy, paths, output, **kwargs):
+    result = CSVConcatExecutor(strategy, str(output), **kwargs).run(paths)
+    assert result == [str(output)]
+    return output.read_text(encoding="utf-8").splitlines()
+
+
+@pytest.mark.parametrize("parser", ["c", "auto"])
+@pytest.mark.parametrize("chunksize", [None, 1])
+def test_unknown_input_extension_is_read_as_csv(tmp_path, chunksize, parser):
+    import gzip
+
+    from csv_file_tool.concat.by_key import ConcatByKeyStrategy
+    from csv_file_tool.concat.by_row import ConcatByRowStrategy
+
+    a = tmp_path / "a.csv"
+    a.write_text("k,x\n1,a\n2,b\n", encoding="utf-8")
+    b = tmp_path / "b.txt"
+    b.write_text("k,x\n3,c\n", encoding="utf-8")
+    c = tmp_path / "c.dat.gz"
+    with gzip.open(c, "wt", encoding="utf-8") as f:
+        f.write("k,y\n1,p\n3,q\n")
+    paths = [str(a), str(b)]
+    kwargs = {"chunksize": chunksize, "parser": parser}
+
+    assert _concat(ConcatByRowStrategy(), paths, tmp_path / "row.csv", **kwargs) == ["k,x", "1,a", "2,b", "3,c"]
+    output = tmp_path / "row.csv.gz"
+    assert CSVConcatExecutor(ConcatByRowStrategy(), str(output), **kwargs).run(paths) == [str(output)]
+    assert read_table(str(output))["x"].tolist() == ["a", "b", "c"]
+    assert _concat(ConcatByIndexStrategy(), [str(b), str(c)], tmp_path / "index.csv", **kwargs) == [
+        "k,x,k,y", "3,c,1,p", ",,3,q"]
+    assert _concat(ConcatByKeyStrategy(["k"]), [str(b), str(c)], tmp_path / "key.csv", **kwargs) == [
+        "k,x,y", "3,c,q"]
+
+
+def test_read_error_mentions_columns_only_when_specified(tmp_path, capsys):
+    path = tmp_path / "bad.txt"
+    path.write_text("a,b\n1,2\n3,4,5,6\n", encoding="utf-8")
+    assert CSVConcatExecutor(ConcatByIndexStrategy(), str(tmp_path / "out.csv"), parser="c").run([str(path)]) is None
+    message = capsys.readouterr().out
+    assert "Error tokenizing data" in message and "指定されたカラム" not in message
+
+    assert CSVConcatExecutor(ConcatByIndexStrategy(), str(tmp_path / "out.csv"), columns=["z"]).run([str(path)]) is None
+    assert "指定されたカラム ['z']" in capsys.readouterr().out
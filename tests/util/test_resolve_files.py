@@ -0,0 +1,81 @@
+import glob
+import os
+import warnings
+
+import pytest
+
+from util.resolve_files.resolve_files import count_files, iter_files, resolve_files
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    for name in ["data/x.bin", "data/a/y.bin", "data/a/b/z.bin", "data/a/b/old.bak", "data/.hidden/h.bin",
+                 "data/.dot.bin", "data/c/w.txt", "data/tmp/t.bin", "r.bin"]:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.mark.parametrize("pattern", ["data/**/*.bin", "data/**", "**/*.bin", "*.bin", "data/*/*.bin",
+                                     "data/[ab]/*", "data/a/b/?.bin", "data/.*", "data/**/.*", "r.bin",
+                                     "missing/*.bin", "*/a/**"])
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_iter_files_matches_glob(tree, pattern, jobs):
+    expected = sorted(p for p in glob.glob(pattern, recursive=True) if os.path.isfile(p))
+    assert sorted(iter_files(pattern, jobs=jobs)) == expected
+
+
+def test_iter_files_absolute_pattern(tree):
+    assert sorted(iter_files(str(tree / "data" / "**" / "*.bak"))) == [str(tree / "data" / "a" / "b" / "old.bak")]
+
+
+def test_iter_files_order_is_deterministic(tree):
+    expected = [os.path.join(*p.split("/")) for p in
+                ["data/x.bin", "data/a/y.bin", "data/a/b/z.bin", "data/tmp/t.bin"]]
+    assert list(iter_files("data/**/*.bin")) == expected
+    assert list(iter_files("data/**/*.bin", jobs=4)) == expected
+
+
+def test_iter_files_multiple_patterns_and_exclude(tree):
+    paths = list(iter_files(["data/**/*.bin", "**/*.bin", "data/**/*.bak"], exclude=["*.bak", "data/tmp/**", "a"]))
+    assert paths == ["data/x.bin", "r.bin"]
+    assert resolve_files("data/**", exclude="*.txt") == [os.path.join(*p.split("/")) for p in
+                                                         ["data/x.bin", "data/a/y.bin", "data/a/b/old.bak",
+                                                          "data/a/b/z.bin", "data/tmp/t.bin"]]
+
+
+def test_iter_files_is_lazy(tree):
+    it = iter_files("**/*.bin")
+    assert next(it) == "r.bin"
+
+
+def test_count_files(tree):
+    assert count_files("**/*.bin") == 5
+    assert count_files("**/*.bin", limit=2) == 2
+    assert count_files("missing/*") == 0
+
+
+def test_bracket_patterns_match_glob_without_warnings(tmp_path, monkeypatch):
+    for name in ["d/[a].bin", "d/a.bin", "d/-.bin", "d/&.bin", "d/s/[a].bin"]:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x")
+    monkeypatch.chdir(tmp_path)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        for pattern in ["**/[[]a].bin", "d/[!a].bin", "d/[&&-].bin", "d/[--]*"]:
+            expected = sorted(p for p in glob.glob(pattern, recursive=True) if os.path.isfile(p))
+            assert sorted(iter_files(pattern)) == expected
+        assert list(iter_files("**/*.bin", exclude=["d/**/[[]a].bin", "[&]*"])) == [
+            os.path.join("d", "-.bin"), os.path.join("d", "a.bin")]
+
+
+def test_exclude_path_patterns(tree):
+    assert list(iter_files("data/**/*.bin", exclude=["data/**/z.bin", "data/*/y.bin"])) == [
+        os.path.join("data", "x.bin"), os.path.join("data", "tmp", "t.bin")]
+    # パターン末尾の ** は1個以上の要素にマッチする
+    assert list(iter_files("data/**/*.bin", exclude=["data/**"])) == []
+    assert list(iter_files("**/*.bin", exclude=["data/a/**"])) == [
+        "r.bin", os.path.join("data", "x.bin"), os.path.join("data", "tmp", "t.bin")]
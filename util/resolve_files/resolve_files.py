@@ -1,12 +1,283 @@
-import glob 
-from pathlib import Path
-from typing import List
+"""
+resolve_files.py
 
-def resolve_files(pattern: str) -> List[str]:
+入力パターン（ワイルドカード含む）にマッチするファイルを解決する関数群。
+
+- iter_files: os.scandir でディレクトリを走査し、マッチしたファイルを順次返すジェネレータ
+  - DirEntry.is_file() / is_dir() を使用し、ファイルごとの追加の stat を行わない
+  - 複数の include パターンと exclude パターンに対応（exclude にマッチするディレクトリは走査しない）
+  - jobs > 1 の場合、ディレクトリの走査をスレッドプールで先行して実行する（返す順序は jobs に依らない）
+  - 全件をリストにしないため、走査中に最初のファイルから処理を開始できる
+- count_files: マッチするファイル数を数える（limit 件で打ち切る）。大量ファイルの確認用
+- resolve_files: マッチするファイルのリストを返す（従来の関数）
+
+パターンの規則は glob.glob(pattern, recursive=True) と同じ:
+    *, ?, [seq] はパス区切りをまたがない。** は0個以上のディレクトリにマッチする
+    '.' で始まる名前は、パターン側も '.' で始まる場合のみマッチする
+    同じディレクトリ内は名前順に、サブディレクトリは深さ優先で返す
+
+exclude パターン:
+    パス区切りを含まない場合はファイル名・ディレクトリ名に、含む場合はパス全体にマッチさせる
+    （例: "*.bak", ".git", "data/tmp/**"）
+"""
+import fnmatch
+import glob
+import os
+import re
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Union
+
+# 大文字・小文字を区別しないファイルシステム（Windows）かどうか
+_IGNORE_CASE = os.path.normcase('A') == 'a'
+
+Patterns = Union[str, Iterable[str]]
+
+
+def _as_list(patterns: Optional[Patterns]) -> List[str]:
+    if patterns is None:
+        return []
+    if isinstance(patterns, str):
+        return [patterns]
+    return list(patterns)
+
+
+def _split(path: str) -> List[str]:
+    return path.replace(os.sep, '/').split('/') if os.sep != '/' else path.split('/')
+
+
+def _translate_segment(segment: str) -> str:
+    """
+    パスの1要素分のワイルドカードを、fnmatch.translate で正規表現に変換する（末尾の \\Z を含む）。
+    要素はパス区切りを含まないため、* / ? がパス区切りをまたぐことはない。
+
+    :param segment: パスの1要素（'**' 以外）
+    :return: 正規表現
+    """
+    return fnmatch.translate(segment)
+
+
+def _match_parts(regexes: List[Optional['re.Pattern[str]']], names: List[str], i: int = 0, j: int = 0) -> bool:
+    """
+    パスの要素 names[j:] が、パターンの要素 regexes[i:]（'**' は None）にマッチするかを返す。
+    '**' は0個以上（パターンの末尾の場合は1個以上）の要素にマッチする。
+
+    :param regexes: パターンの要素ごとの正規表現
+    :param names: パスの要素
+    :return: マッチする場合は True
+    """
+    if i == len(regexes):
+        return j == len(names)
+    if regexes[i] is None:
+        first = j + 1 if i == len(regexes) - 1 else j
+        return any(_match_parts(regexes, names, i + 1, k) for k in range(first, len(names) + 1))
+    return j < len(names) and bool(regexes[i].match(names[j])) and _match_parts(regexes, names, i + 1, j + 1)
+
+
+def _compile(regex: str) -> 're.Pattern[str]':
+    return re.compile(regex, re.IGNORECASE if _IGNORE_CASE else 0)
+
+
+class _Matcher:
+    """
+    include パターンを、ディレクトリ1階層ごとに進める状態（パターンの要素の位置）として扱う。
+    """
+    def __init__(self, parts: List[str]) -> None:
+        self.parts = parts
+        self.end   = len(parts)
+        self.regex = [None if part == '**' else _compile(_translate_segment(part)) for part in parts]
+        # '.' で始まる名前にマッチしてよい要素
+        self.dot   = [part.startswith('.') for part in parts]
+
+    def closure(self, states: frozenset) -> frozenset:
+        """
+        '**' は0個のディレクトリにもマッチするため、次の要素の状態も加える。
+        """
+        result = set(states)
+        stack = list(states)
+        while stack:
+            i = stack.pop()
+            if i < self.end and self.parts[i] == '**' and i + 1 not in result:
+                result.add(i + 1)
+                stack.append(i + 1)
+        return frozenset(result)
+
+    def step(self, states: frozenset, name: str, is_dir: bool) -> frozenset:
+        """
+        名前 name のエントリに進んだ後の状態を返す。
+        """
+        hidden = name.startswith('.')
+        result = set()
+        for i in states:
+            if i == self.end:
+                continue
+            if self.parts[i] == '**':
+                if hidden:
+                    continue
+                if is_dir:
+                    result.add(i)
+                if i + 1 == self.end:
+                    result.add(self.end)
+            elif (not hidden or self.dot[i]) and self.regex[i].match(name):
+                result.add(i + 1)
+        return self.closure(frozenset(result))
+
+
+class _Excluder:
+    """
+    exclude パターンにマッチするかを判定する。
+    """
+    def __init__(self, patterns: List[str]) -> None:
+        self.names = []
+        self.paths = []
+        for pattern in patterns:
+            parts = _split(pattern)
+            if len(parts) == 1:
+                self.names.append(_compile(_translate_segment(pattern)))
+                continue
+            # パス全体のパターンは、要素ごとの正規表現の並びとしてパスの要素と照合する
+            self.paths.append([None if part == '**' else _compile(_translate_segment(part)) for part in parts])
+
+    def __bool__(self) -> bool:
+        return bool(self.names or self.paths)
+
+    def match(self, path: str, name: str) -> bool:
+        if any(regex.match(name) for regex in self.names):
+            return True
+        if self.paths:
+            normalized = '/'.join(_split(path))
+            if normalized.startswith('./'):
+                normalized = normalized[2:]
+            names = normalized.split('/')
+            return any(_match_parts(regexes, names) for regexes in self.paths)
+        return False
+
+
+def _scan(directory: str, matchers: List[_Matcher], states: List[frozenset],
+          excluder: _Excluder) -> tuple[List[str], List[tuple[str, List[frozenset]]]]:
+    """
+    ディレクトリを1階層走査し、マッチしたファイルと、さらに走査するサブディレクトリを返す。
+    """
+    files: List[str] = []
+    subdirs: List[tuple[str, List[frozenset]]] = []
+    try:
+        with os.scandir(directory or '.') as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        return files, subdirs
+
+    for entry in entries:
+        path = os.path.join(directory, entry.name) if directory else entry.name
+        try:
+            is_dir = entry.is_dir()
+            is_file = not is_dir and entry.is_file()
+        except OSError:
+            continue
+        if not (is_dir or is_file):
+            continue
+        if excluder and excluder.match(path, entry.name):
+            continue
+        next_states = [m.step(s, entry.name, is_dir) for m, s in zip(matchers, states)]
+        if is_file:
+            if any(m.end in s for m, s in zip(matchers, next_states)):
+                files.append(path)
+        elif any(s - {m.end} for m, s in zip(matchers, next_states)):
+            subdirs.append((path, next_states))
+    return files, subdirs
+
+
+def _iter_pattern(pattern: str, excluder: _Excluder, pool: Optional[ThreadPoolExecutor]) -> Iterator[str]:
+    """
+    1つの include パターンにマッチするファイルを返す。
+    """
+    if not glob.has_magic(pattern):
+        if os.path.isfile(pattern) and not (excluder and excluder.match(pattern, os.path.basename(pattern))):
+            yield pattern
+        return
+
+    # ワイルドカードを含まない先頭部分を起点のディレクトリとする
+    drive, rest = os.path.splitdrive(pattern)
+    parts = _split(rest)
+    root_parts = []
+    while parts and not glob.has_magic(parts[0]):
+        root_parts.append(parts.pop(0))
+    root = drive + '/'.join(root_parts) if root_parts else drive
+    if root_parts == ['']:
+        root = drive + '/'
+    if root and not os.path.isdir(root):
+        return
+    if os.sep != '/' and root:
+        root = root.replace('/', os.sep)
+
+    matcher = _Matcher(parts)
+    scan = (lambda d, s: pool.submit(_scan, d, [matcher], s, excluder)) if pool else None
+
+    # 深さ優先（同じディレクトリ内は名前順）。pool がある場合は、見つかったサブディレクトリを先行して走査する
+    stack: deque = deque()
+    first = [matcher.closure(frozenset({0}))]
+    stack.append((root, scan(root, first) if scan else first))
+    while stack:
+        directory, pending = stack.pop()
+        if isinstance(pending, Future):
+            files, subdirs = pending.result()
+        else:
+            files, subdirs = _scan(directory, [matcher], pending, excluder)
+        yield from files
+        for path, states in reversed(subdirs):
+            stack.append((path, scan(path, states) if scan else states))
+
+
+def iter_files(patterns: Patterns, exclude: Optional[Patterns] = None, jobs: int = 1) -> Iterator[str]:
+    """
+    入力パターンにマッチするファイルを順次返す。
+
+    :param patterns: 入力ファイルパターン（1つまたは複数。例: data/**/*.bin）
+    :param exclude: 除外するパターン（1つまたは複数。例: *.bak, .git, data/tmp/**）
+    :param jobs: ディレクトリ走査のスレッド数（1の場合は逐次、0の場合は CPU 数）
+    :return: ファイルパスのイテレータ（複数のパターンにマッチしたファイルは1回だけ返す）
+    """
+    excluder = _Excluder(_as_list(exclude))
+    jobs = jobs or os.cpu_count() or 1
+    pool = ThreadPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    seen = set()
+    multiple = len(_as_list(patterns)) > 1
+    try:
+        for pattern in _as_list(patterns):
+            for path in _iter_pattern(pattern, excluder, pool):
+                if multiple:
+                    key = os.path.normcase(os.path.abspath(path))
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                yield path
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def count_files(patterns: Patterns, exclude: Optional[Patterns] = None, limit: Optional[int] = None) -> int:
+    """
+    入力パターンにマッチするファイル数を数える。
+
+    :param patterns: 入力ファイルパターン
+    :param exclude: 除外するパターン
+    :param limit: この件数に達した時点で走査を打ち切る（None の場合は全件）
+    :return: ファイル数（limit 指定時は limit 以下）
+    """
+    count = 0
+    for _ in iter_files(patterns, exclude):
+        count += 1
+        if limit is not None and count >= limit:
+            break
+    return count
+
+
+def resolve_files(pattern: Patterns, exclude: Optional[Patterns] = None) -> List[str]:
     """
     入力パターン（ワイルドカード含む）にマッチするファイル一覧を取得する。
 
     :param pattern: 入力ファイルパターン（例: *.bin, data/**/*.bin など）
-    :return: Path オブジェクトのリスト（ファイルパス）
+    :param exclude: 除外するパターン
+    :return: ファイルパスのリスト
     """
-    return [str(p) for p in glob.glob(pattern, recursive=True) if Path(p).is_file()]
+    return list(iter_files(pattern, exclude))